@@ -0,0 +1,149 @@
+"""Beast frame parser microbenchmark.
+
+Feeds a synthetic Beast stream (real ADS-B payloads from
+``tests/data/sample_data_adsb.csv``, 12 MHz MLAT counter, random
+signal bytes, ~1% Mode A/C frames, every literal 0x1a escaped)
+through the ``modes live`` read path and reports frames per second:
+
+- ``parse``: ``_parse_beast_buffer`` over the whole stream in one call
+- ``read loop``: ``NetworkSource._read_loop`` against an in-memory
+  socket that hands out ``--chunk``-byte recv bursts, i.e. buffer
+  management + parsing + per-frame timestamping, without decoding
+- ``raw loop``: the same with ``raw=True`` (payload bytes, no hex)
+- ``raw bursts``: ``raw=True`` read per recv burst through
+  ``_read_bursts``, as ``modes live`` runs it
+
+Not a pytest unit test — run directly:
+    uv run scripts/benchmark_beast.py [--frames N] [--chunk BYTES]
+
+Fails with exit code 1 if either path loses or corrupts a frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from pyModeS.cli._source import NetworkSource, _parse_beast_buffer
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CORPUS = REPO_ROOT / "tests" / "data" / "sample_data_adsb.csv"
+
+
+def build_stream(n_frames: int, seed: int = 0) -> tuple[bytes, list[str]]:
+    """Return (beast bytes, expected Mode-S hex payloads in order)."""
+    rng = random.Random(seed)
+    payloads = [
+        line.split(",")[1].strip('"') for line in CORPUS.read_text().splitlines()
+    ]
+    out = bytearray()
+    expected: list[str] = []
+    mlat = rng.randrange(1 << 40)
+    for i in range(n_frames):
+        mlat += rng.randrange(1, 24_000)  # 12 MHz, up to 2 ms apart
+        head = mlat.to_bytes(6, "big") + bytes([rng.randrange(256)])
+        if rng.random() < 0.01:
+            body = head + rng.randbytes(2)
+            out += b"\x1a\x31" + body.replace(b"\x1a", b"\x1a\x1a")
+            continue
+        hex_msg = payloads[i % len(payloads)]
+        body = head + bytes.fromhex(hex_msg)
+        out += b"\x1a\x33" + body.replace(b"\x1a", b"\x1a\x1a")
+        expected.append(hex_msg)
+    return bytes(out), expected
+
+
+class _ChunkSocket:
+    """In-memory socket handing out fixed-size bursts of ``data``."""
+
+    def __init__(self, data: bytes, chunk: int) -> None:
+        self._view = memoryview(data)
+        self._pos = 0
+        self._chunk = chunk
+
+    def recv(self, n: int) -> bytes:
+        take = min(n, self._chunk)
+        out = bytes(self._view[self._pos : self._pos + take])
+        self._pos += len(out)
+        return out
+
+    def recv_into(self, buffer: memoryview, nbytes: int = 0) -> int:
+        take = min(nbytes or len(buffer), self._chunk)
+        piece = self._view[self._pos : self._pos + take]
+        buffer[: len(piece)] = piece
+        self._pos += len(piece)
+        return len(piece)
+
+    def settimeout(self, *_: object) -> None:
+        pass
+
+
+def bench_parse(data: bytes) -> tuple[float, list[str]]:
+    t0 = time.perf_counter()
+    frames, _remainder = _parse_beast_buffer(data)
+    elapsed = time.perf_counter() - t0
+    return elapsed, [hex_msg for _mlat, hex_msg in frames]
+
+
+def bench_read_loop(
+    data: bytes, chunk: int, *, raw: bool = False, bursts: bool = False
+) -> tuple[float, list[str]]:
+    src = NetworkSource("bench", 0, raw=raw)
+    src._sock = _ChunkSocket(data, chunk)  # type: ignore[assignment]
+    got: list[str | bytes] = []
+    t0 = time.perf_counter()
+    try:
+        if bursts:
+            for msgs, _timestamps in src._read_bursts():
+                got.extend(msgs)
+        else:
+            for msg, _ts in src._read_loop():
+                got.append(msg)
+    except OSError:
+        pass  # end of stream ("connection closed by remote")
+    elapsed = time.perf_counter() - t0
+    return elapsed, [m if isinstance(m, str) else m.hex().upper() for m in got]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300_000)
+    parser.add_argument("--chunk", type=int, default=8192)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    data, expected = build_stream(args.frames)
+    print(
+        f"stream: {len(data) / 1e6:.1f} MB, {args.frames} frames "
+        f"({len(expected)} Mode-S), {args.chunk}-byte bursts"
+    )
+
+    failed = False
+    cases = (
+        ("parse", lambda: bench_parse(data)),
+        ("read loop", lambda: bench_read_loop(data, args.chunk)),
+        ("raw loop", lambda: bench_read_loop(data, args.chunk, raw=True)),
+        (
+            "raw bursts",
+            lambda: bench_read_loop(data, args.chunk, raw=True, bursts=True),
+        ),
+    )
+    for label, run in cases:
+        best = float("inf")
+        for _ in range(args.rounds):
+            elapsed, got = run()
+            best = min(best, elapsed)
+            if got != expected:
+                print(f"FAIL: {label} returned {len(got)} frames", file=sys.stderr)
+                failed = True
+                break
+        print(f"  {label:>10}: {args.frames / best / 1e3:8.0f} k frames/s")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,14 @@
 """Benchmark v3 CPR against a verbatim port of v2's numpy implementation.
 
+Also compares the v3 scalar pair / with-reference resolvers against
+their ``*_array`` NumPy variants over a bulk reprocessing workload,
+checking on the way that both produce identical positions.
+
 Not a pytest unit test — run directly:
     uv run --with numpy scripts/benchmark_cpr.py
 
-Fails with exit code 1 if v3 is slower than v2 on the hot path.
+Fails with exit code 1 if v3 is slower than v2 on the hot path, or if
+an array variant is slower than (or disagrees with) its scalar loop.
 """
 
 from __future__ import annotations
@@ -49,15 +54,80 @@ def v2_airborne_with_ref(
     return lat, lon
 
 
-def bench(name: str, fn: Callable[[], object], n: int) -> float:
+def bench(name: str, fn: Callable[[], object], n: int, *, items: int = 1) -> float:
+    """Time ``n`` calls of ``fn``; each call processes ``items`` inputs."""
     t0 = time.perf_counter_ns()
     for _ in range(n):
         fn()
     elapsed = (time.perf_counter_ns() - t0) / 1e9
-    print(f"  {name}: {elapsed:.3f}s ({n / elapsed:,.0f} ops/sec)")
+    print(f"  {name}: {elapsed:.3f}s ({n * items / elapsed:,.0f} ops/sec)")
     return elapsed
 
 
+def bench_array(n: int) -> bool:
+    """Scalar loop vs array call over ``n`` random frames. True if OK."""
+    from pyModeS.position import (
+        airborne_position_pair,
+        airborne_position_pair_array,
+        airborne_position_with_ref,
+        airborne_position_with_ref_array,
+    )
+
+    rng = np.random.default_rng(0)
+    le, ne, lo, no = (rng.integers(0, 1 << 17, n) for _ in range(4))
+    fmt = rng.integers(0, 2, n)
+    lat_ref = rng.uniform(-80.0, 80.0, n)
+    lon_ref = rng.uniform(-180.0, 180.0, n)
+    # Plain Python lists for the scalar side so it isn't penalised by
+    # numpy scalar boxing on every element access.
+    le_l, ne_l, lo_l, no_l = le.tolist(), ne.tolist(), lo.tolist(), no.tolist()
+    fmt_l, lat_ref_l, lon_ref_l = fmt.tolist(), lat_ref.tolist(), lon_ref.tolist()
+
+    ok = True
+    cases: list[
+        tuple[
+            str,
+            Callable[[], list[tuple[float, float] | None]],
+            Callable[[], tuple[np.ndarray, np.ndarray]],
+        ]
+    ] = [
+        (
+            "airborne_position_pair",
+            lambda: [
+                airborne_position_pair(a, b, c, d, even_is_newer=True)
+                for a, b, c, d in zip(le_l, ne_l, lo_l, no_l, strict=True)
+            ],
+            lambda: airborne_position_pair_array(le, ne, lo, no, even_is_newer=True),
+        ),
+        (
+            "airborne_position_with_ref",
+            lambda: [
+                airborne_position_with_ref(*args)
+                for args in zip(fmt_l, le_l, ne_l, lat_ref_l, lon_ref_l, strict=True)
+            ],
+            lambda: airborne_position_with_ref_array(fmt, le, ne, lat_ref, lon_ref),
+        ),
+    ]
+    for name, scalar_fn, array_fn in cases:
+        print(f"Benchmarking {name} ({n:,} frames)")
+        t_scalar = bench("  scalar loop", scalar_fn, 1, items=n)
+        t_array = bench("  array", array_fn, 1, items=n)
+        print(f"  speedup: {t_scalar / t_array:.2f}x\n")
+
+        scalar_out = scalar_fn()
+        lat, lon = array_fn()
+        expected = [(np.nan, np.nan) if r is None else r for r in scalar_out]
+        if not np.array_equal(
+            np.column_stack([lat, lon]), np.asarray(expected), equal_nan=True
+        ):
+            print(f"FAIL: {name} array result differs from scalar", file=sys.stderr)
+            ok = False
+        if t_array >= t_scalar:
+            print(f"FAIL: {name} array is not faster than scalar", file=sys.stderr)
+            ok = False
+    return ok
+
+
 def main() -> int:
     from pyModeS.position._cpr import (
         airborne_position_with_ref,
@@ -96,7 +166,9 @@ def main() -> int:
     if t_v3_ar >= t_v2_ar:
         print("FAIL: v3 airborne_with_ref is not faster than v2", file=sys.stderr)
         return 1
-    print("OK: v3 faster on both benchmarks")
+    if not bench_array(1_000_000):
+        return 1
+    print("OK: v3 faster on both benchmarks, array variants match and beat scalar")
     return 0
 
 
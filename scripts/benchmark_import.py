@@ -0,0 +1,117 @@
+"""Import-time check for ``import pyModeS`` and first decode touch.
+
+Not a pytest unit test — run directly:
+    uv run scripts/benchmark_import.py [--rounds N] [--baseline FILE]
+
+Each sample runs in a fresh interpreter with ``-X importtime`` and
+reads the cumulative microseconds the interpreter reports for the
+top-level ``pyModeS`` import, so interpreter start-up and ``site``
+are excluded. Reports the median over ``--rounds`` samples.
+
+Absolute import times depend on the machine, so without
+``--baseline`` the script only reports. With ``--baseline FILE`` the
+first run stores its medians in FILE; later runs on the same machine
+(check out the reference commit, record, then switch back) fail with
+exit code 1 if a median exceeds the stored one by more than
+``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Bare ``import pyModeS`` should load only the package ``__init__``,
+# ``errors`` and the v2-removal finder; ``from pyModeS import decode``
+# additionally pulls in ``core``, ``message`` and the decoder package.
+CASES: tuple[tuple[str, str], ...] = (
+    ("import pyModeS", "import pyModeS"),
+    ("from pyModeS import decode", "from pyModeS import decode"),
+)
+
+
+def measure(stmt: str) -> float:
+    """Return the cumulative import time of ``pyModeS`` for ``stmt`` in ms."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self |  cumulative | name". The
+    # top-level package is the unindented "pyModeS" entry; lazy
+    # attribute access imports further modules (pyModeS.core, logging,
+    # ...) *after* that line as new top-level entries, so sum every
+    # unindented entry from the package line onwards.
+    total_us = 0
+    seen_package = False
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[0].startswith("import time:"):
+            continue
+        name = parts[2].rstrip()
+        if name.startswith("  "):
+            continue
+        seen_package |= name == " pyModeS"
+        if seen_package:
+            total_us += int(parts[1])
+    return total_us / 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="JSON file of reference medians: written if missing, else compared",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown over the baseline as a fraction (default 0.25)",
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, float] | None = None
+    if args.baseline is not None and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    medians: dict[str, float] = {}
+    failed = False
+    for label, stmt in CASES:
+        samples = [measure(stmt) for _ in range(args.rounds)]
+        median = medians[label] = statistics.median(samples)
+        line = f"  {label}: median {median:.1f} ms (min {min(samples):.1f})"
+        reference = None if baseline is None else baseline.get(label)
+        if reference is not None:
+            limit = reference * (1 + args.tolerance)
+            over = median > limit
+            line += f", baseline {reference:.1f} ms"
+            line += " OVER BASELINE" if over else " ok"
+            failed |= over
+        print(line)
+
+    if args.baseline is None:
+        return 0
+    if baseline is None:
+        args.baseline.write_text(json.dumps(medians, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if failed:
+        print(
+            f"FAIL: import time more than {args.tolerance:.0%} over baseline",
+            file=sys.stderr,
+        )
+        return 1
+    print("OK: import time within baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
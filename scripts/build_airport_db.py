@@ -1,12 +1,14 @@
-"""Build src/pyModeS/data/airports.py from OurAirports CSV.
+"""Build src/pyModeS/data/airports.bin from OurAirports CSV.
 
 Run periodically before a release to refresh the curated airport
 database. Not run at install time — the generated file is committed
 to the repo so users don't pay download cost on install.
 
+The binary layout is owned by :func:`pyModeS.data.airports.encode_table`
+so the writer here and the lazy reader in the package can't drift.
+
 Usage:
     uv run scripts/build_airport_db.py
-    uv run ruff format src/pyModeS/data/airports.py
 """
 
 from __future__ import annotations
@@ -16,22 +18,12 @@ import sys
 import urllib.request
 from pathlib import Path
 
+from pyModeS.data.airports import encode_table
+
 SOURCE = "https://davidmegginson.github.io/ourairports-data/airports.csv"
-OUTPUT = Path(__file__).parent.parent / "src" / "pyModeS" / "data" / "airports.py"
+OUTPUT = Path(__file__).parent.parent / "src" / "pyModeS" / "data" / "airports.bin"
 ALLOWED_TYPES = ("large_airport", "medium_airport")
 
-HEADER = '''"""Curated airport database.
-
-Generated from OurAirports dataset by scripts/build_airport_db.py.
-Source: https://davidmegginson.github.io/ourairports-data/airports.csv
-Filter: large_airport + medium_airport with an assigned 4-letter ICAO code.
-
-Do not edit by hand — rerun the build script to regenerate.
-"""
-
-AIRPORTS: dict[str, tuple[float, float]] = {
-'''
-
 
 def _is_icao_code(ident: str) -> bool:
     """Return True if `ident` is a plausible 4-letter ICAO code.
@@ -68,13 +60,13 @@ def filter_and_sort(rows: list[dict[str, str]]) -> list[dict[str, object]]:
     return out
 
 
-def write_module(rows: list[dict[str, object]]) -> None:
+def write_table(rows: list[dict[str, object]]) -> None:
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    with OUTPUT.open("w") as f:
-        f.write(HEADER)
-        for row in rows:
-            f.write(f'    "{row["icao"]}": ({row["lat"]:.5f}, {row["lon"]:.5f}),\n')
-        f.write("}\n")
+    table = [
+        (str(row["icao"]), float(row["lat"]), float(row["lon"]))  # type: ignore[arg-type]
+        for row in rows
+    ]
+    OUTPUT.write_bytes(encode_table(table))
 
 
 def build() -> int:
@@ -84,7 +76,7 @@ def build() -> int:
         print(f"error: failed to fetch {SOURCE}: {e}", file=sys.stderr)
         return 1
     filtered = filter_and_sort(rows)
-    write_module(filtered)
+    write_table(filtered)
     print(f"wrote {len(filtered)} airports to {OUTPUT}")
     return 0
 
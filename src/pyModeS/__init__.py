@@ -21,25 +21,39 @@ For streaming workflows where references aren't known ahead of time,
 use :class:`PipeDecoder` which resolves airborne positions from
 even/odd CPR pairs without any reference and still accepts
 ``surface_ref`` for surface messages.
+
+Import cost
+-----------
+``import pyModeS`` only loads this module, :mod:`pyModeS.errors`
+and the v2-removal finder. The public names (``decode``,
+``PipeDecoder``, ``Message``, ``Decoded``), ``__version__`` and the
+subpackages are resolved on first attribute access through the PEP
+562 ``__getattr__`` below, so CLI one-shots and short-lived workers
+only pay for the decoder modules they actually touch.
+``scripts/benchmark_import.py`` measures it against a baseline.
 """
 
-from importlib.metadata import version as _version
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from pyModeS._pipe import PipeDecoder
 from pyModeS._v2_removed import (
     _V2_REMOVED_NAMES,
     install_v2_removed_finder,
     raise_v2_removed,
 )
-from pyModeS.core import decode
 from pyModeS.errors import (
     DecodeError,
     InvalidHexError,
     InvalidLengthError,
     UnknownDFError,
 )
-from pyModeS.message import Decoded, Message
+
+if TYPE_CHECKING:
+    from pyModeS._pipe import PipeDecoder
+    from pyModeS.core import decode
+    from pyModeS.message import Decoded, Message
+
+    __version__: str
 
 # Intercept every `import pyModeS.<v2_removed>` at the import-
 # system level with a single meta-path finder — see
@@ -47,8 +61,6 @@ from pyModeS.message import Decoded, Message
 # raises on exec.
 install_v2_removed_finder()
 
-__version__ = _version("pyModeS")
-
 __all__ = [
     "DecodeError",
     "Decoded",
@@ -61,14 +73,47 @@ __all__ = [
     "decode",
 ]
 
+# Public names resolved lazily on first access → defining module.
+_LAZY_ATTRS: dict[str, str] = {
+    "Decoded": "pyModeS.message",
+    "Message": "pyModeS.message",
+    "PipeDecoder": "pyModeS._pipe",
+    "decode": "pyModeS.core",
+}
+
+# Subpackages/modules reachable as ``pyModeS.<name>`` after a bare
+# ``import pyModeS`` (the eager imports used to make these visible
+# as a side effect).
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {"core", "data", "decoder", "message", "position", "util"}
+)
+
 
-# ``pyModeS.adsb`` bare attribute access (after ``import pyModeS``)
-# doesn't trip the import system, so the meta-path finder never
-# sees it. PEP 562 gives us this package-level hook as the fallback:
-# anything in ``_V2_REMOVED_NAMES`` (defined in _v2_removed.py) is
-# routed through the same ``raise_v2_removed`` helper the loader
-# uses, so the error text stays uniform.
+# PEP 562 package-level hook. Lazy public names and subpackages are
+# imported on first touch and cached in the module globals, so the
+# hook only runs once per name. ``pyModeS.adsb`` bare attribute
+# access (after ``import pyModeS``) doesn't trip the import system,
+# so the meta-path finder never sees it; anything in
+# ``_V2_REMOVED_NAMES`` (defined in _v2_removed.py) is routed through
+# the same ``raise_v2_removed`` helper the loader uses, so the error
+# text stays uniform.
 def __getattr__(name: str) -> Any:
-    if name in _V2_REMOVED_NAMES:
+    value: Any
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = import_module(f"pyModeS.{name}")
+    elif name == "__version__":
+        from importlib.metadata import version
+
+        value = version("pyModeS")
+    elif name in _V2_REMOVED_NAMES:
         raise_v2_removed(f"pyModeS.{name}")
-    raise AttributeError(f"module 'pyModeS' has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module 'pyModeS' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS, *_LAZY_SUBMODULES, "__version__"})
@@ -0,0 +1,145 @@
+"""JSON encoding specialised for Decoded records.
+
+``json.dumps(decoded, default=str)`` builds a fresh encoder on every
+call and dispatches every value through the generic encoder. Decoded
+records are flat dicts whose keys come from `_FULL_SCHEMA` and whose
+values are almost always None, bool, int, float or str, so
+:func:`dumps` instead:
+
+- joins pre-escaped ``"key":`` fragments for every schema key (plus
+  the ``raw_msg``/``timestamp`` keys the CLI stamps on), escaping
+  anything else once and caching it;
+- formats the scalar types inline and hands anything else (lists,
+  subclasses, non-JSON values) to a reusable stdlib encoder;
+- for the compact form, uses ``orjson`` when it is installed
+  (``pip install "pyModeS[orjson]"``) and the record holds only
+  values it formats exactly like the stdlib.
+
+The output is byte-identical to ``json.dumps(obj, default=str)``
+with the same separators.
+"""
+
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from pyModeS._schema import _FULL_SCHEMA
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson only
+    orjson = None  # type: ignore[assignment]
+
+# orjson writes floats outside [1e-4, 1e16) without the exponent
+# padding/sign Python's repr uses, NaN/Infinity as null, non-ASCII
+# (and DEL) as raw UTF-8, and rejects ints outside 64 bits. Records
+# holding any such key or value go through the stdlib-exact encoder.
+_ORJSON_FLOAT_MIN = 1e-4
+_ORJSON_FLOAT_MAX = 1e16
+_ORJSON_INT_MIN = -(1 << 63)
+_ORJSON_INT_LIMIT = 1 << 64
+
+_FLOAT_SPECIAL = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+# Stop caching fragments for unexpected keys past this many.
+_MAX_KEYS = 1024
+
+# Keys every record may carry; all plain ASCII, so orjson writes them
+# like the stdlib and only other keys need checking.
+_KNOWN_KEYS = frozenset((*_FULL_SCHEMA, "raw_msg", "timestamp"))
+
+
+class _Encoder:
+    """Flat-dict encoder for one ``(item_separator, key_separator)`` pair."""
+
+    def __init__(self, item_sep: str, key_sep: str) -> None:
+        self._item_sep = item_sep
+        self._key_sep = key_sep
+        self._keys = {
+            key: encode_basestring_ascii(key) + key_sep for key in _KNOWN_KEYS
+        }
+        self._fallback = json.JSONEncoder(
+            separators=(item_sep, key_sep), default=str
+        ).encode
+
+    def encode(self, obj: dict[str, Any]) -> str:
+        keys = self._keys
+        fallback = self._fallback
+        parts: list[str] = []
+        append = parts.append
+        for key, value in obj.items():
+            frag = keys.get(key)
+            if frag is None:
+                if type(key) is not str:
+                    return fallback(obj)
+                frag = encode_basestring_ascii(key) + self._key_sep
+                if len(keys) < _MAX_KEYS:
+                    keys[key] = frag
+            t = type(value)
+            if value is None:
+                append(frag + "null")
+            elif t is str:
+                append(frag + encode_basestring_ascii(value))
+            elif t is int:
+                append(frag + int.__repr__(value))
+            elif t is float:
+                text = float.__repr__(value)
+                if text[-1] == "n" or text[-1] == "f":
+                    text = _FLOAT_SPECIAL[text]
+                append(frag + text)
+            elif t is bool:
+                append(frag + ("true" if value else "false"))
+            else:
+                append(frag + fallback(value))
+        return "{" + self._item_sep.join(parts) + "}"
+
+
+_COMPACT = _Encoder(",", ":")
+_SPACED = _Encoder(", ", ": ")
+
+
+def _orjson_exact(obj: dict[str, Any]) -> bool:
+    """True if orjson would encode every key and value in ``obj`` like json."""
+    if not _KNOWN_KEYS.issuperset(obj):
+        for key in obj:
+            if type(key) is not str or not key.isascii() or "\x7f" in key:
+                return False
+    for value in obj.values():
+        if value is None:
+            continue
+        t = type(value)
+        if t is float:
+            if not _ORJSON_FLOAT_MIN <= abs(value) < _ORJSON_FLOAT_MAX and value != 0:
+                return False
+        elif t is str:
+            if not value.isascii() or "\x7f" in value:
+                return False
+        elif t is int:
+            if not _ORJSON_INT_MIN <= value < _ORJSON_INT_LIMIT:
+                return False
+        elif t is list:
+            for item in value:
+                if type(item) is not str or not item.isascii() or "\x7f" in item:
+                    return False
+        elif t is not bool:
+            return False
+    return True
+
+
+def dumps(obj: dict[str, Any], *, compact: bool = True) -> str:
+    """Encode a flat ``Decoded``-style dict as JSON text.
+
+    ``compact`` selects ``separators=(",", ":")``; otherwise the
+    stdlib default ``(", ", ": ")`` is used. Either way the result
+    equals ``json.dumps(obj, separators=..., default=str)``.
+    """
+    if not compact:
+        return _SPACED.encode(obj)
+    if orjson is not None and _orjson_exact(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # non-str keys; the stdlib path coerces them
+    return _COMPACT.encode(obj)
@@ -5,6 +5,8 @@ calls so that:
 
 - Comm-B BDS 5,0/6,0 disambiguation can use prior groundspeed/track/
   heading observations.
+- Comm-B inference skips heuristic registers an aircraft did not list
+  in its last BDS 1,7 capability report.
 - DF20/21 ICAO verification can match against ICAOs learned from
   prior DF11/DF17/DF18 messages.
 - Even/odd CPR frame pairs can be matched within a configurable
@@ -32,12 +34,15 @@ no locking is needed -- just don't share the decoder across threads.
 from __future__ import annotations
 
 from math import asin, cos, radians, sin, sqrt
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pyModeS._aero import gs_to_ias, gs_to_mach
 from pyModeS.errors import InvalidHexError, InvalidLengthError
 from pyModeS.message import Decoded, Message
 
+if TYPE_CHECKING:
+    from pyModeS.decoder.bds._infer import CacheInfo
+
 # Size of the rolling per-ICAO position-history window used for the
 # motion-consistency check. Five entries is large enough that a short
 # burst of phantom positions at stream start cannot permanently poison
@@ -68,8 +73,9 @@ def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 
 # Maps decoded field names → "known" dict key names. The known
-# keys MUST match what _infer._SCORE_FIELDS_BDS50 / _BDS60 expect,
-# otherwise Phase 3 disambiguation will silently fail.
+# keys MUST match what _infer._SCORE_FIELDS_BDS50 / _BDS60 (and the
+# `supported_bds` capability filter) expect, otherwise Phase 3
+# disambiguation will silently fail.
 _DECODED_TO_KNOWN: dict[str, str] = {
     "groundspeed": "groundspeed",  # BDS 0,9 + BDS 0,6 + BDS 5,0
     "track": "track",  # BDS 0,9 + BDS 0,6
@@ -80,6 +86,10 @@ _DECODED_TO_KNOWN: dict[str, str] = {
     "true_airspeed": "tas",  # BDS 5,0
     "mach": "mach",  # BDS 6,0
     "altitude": "altitude",  # informational; not in scoring tables
+    # BDS 1,7 capability report; lets _infer skip heuristic validators
+    # for registers this aircraft never advertised. Only kept from
+    # replies with a verified ICAO (see _update_state).
+    "supported_bds": "supported_bds",
 }
 
 # BDS-payload fields cleared from a DF20 result that fails altitude
@@ -160,6 +170,24 @@ def _track_tolerance(dt: float) -> float:
     return max(20.0, min(dt * 10.0, 180.0))
 
 
+def _raw_hex(msg: str | bytes | int, length: int | None) -> str:
+    """Hex form of a rejected input, for the error dict's ``raw_msg``."""
+    if isinstance(msg, str):
+        return msg
+    if isinstance(msg, bytes):
+        return msg.hex().upper()
+    return f"{msg:0{(length or 112) // 4}X}"
+
+
+def _infer_cache_info() -> CacheInfo:
+    """Counters of the process-wide Comm-B inference caches."""
+    # Imported here: the decoder package must load after
+    # pyModeS.message, which the imports above guarantee by now.
+    from pyModeS.decoder.bds._infer import cache_info
+
+    return cache_info()
+
+
 class PipeDecoder:
     """Stateful Mode-S decoder with per-ICAO state and CPR pair matching.
 
@@ -181,6 +209,7 @@ class PipeDecoder:
         "_bootstrap",
         "_eviction_ttl",
         "_full_dict",
+        "_infer_base",
         "_max_speed_kmps",
         "_motion_margin_km",
         "_pair_window",
@@ -268,15 +297,25 @@ class PipeDecoder:
             "bootstrap_held": 0,
             "bootstrap_reset": 0,
         }
+        # The Comm-B inference caches are process-wide; stats reports
+        # their counters relative to this snapshot.
+        self._infer_base = _infer_cache_info()
 
     def decode(
         self,
-        msg: str,
+        msg: str | bytes | int,
         *,
         timestamp: float | None = None,
+        length: int | None = None,
     ) -> Decoded:
         """Decode a single message.
 
+        ``msg`` is a hex string, the raw message bytes, or the message
+        as an int with its bit ``length`` (56 or 112, default 112) —
+        the same forms :class:`Message` accepts. Binary sources such
+        as a Beast feed can pass bytes straight through without a hex
+        round trip.
+
         Looks up any prior per-ICAO state and forwards it as ``known=``
         to :meth:`Message.decode` so Comm-B BDS 5,0/6,0 disambiguation
         can score candidates against recent observations. After the
@@ -288,9 +327,9 @@ class PipeDecoder:
         self._stats["total"] += 1
 
         try:
-            message = Message(msg)
+            message = Message(msg, length=length)
         except (InvalidHexError, InvalidLengthError) as e:
-            return Decoded({"error": str(e), "raw_msg": msg})
+            return Decoded({"error": str(e), "raw_msg": _raw_hex(msg, length)})
 
         # Look up prior state for this ICAO so the decoder can use it
         # for Comm-B BDS 5,0/6,0 disambiguation. Filter out housekeeping
@@ -890,6 +929,16 @@ class PipeDecoder:
             self._bootstrap[icao] = []
             self._stats["bootstrap_reset"] += 1
 
+    def expire(self, now: float) -> None:
+        """Drop state and pending frames older than ``eviction_ttl``.
+
+        :meth:`decode` does this on every timestamped call. Call it
+        directly to advance the clock of a decoder that only sees part
+        of a stream (e.g. one ICAO partition), so it evicts exactly
+        what a decoder fed the whole stream would have.
+        """
+        self._evict_expired(now)
+
     def flush(self) -> None:
         """Finalize any still-bootstrapping ICAOs, retro-filling lat/lon
         on held result dicts wherever possible.
@@ -916,6 +965,33 @@ class PipeDecoder:
             else:
                 self._bootstrap_try_lock(icao, min_candidates=2)
 
+    def holds(self, result: Decoded, *, now: float | None = None) -> bool:
+        """Return True while the pipe may still write to ``result``.
+
+        A result dict returned by :meth:`decode` can be updated after
+        the fact in two ways: a pending CPR frame gets ``latitude`` /
+        ``longitude`` when its opposite parity arrives, and a
+        bootstrap-held pair is retro-filled when its ICAO's cluster
+        locks (or on :meth:`flush`). Streaming consumers use this to
+        decide when a result is final and safe to emit.
+
+        ``now`` is the timestamp of the most recent decode call. When
+        given, pending frames older than ``pair_window`` no longer
+        count as held — assuming non-decreasing timestamps, nothing
+        can pair with them any more.
+        """
+        icao = result.get("icao")
+        if icao is None:
+            return False
+        for entry in self._bootstrap.get(icao, ()):
+            if any(rd is result for rd in entry[3]):
+                return True
+        for pending in (self._pending_even, self._pending_odd):
+            for t, _lat, _lon, rd in pending.get(icao, ()):
+                if rd is result and (now is None or now - t <= self._pair_window):
+                    return True
+        return False
+
     def _handle_cpr_pair(
         self,
         result: Decoded,
@@ -1084,6 +1160,12 @@ class PipeDecoder:
             if val is not None:
                 new_fields[known_key] = val
 
+        # A capability map rules registers out for good, and is_bds17
+        # is a weak test: a misread 1,7 from an unverified address
+        # would silence 4,0/5,0/6,0 for the aircraft it landed on.
+        if "supported_bds" in new_fields and result.get("icao_verified") is not True:
+            del new_fields["supported_bds"]
+
         # BDS 0,9 subtype 3/4 emits a polymorphic `airspeed` field
         # discriminated by `airspeed_type` ("IAS" or "TAS"). Route to
         # the appropriate known-state slot so Phase 3 disambiguation
@@ -1105,8 +1187,22 @@ class PipeDecoder:
 
     @property
     def stats(self) -> dict[str, int]:
-        """Return a snapshot of internal counters."""
-        return dict(self._stats)
+        """Return a snapshot of internal counters.
+
+        The ``infer_*`` entries count Comm-B inference cache lookups
+        since the decoder was created or reset. The caches are shared
+        by every decoder in the process, so they include the lookups
+        of any other decoder running alongside this one.
+        """
+        stats = dict(self._stats)
+        now = _infer_cache_info()
+        base = self._infer_base
+        # max(): the counters restart if the caches are cleared.
+        stats["infer_cache_hits"] = max(now.hits - base.hits, 0)
+        stats["infer_cache_misses"] = max(now.misses - base.misses, 0)
+        stats["infer_score_hits"] = max(now.score_hits - base.score_hits, 0)
+        stats["infer_score_misses"] = max(now.score_misses - base.score_misses, 0)
+        return stats
 
     def reset(self) -> None:
         """Clear all per-ICAO state and counters."""
@@ -1120,3 +1216,4 @@ class PipeDecoder:
         self._bootstrap.clear()
         for k in self._stats:
             self._stats[k] = 0
+        self._infer_base = _infer_cache_info()
@@ -80,7 +80,7 @@ _FULL_SCHEMA: dict[str, type | str] = {
     "geo_minus_baro": "int | None",
     "nac_v": "int | None",
     # BDS 1,0 data link capability
-    "config": "int | None",
+    "config": "bool | None",
     "overlay_command_capability": "bool | None",
     "acas_operational": "bool | None",
     "mode_s_subnetwork_version": "int | None",
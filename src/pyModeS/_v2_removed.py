@@ -18,7 +18,10 @@ so the error text stays uniform across every v2 touchpoint:
    import X``, ``import pyModeS.commb``, and nested paths like
    ``from pyModeS.bds.bds05 import altitude`` — the
    ``pyModeS.bds`` parent shim fires before the nested module
-   is ever resolved.
+   is ever resolved. The finder sits at the *tail* of
+   ``sys.meta_path``: the removed names have no file on disk,
+   so the regular ``PathFinder`` always misses them first, and
+   every other import in the process never reaches our hook.
 
 2. A module-level ``__getattr__`` in ``pyModeS/__init__.py``
    (PEP 562) catches bare attribute access like
@@ -37,12 +40,19 @@ pointing at ``modes live`` / ``modes decode``.
 
 from __future__ import annotations
 
-import importlib.abc
 import importlib.machinery
 import sys
-from collections.abc import Sequence
-from types import ModuleType
-from typing import NoReturn
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.abc import Loader as _LoaderBase
+    from importlib.abc import MetaPathFinder as _FinderBase
+    from types import ModuleType
+    from typing import NoReturn
+else:
+    _LoaderBase = object
+    _FinderBase = object
 
 _MIGRATION_URL = "https://github.com/junzis/pyModeS/blob/main/docs/migration.md"
 
@@ -144,7 +154,7 @@ def raise_v2_removed(qualname: str) -> NoReturn:
     raise v2_removed_error(qualname, hint=_V2_HINTS.get(qualname))
 
 
-class _V2RemovedLoader(importlib.abc.Loader):
+class _V2RemovedLoader(_LoaderBase):
     """Loader that raises V2APIRemovedError instead of executing a module.
 
     The meta-path finder attaches this loader to the spec it
@@ -152,6 +162,11 @@ class _V2RemovedLoader(importlib.abc.Loader):
     ``exec_module``, we raise — the module never populates
     ``sys.modules``, so a subsequent import retries from scratch
     rather than replaying a stale, partially-initialised shim.
+
+    Only subclasses ``importlib.abc.Loader`` for the type checker;
+    at runtime it's a plain class, because importing ``importlib.abc``
+    drags in ``importlib.resources`` and ``tempfile``, which used to
+    be the single largest item in ``import pyModeS``.
     """
 
     def __init__(self, qualname: str) -> None:
@@ -170,7 +185,7 @@ class _V2RemovedLoader(importlib.abc.Loader):
         raise_v2_removed(self.qualname)
 
 
-class _V2RemovedFinder(importlib.abc.MetaPathFinder):
+class _V2RemovedFinder(_FinderBase):
     """Meta-path finder that intercepts removed-v2 submodule imports.
 
     Direct matches (``pyModeS.adsb``, ``pyModeS.common``, ...) and
@@ -187,6 +202,8 @@ class _V2RemovedFinder(importlib.abc.MetaPathFinder):
         path: Sequence[str] | None,
         target: ModuleType | None = None,
     ) -> importlib.machinery.ModuleSpec | None:
+        if not fullname.startswith("pyModeS."):
+            return None
         if fullname in _V2_REMOVED_MODULES:
             return importlib.machinery.ModuleSpec(
                 fullname, _V2RemovedLoader(fullname), is_package=False
@@ -195,11 +212,11 @@ class _V2RemovedFinder(importlib.abc.MetaPathFinder):
         # Report the parent shim's name in the error so users see
         # "pyModeS.bds is part of the v2 API" rather than a
         # confusing "pyModeS.bds.bds05" they may not recognise.
-        for removed in _V2_REMOVED_MODULES:
-            if fullname.startswith(f"{removed}."):
-                return importlib.machinery.ModuleSpec(
-                    fullname, _V2RemovedLoader(removed), is_package=False
-                )
+        parent = ".".join(fullname.split(".", 2)[:2])
+        if parent in _V2_REMOVED_MODULES:
+            return importlib.machinery.ModuleSpec(
+                fullname, _V2RemovedLoader(parent), is_package=False
+            )
         return None
 
 
@@ -207,13 +224,15 @@ _FINDER: _V2RemovedFinder = _V2RemovedFinder()
 
 
 def install_v2_removed_finder() -> None:
-    """Install :class:`_V2RemovedFinder` at the head of ``sys.meta_path``.
+    """Append :class:`_V2RemovedFinder` to the end of ``sys.meta_path``.
 
     Idempotent — repeated calls are a no-op. Called from
-    :mod:`pyModeS` at package import time.
+    :mod:`pyModeS` at package import time. Appending rather than
+    inserting at the head means the finder is only consulted for
+    imports every standard finder has already failed to resolve.
     """
     if _FINDER not in sys.meta_path:
-        sys.meta_path.insert(0, _FINDER)
+        sys.meta_path.append(_FINDER)
 
 
 def modeslive_main() -> int:
@@ -1,13 +1,15 @@
 """pyModeS command-line interface.
 
-Two subcommands:
+Three subcommands:
 
 - ``modes decode`` — one-shot or file-based hex → JSON decoder
 - ``modes live`` — streaming TCP → PipeDecoder → JSON-lines or textual TUI
+- ``modes replay`` — serve a recorded capture as a Beast TCP feed
 
 The entry point is registered in ``pyproject.toml`` as ``modes``. The
 full implementation lives in the sibling modules in this package:
-``_args``, ``decode``, ``live``, ``_source``, ``_sink``, ``_tui``.
+``_args``, ``decode``, ``live``, ``replay``, ``_source``, ``_sink``,
+``_tui``.
 """
 
 from __future__ import annotations
@@ -33,8 +35,9 @@ def main(argv: list[str] | None = None) -> int:
     """CLI entry point. Returns the exit code.
 
     Delegates to :mod:`pyModeS.cli._args` for argument parsing and
-    dispatches to ``decode.run`` or ``live.run`` based on the chosen
-    subcommand. Returns 0 on normal exit, non-zero on error.
+    dispatches to ``decode.run``, ``live.run`` or ``replay.run`` based
+    on the chosen subcommand. Returns 0 on normal exit, non-zero on
+    error.
     """
     from pyModeS.cli._args import build_parser, validate_args
 
@@ -46,6 +49,8 @@ def main(argv: list[str] | None = None) -> int:
         return _load_runner("decode")(args)
     if args.command == "live":
         return _load_runner("live")(args)
+    if args.command == "replay":
+        return _load_runner("replay")(args)
 
     parser.print_help()
     return 2
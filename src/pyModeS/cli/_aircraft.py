@@ -0,0 +1,258 @@
+"""Aircraft table state behind ``modes live --tui``.
+
+Kept free of textual so the bookkeeping can be used and tested
+without the ``pyModeS[tui]`` extra.
+
+- :class:`AircraftStore` is written by the TUI's decode worker. It
+  merges the tracked fields of each decoded message into a per-ICAO
+  state dict and remembers which aircraft changed since the UI last
+  asked: ``changed`` when a tracked field took a new value or the
+  aircraft is new, ``seen`` whenever a message arrived.
+- :class:`AircraftIndex` is owned by the UI thread. It holds the
+  aircraft that pass the search filter and haven't expired, in sort
+  order, and on every refresh re-positions only the aircraft the
+  store reports. Expiry walks a recency list from its oldest end, so
+  it stops at the first aircraft still alive.
+
+Between them a refresh costs O(changes · log n) plus the rows on
+screen, instead of a filter, sort and diff over every aircraft.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Fields the worker copies out of each decoded message into the
+# per-ICAO state. Covers every column across every responsive
+# breakpoint. Comm-B and ADS-B use slightly different names for
+# several concepts (vertical rate, track, altitude); both are
+# captured so the UI can render whichever was most recently
+# observed.
+TRACKED_FIELDS: frozenset[str] = frozenset(
+    {
+        "callsign",
+        "squawk",
+        "latitude",
+        "longitude",
+        "altitude",
+        "selected_altitude_mcp",
+        "selected_altitude_fms",
+        "groundspeed",
+        "true_airspeed",
+        "indicated_airspeed",
+        "mach",
+        "vertical_rate",
+        "baro_vertical_rate",
+        "inertial_vertical_rate",
+        "track",
+        "true_track",
+        "heading",
+        "magnetic_heading",
+        "roll",
+        "nac_p",
+    }
+)
+
+# Aircraft older than this are hidden from the table (matches
+# PipeDecoder.eviction_ttl default of 300 seconds).
+EXPIRE_SECONDS: float = 300.0
+
+
+def sort_value(icao: str, state: Mapping[str, Any], key: str) -> Any:
+    """Return a sortable value for the given sort key.
+
+    Missing fields sort to the end in ascending order (and so to the
+    start in descending order).
+    """
+    if key == "last_seen":
+        return state.get("_last_seen", 0.0)
+    if key == "icao":
+        return icao
+    if key == "callsign":
+        return state.get("callsign") or "\uffff"
+    if key == "altitude":
+        v = state.get("altitude")
+        return float("inf") if v is None else float(v)
+    if key == "groundspeed":
+        v = state.get("groundspeed")
+        return float("inf") if v is None else float(v)
+    if key == "vertical_rate":
+        v = state.get("vertical_rate") or state.get("baro_vertical_rate")
+        return float("inf") if v is None else float(v)
+    return 0
+
+
+class AircraftStore:
+    """Per-aircraft state shared between the decode worker and the UI.
+
+    ``states`` sees single-key writes from the worker (GIL-atomic
+    under CPython) and per-key reads from the UI. The dirty sets are
+    swapped under a lock once per burst and once per refresh.
+    """
+
+    def __init__(self) -> None:
+        self.states: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._changed: set[str] = set()
+        self._seen: set[str] = set()
+
+    def merge(self, records: Iterable[tuple[str, Mapping[str, Any], float]]) -> None:
+        """Merge one burst of ``(icao, decoded, timestamp)`` records."""
+        states = self.states
+        changed: set[str] = set()
+        seen: set[str] = set()
+        for icao, decoded, ts in records:
+            seen.add(icao)
+            state = states.get(icao)
+            if state is None:
+                state = {"_first_seen": ts, "_last_seen": ts}
+                states[icao] = state
+                changed.add(icao)
+            else:
+                state["_last_seen"] = ts
+            # Only the few keys a message actually carries are looked
+            # at, rather than every tracked field.
+            for key in TRACKED_FIELDS.intersection(decoded):
+                val = decoded[key]
+                if val is not None and state.get(key) != val:
+                    state[key] = val
+                    changed.add(icao)
+        if seen:
+            with self._lock:
+                self._changed |= changed
+                self._seen |= seen
+
+    def drain(self) -> tuple[set[str], set[str]]:
+        """Return and reset the ``(changed, seen)`` ICAO sets."""
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            seen, self._seen = self._seen, set()
+        return changed, seen
+
+
+class AircraftIndex:
+    """The filtered, sorted aircraft list shown by the TUI.
+
+    Entries are ``(sort value, icao)`` tuples kept sorted ascending;
+    ``ascending=False`` only changes how positions are read, so
+    reversing the order is free.
+    """
+
+    def __init__(
+        self,
+        states: Mapping[str, Mapping[str, Any]],
+        *,
+        sort_key: str = "icao",
+        ascending: bool = True,
+        query: str = "",
+    ) -> None:
+        self._states = states
+        self.sort_key = sort_key
+        self.ascending = ascending
+        self.query = query
+        self._entries: list[tuple[Any, str]] = []
+        self._entry: dict[str, tuple[Any, str]] = {}
+        # Every unexpired aircraft, least recently seen first, so
+        # expiry only looks at the oldest end.
+        self._recency: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def tracked(self) -> int:
+        """Unexpired aircraft, whether or not they match the query."""
+        return len(self._recency)
+
+    def resort(self, now: float, *, sort_key: str, query: str) -> None:
+        """Rebuild the index for a new sort key or search query."""
+        self.sort_key = sort_key
+        self.query = query
+        self._entries = []
+        self._entry = {}
+        cutoff = now - EXPIRE_SECONDS
+        for icao, state in list(self._states.items()):
+            if state.get("_last_seen", 0.0) < cutoff:
+                continue
+            self._recency.setdefault(icao)
+            entry = self._make_entry(icao, state)
+            if entry is not None:
+                self._entry[icao] = entry
+                self._entries.append(entry)
+        self._entries.sort()
+
+    def apply(self, changed: set[str], seen: set[str], now: float) -> None:
+        """Re-position ``changed`` aircraft and expire stale ones.
+
+        ``seen`` aircraft only move when the table is sorted by
+        last-seen time; otherwise their position can't have changed.
+        """
+        recency = self._recency
+        # Aircraft back from expiry are listed again even if none of
+        # their fields changed.
+        returned = seen.difference(recency)
+        states = self._states
+        for icao in sorted(seen, key=lambda i: states[i]["_last_seen"]):
+            recency[icao] = None
+            recency.move_to_end(icao)
+        moved = changed | seen if self.sort_key == "last_seen" else changed
+        for icao in moved | returned:
+            self._place(icao)
+        cutoff = now - EXPIRE_SECONDS
+        while recency:
+            icao = next(iter(recency))
+            if states.get(icao, {}).get("_last_seen", 0.0) >= cutoff:
+                break
+            del recency[icao]
+            self._remove(icao)
+
+    def position(self, icao: str) -> int | None:
+        """Row number of ``icao``, or None if it isn't listed."""
+        entry = self._entry.get(icao)
+        if entry is None:
+            return None
+        i = bisect_left(self._entries, entry)
+        return i if self.ascending else len(self._entries) - 1 - i
+
+    def at(self, position: int) -> str:
+        """ICAO at row ``position``."""
+        if not self.ascending:
+            position = len(self._entries) - 1 - position
+        return self._entries[position][1]
+
+    def window(self, start: int, count: int) -> list[str]:
+        """ICAOs of rows ``start`` to ``start + count``, in display order."""
+        if self.ascending:
+            return [icao for _, icao in self._entries[start : start + count]]
+        n = len(self._entries)
+        lo, hi = max(0, n - start - count), max(0, n - start)
+        return [icao for _, icao in reversed(self._entries[lo:hi])]
+
+    def _make_entry(
+        self, icao: str, state: Mapping[str, Any]
+    ) -> tuple[Any, str] | None:
+        query = self.query.lower()
+        if query:
+            callsign = str(state.get("callsign") or "").lower()
+            if query not in icao.lower() and query not in callsign:
+                return None
+        return (sort_value(icao, state, self.sort_key), icao)
+
+    def _place(self, icao: str) -> None:
+        self._remove(icao)
+        state = self._states.get(icao)
+        if state is None or icao not in self._recency:
+            return
+        entry = self._make_entry(icao, state)
+        if entry is not None:
+            self._entry[icao] = entry
+            insort(self._entries, entry)
+
+    def _remove(self, icao: str) -> None:
+        entry = self._entry.pop(icao, None)
+        if entry is not None:
+            del self._entries[bisect_left(self._entries, entry)]
@@ -2,12 +2,33 @@
 
 Kept in a separate module so ``test_cli_args.py`` can exercise the
 flag surface without importing the heavier ``decode``, ``live``,
-``_source``, ``_sink``, ``_tui`` modules.
+``_source``, ``_sink``, ``_tui`` modules. Also holds the small
+helpers the subcommands share for listen addresses and SIGTERM.
 """
 
 from __future__ import annotations
 
 import argparse
+import math
+import signal
+from pathlib import PurePath
+from types import FrameType
+from typing import Any
+
+# --dump-format inferred from the --dump-to suffix when not given.
+_DUMP_SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+}
+
+# Compression suffixes handled by cli._compress (jsonl dumps only).
+_COMPRESSED_SUFFIXES = (".gz", ".zst", ".zstd")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -16,13 +37,15 @@ def build_parser() -> argparse.ArgumentParser:
         prog="modes",
         description=(
             "pyModeS command-line tool. Use `modes decode MESSAGE` for one-shot "
-            "decoding or `modes live --network HOST:PORT` for streaming."
+            "decoding, `modes live --network HOST:PORT` for streaming, or "
+            "`modes replay --file PATH` to serve a capture as a Beast feed."
         ),
     )
     subparsers = parser.add_subparsers(dest="command", metavar="SUBCOMMAND")
 
     _add_decode_parser(subparsers)
     _add_live_parser(subparsers)
+    _add_replay_parser(subparsers)
 
     return parser
 
@@ -44,6 +67,9 @@ def _add_decode_parser(
             "  modes decode 8D406B902015A678D4D220AA4BDA --compact | jq .\n"
             "  modes decode --file captures/lfbo.csv --surface-ref LFBO\n"
             "  modes decode --file - --compact < capture.log\n"
+            "  modes decode --file day.csv --compact --jobs 8 > day.jsonl\n"
+            "  modes decode --file day.csv --jobs 8 --dump-to day.parquet "
+            "(requires pyModeS[arrow])\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -60,7 +86,8 @@ def _add_decode_parser(
         "--file",
         metavar="PATH",
         default=None,
-        help="Read hex messages from a file (one per line or 'timestamp,hex' CSV). "
+        help="Read hex messages from a file (one per line or 'timestamp,hex' CSV) "
+        "or a raw Beast binary capture, optionally .gz/.zst compressed. "
         "Use '-' for stdin.",
     )
 
@@ -89,6 +116,46 @@ def _add_decode_parser(
         default=None,
         help="Surface CPR reference: airport ICAO code (e.g. LFBO) or 'lat,lon'.",
     )
+    decode_p.add_argument(
+        "--mlat-hz",
+        type=float,
+        metavar="HZ",
+        default=None,
+        help="MLAT tick rate of a Beast binary --file (12e6 for dump1090, "
+        "1e9 for radarcape); inferred from the capture by default.",
+    )
+    decode_p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        default=1,
+        help="Decode --file input in N worker processes, partitioned by ICAO "
+        "(default: 1).",
+    )
+    decode_p.add_argument(
+        "--unordered",
+        action="store_true",
+        help="With --jobs, emit records as workers finish them instead of "
+        "in input order.",
+    )
+    decode_p.add_argument(
+        "--check",
+        type=int,
+        nargs="?",
+        const=10000,
+        metavar="LINES",
+        default=None,
+        help="With --jobs, decode the first LINES records (default 10000) "
+        "serially and in parallel and report whether the outputs match.",
+    )
+    decode_p.add_argument(
+        "--dump-to",
+        metavar="FILE",
+        default=None,
+        help="Write the decoded records to FILE instead of stdout.",
+    )
+    _add_dump_format_options(decode_p)
 
 
 def _add_live_parser(
@@ -98,26 +165,66 @@ def _add_live_parser(
         "live",
         help="Stream decode from a network TCP source.",
         description=(
-            "Connect to a dump1090-style TCP feed, parse Mode-S Beast "
-            "binary frames, and emit decoded JSON lines to stdout or a "
-            "rich-based live aircraft table."
+            "Connect to a dump1090-style TCP feed (or read one from a Unix "
+            "socket or stdin), parse Mode-S Beast binary frames, and emit "
+            "decoded JSON lines to stdout or a rich-based live aircraft table."
         ),
         epilog=(
             "Examples:\n"
             "  modes live --network localhost:30005\n"
             "  modes live --network airsquitter.lr.tudelft.nl:10006\n"
+            "  modes live --network rx1:30005 --network rx2:30005\n"
+            "  modes live --unix /run/readsb/beast.sock\n"
+            "  nc localhost 30005 | modes live --beast-stdin --quiet "
+            "--dump-to traffic.db\n"
             "  modes live --network host:30002 --dump-to flight.jsonl\n"
+            "  modes live --network host:30002 --dump-to flight.jsonl "
+            "--flush-ms 500\n"
+            "  modes live --network host:30002 --quiet --dump-to flight.parquet "
+            "--rotate-seconds 3600  (requires pyModeS[arrow])\n"
+            "  modes live --network host:30002 --quiet --dump-to traffic.db\n"
+            "  modes live --network host:30002 --quiet --metrics 9108\n"
+            "  modes live --network host:30002 --quiet --dump-to traffic.db "
+            "--jobs 4\n"
+            "  modes live --network rx1:30005 --network rx2:30005 --quiet "
+            "--dump-to traffic.db --shed dup,commb,sample\n"
+            "  modes live --network host:30002 --quiet --serve 30154  "
+            "(then: nc localhost 30154)\n"
+            "  modes live --network host:30005 --quiet --relay 30105 "
+            "--relay-df 17,18 --relay-crc --relay-file adsb.beast.zst\n"
             "  modes live --network host:30002 --tui  (requires pyModeS[tui])\n"
             "  modes live --network host:30002 --quiet --dump-to flight.jsonl\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    live_p.add_argument(
+    feed = live_p.add_mutually_exclusive_group(required=True)
+    feed.add_argument(
         "--network",
         metavar="HOST:PORT",
-        required=True,
-        help="TCP endpoint of the Mode-S feed, in host:port form.",
+        action="append",
+        help=(
+            "TCP endpoint of the Mode-S feed, in host:port form. Repeat "
+            "to merge several receivers into one timestamp-ordered stream "
+            "decoded with shared state."
+        ),
+    )
+    feed.add_argument(
+        "--unix",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Read the Beast feed from a Unix stream socket instead, for a "
+            "receiver on the same host. Reconnects like --network."
+        ),
+    )
+    feed.add_argument(
+        "--beast-stdin",
+        action="store_true",
+        help=(
+            "Read the Beast feed from stdin, e.g. piped from nc or socat. "
+            "Ends at end of input."
+        ),
     )
     live_p.add_argument(
         "--surface-ref",
@@ -134,8 +241,38 @@ def _add_live_parser(
         "--dump-to",
         metavar="FILE",
         default=None,
-        help="Tee JSON lines to a file in addition to stdout.",
+        help="Tee decoded records to FILE, in --dump-format, in addition to stdout.",
+    )
+    live_p.add_argument(
+        "--flush-records",
+        metavar="N",
+        type=int,
+        default=None,
+        help=(
+            "Buffer --dump-to output and flush after N records "
+            "(default: flush every line; a SQLite --dump-to commits "
+            "every 10000 records or 1 s)."
+        ),
+    )
+    live_p.add_argument(
+        "--flush-bytes",
+        metavar="BYTES",
+        type=int,
+        default=None,
+        help="Buffer --dump-to output and flush once BYTES are pending.",
+    )
+    live_p.add_argument(
+        "--flush-ms",
+        metavar="MS",
+        type=float,
+        default=None,
+        help=(
+            "Buffer --dump-to output and flush once the oldest pending "
+            "line is MS milliseconds old. Combined limits flush on "
+            "whichever is reached first."
+        ),
     )
+    _add_dump_format_options(live_p)
     live_p.add_argument(
         "--tui",
         action="store_true",
@@ -146,6 +283,309 @@ def _add_live_parser(
         action="store_true",
         help="Suppress stdout output (use with --dump-to).",
     )
+    live_p.add_argument(
+        "--metrics",
+        metavar="[HOST:]PORT",
+        default=None,
+        help=(
+            "Serve Prometheus metrics on http://HOST:PORT/metrics (HOST "
+            "defaults to 127.0.0.1): decoder counters, messages by DF, "
+            "reconnects, parser resyncs, sink queue depth and decode latency."
+        ),
+    )
+    live_p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        default=None,
+        help=(
+            "Run as a pipeline of processes: a reader parsing frames into "
+            "shared-memory rings, N decoders partitioned by ICAO, and a "
+            "writer for the output. The reader drops frames (counted as "
+            "overruns) rather than stall the feed when decoding or output "
+            "falls behind."
+        ),
+    )
+    live_p.add_argument(
+        "--serve",
+        metavar="[HOST:]PORT|unix:PATH",
+        default=None,
+        help=(
+            "Also serve the decoded records as JSON lines to any number of "
+            "local clients, on a TCP port (HOST defaults to 127.0.0.1) or a "
+            "Unix socket. Each record is encoded once for all clients; a "
+            "client that falls behind is disconnected."
+        ),
+    )
+    live_p.add_argument(
+        "--relay",
+        metavar="[HOST:]PORT|unix:PATH",
+        default=None,
+        help=(
+            "Re-emit the feed's raw Beast frames, MLAT counter and signal "
+            "level included, to any number of clients on a TCP port (HOST "
+            "defaults to 127.0.0.1) or a Unix socket. Frames are filtered "
+            "by --relay-df, --relay-icao and --relay-crc before decoding."
+        ),
+    )
+    live_p.add_argument(
+        "--relay-file",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Append the relayed Beast frames to PATH, a raw .beast capture "
+            "(compressed if it ends in .gz or .zst)."
+        ),
+    )
+    live_p.add_argument(
+        "--relay-df",
+        metavar="DF[,DF...]",
+        type=_parse_dfs,
+        default=None,
+        help="Relay only these downlink formats, e.g. 17,18 or 20,21.",
+    )
+    live_p.add_argument(
+        "--relay-icao",
+        metavar="ICAO[,ICAO...]",
+        type=_parse_icaos,
+        default=None,
+        help="Relay only frames of these 24-bit addresses (hex).",
+    )
+    live_p.add_argument(
+        "--relay-crc",
+        action="store_true",
+        help=(
+            "Relay only frames whose parity checks out: DF17/18 with a valid "
+            "CRC, DF11 with an interrogator code, and replies from aircraft "
+            "already heard in a valid DF17/18."
+        ),
+    )
+    live_p.add_argument(
+        "--shed",
+        metavar="POLICY[,POLICY...]",
+        type=_parse_shed,
+        default=None,
+        help=(
+            "Read the feed ahead into a bounded queue and, as it fills, "
+            "drop frames by these policies in order: 'dup' (repeated "
+            "payloads), 'commb' (DF20/21 Comm-B replies), 'sample' (at most "
+            "two frames per aircraft per second). Keeps the connection up "
+            "when decoding or output falls behind; drops are counted."
+        ),
+    )
+    live_p.add_argument(
+        "--queue-frames",
+        metavar="N",
+        type=int,
+        default=None,
+        help=(
+            "Frames buffered between the feed and decoding: the --shed "
+            "queue, or each decoder's ring with --jobs (default: 65536)."
+        ),
+    )
+
+
+def _add_replay_parser(
+    subparsers: argparse._SubParsersAction,  # type: ignore[type-arg]
+) -> None:
+    replay_p = subparsers.add_parser(
+        "replay",
+        help="Serve a recorded capture as a Beast TCP feed.",
+        description=(
+            "Replay a hex/CSV or raw Beast capture as a Mode-S Beast TCP "
+            "feed, at the recorded pace or sped up, for `modes live` or any "
+            "other Beast consumer to connect to. Starts when the first "
+            "client connects and reports frames/s and consumer lag on stderr."
+        ),
+        epilog=(
+            "Examples:\n"
+            "  modes replay --file day.beast\n"
+            "  modes replay --file day.csv.gz --speed 10 --listen 0.0.0.0:30005\n"
+            "  modes replay --file day.csv --speed max --listen 40005\n"
+            "  modes live --network 127.0.0.1:30005  (in another terminal)\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    replay_p.add_argument(
+        "--file",
+        metavar="PATH",
+        required=True,
+        help=(
+            "Capture to replay: hex per line, 'timestamp,hex' CSV or raw "
+            "Beast, optionally .gz/.zst compressed. Use '-' for stdin."
+        ),
+    )
+    replay_p.add_argument(
+        "--listen",
+        metavar="[HOST:]PORT",
+        default="127.0.0.1:30005",
+        help="Address to serve the feed on (default: 127.0.0.1:30005).",
+    )
+    replay_p.add_argument(
+        "--speed",
+        metavar="FACTOR",
+        type=_parse_speed,
+        default=1.0,
+        help=(
+            "Speed-up over the recorded pace, e.g. 10 for 10x; 'max' sends "
+            "as fast as the clients read (default: 1)."
+        ),
+    )
+    replay_p.add_argument(
+        "--mlat-hz",
+        metavar="HZ",
+        type=float,
+        default=None,
+        help=(
+            "MLAT tick rate of a Beast capture (12e6 for dump1090/readsb, "
+            "1e9 for radarcape-style receivers); inferred when omitted."
+        ),
+    )
+    replay_p.add_argument(
+        "--stats-interval",
+        metavar="S",
+        type=float,
+        default=10.0,
+        help="Seconds between stats lines on stderr (default: 10).",
+    )
+
+
+def _parse_shed(value: str) -> tuple[str, ...]:
+    """``--shed``: comma-separated policies, in the order they engage."""
+    from pyModeS.cli._overload import SHED_POLICIES
+
+    policies = tuple(p.strip().lower() for p in value.split(","))
+    for policy in policies:
+        if policy not in SHED_POLICIES:
+            raise argparse.ArgumentTypeError(
+                f"unknown policy {policy!r} (choose from {', '.join(SHED_POLICIES)})"
+            )
+    if len(set(policies)) != len(policies):
+        raise argparse.ArgumentTypeError("each policy may be given once")
+    return policies
+
+
+def _parse_dfs(value: str) -> frozenset[int]:
+    """``--relay-df``: comma-separated downlink formats, 0-24."""
+    dfs = set()
+    for item in value.split(","):
+        try:
+            df = int(item)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"expected a downlink format number, got {item!r}"
+            ) from None
+        if not 0 <= df <= 24:
+            raise argparse.ArgumentTypeError(f"no downlink format {df}")
+        dfs.add(df)
+    if 24 in dfs:
+        # DF24 is "11" followed by anything in the 5-bit field.
+        dfs.update(range(25, 32))
+    return frozenset(dfs)
+
+
+def _parse_icaos(value: str) -> frozenset[int]:
+    """``--relay-icao``: comma-separated 6-digit hex addresses."""
+    icaos = set()
+    for item in value.split(","):
+        item = item.strip()
+        try:
+            if len(item) != 6:
+                raise ValueError
+            icaos.add(int(item, 16))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"expected a 6-digit hex ICAO address, got {item!r}"
+            ) from None
+    return frozenset(icaos)
+
+
+def _parse_speed(value: str) -> float:
+    """``--speed``: a positive factor, or ``max`` for no pacing."""
+    if value.lower() == "max":
+        return math.inf
+    try:
+        speed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected a number or 'max', got {value!r}"
+        ) from None
+    if not speed > 0:
+        raise argparse.ArgumentTypeError("must be positive")
+    return speed
+
+
+def _add_dump_format_options(p: argparse.ArgumentParser) -> None:
+    """``--dump-format`` and the columnar row-group/rotation flags."""
+    p.add_argument(
+        "--dump-format",
+        choices=("jsonl", "sqlite", "parquet", "arrow"),
+        default=None,
+        help=(
+            "Format of --dump-to: JSON lines, a SQLite database, Parquet, "
+            "or an Arrow IPC file (parquet/arrow require pyModeS[arrow]). "
+            "Inferred from the file suffix (.db, .sqlite, .sqlite3, "
+            ".parquet, .pq, .arrow, .feather, .ipc); jsonl otherwise. "
+            "A jsonl FILE ending in .gz or .zst is compressed."
+        ),
+    )
+    p.add_argument(
+        "--row-group-size",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Rows per Parquet row group / Arrow record batch (default: 65536).",
+    )
+    p.add_argument(
+        "--rotate-bytes",
+        metavar="BYTES",
+        type=int,
+        default=None,
+        help=(
+            "Start a new numbered parquet/arrow file (FILE stem + .0000, "
+            ".0001, ...) once the current one reaches BYTES."
+        ),
+    )
+    p.add_argument(
+        "--rotate-seconds",
+        metavar="S",
+        type=float,
+        default=None,
+        help="Start a new numbered parquet/arrow file every S seconds.",
+    )
+
+
+def _validate_dump_format(
+    args: argparse.Namespace, parser: argparse.ArgumentParser
+) -> None:
+    """Resolve ``--dump-format`` and check the flags that depend on it."""
+    if args.dump_to is None:
+        if args.dump_format is not None:
+            parser.error("--dump-format is only valid with --dump-to.")
+    else:
+        path = PurePath(args.dump_to)
+        compressed = path.suffix.lower() in _COMPRESSED_SUFFIXES
+        if compressed:
+            path = PurePath(path.stem)
+        if args.dump_format is None:
+            args.dump_format = _DUMP_SUFFIXES.get(path.suffix.lower(), "jsonl")
+        if compressed and args.dump_format != "jsonl":
+            parser.error(
+                f"only jsonl --dump-to files can be compressed, "
+                f"not {args.dump_format} ({args.dump_to})."
+            )
+    for flag, value in (
+        ("--row-group-size", args.row_group_size),
+        ("--rotate-bytes", args.rotate_bytes),
+        ("--rotate-seconds", args.rotate_seconds),
+    ):
+        if value is None:
+            continue
+        if args.dump_format not in ("parquet", "arrow"):
+            parser.error(f"{flag} requires --dump-to with a parquet or arrow format.")
+        if value <= 0:
+            parser.error(f"{flag} must be positive.")
 
 
 def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
@@ -160,6 +600,25 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
     and exits 2 — on the first violation.
     """
     if args.command == "decode":
+        if args.mlat_hz is not None and args.file is None:
+            parser.error("--mlat-hz is only valid with --file.")
+        if args.jobs < 1:
+            parser.error("--jobs must be at least 1.")
+        if args.jobs > 1 and args.file is None:
+            parser.error("--jobs is only valid with --file.")
+        if args.unordered and args.jobs == 1:
+            parser.error("--unordered requires --jobs N with N > 1.")
+        if args.check is not None and args.jobs == 1:
+            parser.error("--check requires --jobs N with N > 1.")
+        if args.dump_to is not None:
+            if args.message is not None and "," not in args.message:
+                parser.error(
+                    "--dump-to is only valid with --file or a comma-separated "
+                    "batch MESSAGE."
+                )
+            if args.check is not None:
+                parser.error("--check and --dump-to are mutually exclusive.")
+        _validate_dump_format(args, parser)
         if args.file is not None and args.reference is not None:
             parser.error(
                 "--reference is only valid with a single positional MESSAGE "
@@ -178,13 +637,110 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
             )
 
     if args.command == "live":
+        if args.tui and args.beast_stdin:
+            parser.error(
+                "--tui and --beast-stdin are mutually exclusive: the TUI "
+                "reads the keyboard from stdin."
+            )
         if args.tui and args.dump_to is not None:
             parser.error(
                 "--tui and --dump-to are mutually exclusive: the TUI takes "
                 "over the terminal and cannot tee to a file."
             )
+        if args.tui and args.metrics is not None:
+            parser.error(
+                "--tui and --metrics are mutually exclusive: the TUI drives "
+                "its own decode loop."
+            )
+        if args.jobs is not None and args.jobs < 1:
+            parser.error("--jobs must be at least 1.")
+        if args.tui and args.jobs is not None:
+            parser.error(
+                "--tui and --jobs are mutually exclusive: the TUI drives "
+                "its own decode loop."
+            )
         if args.tui and args.quiet:
             parser.error(
                 "--tui and --quiet are mutually exclusive: the TUI owns "
                 "stdout, there is nothing to suppress."
             )
+        if args.tui and args.serve is not None:
+            parser.error(
+                "--tui and --serve are mutually exclusive: the TUI drives "
+                "its own decode loop."
+            )
+        relaying = args.relay is not None or args.relay_file is not None
+        if args.tui and relaying:
+            parser.error(
+                "--tui and --relay/--relay-file are mutually exclusive: the "
+                "TUI drives its own source."
+            )
+        for flag, value in (
+            ("--relay-df", args.relay_df),
+            ("--relay-icao", args.relay_icao),
+            ("--relay-crc", args.relay_crc or None),
+        ):
+            if value is not None and not relaying:
+                parser.error(f"{flag} is only valid with --relay or --relay-file.")
+        if args.tui and args.shed is not None:
+            parser.error(
+                "--tui and --shed are mutually exclusive: the TUI drives "
+                "its own decode loop."
+            )
+        if args.queue_frames is not None:
+            if args.shed is None and args.jobs is None:
+                parser.error("--queue-frames is only valid with --shed or --jobs.")
+            if args.queue_frames < 1:
+                parser.error("--queue-frames must be at least 1.")
+        _validate_dump_format(args, parser)
+        for flag, value in (
+            ("--flush-records", args.flush_records),
+            ("--flush-bytes", args.flush_bytes),
+            ("--flush-ms", args.flush_ms),
+        ):
+            if value is None:
+                continue
+            if args.dump_to is None:
+                parser.error(f"{flag} is only valid with --dump-to.")
+            # SQLite batches transactions by record count and age.
+            if args.dump_format != "jsonl" and (
+                args.dump_format != "sqlite" or flag == "--flush-bytes"
+            ):
+                parser.error(
+                    f"{flag} does not apply to a {args.dump_format} --dump-to."
+                )
+            if value <= 0:
+                parser.error(f"{flag} must be positive.")
+
+    if args.command == "replay" and not args.stats_interval > 0:
+        parser.error("--stats-interval must be positive.")
+
+
+def parse_listen(value: str) -> tuple[str | None, int]:
+    """Split ``[HOST:]PORT``; HOST defaults to 127.0.0.1.
+
+    Returns (None, 0) on parse failure.
+    """
+    host, _, port_str = value.rpartition(":")
+    try:
+        port = int(port_str)
+    except ValueError:
+        return None, 0
+    if not 0 <= port < 65536:
+        return None, 0
+    return host or "127.0.0.1", port
+
+
+def interrupt_on_sigterm() -> Any:
+    """Raise KeyboardInterrupt on SIGTERM; return the previous handler.
+
+    Returns None off the main thread, where handlers can't be set.
+    """
+
+    def _handler(signum: int, frame: FrameType | None) -> None:
+        raise KeyboardInterrupt
+
+    try:
+        return signal.signal(signal.SIGTERM, _handler)
+    except ValueError:
+        return None
@@ -0,0 +1,266 @@
+"""Fan-out server for ``modes live --serve``.
+
+One ``modes live`` decodes the feed once and serves the result to any
+number of local consumers over TCP or a Unix socket, instead of every
+consumer opening its own connection to the receiver and decoding the
+same frames again.
+
+:class:`Broadcaster` is the server: a daemon thread accepts clients and
+writes to them from one selector loop. The producer calls
+:meth:`Broadcaster.send` with bytes, which only appends to each
+client's buffer and, if the thread was idle, wakes it. A client whose
+buffer grows past ``max_buffer`` bytes is disconnected rather than
+allowed to hold up the others or grow memory without bound.
+
+:class:`BroadcastSink` is the ``modes live`` sink on top: it encodes
+each record as a compact JSON line once, for all clients, and not at
+all while nobody is connected. Behind a ``TeeSink`` it shares that
+line with stdout and a JSON-lines ``--dump-to``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import selectors
+import socket
+import stat
+import threading
+from collections.abc import Callable
+
+from pyModeS._json import dumps
+from pyModeS.message import Decoded
+
+# Bytes a client may fall behind before it is dropped: a few seconds
+# of JSON lines from a busy feed.
+CLIENT_BUFFER = 4 << 20
+
+_RECV_SIZE = 4096
+
+
+class _Client:
+    __slots__ = ("buffer", "conn", "events", "name", "slow")
+
+    def __init__(self, conn: socket.socket, name: str) -> None:
+        self.conn = conn
+        self.name = name
+        self.buffer = bytearray()
+        self.events = selectors.EVENT_READ
+        self.slow = False
+
+
+class Broadcaster:
+    """Send the same bytes to every connected client, from a thread.
+
+    ``address`` is ``(host, port)`` for TCP or a filesystem path for a
+    Unix socket; the bound TCP address (useful with port 0) is in
+    ``address`` afterwards. ``log`` receives one line per client
+    connected or dropped. Raises OSError if the address can't be
+    bound.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] | str,
+        *,
+        max_buffer: int = CLIENT_BUFFER,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._path: str | None = None
+        if isinstance(address, str):
+            self._listener = _unix_listener(address)
+            self._path = address
+            self.address: tuple[str, int] | str = address
+        else:
+            self._listener = socket.create_server(address)
+            self.address = self._listener.getsockname()[:2]
+        self._listener.setblocking(False)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._max_buffer = max_buffer
+        self._log = log
+        self._lock = threading.Lock()
+        self._clients: dict[socket.socket, _Client] = {}
+        self._closing = False
+        # Clients disconnected for falling behind.
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._serve, name="pyModeS-serve", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def clients(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    def send(self, data: bytes) -> None:
+        """Queue ``data`` for every client."""
+        wake = False
+        with self._lock:
+            for client in self._clients.values():
+                if client.slow:
+                    continue
+                if not client.buffer:
+                    wake = True
+                client.buffer += data
+                if len(client.buffer) > self._max_buffer:
+                    client.slow = wake = True
+        if wake:
+            self._wake()
+
+    def close(self) -> None:
+        """Stop serving; what can be sent without blocking still is."""
+        self._closing = True
+        self._wake()
+        self._thread.join()
+
+    def _wake(self) -> None:
+        # A full wake-up socket already has the thread's attention.
+        with contextlib.suppress(OSError):
+            self._wake_w.send(b"\0")
+
+    def _serve(self) -> None:
+        sel = selectors.DefaultSelector()
+        sel.register(self._listener, selectors.EVENT_READ)
+        sel.register(self._wake_r, selectors.EVENT_READ)
+        try:
+            while not self._closing:
+                for key, events in sel.select():
+                    if key.fileobj is self._listener:
+                        self._accept(sel)
+                    elif key.fileobj is self._wake_r:
+                        with contextlib.suppress(OSError):
+                            self._wake_r.recv(_RECV_SIZE)
+                    else:
+                        self._service(sel, key.data, events)
+                self._update(sel)
+        finally:
+            for client in list(self._clients.values()):
+                with contextlib.suppress(OSError):
+                    client.conn.send(client.buffer)
+                self._drop(sel, client)
+            sel.close()
+            self._listener.close()
+            self._wake_r.close()
+            self._wake_w.close()
+            if self._path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(self._path)
+
+    def _accept(self, sel: selectors.BaseSelector) -> None:
+        while True:
+            try:
+                conn, peer = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            conn.setblocking(False)
+            if conn.family != socket.AF_UNIX:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            name = f"{peer[0]}:{peer[1]}" if isinstance(peer, tuple) else "unix"
+            client = _Client(conn, name)
+            with self._lock:
+                self._clients[conn] = client
+            sel.register(conn, client.events, client)
+            if self._log is not None:
+                self._log(f"client {name} connected")
+
+    def _service(
+        self, sel: selectors.BaseSelector, client: _Client, events: int
+    ) -> None:
+        try:
+            # Clients have nothing to say; reading only tells us when
+            # they hang up.
+            if events & selectors.EVENT_READ and not client.conn.recv(_RECV_SIZE):
+                self._drop(sel, client)
+                return
+            if events & selectors.EVENT_WRITE:
+                with self._lock:
+                    sent = client.conn.send(client.buffer)
+                    del client.buffer[:sent]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            self._drop(sel, client)
+
+    def _update(self, sel: selectors.BaseSelector) -> None:
+        """Drop slow clients; watch for writability where data waits."""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            if client.slow:
+                if self._log is not None:
+                    behind = len(client.buffer)
+                    self._log(
+                        f"dropped slow client {client.name} ({behind} bytes behind)"
+                    )
+                self.dropped += 1
+                self._drop(sel, client)
+                continue
+            events = selectors.EVENT_READ
+            if client.buffer:
+                events |= selectors.EVENT_WRITE
+            if events != client.events:
+                client.events = events
+                sel.modify(client.conn, events, client)
+
+    def _drop(self, sel: selectors.BaseSelector, client: _Client) -> None:
+        with self._lock:
+            if self._clients.pop(client.conn, None) is None:
+                return
+        with contextlib.suppress(KeyError, ValueError):
+            sel.unregister(client.conn)
+        client.conn.close()
+
+
+def _unix_listener(path: str) -> socket.socket:
+    # A socket file left behind by an earlier run would make bind()
+    # fail; anything else at the path is not ours to remove.
+    with contextlib.suppress(FileNotFoundError):
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        sock.listen()
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class BroadcastSink:
+    """Serve decoded records as JSON lines to every connected client.
+
+    Each record is encoded once, and skipped entirely while no client
+    is connected: ``takes_lines`` and ``writes_raw_msg`` are only true
+    while one is. Closing the sink closes the server.
+    """
+
+    pending = 0
+
+    def __init__(self, server: Broadcaster) -> None:
+        self._server = server
+
+    @property
+    def writes_raw_msg(self) -> bool:
+        return self._server.clients > 0
+
+    @property
+    def takes_lines(self) -> bool:
+        return self._server.clients > 0
+
+    def write(self, decoded: Decoded) -> None:
+        if self._server.clients:
+            self.write_line(dumps(decoded))
+
+    def write_line(self, line: str) -> None:
+        """Send one already encoded record (no trailing newline)."""
+        self._server.send((line + "\n").encode())
+
+    def flush_due(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._server.close()
@@ -0,0 +1,220 @@
+"""Columnar Parquet / Arrow IPC output for ``--dump-to``.
+
+``ColumnarSink`` has the same ``write``/``close`` interface as the
+sinks in ``_sink.py``. It buffers records and writes them out as one
+Parquet row group (or one Arrow IPC record batch) every
+``row_group_size`` records, so memory stays bounded and readers see
+data in whole groups.
+
+Columns follow ``SCHEMA_COLUMNS`` (``_FULL_SCHEMA`` plus
+``timestamp``), typed from the schema annotations (int64, float64,
+bool, string, list<string>) and null where a record lacks the key, so
+every file has the same shape as ``full_dict=True`` output. Keys
+outside the schema are dropped. A value that doesn't fit its column
+is converted where that is lossless (bool to int, int to float,
+anything to its ``str()``) and written as null otherwise.
+
+With ``rotate_bytes`` or ``rotate_seconds`` the sink writes
+``<stem>.0000<suffix>``, ``<stem>.0001<suffix>``, ... and starts a new
+file once the current one reaches that size or age. Both are checked
+as records arrive, and every file is complete on its own. ``close()``
+writes the pending rows and the file footer: ``modes live`` calls it
+on SIGINT/SIGTERM, including while it waits to reconnect to a
+receiver, and ``modes decode`` on SIGTERM, so an interrupted capture
+stays readable.
+
+pyarrow is an optional dependency (``pip install "pyModeS[arrow]"``).
+The CLI imports this module only when a columnar ``--dump-format`` is
+selected, so the JSON-lines path never pays for it.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover - exercised without pyarrow only
+    raise ImportError(
+        "Parquet/Arrow output requires the optional `pyarrow` package; "
+        'install via: pip install "pyModeS[arrow]"'
+    ) from e
+
+from pyModeS.cli._sink import SCHEMA_COLUMNS
+from pyModeS.message import Decoded
+
+FORMATS = ("parquet", "arrow")
+
+# Rows per Parquet row group / Arrow record batch.
+ROW_GROUP_SIZE = 65_536
+
+_COMPRESSION = "zstd"
+
+_ARROW_TYPES = {
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "bool": pa.bool_(),
+    "str": pa.string(),
+    "list[str]": pa.list_(pa.string()),
+}
+
+_INT64_MIN = -(1 << 63)
+_INT64_LIMIT = 1 << 63
+
+
+SCHEMA = pa.schema(
+    [pa.field(key, _ARROW_TYPES[kind]) for key, kind in SCHEMA_COLUMNS.items()]
+)
+
+
+def _coerce(kind: str, value: Any) -> Any:
+    """Convert ``value`` for a ``kind`` column, or None if that is lossy."""
+    if value is None:
+        return None
+    if kind == "str":
+        return value if isinstance(value, str) else str(value)
+    if kind == "float":
+        return float(value) if isinstance(value, int | float) else None
+    if kind == "int":
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, int) and _INT64_MIN <= value < _INT64_LIMIT:
+            return int(value)
+        return None
+    if kind == "bool":
+        return bool(value) if isinstance(value, int) else None
+    if isinstance(value, list | tuple):
+        return [str(item) for item in value]
+    return None
+
+
+def _array(kind: str, values: list[Any]) -> Any:
+    """Build one column, falling back to per-value coercion on a mismatch."""
+    arrow_type = _ARROW_TYPES[kind]
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([_coerce(kind, v) for v in values], type=arrow_type)
+
+
+class ColumnarSink:
+    """Write decoded records to Parquet or Arrow IPC files.
+
+    ``fmt`` is ``"parquet"`` or ``"arrow"``; ``row_group_size``
+    defaults to :data:`ROW_GROUP_SIZE`. The first file is created
+    immediately so a bad path fails at startup; ``paths`` lists every
+    file written so far.
+    """
+
+    writes_raw_msg = True
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fmt: str = "parquet",
+        row_group_size: int | None = None,
+        rotate_bytes: int | None = None,
+        rotate_seconds: float | None = None,
+    ) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown columnar format {fmt!r}")
+        self._path = Path(path)
+        self._fmt = fmt
+        self._row_group_size = row_group_size or ROW_GROUP_SIZE
+        self._rotate_bytes = rotate_bytes
+        self._rotate_seconds = rotate_seconds
+        self._rotating = rotate_bytes is not None or rotate_seconds is not None
+        self._rows: list[Decoded] = []
+        self._index = 0
+        self._file: Any = None
+        self._writer: Any = None
+        self._opened_at = 0.0
+        self.paths: list[Path] = []
+        self._open()
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting for the next row group."""
+        return len(self._rows)
+
+    def write(self, decoded: Decoded) -> None:
+        if self._writer is None:
+            self._open()
+        elif (
+            self._rotate_seconds is not None
+            and time.monotonic() - self._opened_at >= self._rotate_seconds
+        ):
+            self._write_group()
+            self._close_file()
+            self._open()
+        rows = self._rows
+        rows.append(decoded)
+        if len(rows) >= self._row_group_size:
+            self._write_group()
+            if (
+                self._rotate_bytes is not None
+                and self._file.tell() >= self._rotate_bytes
+            ):
+                self._close_file()
+
+    def flush_due(self) -> None:
+        # Rows only go out in whole row groups.
+        pass
+
+    def close(self) -> None:
+        try:
+            self._write_group()
+        finally:
+            self._close_file()
+
+    def _open(self) -> None:
+        path = self._path
+        if self._rotating:
+            path = path.with_name(f"{path.stem}.{self._index:04d}{path.suffix}")
+        self._index += 1
+        self._file = pa.OSFile(str(path), "wb")
+        if self._fmt == "parquet":
+            self._writer = pq.ParquetWriter(
+                self._file, SCHEMA, compression=_COMPRESSION
+            )
+        else:
+            self._writer = pa.ipc.new_file(
+                self._file,
+                SCHEMA,
+                options=pa.ipc.IpcWriteOptions(compression=_COMPRESSION),
+            )
+        self._opened_at = time.monotonic()
+        self.paths.append(path)
+
+    def _write_group(self) -> None:
+        rows = self._rows
+        if not rows:
+            return
+        if self._writer is None:
+            self._open()
+        batch = pa.RecordBatch.from_arrays(
+            [
+                _array(kind, [row.get(key) for row in rows])
+                for key, kind in SCHEMA_COLUMNS.items()
+            ],
+            schema=SCHEMA,
+        )
+        if self._fmt == "parquet":
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        rows.clear()
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        try:
+            self._writer.close()
+        finally:
+            self._file.close()
+            self._writer = None
+            self._file = None
@@ -0,0 +1,219 @@
+"""Transparent gzip / Zstandard for capture and dump files.
+
+The compression is chosen by file extension: ``.gz`` is gzip (stdlib
+``zlib``), and ``.zst`` / ``.zstd`` is Zstandard, which needs the optional
+``zstandard`` package (``pip install "pyModeS[zstd]"``). Any other
+path is read and written as-is.
+
+Reading: :func:`open_text` decompresses in a daemon thread that reads
+ahead into a bounded queue of ~1 MiB chunks. zlib and zstandard drop
+the GIL while they work, so decompression overlaps with decoding on
+the main thread instead of stalling it, and read-ahead stays bounded
+at ``_READ_AHEAD`` chunks. A corrupt or truncated stream is re-raised
+in the reading thread as OSError, like any other read failure.
+:func:`open_binary` is the plain, unthreaded decompressing stream, for
+sniffing a file's first bytes; :func:`read_bytes` reads a whole file,
+e.g. a compressed Beast capture that can't be memory-mapped.
+
+Writing: :func:`open_text_write` and :func:`open_binary_write`
+compress on write. ``flush()`` hands buffered data to the compressor
+without forcing a compressed block boundary, so a sink that flushes
+per line still gets the full compression ratio. The stream is only
+complete once closed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import queue
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+# Decompressed chunk size and the number of chunks the reader thread
+# may hold ahead of the consumer.
+_CHUNK = 1 << 20
+_READ_AHEAD = 8
+
+# gzip level 6 (zlib's default) and zstd level 3 (its default) keep
+# compression well ahead of decoding.
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+_SUFFIXES = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def compression(path: str | Path) -> str | None:
+    """``"gzip"``, ``"zstd"`` or None, from the file extension."""
+    return _SUFFIXES.get(Path(path).suffix.lower())
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "reading or writing .zst files requires the optional "
+            '`zstandard` package; install via: pip install "pyModeS[zstd]"'
+        ) from e
+    return zstandard
+
+
+def open_binary(path: str | Path) -> io.BufferedIOBase:
+    """Open ``path`` for reading, decompressing by extension."""
+    kind = compression(path)
+    if kind == "gzip":
+        return gzip.open(path, "rb")
+    if kind == "zstd":
+        zstandard = _zstandard()
+        fh = Path(path).open("rb")  # noqa: SIM115
+        try:
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                fh, read_across_frames=True, closefd=True
+            )
+        except BaseException:
+            fh.close()
+            raise
+        return io.BufferedReader(reader, _CHUNK)
+    return Path(path).open("rb")
+
+
+def read_bytes(path: str | Path) -> bytes:
+    """Return the decompressed contents of ``path``."""
+    try:
+        with open_binary(path) as fh:
+            return fh.read()
+    except OSError:
+        raise
+    except Exception as e:
+        raise _read_error(path, e) from e
+
+
+def _read_error(path: str | Path, e: Exception) -> OSError:
+    """Report a decompression failure (EOFError, zlib.error, ...) as OSError."""
+    return OSError(f"{path}: corrupt or truncated {compression(path)} data ({e})")
+
+
+def open_text(path: str | Path) -> TextIO:
+    """Open ``path`` as text, decompressing in a background thread."""
+    if compression(path) is None:
+        return Path(path).open()
+    raw = _ThreadedReader(open_binary(path), path)
+    return io.TextIOWrapper(io.BufferedReader(raw, _CHUNK))
+
+
+def open_text_write(path: str | Path, *, line_buffered: bool = False) -> TextIO:
+    """Open ``path`` for writing text, compressing by extension.
+
+    ``line_buffered`` applies to uncompressed files only; a compressed
+    stream can't be read line by line before it is closed anyway.
+    """
+    if compression(path) is None:
+        return Path(path).open("w", buffering=1 if line_buffered else -1)
+    return io.TextIOWrapper(open_binary_write(path), encoding="utf-8")
+
+
+def open_binary_write(path: str | Path) -> io.BufferedWriter:
+    """Open ``path`` for writing bytes, compressing by extension."""
+    kind = compression(path)
+    if kind is None:
+        return Path(path).open("wb")
+    compressor: Any
+    if kind == "gzip":
+        # wbits=31: gzip header and trailer around the deflate stream.
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+    else:
+        compressor = _zstandard().ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    raw = _CompressedWriter(Path(path).open("wb"), compressor)  # noqa: SIM115
+    return io.BufferedWriter(raw, 1 << 16)
+
+
+class _ThreadedReader(io.RawIOBase):
+    """Raw stream over chunks read from ``source`` by a daemon thread."""
+
+    def __init__(self, source: io.BufferedIOBase, path: str | Path) -> None:
+        self._path = path
+        self._queue: queue.Queue[bytes | BaseException] = queue.Queue(_READ_AHEAD)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(
+            target=self._pump, args=(source,), name="pyModeS-decompress", daemon=True
+        )
+        self._thread.start()
+
+    def _pump(self, source: io.BufferedIOBase) -> None:
+        try:
+            with source:
+                while not self._stop.is_set():
+                    chunk = source.read(_CHUNK)
+                    self._put(chunk)
+                    if not chunk:
+                        return
+        except OSError as e:
+            self._put(e)
+        except Exception as e:
+            self._put(_read_error(self._path, e))
+
+    def _put(self, item: bytes | BaseException) -> None:
+        # Wake up regularly so close() can stop a thread blocked on a
+        # full queue.
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join(timeout=1.0)
+        super().close()
+
+
+class _CompressedWriter(io.RawIOBase):
+    """Raw stream feeding ``compressor`` and writing its output to ``fh``."""
+
+    def __init__(self, fh: BinaryIO, compressor: Any) -> None:
+        self._fh = fh
+        self._compressor = compressor
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        out = self._compressor.compress(bytes(data))
+        if out:
+            self._fh.write(out)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._fh.write(self._compressor.flush())
+            finally:
+                self._fh.close()
+        super().close()
@@ -0,0 +1,343 @@
+"""Prometheus metrics endpoint for ``modes live --metrics``.
+
+:class:`LiveMetrics` holds what the decode loop reports and renders
+it, together with the PipeDecoder, source and sink counters, in the
+Prometheus text exposition format (version 0.0.4). :class:`MetricsServer`
+serves that on ``GET /metrics`` from a daemon thread.
+
+The decode loop never waits on the endpoint. Once per recv burst it
+calls :meth:`LiveMetrics.observe`, which only bumps plain ints and
+overwrites one slot of a preallocated ring, with no lock. A scrape
+reads the live objects from the server thread: copying a dict or a
+list of numbers happens under the GIL in one step, so a scrape sees
+each counter either before or after an update, never torn.
+
+Exported metrics (all prefixed ``pymodes_``):
+
+- ``pipe_<counter>_total`` / ``pipe_pending_pairs`` — every
+  :attr:`PipeDecoder.stats` counter (``total`` as
+  ``pipe_messages_total``).
+- ``live_messages_total{df}`` — messages received by downlink format.
+  Take ``rate()`` over it for messages per second.
+- ``live_bursts_total`` and ``live_last_burst_timestamp_seconds`` —
+  alert on a stalled feed with ``time() - last_burst > N``.
+- ``live_reconnects_total{feed}`` / ``live_resyncs_total{feed}`` —
+  dropped or failed connections, and times the Beast parser skipped
+  bytes to find the next frame.
+- ``live_sink_pending`` — records buffered in the sink, not yet written.
+- ``live_decode_seconds`` — a summary of the per-message time spent
+  decoding and writing to the sink. Each burst contributes its mean,
+  so the loop takes two clock readings per burst rather than two per
+  message. The p50/p90/p99 quantiles cover the last
+  ``LATENCY_WINDOW`` bursts.
+- ``live_intake_depth`` / ``live_shed_total{reason}`` — with
+  ``--shed``, frames waiting between the socket and the decoder and
+  frames dropped, by shedding policy or ``overflow``.
+
+With ``--jobs`` the decode loop runs in other processes and
+:class:`PipelineMetrics` takes over: the same ``pipe_*`` counters
+summed over the decoders, plus the pipeline's stage counters (frames
+read, ring depth and overruns per decoder, writer queue depth,
+records written, sink pending), and ``live_shed_total`` per policy
+when ``--shed`` is set.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from pyModeS import PipeDecoder
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bursts kept for the decode-latency quantiles.
+LATENCY_WINDOW = 1024
+_QUANTILES = (0.5, 0.9, 0.99)
+
+# PipeDecoder.stats keys that are levels, not monotonic counters, and
+# keys exported under another name.
+_PIPE_GAUGES = frozenset({"pending_pairs"})
+_PIPE_NAMES = {"total": "messages"}
+
+# DF24 is any downlink starting with binary 11 (Comm-D).
+_MAX_DF = 24
+
+
+class LiveMetrics:
+    """Counters for one ``modes live`` run and their exposition.
+
+    ``source`` is a NetworkSource or MultiNetworkSource, ``sink`` any
+    object with a ``pending`` count and ``intake`` the IntakeQueue of
+    ``--shed``, if any; all are read at scrape time only.
+    """
+
+    def __init__(
+        self, pipe: PipeDecoder, source: Any, sink: Any, *, intake: Any = None
+    ) -> None:
+        self._pipe = pipe
+        self._source = source
+        self._sink = sink
+        self._intake = intake
+        self.df_counts = [0] * (_MAX_DF + 1)
+        self.bursts = 0
+        self.last_burst = 0.0
+        self.decode_seconds = 0.0
+        self.decoded = 0
+        self._latency = [0.0] * LATENCY_WINDOW
+        self._latency_next = 0
+
+    def observe(self, msgs: list[str | bytes], elapsed_ns: int) -> None:
+        """Record one burst and the time spent decoding and writing it."""
+        counts = self.df_counts
+        for msg in msgs:
+            df = msg[0] >> 3 if isinstance(msg, bytes) else int(msg[:2], 16) >> 3
+            counts[min(df, _MAX_DF)] += 1
+        n = len(msgs)
+        if not n:
+            return
+        seconds = elapsed_ns / 1e9
+        self.bursts += 1
+        self.last_burst = time.time()
+        self.decode_seconds += seconds
+        self.decoded += n
+        self._latency[self._latency_next % LATENCY_WINDOW] = seconds / n
+        self._latency_next += 1
+
+    def render(self) -> str:
+        """The current metrics in Prometheus text format."""
+        out = _Exposition()
+        _pipe_metrics(out, self._pipe.stats)
+        counts = list(self.df_counts)
+        out.metric(
+            "live_messages_total",
+            "counter",
+            "Messages received, by downlink format.",
+            [(f'{{df="{df}"}}', n) for df, n in enumerate(counts) if n],
+        )
+        out.metric(
+            "live_bursts_total",
+            "counter",
+            "Receive bursts decoded.",
+            [("", self.bursts)],
+        )
+        out.metric(
+            "live_last_burst_timestamp_seconds",
+            "gauge",
+            "Unix time of the last decoded burst (0 before the first).",
+            [("", self.last_burst)],
+        )
+        sources = list(self._source.sources)
+        out.metric(
+            "live_reconnects_total",
+            "counter",
+            "Dropped or failed feed connections.",
+            [(_feed_label(src.name), src.reconnects) for src in sources],
+        )
+        out.metric(
+            "live_resyncs_total",
+            "counter",
+            "Times the Beast parser skipped bytes to find the next frame.",
+            [(_feed_label(src.name), src.resyncs) for src in sources],
+        )
+        out.metric(
+            "live_sink_pending",
+            "gauge",
+            "Records buffered in the output sink, not yet written.",
+            [("", self._sink.pending)],
+        )
+        if self._intake is not None:
+            out.metric(
+                "live_intake_depth",
+                "gauge",
+                "Frames read from the feed, waiting to be decoded.",
+                [("", self._intake.depth)],
+            )
+            _shed_metric(out, self._intake.dropped)
+        filled = min(self._latency_next, LATENCY_WINDOW)
+        window = sorted(self._latency[:filled])
+        samples = [(f'{{quantile="{q}"}}', _quantile(window, q)) for q in _QUANTILES]
+        samples += [("_sum", self.decode_seconds), ("_count", self.decoded)]
+        out.metric(
+            "live_decode_seconds",
+            "summary",
+            "Per-message decode and sink write time, averaged per burst.",
+            samples,
+        )
+        return out.text()
+
+
+class PipelineMetrics:
+    """Metrics of a ``modes live --jobs`` pipeline (``_pipeline.py``).
+
+    Everything is read from the pipeline's shared-memory counters at
+    scrape time; the processes themselves don't know about the
+    endpoint.
+    """
+
+    def __init__(self, pipeline: Any) -> None:
+        self._pipeline = pipeline
+
+    def render(self) -> str:
+        """The current metrics in Prometheus text format."""
+        pipeline = self._pipeline
+        reader = pipeline.reader_counters
+        writer = pipeline.writer_counters
+        out = _Exposition()
+        _pipe_metrics(out, pipeline.pipe_stats())
+        out.metric(
+            "pipeline_frames_total",
+            "counter",
+            "Frames the reader process received.",
+            [("", reader["frames"])],
+        )
+        out.metric(
+            "pipeline_reconnects_total",
+            "counter",
+            "Dropped or failed feed connections.",
+            [("", reader["reconnects"])],
+        )
+        out.metric(
+            "pipeline_resyncs_total",
+            "counter",
+            "Times the Beast parser skipped bytes to find the next frame.",
+            [("", reader["resyncs"])],
+        )
+        rings = list(enumerate(pipeline.rings))
+        out.metric(
+            "pipeline_ring_depth",
+            "gauge",
+            "Frames waiting in a decoder's ring.",
+            [(f'{{decoder="{i}"}}', ring.depth) for i, ring in rings],
+        )
+        out.metric(
+            "pipeline_ring_overruns_total",
+            "counter",
+            "Frames dropped because a decoder's ring was full.",
+            [(f'{{decoder="{i}"}}', ring.overruns) for i, ring in rings],
+        )
+        out.metric(
+            "pipeline_writer_queue_depth",
+            "gauge",
+            "Decoded batches waiting for the writer process.",
+            [("", pipeline.queue_depth())],
+        )
+        out.metric(
+            "pipeline_records_written_total",
+            "counter",
+            "Records handed to the sink by the writer process.",
+            [("", writer["records"])],
+        )
+        out.metric(
+            "live_sink_pending",
+            "gauge",
+            "Records buffered in the output sink, not yet written.",
+            [("", writer["pending"])],
+        )
+        if pipeline.shed_counters is not None:
+            _shed_metric(out, pipeline.shed_counters.as_dict())
+        return out.text()
+
+
+class _Exposition:
+    """Lines of a Prometheus text exposition."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def metric(
+        self, name: str, kind: str, help_text: str, samples: list[tuple[str, float]]
+    ) -> None:
+        name = f"pymodes_{name}"
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        for suffix, value in samples:
+            self._lines.append(f"{name}{suffix} {_format(value)}")
+
+    def text(self) -> str:
+        return "\n".join([*self._lines, ""])
+
+
+def _pipe_metrics(out: _Exposition, stats: dict[str, int]) -> None:
+    for key, value in stats.items():
+        if key in _PIPE_GAUGES:
+            out.metric(f"pipe_{key}", "gauge", f"PipeDecoder {key}.", [("", value)])
+        else:
+            out.metric(
+                f"pipe_{_PIPE_NAMES.get(key, key)}_total",
+                "counter",
+                f"PipeDecoder {key} counter.",
+                [("", value)],
+            )
+
+
+def _shed_metric(out: _Exposition, dropped: dict[str, int]) -> None:
+    out.metric(
+        "live_shed_total",
+        "counter",
+        "Frames dropped under overload, by shedding policy.",
+        [(f'{{reason="{reason}"}}', n) for reason, n in dropped.items()],
+    )
+
+
+def _feed_label(name: str) -> str:
+    escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'{{feed="{escaped}"}}'
+
+
+def _format(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    return repr(float(value))
+
+
+def _quantile(values: list[float], q: float) -> float:
+    """Nearest-rank quantile of sorted ``values``; NaN when empty."""
+    if not values:
+        return float("nan")
+    index = min(len(values) - 1, max(0, round(q * len(values)) - 1))
+    return values[index]
+
+
+class MetricsServer:
+    """Serve ``render()`` on ``GET /metrics`` from a daemon thread.
+
+    ``address`` is the bound ``(host, port)``, useful with port 0.
+    Raises OSError if the address can't be bound.
+    """
+
+    def __init__(self, host: str, port: int, render: Callable[[], str]) -> None:
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self.address: tuple[str, int] = self._server.server_address[:2]  # type: ignore[assignment]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="pyModeS-metrics",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,235 @@
+"""Overload policy for ``modes live --shed``.
+
+When decoding or the sink can't keep up, ``modes live`` stops reading
+the socket, the TCP receive window fills, and receivers that drop slow
+clients start a reconnect storm. With ``--shed`` the socket is drained
+by a thread into an :class:`IntakeQueue` of at most ``--queue-frames``
+frames, and a :class:`LoadShedder` thins each incoming burst by how
+full the queue is:
+
+- ``dup`` — a payload already seen in the last ``DUP_WINDOW`` seconds
+  (merged receivers hear most frames more than once).
+- ``commb`` — DF20/21 Comm-B replies, which are expensive to decode
+  and carry no position.
+- ``sample`` — more than one frame per aircraft every
+  ``SAMPLE_INTERVAL`` seconds.
+
+Policies engage in the order given, from half full upwards: with k of
+them the i-th (from 0) starts at a fill of ``1/2 + i/(2k)``, so
+``dup,commb,sample`` drops duplicates from 50 %, Comm-B from 67 % and
+samples from 83 %. A burst that still doesn't fit is cut at its tail
+and counted as ``overflow``. The queue never blocks the socket.
+
+The same shedder runs in the reader process of ``--jobs``, against the
+fill of each decoder's ring.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+from pyModeS.cli._parallel import address
+
+SHED_POLICIES = ("dup", "commb", "sample")
+
+# Default bound on frames waiting between the socket and the decoder.
+QUEUE_FRAMES = 1 << 16
+
+DUP_WINDOW = 1.0
+SAMPLE_INTERVAL = 0.5
+
+# Fill at which the first policy engages.
+_SHED_START = 0.5
+
+# Per-ICAO sample clocks kept before starting afresh; corrupt frames
+# attribute to random addresses, so the map has to be capped.
+_MAX_SAMPLED = 1 << 16
+
+# How long an idle consumer waits before yielding an empty burst, so
+# the caller can check its stop flag.
+_POLL = 0.1
+
+
+class LoadShedder:
+    """Drop frames by ``policies`` (from :data:`SHED_POLICIES`) under load.
+
+    ``dropped`` counts the frames each policy removed.
+    """
+
+    def __init__(self, policies: Sequence[str]) -> None:
+        unknown = set(policies) - set(SHED_POLICIES)
+        if unknown:
+            raise ValueError(f"unknown shed policy: {sorted(unknown)[0]!r}")
+        self.policies = tuple(policies)
+        self.dropped = dict.fromkeys(self.policies, 0)
+        step = (1.0 - _SHED_START) / max(1, len(self.policies))
+        checks: dict[str, Callable[[str | bytes, float], bool]] = {
+            "dup": self._dup,
+            "commb": self._commb,
+            "sample": self._sample,
+        }
+        self._stages = [
+            (_SHED_START + i * step, policy, checks[policy])
+            for i, policy in enumerate(self.policies)
+        ]
+        self._dup_since = 0.0
+        self._dup_current: set[str | bytes] = set()
+        self._dup_previous: set[str | bytes] = set()
+        self._sampled: dict[int, float] = {}
+
+    def shed(
+        self, msgs: list[str | bytes], timestamps: list[float], fill: float
+    ) -> tuple[list[str | bytes], list[float]]:
+        """Return the frames of a burst that survive at queue ``fill``."""
+        active = [(p, check) for start, p, check in self._stages if fill >= start]
+        if not active:
+            return msgs, timestamps
+        dropped = self.dropped
+        kept_msgs: list[str | bytes] = []
+        kept_ts: list[float] = []
+        for msg, ts in zip(msgs, timestamps, strict=True):
+            for policy, check in active:
+                if check(msg, ts):
+                    dropped[policy] += 1
+                    break
+            else:
+                kept_msgs.append(msg)
+                kept_ts.append(ts)
+        return kept_msgs, kept_ts
+
+    def _dup(self, msg: str | bytes, ts: float) -> bool:
+        # Two generations of seen payloads: a frame is remembered for
+        # between one and two windows.
+        if not 0.0 <= ts - self._dup_since < DUP_WINDOW:
+            self._dup_previous = self._dup_current
+            self._dup_current = set()
+            self._dup_since = ts
+        if msg in self._dup_current or msg in self._dup_previous:
+            return True
+        self._dup_current.add(msg)
+        return False
+
+    def _commb(self, msg: str | bytes, ts: float) -> bool:
+        return _downlink_format(msg) in (20, 21)
+
+    def _sample(self, msg: str | bytes, ts: float) -> bool:
+        icao = address(msg)
+        last = self._sampled.get(icao)
+        if last is not None and 0.0 <= ts - last < SAMPLE_INTERVAL:
+            return True
+        if len(self._sampled) >= _MAX_SAMPLED:
+            self._sampled.clear()
+        self._sampled[icao] = ts
+        return False
+
+
+def _downlink_format(msg: str | bytes) -> int:
+    if isinstance(msg, bytes):
+        return msg[0] >> 3 if msg else -1
+    try:
+        return int(msg[:2], 16) >> 3
+    except ValueError:
+        return -1
+
+
+class IntakeQueue:
+    """A source's bursts, read ahead by a thread into a bounded queue.
+
+    Wraps a NetworkSource or MultiNetworkSource and offers the same
+    ``iter_batches()`` and ``sources``. Errors raised by the source
+    are re-raised to the consumer once the queue is drained.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        shedder: LoadShedder | None = None,
+        *,
+        capacity: int = QUEUE_FRAMES,
+    ) -> None:
+        self._source = source
+        self._shedder = shedder
+        self.capacity = capacity
+        self.depth = 0
+        self.overflow = 0
+        self._bursts: deque[tuple[list[str | bytes], list[float]]] = deque()
+        self._cond = threading.Condition()
+        self._done = False
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def sources(self) -> Any:
+        return self._source.sources
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        """Frames dropped so far, by policy plus ``overflow``."""
+        dropped = dict(self._shedder.dropped) if self._shedder else {}
+        dropped["overflow"] = self.overflow
+        return dropped
+
+    def start(self) -> None:
+        """Start reading the source; ``iter_batches`` does so if needed."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._fill, name="pyModeS-live-intake", daemon=True
+            )
+            self._thread.start()
+
+    def iter_batches(self) -> Iterator[tuple[list[str | bytes], list[float]]]:
+        """Yield queued bursts; an empty one when idle for a moment."""
+        self.start()
+        cond = self._cond
+        bursts = self._bursts
+        while True:
+            with cond:
+                if not bursts and not self._done:
+                    cond.wait(_POLL)
+                if bursts:
+                    msgs, timestamps = bursts.popleft()
+                    self.depth -= len(msgs)
+                elif self._done:
+                    break
+                else:
+                    msgs, timestamps = [], []
+            yield msgs, timestamps
+        if self._error is not None:
+            raise self._error
+
+    def _fill(self) -> None:
+        shedder = self._shedder
+        capacity = self.capacity
+        cond = self._cond
+        try:
+            for msgs, timestamps in self._source.iter_batches():
+                # Only the consumer lowers depth, so a stale read can
+                # only under-estimate the room left.
+                depth = self.depth
+                if shedder is not None:
+                    msgs, timestamps = shedder.shed(msgs, timestamps, depth / capacity)
+                room = capacity - depth
+                if len(msgs) > room:
+                    self.overflow += len(msgs) - room
+                    msgs, timestamps = msgs[:room], timestamps[:room]
+                if not msgs:
+                    continue
+                with cond:
+                    self._bursts.append((msgs, timestamps))
+                    self.depth += len(msgs)
+                    cond.notify()
+        except BaseException as e:
+            self._error = e
+        finally:
+            with cond:
+                self._done = True
+                cond.notify()
+
+
+def shed_summary(dropped: Mapping[str, int]) -> str:
+    """``shed N (dup a, commb b, ...)`` for a stats line."""
+    detail = ", ".join(f"{reason} {n}" for reason, n in dropped.items())
+    return f"shed {sum(dropped.values())} ({detail})"
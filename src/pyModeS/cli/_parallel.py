@@ -0,0 +1,262 @@
+"""Multi-process decode for ``modes decode --file PATH --jobs N``.
+
+The parent process reads ``(hex, timestamp)`` records and routes each
+one to worker ``icao % N``. Every worker owns a :class:`PipeDecoder`
+and a :class:`ReleaseQueue`, and sends back formatted records tagged
+with their input sequence number. The parent writes them either
+re-sequenced into input order (default) or as they arrive
+(``--unordered``).
+
+Partitioning by ICAO keeps results identical to the serial path:
+every piece of PipeDecoder state (tracked fields, pending CPR halves,
+altitude/velocity anchors, position history, bootstrap buffers, the
+trusted-ICAO set) is keyed by the ICAO the message is attributed to,
+and the parent derives that ICAO with the same header parse
+:class:`Message` uses. The one cross-ICAO input is the eviction clock:
+a serial pipe expires state against every message's timestamp, a
+worker only sees its own partition's. Each record therefore carries
+the latest timestamp in the whole stream since the worker's previous
+record, and the worker expires against it before decoding. While
+timestamps are non-decreasing that is just the record's own
+timestamp; after the first regression the parent tracks it per
+worker. ``--check`` compares both paths on a sample.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import queue
+from collections.abc import Callable, Iterable, Sequence
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from pyModeS import PipeDecoder
+from pyModeS._bits import crc_remainder
+from pyModeS.cli._stream import ReleaseQueue, format_record
+from pyModeS.message import Decoded
+
+# Records per chunk sent to a worker, and chunks a worker may have
+# queued before the parent blocks. Together they bound read-ahead to
+# about _CHUNK * _INBOX_DEPTH records per worker.
+_CHUNK = 1024
+_INBOX_DEPTH = 4
+
+# (seq, hex, timestamp, clock) as sent to workers; (seq, text) back.
+_Record = tuple[int, str, float, float]
+_Output = tuple[int, str]
+
+
+def run_parallel(
+    records: Iterable[tuple[str, float]],
+    *,
+    jobs: int,
+    surface_ref: Any,
+    full_dict: bool,
+    compact: bool,
+    ordered: bool,
+    write: Callable[[str], None],
+    timestamps: bool = False,
+) -> None:
+    """Decode ``records`` across ``jobs`` worker processes.
+
+    ``write`` receives each formatted record, in input order when
+    ``ordered`` is True. With ``timestamps`` each record also carries
+    its input timestamp. Raises :class:`RuntimeError` if a worker dies.
+    """
+    ctx = multiprocessing.get_context()
+    outbox: multiprocessing.Queue[tuple[int, list[_Output] | None, bool]] = ctx.Queue()
+    inboxes: list[multiprocessing.Queue[tuple[list[_Record], bool, float | None]]] = [
+        ctx.Queue(maxsize=_INBOX_DEPTH) for _ in range(jobs)
+    ]
+    procs = [
+        ctx.Process(
+            target=_worker,
+            args=(
+                wid,
+                inboxes[wid],
+                outbox,
+                surface_ref,
+                full_dict,
+                compact,
+                timestamps,
+            ),
+            daemon=True,
+        )
+        for wid in range(jobs)
+    ]
+    for proc in procs:
+        proc.start()
+    merger = _Merger(outbox, procs, write, ordered=ordered)
+
+    def send(wid: int, item: tuple[list[_Record], bool, float | None]) -> None:
+        # Keep draining results while a worker's inbox is full so a
+        # slow parent write can never deadlock against a full outbox.
+        while True:
+            try:
+                inboxes[wid].put(item, timeout=0.05)
+            except queue.Full:
+                merger.drain(block=False)
+            else:
+                return
+
+    try:
+        buffers: list[list[_Record]] = [[] for _ in range(jobs)]
+        latest = -math.inf
+        # Per-worker latest timestamp since its previous record; only
+        # tracked once timestamps have gone backwards.
+        clocks: list[float] | None = None
+        for seq, (hex_msg, ts) in enumerate(records):
+            wid = route(hex_msg, jobs)
+            if clocks is None and ts < latest:
+                clocks = [latest] * jobs
+            if clocks is None:
+                latest = clock = ts
+            else:
+                for w in range(jobs):
+                    if ts > clocks[w]:
+                        clocks[w] = ts
+                clock = clocks[wid]
+                clocks[wid] = -math.inf
+            buf = buffers[wid]
+            buf.append((seq, hex_msg, ts, clock))
+            if len(buf) >= _CHUNK:
+                send(wid, (buf, False, None))
+                buffers[wid] = []
+                merger.drain(block=False)
+        for wid in range(jobs):
+            final = latest if clocks is None else clocks[wid]
+            send(wid, (buffers[wid], True, final if final > -math.inf else None))
+        while merger.done < jobs:
+            merger.drain(block=True)
+    finally:
+        for proc in procs:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.terminate()
+
+
+def route(msg: str | bytes, jobs: int) -> int:
+    """Worker index for a message: its ICAO modulo ``jobs``."""
+    return address(msg) % jobs
+
+
+def address(msg: str | bytes) -> int:
+    """The 24-bit ICAO address a message is attributed to.
+
+    Mirrors the header parse in :class:`Message` (plain-text ICAO for
+    DF11/17/18, CRC remainder otherwise) without building the object.
+    ``msg`` is hex or, from a Beast source, payload bytes. Unparseable
+    input gives 0; it decodes to an error dict wherever it goes.
+    """
+    if isinstance(msg, bytes):
+        n = int.from_bytes(msg, "big")
+        length = len(msg) * 8
+    else:
+        try:
+            n = int(msg, 16)
+        except ValueError:
+            return 0
+        length = len(msg) * 4
+    if length not in (56, 112):
+        return 0
+    if (n >> (length - 5)) & 0x1F in (11, 17, 18):
+        return (n >> (length - 32)) & 0xFFFFFF
+    return crc_remainder(n, length)
+
+
+def _worker(
+    wid: int,
+    inbox: multiprocessing.Queue[tuple[list[_Record], bool, float | None]],
+    outbox: multiprocessing.Queue[tuple[int, list[_Output] | None, bool]],
+    surface_ref: Any,
+    full_dict: bool,
+    compact: bool,
+    timestamps: bool,
+) -> None:
+    """Worker process body: decode one ICAO partition."""
+    out: list[_Output] = []
+
+    def emit(tag: tuple[int, str, float], result: Decoded) -> None:
+        seq, hex_msg, ts = tag
+        text = format_record(
+            hex_msg, result, compact=compact, timestamp=ts if timestamps else None
+        )
+        out.append((seq, text))
+
+    try:
+        pipe = PipeDecoder(surface_ref=surface_ref, full_dict=full_dict)
+        release: ReleaseQueue[tuple[int, str, float]] = ReleaseQueue(pipe, emit)
+        while True:
+            chunk, done, last_ts = inbox.get()
+            for seq, hex_msg, ts, clock in chunk:
+                release.feed((seq, hex_msg, ts), hex_msg, ts, clock=clock)
+            if done:
+                release.finish(timestamp=last_ts)
+            # Queue.put pickles lazily on a feeder thread, so hand
+            # over a copy rather than the list we keep appending to.
+            outbox.put((wid, out.copy(), done))
+            out.clear()
+            if done:
+                return
+    except BaseException:
+        outbox.put((wid, None, True))
+        raise
+
+
+class _Merger:
+    """Collect worker output and hand it to ``write``."""
+
+    def __init__(
+        self,
+        outbox: multiprocessing.Queue[tuple[int, list[_Output] | None, bool]],
+        procs: Sequence[BaseProcess],
+        write: Callable[[str], None],
+        *,
+        ordered: bool,
+    ) -> None:
+        self._outbox = outbox
+        self._procs = procs
+        self._write = write
+        self._ordered = ordered
+        self._pending: dict[int, str] = {}
+        self._next_seq = 0
+        self.done = 0
+
+    def drain(self, *, block: bool) -> None:
+        """Consume available worker output; wait for some if ``block``."""
+        while True:
+            try:
+                if block:
+                    item = self._outbox.get(timeout=0.5)
+                else:
+                    item = self._outbox.get_nowait()
+            except queue.Empty:
+                if not block:
+                    return
+                self._check_workers()
+                continue
+            self._accept(*item)
+            block = False
+
+    def _accept(self, wid: int, batch: list[_Output] | None, done: bool) -> None:
+        if batch is None:
+            raise RuntimeError(f"decode worker {wid} failed")
+        if done:
+            self.done += 1
+        if not self._ordered:
+            for _seq, text in batch:
+                self._write(text)
+            return
+        pending = self._pending
+        pending.update(batch)
+        while self._next_seq in pending:
+            self._write(pending.pop(self._next_seq))
+            self._next_seq += 1
+
+    def _check_workers(self) -> None:
+        for wid, proc in enumerate(self._procs):
+            if proc.exitcode not in (None, 0):
+                raise RuntimeError(
+                    f"decode worker {wid} exited with code {proc.exitcode}"
+                )
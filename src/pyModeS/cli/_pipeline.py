@@ -0,0 +1,501 @@
+"""Multi-process ``modes live --jobs N``.
+
+Pipeline::
+
+    reader process: NetworkSource / MultiNetworkSource
+        │ routes each frame by ICAO, like ``modes decode --jobs``
+        ▼
+    N FrameRings in shared memory (one per decoder, fixed slots)
+        ▼
+    N decoder processes: one PipeDecoder each
+        │ batches of records over a bounded multiprocessing.Queue
+        ▼
+    writer process: the stdout / --dump-to sink
+
+The reader only parses Beast frames and copies them into a ring, so
+it keeps up with the socket whatever happens downstream: when a ring
+is full the frame is dropped and counted as an overrun instead of
+blocking, and the receiver never sees a stalled consumer. A slow sink
+fills the writer queue, which blocks the decoders, which lets their
+rings fill; that is where load is shed, either at a full ring or,
+with ``--shed``, earlier and selectively by a LoadShedder
+(``_overload.py``) in the reader. Routing by ICAO keeps each
+aircraft's state in a single PipeDecoder. Records of different
+aircraft can reach the sink out of timestamp order when N > 1.
+A ``--relay`` (``_relay.py``) runs in the reader, on the frames as
+parsed, so it is unaffected by anything downstream.
+
+Counters live in shared memory too, each written by a single process:
+frames, reconnects and parser resyncs for the reader, depth and
+overruns per ring, the PipeDecoder stats of each decoder, the writer
+queue depth and the records written and pending in the sink. The
+parent process reads them for the stats lines and ``--metrics``.
+
+Shutdown is driven by the parent: it stops the reader, marks every
+ring closed, and the decoders drain their ring, hand a final ``None``
+to the writer and exit; the writer closes the sink once it has seen
+all of them. Children ignore SIGINT so that Ctrl-C in a terminal
+(which signals the whole process group) goes through that sequence,
+and die on SIGTERM whatever handler the parent had installed.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import signal
+import struct
+import sys
+import time
+from collections.abc import Callable, Sequence
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Any
+
+from pyModeS import PipeDecoder
+from pyModeS.cli._overload import LoadShedder, shed_summary
+from pyModeS.cli._parallel import route
+from pyModeS.message import Decoded
+
+# Slots per decoder ring: about 1.5 MB and several seconds of a busy
+# feed.
+RING_SLOTS = 1 << 16
+
+# Ring header: head and tail (running frame counts), overruns and the
+# closed flag. Slot: timestamp, zero-padded payload, payload length.
+_HEADER = struct.Struct("<QQQQ")
+_U64 = struct.Struct("<Q")
+_HEAD, _TAIL, _OVERRUNS, _CLOSED = 0, 8, 16, 24
+_SLOT = struct.Struct("<d14sBx")
+
+# Frames a decoder takes from its ring at once, batches each decoder
+# may have queued for the writer, how long an idle decoder sleeps and
+# how long the writer waits for a batch before checking its sink's
+# time limits (--flush-ms).
+_BATCH = 4096
+_OUT_DEPTH = 8
+_IDLE = 0.001
+_WRITER_IDLE = 0.1
+
+_READER_FIELDS = ("frames", "reconnects", "resyncs")
+_WRITER_FIELDS = ("batches", "records", "pending")
+
+
+class FrameRing:
+    """Single-producer, single-consumer ring of frames in shared memory.
+
+    Each fixed-size slot holds a timestamp and a Mode-S payload of up
+    to 14 bytes. ``head`` is written only by the producer and ``tail``
+    only by the consumer, so neither side takes a lock. A full ring
+    drops new frames and counts them as overruns; the producer never
+    waits.
+    """
+
+    def __init__(self, slots: int = RING_SLOTS, *, ctx: Any = None) -> None:
+        ctx = ctx or multiprocessing.get_context()
+        self.slots = slots
+        self._raw = ctx.RawArray("B", _HEADER.size + slots * _SLOT.size)
+        self._mem = memoryview(self._raw).cast("B")
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"slots": self.slots, "raw": self._raw}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.slots = state["slots"]
+        self._raw = state["raw"]
+        self._mem = memoryview(self._raw).cast("B")
+
+    @property
+    def depth(self) -> int:
+        """Frames written but not yet read."""
+        return _load(self._mem, _HEAD) - _load(self._mem, _TAIL)
+
+    @property
+    def overruns(self) -> int:
+        """Frames dropped because the ring was full."""
+        return _load(self._mem, _OVERRUNS)
+
+    @property
+    def closed(self) -> bool:
+        return bool(_load(self._mem, _CLOSED))
+
+    def close(self) -> None:
+        """Tell the consumer no more frames will come."""
+        _U64.pack_into(self._mem, _CLOSED, 1)
+
+    def push(self, msgs: Sequence[bytes], timestamps: Sequence[float]) -> int:
+        """Append frames; returns how many were dropped as overruns."""
+        mem = self._mem
+        slots = self.slots
+        size = _SLOT.size
+        pack = _SLOT.pack_into
+        head = _load(mem, _HEAD)
+        free = slots - (head - _load(mem, _TAIL))
+        fit = min(free, len(msgs))
+        for i in range(fit):
+            msg = msgs[i]
+            pack(
+                mem, _HEADER.size + (head % slots) * size, timestamps[i], msg, len(msg)
+            )
+            head += 1
+        _U64.pack_into(mem, _HEAD, head)
+        dropped = len(msgs) - fit
+        if dropped:
+            _U64.pack_into(mem, _OVERRUNS, _load(mem, _OVERRUNS) + dropped)
+        return dropped
+
+    def pop(self, limit: int) -> tuple[list[bytes], list[float]]:
+        """Take up to ``limit`` frames as parallel payload / timestamp lists."""
+        mem = self._mem
+        slots = self.slots
+        size = _SLOT.size
+        unpack = _SLOT.unpack_from
+        tail = _load(mem, _TAIL)
+        n = min(_load(mem, _HEAD) - tail, limit)
+        msgs: list[bytes] = []
+        timestamps: list[float] = []
+        for i in range(tail, tail + n):
+            ts, payload, length = unpack(mem, _HEADER.size + (i % slots) * size)
+            msgs.append(payload[:length])
+            timestamps.append(ts)
+        _U64.pack_into(mem, _TAIL, tail + n)
+        return msgs, timestamps
+
+
+def _load(mem: memoryview, offset: int) -> int:
+    return int(_U64.unpack_from(mem, offset)[0])
+
+
+class Counters:
+    """Named int64 counters in shared memory, written by one process."""
+
+    def __init__(self, fields: Sequence[str], *, ctx: Any = None) -> None:
+        ctx = ctx or multiprocessing.get_context()
+        self.fields = tuple(fields)
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._raw = ctx.RawArray("q", len(self.fields))
+
+    def __getitem__(self, name: str) -> int:
+        return int(self._raw[self._index[name]])
+
+    def __setitem__(self, name: str, value: int) -> None:
+        self._raw[self._index[name]] = value
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(zip(self.fields, self._raw, strict=True))
+
+
+class LivePipeline:
+    """The reader, decoder and writer processes of ``modes live --jobs``.
+
+    ``make_source`` and ``make_sink`` build the source and sink inside
+    the reader and writer processes, so they must be picklable (a
+    ``functools.partial`` of a module-level function is). So must
+    ``make_relay``: the reader builds the ``--relay`` frame hook with
+    it and passes it to ``make_source`` as ``relay``.
+    """
+
+    def __init__(
+        self,
+        make_source: Callable[[], Any],
+        make_sink: Callable[[], Any],
+        *,
+        jobs: int,
+        surface_ref: Any = None,
+        full_dict: bool = False,
+        ring_slots: int = RING_SLOTS,
+        shed: Sequence[str] | None = None,
+        make_relay: Callable[[], Any] | None = None,
+    ) -> None:
+        ctx = multiprocessing.get_context()
+        self.jobs = jobs
+        self.rings = [FrameRing(ring_slots, ctx=ctx) for _ in range(jobs)]
+        self.reader_counters = Counters(_READER_FIELDS, ctx=ctx)
+        # Frames the reader's LoadShedder dropped, per policy.
+        self.shed_counters = Counters(shed, ctx=ctx) if shed else None
+        stat_fields = (*PipeDecoder().stats, "batches")
+        self.decoder_counters = [Counters(stat_fields, ctx=ctx) for _ in range(jobs)]
+        self.writer_counters = Counters(_WRITER_FIELDS, ctx=ctx)
+        self._out: multiprocessing.Queue[list[Any] | None] = ctx.Queue(
+            maxsize=_OUT_DEPTH * jobs
+        )
+        self._reader = ctx.Process(
+            target=_reader,
+            args=(
+                make_source,
+                self.rings,
+                self.reader_counters,
+                self.shed_counters,
+                make_relay,
+            ),
+            name="pyModeS-live-reader",
+            daemon=True,
+        )
+        self._decoders = [
+            ctx.Process(
+                target=_decoder,
+                args=(ring, self._out, counters, surface_ref, full_dict),
+                name=f"pyModeS-live-decoder-{wid}",
+                daemon=True,
+            )
+            for wid, (ring, counters) in enumerate(
+                zip(self.rings, self.decoder_counters, strict=True)
+            )
+        ]
+        self._writer = ctx.Process(
+            target=_writer,
+            args=(make_sink, self._out, self.writer_counters, jobs),
+            name="pyModeS-live-writer",
+            daemon=True,
+        )
+
+    @property
+    def _processes(self) -> list[BaseProcess]:
+        return [self._writer, *self._decoders, self._reader]
+
+    def start(self) -> None:
+        # Downstream first, so nothing the reader pushes waits on a
+        # process that hasn't started.
+        for proc in self._processes:
+            proc.start()
+
+    def poll(self) -> int | None:
+        """None while every process runs, else the exit code to stop with.
+
+        A network source reconnects forever, so the reader only ends by
+        itself on an error, or with 0 when a finite source runs out.
+        Any other process ending first is an error.
+        """
+        code = self._reader.exitcode
+        if code is not None:
+            return code
+        for proc in (self._writer, *self._decoders):
+            if proc.exitcode is not None:
+                return proc.exitcode or 1
+        return None
+
+    def stop(self, timeout: float = 10.0) -> int:
+        """Shut the pipeline down in order; return the first failure code.
+
+        Frames already in a ring are still decoded and written. A
+        process that doesn't finish within ``timeout`` seconds of its
+        turn is terminated.
+        """
+        if self._reader.is_alive():
+            self._reader.terminate()
+        self._reader.join(timeout)
+        for ring in self.rings:
+            ring.close()
+        deadline = time.monotonic() + timeout
+        for proc in self._decoders:
+            while proc.is_alive() and time.monotonic() < deadline:
+                # A dead writer would leave the decoders blocked on a
+                # full queue forever.
+                if not self._writer.is_alive():
+                    break
+                proc.join(0.1)
+        self._writer.join(max(0.0, deadline - time.monotonic()))
+        codes = []
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+            codes.append(process.exitcode)
+        self._out.close()
+        # The reader was terminated on purpose; only its own error
+        # exits count.
+        failures = [code for code in codes if code is not None and code > 0]
+        return failures[0] if failures else 0
+
+    def pipe_stats(self) -> dict[str, int]:
+        """PipeDecoder stats summed over the decoders."""
+        total: dict[str, int] = {}
+        for counters in self.decoder_counters:
+            for key, value in counters.as_dict().items():
+                if key != "batches":
+                    total[key] = total.get(key, 0) + value
+        return total
+
+    def queue_depth(self) -> int:
+        """Batches decoded but not yet taken by the writer."""
+        queued = sum(counters["batches"] for counters in self.decoder_counters)
+        return max(0, queued - self.writer_counters["batches"])
+
+    def stats_line(self, *, prefix: str = "") -> str:
+        stats = self.pipe_stats()
+        label = f"[pyModeS.live{' ' + prefix if prefix else ''}]"
+        depths = [ring.depth for ring in self.rings]
+        overruns = sum(ring.overruns for ring in self.rings)
+        writer = self.writer_counters
+        line = (
+            f"{label} {stats['total']} msgs, "
+            f"{stats['decoded']} decoded, "
+            f"{stats['crc_fail']} crc_fail, "
+            f"{stats['pending_pairs']} pending pairs; "
+            f"ring depth {max(depths)}/{self.rings[0].slots}, "
+            f"{overruns} overruns, "
+            f"writer queue {self.queue_depth()}, "
+            f"{writer['pending']} pending in sink"
+        )
+        if self.shed_counters is not None:
+            line += f", {shed_summary(self.shed_counters.as_dict())}"
+        return line
+
+
+def _child_signals() -> None:
+    # Forked children inherit the parent's handlers; SIGTERM has to
+    # kill again for terminate() to work.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _terminated(signum: int, frame: FrameType | None) -> None:
+    sys.exit(0)
+
+
+def _reader(
+    make_source: Callable[..., Any],
+    rings: Sequence[FrameRing],
+    counters: Counters,
+    shed_counters: Counters | None,
+    make_relay: Callable[[], Any] | None,
+) -> None:
+    """Reader process body: socket to rings, never blocking on them."""
+    from pyModeS.cli._source import UnsupportedStreamError
+
+    _child_signals()
+    shedder = LoadShedder(shed_counters.fields) if shed_counters else None
+    frames = 0
+    relay = None
+    try:
+        if make_relay is None:
+            source = make_source()
+        else:
+            relay = make_relay()
+            # The reader is stopped with SIGTERM; unwind instead, so
+            # the relay file is complete.
+            signal.signal(signal.SIGTERM, _terminated)
+            source = make_source(relay=relay)
+        feeds = source.sources
+        for msgs, timestamps in source.iter_batches():
+            _push(rings, msgs, timestamps, shedder)
+            frames += len(msgs)
+            counters["frames"] = frames
+            counters["reconnects"] = sum(feed.reconnects for feed in feeds)
+            counters["resyncs"] = sum(feed.resyncs for feed in feeds)
+            if shedder is not None and shed_counters is not None:
+                for policy, dropped in shedder.dropped.items():
+                    shed_counters[policy] = dropped
+    except UnsupportedStreamError as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except Exception as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if relay is not None:
+            relay.close()
+
+
+def _push(
+    rings: Sequence[FrameRing],
+    msgs: list[Any],
+    timestamps: list[float],
+    shedder: LoadShedder | None,
+) -> None:
+    jobs = len(rings)
+    if jobs == 1:
+        routed = [(msgs, timestamps)]
+    else:
+        routed = [([], []) for _ in range(jobs)]
+        for msg, ts in zip(msgs, timestamps, strict=True):
+            part = routed[route(msg, jobs)]
+            part[0].append(msg)
+            part[1].append(ts)
+    for ring, (part_msgs, part_ts) in zip(rings, routed, strict=True):
+        if shedder is not None and part_msgs:
+            part_msgs, part_ts = shedder.shed(
+                part_msgs, part_ts, ring.depth / ring.slots
+            )
+        if part_msgs:
+            ring.push(part_msgs, part_ts)
+
+
+def _decoder(
+    ring: FrameRing,
+    out: multiprocessing.Queue[list[Any] | None],
+    counters: Counters,
+    surface_ref: Any,
+    full_dict: bool,
+) -> None:
+    """Decoder process body: ring to PipeDecoder to writer queue."""
+    _child_signals()
+    pipe = PipeDecoder(surface_ref=surface_ref, full_dict=full_dict)
+    decode = pipe.decode
+    batches = 0
+    try:
+        while True:
+            msgs, timestamps = ring.pop(_BATCH)
+            if not msgs:
+                if ring.closed and not ring.depth:
+                    return
+                time.sleep(_IDLE)
+                continue
+            batch = []
+            for msg, ts in zip(msgs, timestamps, strict=True):
+                result = decode(msg, timestamp=ts)
+                # The sink is in the writer process; every sink but
+                # NullSink (--quiet without --dump-to) writes raw_msg.
+                result["raw_msg"] = msg.hex().upper()
+                result["timestamp"] = ts
+                # Copy now: PipeDecoder may still fill in this result
+                # (a later CPR half) before the batch is pickled, which
+                # the single-process loop, writing at once, never sees.
+                batch.append(Decoded(result))
+            out.put(batch)
+            batches += 1
+            for key, value in pipe.stats.items():
+                counters[key] = value
+            counters["batches"] = batches
+    finally:
+        out.put(None)
+
+
+def _writer(
+    make_sink: Callable[[], Any],
+    out: multiprocessing.Queue[list[Any] | None],
+    counters: Counters,
+    decoders: int,
+) -> None:
+    """Writer process body: writer queue to the sink."""
+    _child_signals()
+    try:
+        sink = make_sink()
+    except ImportError as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        sys.exit(3)
+    except OSError as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        sys.exit(1)
+    write = sink.write
+    finished = batches = records = 0
+    try:
+        while finished < decoders:
+            try:
+                batch = out.get(timeout=_WRITER_IDLE)
+            except queue.Empty:
+                sink.flush_due()
+                continue
+            if batch is None:
+                finished += 1
+                continue
+            for record in batch:
+                write(record)
+            batches += 1
+            records += len(batch)
+            counters["batches"] = batches
+            counters["records"] = records
+            counters["pending"] = sink.pending
+    finally:
+        sink.close()
+        counters["pending"] = 0
@@ -0,0 +1,145 @@
+"""Filtered raw Beast output for ``modes live --relay`` / ``--relay-file``.
+
+MLAT servers and raw archives want Beast frames exactly as the
+receiver sent them, MLAT counter and signal level included, but rarely
+every frame of a busy feed. :class:`BeastRelay` is the source's frame
+hook (``NetworkSource.relay``): it sees each burst as the parser finds
+it, before anything is decoded, and copies the frames that pass its
+filter out of the receive buffer — still escaped — to a
+:class:`~pyModeS.cli._broadcast.Broadcaster` and/or a file (``.gz`` /
+``.zst`` compressed by extension).
+
+The filter reads only the payload's header and parity:
+
+- ``dfs`` — downlink formats to keep.
+- ``icaos`` — addresses to keep: the plain-text ICAO of DF11/17/18,
+  the address recovered from the parity field otherwise.
+- ``crc`` — only frames whose parity checks out: DF17/18 with a zero
+  CRC remainder, DF11 with no more than an interrogator code in it,
+  and the address/parity replies (DF0/4/5/16/20/21) of an aircraft
+  already heard in a CRC-valid DF17/18, like PipeDecoder's trusted
+  ICAO set.
+
+Mode A/C and status frames are never relayed.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Callable, Collection
+
+from pyModeS._bits import crc_remainder
+from pyModeS.cli._broadcast import Broadcaster
+from pyModeS.cli._source import _Buffer, _frame_end
+
+# Replies whose parity field is overlaid with the address.
+_PARITY_DFS = frozenset((0, 4, 5, 16, 20, 21))
+
+# Addresses trusted before starting afresh; the set only grows from
+# CRC-valid squitters, but a long run still sees a lot of aircraft.
+_MAX_TRUSTED = 1 << 16
+
+
+class BeastRelay:
+    """Re-emit the Beast frames that pass a filter, before decoding.
+
+    Writes each burst's kept frames to ``server`` (while it has
+    clients) and ``file`` in one piece. ``seen`` and ``relayed``
+    count the frames offered and written; ``log`` receives a summary
+    line on :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        *,
+        server: Broadcaster | None = None,
+        file: io.BufferedIOBase | None = None,
+        dfs: Collection[int] | None = None,
+        icaos: Collection[int] | None = None,
+        crc: bool = False,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._server = server
+        self._file = file
+        self._dfs = None if dfs is None else frozenset(dfs)
+        self._icaos = None if icaos is None else frozenset(icaos)
+        self._crc = crc
+        self._log = log
+        self._trusted: set[int] = set()
+        self.seen = 0
+        self.relayed = 0
+
+    def __call__(
+        self, buf: _Buffer, frames: list[tuple[int, int, bytes | bytearray]]
+    ) -> None:
+        self.seen += len(frames)
+        server = self._server
+        serving = server is not None and server.clients > 0
+        keep = self._keep
+        if self._file is None and not serving:
+            # Nobody to write to: only the trusted set needs upkeep.
+            if self._crc:
+                for _offset, _mlat, payload in frames:
+                    keep(payload)
+            return
+        find = buf.find
+        chunks = []
+        for offset, _mlat, payload in frames:
+            if not keep(payload):
+                continue
+            # Type, MLAT(6), signal(1) and payload, unless escaped
+            # bytes make the frame longer.
+            stop = offset + 9 + len(payload)
+            if find(b"\x1a", offset + 2, stop) != -1:
+                stop = _frame_end(buf, offset)
+            chunks.append(buf[offset:stop])
+        if not chunks:
+            return
+        self.relayed += len(chunks)
+        data = b"".join(chunks)
+        if serving and server is not None:
+            server.send(data)
+        if self._file is not None:
+            self._file.write(data)
+
+    def _keep(self, payload: bytes | bytearray) -> bool:
+        df = payload[0] >> 3
+        dfs = self._dfs
+        icaos = self._icaos
+        if not self._crc and icaos is None:
+            return dfs is None or df in dfs
+        n = int.from_bytes(payload, "big")
+        length = len(payload) * 8
+        if df in (11, 17, 18):
+            icao = (n >> (length - 32)) & 0xFFFFFF
+            if self._crc:
+                remainder = crc_remainder(n, length)
+                if df == 11:
+                    # The parity carries the interrogator's II/SI code.
+                    if remainder & ~0x7F:
+                        return False
+                elif remainder:
+                    return False
+                else:
+                    trusted = self._trusted
+                    if len(trusted) >= _MAX_TRUSTED:
+                        trusted.clear()
+                    trusted.add(icao)
+        else:
+            icao = crc_remainder(n, length)
+            if self._crc and (df not in _PARITY_DFS or icao not in self._trusted):
+                return False
+        if dfs is not None and df not in dfs:
+            return False
+        return icaos is None or icao in icaos
+
+    def close(self) -> None:
+        """Close the outputs and log how much was relayed."""
+        try:
+            if self._file is not None:
+                self._file.close()
+        finally:
+            if self._server is not None:
+                self._server.close()
+        if self._log is not None:
+            self._log(f"relayed {self.relayed} of {self.seen} frames")
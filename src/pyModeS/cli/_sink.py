@@ -3,95 +3,305 @@
 Three sink classes sharing a common interface:
 
 - ``JsonLinesSink`` — writes compact JSON lines to a text file handle
-  (stdout by default). One line per decoded message.
+  (stdout by default). One line per decoded message, flushed per line
+  or batched under a size/time flush policy.
 - ``TeeSink`` — wraps a primary sink and mirrors every write to a
-  secondary sink (typically stdout + a file).
+  secondary sink (typically stdout + a file), encoding each record's
+  JSON line once for all the sinks that write one.
 - ``NullSink`` — discards every write (used by ``--quiet``).
 
 The rich-based ``TuiSink`` lives in ``_tui.py`` (lazy-imported only
 when ``--tui`` is set) so that users without the ``pyModeS[tui]``
 extra don't pay the ``rich`` import cost on every ``modes live`` run.
+``ColumnarSink`` (Parquet / Arrow IPC ``--dump-to``) lives in
+``_columnar.py`` for the same reason: it needs the optional
+``pyModeS[arrow]`` extra. ``SqliteSink`` (``_sqlite.py``) is stdlib
+only but is likewise imported just when selected; both are opened
+through :func:`open_file_sink` and share :data:`SCHEMA_COLUMNS`.
+``BroadcastSink`` (``--serve``) and the server behind it live in
+``_broadcast.py``.
 
 All sinks implement ``write(decoded) -> None`` and ``close() -> None``.
 The live main loop calls ``write`` for every decoded message and
-``close`` during graceful shutdown.
+``close`` during graceful shutdown. While the feed is idle it calls
+``flush_due()`` instead, so a sink holding records back under a time
+limit writes them out without waiting for the next one.
+``writes_raw_msg`` tells the loop whether the sink serialises the
+``raw_msg`` field; the hex string is only built for sinks that do.
+``pending`` is the number of records buffered but not yet written
+out, exported by ``modes live --metrics`` as the sink queue depth.
+
+Sinks whose output is the record's compact JSON line (``JsonLinesSink``,
+``BroadcastSink``) also implement :class:`LineSink`, so a ``TeeSink``
+can hand them one shared encoding.
 """
 
 from __future__ import annotations
 
-import json
+import contextlib
 import sys
-from typing import IO, Protocol
+import time
+from typing import IO, Protocol, runtime_checkable
 
+from pyModeS._json import dumps
+from pyModeS._schema import _FULL_SCHEMA
+from pyModeS.cli._compress import open_text_write
 from pyModeS.message import Decoded
 
 
+def _kind(annotation: type | str) -> str:
+    """``"int | None"`` or ``int`` -> ``"int"``."""
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return annotation.removesuffix(" | None")
+
+
+# Column name -> value kind ("int", "float", "bool", "str" or
+# "list[str]") for the typed file sinks: every _FULL_SCHEMA key plus
+# the timestamp ``modes live`` stamps on.
+SCHEMA_COLUMNS: dict[str, str] = {
+    key: _kind(annotation) for key, annotation in _FULL_SCHEMA.items()
+}
+SCHEMA_COLUMNS["timestamp"] = "float"
+
+
 class Sink(Protocol):
+    @property
+    def writes_raw_msg(self) -> bool: ...
+    @property
+    def pending(self) -> int: ...
     def write(self, decoded: Decoded) -> None: ...
+    def flush_due(self) -> None: ...
     def close(self) -> None: ...
 
 
+@runtime_checkable
+class LineSink(Sink, Protocol):
+    @property
+    def takes_lines(self) -> bool: ...
+    def write_line(self, line: str) -> None: ...
+
+
 class JsonLinesSink:
     """Write compact JSON lines to a text stream (default: stdout).
 
-    Each ``write(decoded)`` call emits exactly one line to the stream
-    with no indentation. The stream is flushed after every write so
-    tailers see output immediately (important for ``--dump-to`` file
-    consumers running ``tail -f``).
+    Each ``write(decoded)`` call emits exactly one line with no
+    indentation. By default the stream is flushed after every write
+    so tailers see output immediately (important for ``--dump-to``
+    file consumers running ``tail -f``).
+
+    Setting any of ``max_records``, ``max_bytes`` or ``max_delay``
+    (seconds) buffers lines instead and writes them out in one call
+    once the buffer holds that many records or bytes, or its oldest
+    line is that old — whichever comes first. The age is checked as
+    records arrive and on :meth:`flush_due`, which ``modes live``
+    calls while the feed is quiet. ``close()`` always flushes, and
+    ``modes live`` closes its sinks on SIGINT/SIGTERM.
     """
 
-    def __init__(self, stream: IO[str] | None = None) -> None:
+    writes_raw_msg = True
+
+    def __init__(
+        self,
+        stream: IO[str] | None = None,
+        *,
+        max_records: int | None = None,
+        max_bytes: int | None = None,
+        max_delay: float | None = None,
+    ) -> None:
         self._stream = stream if stream is not None else sys.stdout
         self._owns_stream = False
+        self._buffered = any(
+            limit is not None for limit in (max_records, max_bytes, max_delay)
+        )
+        self._max_records = max_records
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
 
     @classmethod
-    def to_file(cls, path: str) -> JsonLinesSink:
-        """Open a file in line-buffered mode and wrap it."""
-        # buffering=1 → line buffered (text mode)
-        fh = open(path, "w", buffering=1)  # noqa: SIM115
-        sink = cls(fh)
+    def to_file(
+        cls,
+        path: str,
+        *,
+        max_records: int | None = None,
+        max_bytes: int | None = None,
+        max_delay: float | None = None,
+    ) -> JsonLinesSink:
+        """Open ``path`` for writing and wrap it.
+
+        Without a flush policy the file is line-buffered; with one the
+        sink does its own batching, so the file uses default buffering.
+        A ``.gz`` or ``.zst`` path is compressed (see ``_compress``).
+        """
+        sink = cls(
+            None, max_records=max_records, max_bytes=max_bytes, max_delay=max_delay
+        )
+        sink._stream = open_text_write(path, line_buffered=not sink._buffered)
         sink._owns_stream = True
         return sink
 
+    @property
+    def pending(self) -> int:
+        """Records buffered and not yet written to the stream."""
+        return len(self._pending)
+
+    # Always wants lines; see LineSink.
+    takes_lines = True
+
     def write(self, decoded: Decoded) -> None:
-        line = json.dumps(decoded, separators=(",", ":"), default=str)
-        self._stream.write(line)
-        self._stream.write("\n")
+        self.write_line(dumps(decoded))
+
+    def write_line(self, line: str) -> None:
+        """Write one already encoded record (no trailing newline)."""
+        if not self._buffered:
+            self._stream.write(line)
+            self._stream.write("\n")
+            self._stream.flush()
+            return
+        pending = self._pending
+        if not pending:
+            self._pending_since = time.monotonic()
+        pending.append(line)
+        # The encoder escapes non-ASCII, so len() is the byte count.
+        self._pending_bytes += len(line) + 1
+        if (
+            (self._max_records is not None and len(pending) >= self._max_records)
+            or (self._max_bytes is not None and self._pending_bytes >= self._max_bytes)
+            or (
+                self._max_delay is not None
+                and time.monotonic() - self._pending_since >= self._max_delay
+            )
+        ):
+            self.flush()
+
+    def flush_due(self) -> None:
+        """Flush if the oldest buffered line is ``max_delay`` old."""
+        if (
+            self._pending
+            and self._max_delay is not None
+            and time.monotonic() - self._pending_since >= self._max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered lines and flush the stream."""
+        if self._pending:
+            self._pending.append("")
+            self._stream.write("\n".join(self._pending))
+            self._pending.clear()
+            self._pending_bytes = 0
         self._stream.flush()
 
     def close(self) -> None:
+        self.flush()
         if self._owns_stream:
             self._stream.close()
 
 
+def open_file_sink(
+    path: str,
+    fmt: str,
+    *,
+    flush_records: int | None = None,
+    flush_bytes: int | None = None,
+    flush_delay: float | None = None,
+    row_group_size: int | None = None,
+    rotate_bytes: int | None = None,
+    rotate_seconds: float | None = None,
+) -> Sink:
+    """Open the ``--dump-to`` sink for ``fmt``.
+
+    ``fmt`` is ``"jsonl"``, ``"sqlite"``, ``"parquet"`` or ``"arrow"``.
+    The flush limits apply to JSON lines (and, except for bytes, to
+    SQLite transactions); the row-group and rotation settings to
+    Parquet/Arrow. The SQLite and columnar sinks are imported only
+    here. Raises ImportError for parquet/arrow without pyarrow.
+    """
+    if fmt == "jsonl":
+        return JsonLinesSink.to_file(
+            path,
+            max_records=flush_records,
+            max_bytes=flush_bytes,
+            max_delay=flush_delay,
+        )
+    if fmt == "sqlite":
+        from pyModeS.cli._sqlite import SqliteSink
+
+        return SqliteSink(path, batch_records=flush_records, batch_delay=flush_delay)
+    from pyModeS.cli._columnar import ColumnarSink
+
+    return ColumnarSink(
+        path,
+        fmt=fmt,
+        row_group_size=row_group_size,
+        rotate_bytes=rotate_bytes,
+        rotate_seconds=rotate_seconds,
+    )
+
+
 class TeeSink:
     """Wraps a primary sink and mirrors every write to a secondary.
 
     Used by ``modes live --dump-to FILE`` to send JSON lines both to
-    stdout and to the dump file. Closing the tee closes both underlying
-    sinks.
+    stdout and to the dump file. Nested tees are flattened, and each
+    record is encoded once for every :class:`LineSink` that currently
+    takes lines. Closing the tee closes all underlying sinks.
     """
 
     def __init__(self, primary: Sink, secondary: Sink) -> None:
-        self._primary = primary
-        self._secondary = secondary
+        self._sinks: list[Sink] = []
+        for part in (primary, secondary):
+            self._sinks.extend(part._sinks if isinstance(part, TeeSink) else (part,))
+        self._line_sinks: list[LineSink] = []
+        self._other_sinks: list[Sink] = []
+        for sink in self._sinks:
+            if isinstance(sink, LineSink):
+                self._line_sinks.append(sink)
+            else:
+                self._other_sinks.append(sink)
+
+    @property
+    def writes_raw_msg(self) -> bool:
+        return any(sink.writes_raw_msg for sink in self._sinks)
+
+    @property
+    def pending(self) -> int:
+        return sum(sink.pending for sink in self._sinks)
 
     def write(self, decoded: Decoded) -> None:
-        self._primary.write(decoded)
-        self._secondary.write(decoded)
+        line = None
+        for line_sink in self._line_sinks:
+            if line_sink.takes_lines:
+                if line is None:
+                    line = dumps(decoded)
+                line_sink.write_line(line)
+        for sink in self._other_sinks:
+            sink.write(decoded)
+
+    def flush_due(self) -> None:
+        for sink in self._sinks:
+            sink.flush_due()
 
     def close(self) -> None:
-        try:
-            self._primary.close()
-        finally:
-            self._secondary.close()
+        with contextlib.ExitStack() as stack:
+            for sink in reversed(self._sinks):
+                stack.callback(sink.close)
 
 
 class NullSink:
     """Sink that discards every write. Used by ``--quiet`` with no dump."""
 
+    writes_raw_msg = False
+    pending = 0
+
     def write(self, decoded: Decoded) -> None:
         pass
 
+    def flush_due(self) -> None:
+        pass
+
     def close(self) -> None:
         pass
@@ -1,9 +1,22 @@
-"""Network source + beast frame parser for ``modes live``.
+"""Network and capture-file sources + beast frame parser.
 
 ``NetworkSource`` opens a TCP socket to a dump1090-style Mode-S feed,
 verifies the stream is Mode-S Beast binary format, parses frames into
 hex strings, and yields ``(hex_msg, timestamp)`` tuples.
 
+``MultiNetworkSource`` multiplexes several such feeds with
+:mod:`selectors` and merges their frames into one timestamp-ordered
+stream, calibrating and reconnecting each feed independently.
+
+``UnixSource`` and ``PipeSource`` read the same stream from a Unix
+socket or a pipe (stdin), for receivers on the same host.
+
+``BeastFileSource`` yields the same tuples from a raw Beast capture
+file (``.beast``), memory-mapped and parsed in place, with the
+receiver's MLAT counter as the timestamp. ``open_capture`` picks
+between it and the hex / CSV text reader for a capture path, as used
+by ``modes decode --file`` and ``modes replay``.
+
 Only Mode-S Beast binary is supported — that covers dump1090's default
 port 30005, dump1090-fa, readsb, piaware, the AirSquitter receiver,
 and most modern Mode-S feeds. The legacy AVR raw text format (port
@@ -28,10 +41,28 @@ FlightAware dump1090 ``net_io.c::modesReadFromClient``)::
 
 from __future__ import annotations
 
+import contextlib
+import errno
+import heapq
+import mmap
+import os
+import select
+import selectors
 import socket
 import sys
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from pyModeS.cli._compress import (
+    _read_error,
+    compression,
+    open_binary,
+    open_text,
+    read_bytes,
+)
 
 _DETECT_CAP = 16 * 1024  # give up on auto-detect after 16 KB
 
@@ -57,6 +88,45 @@ _BODY_LEN_MODE_AC = 7 + 2  # type 0x31
 _MLAT_HZ_DUMP1090: float = 12_000_000.0
 _MLAT_HZ_RADARCAPE: float = 1_000_000_000.0
 
+# Counter wrap points. Radarcape-style counters restart at midnight;
+# free-running 12 MHz counters wrap at the 48-bit limit.
+_MLAT_WRAP_TICKS: dict[float, int] = {
+    _MLAT_HZ_DUMP1090: 1 << 48,
+    _MLAT_HZ_RADARCAPE: 86_400 * 1_000_000_000,
+}
+
+# BeastFileSource has no wall clock to calibrate against, so it infers
+# the tick rate from the capture itself: the median gap between
+# consecutive ADS-B squitters of one aircraft (~0.1-1 s in practice)
+# is ~1e6-1e7 ticks at 12 MHz and ~1e8-1e9 at 1 GHz. The geometric
+# mean of the two rates at 0.2 s separates them with a wide margin.
+_DETECT_FRAMES = 4096
+
+# BeastFileSource parses its mapping in windows of this many bytes.
+_FILE_WINDOW = 1 << 20
+
+# NetworkSource receive buffer. Only an incomplete trailing frame
+# (tens of bytes) survives between reads, so this never needs to grow.
+_RECV_BUF_SIZE = 64 * 1024
+
+# Receive buffer of the local sources (Unix socket, pipe), and the
+# pipe size asked for: a co-located receiver can hand over far more
+# than a TCP segment's worth per read.
+_LOCAL_BUF_SIZE = 1 << 20
+
+# NetworkSource, UnixSource and PipeSource wait this long for input
+# before yielding an empty burst, so the consumer can check its stop
+# flag and flush age-limited sinks while the feed is quiet or down.
+_IDLE_POLL_S = 0.1
+_DETECT_GAP_SPLIT = 0.2 * (_MLAT_HZ_DUMP1090 * _MLAT_HZ_RADARCAPE) ** 0.5
+
+# MultiNetworkSource holds frames this long (seconds of wall-clock
+# time) so slower feeds can catch up before frames are released in
+# timestamp order, and polls its selector at this interval so held
+# frames and reconnects are serviced even when every feed is quiet.
+_MERGE_WINDOW_S = 0.5
+_MULTI_POLL_S = 0.05
+
 # Minimum wall-clock delta between calibration samples — a new
 # rate estimate is only accepted when the two anchoring bursts
 # are spaced at least this far apart. Avoids dividing by tiny
@@ -79,140 +149,155 @@ def _detect_format(chunk: bytes) -> bool:
     return b"\x1a" in chunk
 
 
-def _walk_body(buf: bytes, start: int, body_len: int) -> tuple[list[int], int]:
-    """Walk the beast body starting at ``buf[start]`` un-escaping 0x1a 0x1a.
-
-    Collects ``body_len`` un-escaped bytes (MLAT + SIG + PAYLOAD) and
-    returns (body_bytes, next_index) where next_index points to the
-    first byte after the last consumed byte in ``buf``.
+# Body length per beast frame type; 0x34 status frames have no fixed
+# length and run to the next frame marker.
+_BODY_LEN: dict[int, int] = {
+    0x31: _BODY_LEN_MODE_AC,
+    0x32: _BODY_LEN_SHORT,
+    0x33: _BODY_LEN_LONG,
+}
 
-    If the buffer ends before ``body_len`` un-escaped bytes have been
-    collected, returns (partial_body, -1) to signal incompleteness.
-    """
-    body: list[int] = []
-    j = start
-    while j < len(buf) and len(body) < body_len:
-        b = buf[j]
-        if b == 0x1A:
-            if j + 1 >= len(buf):
-                # Dangling 0x1a at end of buffer — can't tell yet if
-                # it's a literal (0x1a 0x1a) or the start of the next
-                # frame. Wait for more bytes.
-                return body, -1
-            if buf[j + 1] == 0x1A:
-                body.append(0x1A)
-                j += 2
-                continue
-            # Unescaped 0x1a mid-body means the frame is truncated
-            # and the 0x1a is the start of the next frame. Caller
-            # will treat the current frame as incomplete.
-            return body, -1
-        body.append(b)
-        j += 1
-    if len(body) < body_len:
-        return body, -1
-    return body, j
+# Anything exposing bytes.find-style ``find(sub, start, end)`` and
+# int indexing: the recv bytearray, a capture mmap, plain bytes.
+_Buffer = bytes | bytearray | mmap.mmap
 
+# Frame hook of NetworkSource: the receive buffer and the frames
+# _scan_frames found in it.
+Relay = Callable[[_Buffer, list[tuple[int, int, bytes | bytearray]]], None]
 
-def _parse_beast_buffer(buf: bytes) -> tuple[list[tuple[int, str]], bytes]:
-    """Parse a beast-format byte buffer into frames + remainder.
 
-    Scans forward through ``buf`` looking for frame starts (0x1a).
-    For each recognised frame (types 0x32 and 0x33), un-escapes the
-    body and extracts the 48-bit MLAT counter and the payload hex.
-    Mode AC (0x31) and status (0x34) frames are skipped but still
-    advance the parse cursor. Unknown type bytes are also skipped.
+def _read_body(
+    buf: _Buffer, start: int, body_len: int, end: int
+) -> tuple[bytes | None, int]:
+    """Un-escape ``body_len`` body bytes from ``buf[start:end]``.
 
-    Returns ``(frames, remainder)`` where ``frames`` is a list of
-    ``(mlat_ticks, payload_hex)`` tuples and ``remainder`` is the
-    tail of the buffer containing any incomplete trailing frame
-    (from the last 0x1a that couldn't be fully parsed). The caller
-    should prepend the remainder to the next chunk of bytes before
-    the next parse.
+    Slow path for bodies containing 0x1a: each escaped pair is found
+    with ``find`` and the runs between them are sliced, never walked
+    byte by byte.
 
-    ``mlat_ticks`` is the big-endian 48-bit counter at the head of
-    the beast body. Interpretation (unix time vs free-running) is
-    receiver-dependent; :class:`NetworkSource` anchors the first
-    frame's MLAT against ``time.time()`` and computes per-frame
-    wall-clock from the 12 MHz tick rate used by dump1090-compatible
-    feeds.
+    Returns ``(body, next_index)``. When the body cannot be completed
+    ``body`` is None and ``next_index`` is -1 if ``buf`` ran out first
+    (wait for more bytes), or the index of the unescaped 0x1a that
+    cut the body short (a corrupt frame; resync there).
     """
-    frames: list[tuple[int, str]] = []
-    i = 0
-    last_consumed = 0
+    find = buf.find
+    parts: list[bytes | bytearray] = []
+    need = body_len
+    j = start
+    while True:
+        stop = j + need
+        k = find(b"\x1a", j, min(stop, end))
+        if k == -1:
+            if stop > end:
+                return None, -1
+            parts.append(buf[j:stop])
+            return b"".join(parts), stop
+        parts.append(buf[j:k])
+        need -= k - j
+        if k + 1 >= end:
+            return None, -1
+        if buf[k + 1] != 0x1A:
+            return None, k
+        parts.append(b"\x1a")
+        need -= 1
+        j = k + 2
+        if need == 0:
+            return b"".join(parts), j
 
-    while i < len(buf):
-        if buf[i] != 0x1A:
-            i += 1
-            continue
 
-        # Potential frame start at buf[i]
-        if i + 1 >= len(buf):
-            # Dangling 0x1a, wait for more bytes
-            break
+def _scan_frames(
+    buf: _Buffer, pos: int, end: int, *, final: bool = False
+) -> tuple[list[tuple[int, int, bytes | bytearray]], int, int]:
+    """Parse beast frames from ``buf[pos:end]`` in place.
 
-        msg_type = buf[i + 1]
+    Returns ``(frames, consumed, resyncs)``. ``frames`` holds one
+    ``(offset, mlat_ticks, payload)`` tuple per Mode-S short (0x32)
+    or long (0x33) frame, ``offset`` being the frame's 0x1a marker.
+    ``consumed`` is where parsing stopped: the start of an incomplete
+    trailing frame (to be completed by the next read) or ``end``.
+    ``resyncs`` counts the corrupt frames and unknown type bytes
+    skipped on the way.
 
-        if msg_type == 0x32:
-            body_len = _BODY_LEN_SHORT
-            payload_offset = 7
-        elif msg_type == 0x33:
-            body_len = _BODY_LEN_LONG
-            payload_offset = 7
+    Frame markers are located with ``find``. A body with no 0x1a in
+    it — nearly all of them — is sliced out in one go; only bodies
+    with escaped bytes go through :func:`_read_body`. Mode A/C
+    (0x31), status (0x34) and unknown frame types are skipped; a
+    corrupt frame (unescaped 0x1a mid-body) is dropped and parsing
+    resyncs at that marker. With ``final`` the buffer is known to be
+    complete (a capture file), so a trailing status frame runs to
+    ``end`` rather than waiting for more bytes.
+    """
+    frames: list[tuple[int, int, bytes | bytearray]] = []
+    append = frames.append
+    find = buf.find
+    from_bytes = int.from_bytes
+    resyncs = 0
+    i = find(b"\x1a", pos, end)
+    while i != -1:
+        if i + 1 >= end:
+            return frames, i, resyncs  # dangling marker; type byte not here yet
+        msg_type = buf[i + 1]
+        if msg_type == 0x33 or msg_type == 0x32:
+            start = i + 2
+            stop = start + (_BODY_LEN_LONG if msg_type == 0x33 else _BODY_LEN_SHORT)
+            if stop <= end and find(b"\x1a", start, stop) == -1:
+                # Body layout: MLAT(6, big-endian) + SIG(1) + PAYLOAD.
+                append(
+                    (
+                        i,
+                        from_bytes(buf[start : start + 6], "big"),
+                        buf[start + 7 : stop],
+                    )
+                )
+                i = find(b"\x1a", stop, end)
+                continue
+            body, nxt = _read_body(buf, start, stop - start, end)
+            if body is None:
+                if nxt == -1:
+                    return frames, i, resyncs
+                resyncs += 1
+                i = nxt
+                continue
+            append((i, from_bytes(body[:6], "big"), body[7:]))
+            i = find(b"\x1a", nxt, end)
         elif msg_type == 0x31:
-            # Mode A/C: skip
-            body, next_i = _walk_body(buf, i + 2, _BODY_LEN_MODE_AC)
-            if next_i == -1:
-                break  # incomplete; keep remainder from i
-            i = next_i
-            last_consumed = next_i
-            continue
+            body, nxt = _read_body(buf, i + 2, _BODY_LEN_MODE_AC, end)
+            if nxt == -1:
+                return frames, i, resyncs
+            i = find(b"\x1a", nxt, end)
         elif msg_type == 0x34:
-            # Status frame: skip. Length is format-defined but we
-            # don't know it precisely; scan to the next unescaped
-            # 0x1a to resync.
-            j = i + 2
-            while j < len(buf):
-                if buf[j] == 0x1A:
-                    if j + 1 < len(buf) and buf[j + 1] == 0x1A:
-                        j += 2
-                        continue
-                    break
-                j += 1
-            if j >= len(buf):
-                break  # incomplete; keep remainder from i
+            j = find(b"\x1a", i + 2, end)
+            while j != -1 and j + 1 < end and buf[j + 1] == 0x1A:
+                j = find(b"\x1a", j + 2, end)
+            if j == -1 or j + 1 >= end:
+                return frames, end if final else i, resyncs
             i = j
-            last_consumed = j
-            continue
         else:
-            # Unknown type byte — advance past the escape and try
-            # again at the next byte.
-            i += 1
-            continue
+            # Unknown type byte (including a second 0x1a): advance
+            # past this marker and retry from the next one.
+            resyncs += 1
+            i = find(b"\x1a", i + 1, end)
+    return frames, end, resyncs
 
-        body, next_i = _walk_body(buf, i + 2, body_len)
-        if next_i == -1:
-            # Incomplete frame; keep remainder starting at i so the
-            # next call can continue from this frame's 0x1a.
-            break
 
-        # Body layout (after un-escape): MLAT(6) + SIG(1) + PAYLOAD.
-        # The MLAT counter is big-endian 48-bit; NetworkSource turns
-        # it into a wall-clock timestamp via an anchor set on the
-        # first frame.
-        mlat_ticks = int.from_bytes(bytes(body[:6]), "big")
-        payload_bytes = bytes(body[payload_offset:])
-        frames.append((mlat_ticks, payload_bytes.hex().upper()))
-        i = next_i
-        last_consumed = next_i
-
-    remainder = buf[last_consumed:] if last_consumed > 0 else buf
-    # If we consumed nothing AND found no frames, return the whole
-    # buffer as remainder (waiting for more bytes). If we consumed
-    # everything cleanly, return empty.
-    if not frames and last_consumed == 0:
-        return frames, buf
-    return frames, remainder
+def _parse_beast_buffer(buf: bytes) -> tuple[list[tuple[int, str]], bytes]:
+    """Parse a beast-format byte buffer into frames + remainder.
+
+    Convenience wrapper over :func:`_scan_frames` for callers holding
+    a plain ``bytes`` chunk. Returns ``(frames, remainder)`` where
+    ``frames`` is a list of ``(mlat_ticks, payload_hex)`` tuples and
+    ``remainder`` is the tail of the buffer holding any incomplete
+    trailing frame, to be prepended to the next chunk.
+
+    ``mlat_ticks`` is the big-endian 48-bit counter at the head of
+    the beast body. Interpretation (unix time vs free-running) is
+    receiver-dependent; :class:`NetworkSource` calibrates its tick
+    rate against wall-clock time.
+    """
+    frames, consumed, _resyncs = _scan_frames(buf, 0, len(buf))
+    return [(mlat, payload.hex().upper()) for _o, mlat, payload in frames], buf[
+        consumed:
+    ]
 
 
 class NetworkSource:
@@ -224,6 +309,18 @@ class NetworkSource:
         for hex_msg, timestamp in src:
             ...
 
+    With ``raw=True`` the iterator yields the payload ``bytes``
+    instead of a hex string. :meth:`PipeDecoder.decode` accepts those
+    directly, so a consumer that only needs the hex for output can
+    defer (or skip) the conversion. :meth:`iter_batches` yields whole
+    recv bursts as parallel lists instead of one frame at a time.
+
+    ``relay``, if set, sees every burst's frames before they are
+    yielded: it is called with the receive buffer and the
+    ``(offset, mlat_ticks, payload)`` tuples of :func:`_scan_frames`,
+    so it can copy frames out exactly as received (``modes live
+    --relay``, see ``_relay.py``).
+
     Iterator never terminates under normal operation — it reconnects
     on dropped connections with exponential backoff. Caller is
     responsible for interrupting via signal (Ctrl-C) or by raising
@@ -236,6 +333,8 @@ class NetworkSource:
     feed.
     """
 
+    _buf_size = _RECV_BUF_SIZE
+
     def __init__(
         self,
         host: str,
@@ -245,6 +344,8 @@ class NetworkSource:
         read_timeout: float = 30.0,
         on_detect: Callable[[str], None] | None = None,
         silent: bool = False,
+        raw: bool = False,
+        relay: Relay | None = None,
     ) -> None:
         self.host = host
         self.port = port
@@ -257,8 +358,14 @@ class NetworkSource:
         # rich.live.Live's alt-screen buffer without corrupting the
         # rendered table.
         self.silent = silent
+        self.raw = raw
+        self.relay = relay
         self._sock: socket.socket | None = None
-        self._buf: bytes = b""
+        # Fixed receive buffer filled in place by recv_into; bytes
+        # [0, _filled) are unparsed data carried over between reads.
+        self._buf = bytearray(self._buf_size)
+        self._view = memoryview(self._buf)
+        self._filled = 0
         self._detected: bool = False
         # MLAT-to-wall-clock calibration state. A per-recv() anchor
         # (wall time + first-frame MLAT in the burst) drives per-
@@ -268,35 +375,73 @@ class NetworkSource:
         self._prev_burst_wall: float | None = None
         self._prev_burst_mlat: int | None = None
         self._rate_estimate: float | None = None
+        # Lifetime counters, read by ``modes live --metrics``: dropped
+        # connections, and times the parser skipped bytes to find the
+        # next frame (preamble, corrupt frame, unknown type byte).
+        self.reconnects = 0
+        self.resyncs = 0
 
-    def __iter__(self) -> Iterator[tuple[str, float]]:
+    @property
+    def name(self) -> str:
+        """The feed's ``host:port``, for status lines."""
+        return f"{self.host}:{self.port}"
+
+    @property
+    def sources(self) -> list[NetworkSource]:
+        """The per-feed sources: just this one."""
+        return [self]
+
+    def __iter__(self) -> Iterator[tuple[str | bytes, float]]:
+        for msgs, timestamps in self.iter_batches():
+            yield from zip(msgs, timestamps, strict=True)
+
+    def iter_batches(self) -> Iterator[tuple[list[str | bytes], list[float]]]:
+        """Yield one ``(msgs, timestamps)`` pair of lists per recv burst.
+
+        The lists are parallel: ``timestamps[i]`` is the MLAT-derived
+        wall-clock time of ``msgs[i]``, computed for the whole burst in
+        one pass. Consumers that loop over a burst themselves avoid a
+        generator resume per frame. A quiet feed, or one waiting out
+        a reconnect backoff, yields empty lists. Reconnects exactly
+        like iterating the source frame by frame, which is built on
+        top of this.
+        """
         backoff = 0.5
         while True:
             try:
                 self._connect()
                 backoff = 0.5  # reset on successful connect
-                yield from self._read_loop()
+                yield from self._read_bursts()
             except UnsupportedStreamError:
                 raise
             except (OSError, TimeoutError) as e:
+                self.reconnects += 1
                 if not self.silent:
                     print(
                         f"[pyModeS.live] connection dropped ({e}); "
                         f"retrying in {backoff:.1f}s",
                         file=sys.stderr,
                     )
-                time.sleep(backoff)
+                # Wait in slices so the consumer can still stop and
+                # flush its sinks while the receiver is down.
+                resume = time.monotonic() + backoff
+                while (left := resume - time.monotonic()) > 0:
+                    time.sleep(min(left, _IDLE_POLL_S))
+                    yield [], []
                 backoff = min(backoff * 2, 10.0)
-                self._detected = False
-                self._buf = b""
-                # New TCP connection → the receiver's MLAT epoch
-                # may be unrelated to the previous one (and on
-                # radarcape feeds may even change after midnight).
-                # Drop the calibration state so the next burst
-                # re-anchors.
-                self._prev_burst_wall = None
-                self._prev_burst_mlat = None
-                self._rate_estimate = None
+                self._reset()
+
+    def _reset(self) -> None:
+        """Forget per-connection state before reconnecting."""
+        self._detected = False
+        self._filled = 0
+        # New TCP connection → the receiver's MLAT epoch may be
+        # unrelated to the previous one (and on radarcape feeds may
+        # even change after midnight). Drop the calibration state so
+        # the next burst re-anchors.
+        self._prev_burst_wall = None
+        self._prev_burst_mlat = None
+        self._rate_estimate = None
 
     def _connect(self) -> None:
         self._sock = socket.create_connection(
@@ -304,8 +449,20 @@ class NetworkSource:
         )
         self._sock.settimeout(self.read_timeout)
 
-    def _read_loop(self) -> Iterator[tuple[str, float]]:
-        """Inner loop: read bytes, parse beast frames, yield (hex, ts).
+    def _read_loop(self) -> Iterator[tuple[str | bytes, float]]:
+        """Frame-by-frame view of :meth:`_read_bursts`: yield (msg, ts)."""
+        for msgs, timestamps in self._read_bursts():
+            yield from zip(msgs, timestamps, strict=True)
+
+    def _read_bursts(self) -> Iterator[tuple[list[str | bytes], list[float]]]:
+        """Inner loop: read bytes, parse beast frames, yield per burst.
+
+        Yields ``(msgs, timestamps)`` for every recv burst that
+        completed at least one Mode-S frame, and an empty pair after
+        each ``_IDLE_POLL_S`` without input. ``msgs`` holds the
+        payloads as bytes with ``raw=True``, otherwise as upper-case
+        hex strings. ``read_timeout`` seconds of silence still count
+        as a dropped connection.
 
         Per-frame timestamp strategy:
 
@@ -328,60 +485,687 @@ class NetworkSource:
           nanosecond counters with no configuration.
         """
         assert self._sock is not None
+        sock = self._sock
+        sock.settimeout(min(_IDLE_POLL_S, self.read_timeout))
+        view = self._view
+        heard = time.monotonic()
         while True:
-            chunk = self._sock.recv(8192)
-            if not chunk:
+            try:
+                n = sock.recv_into(view[self._filled :])
+            except TimeoutError:
+                if time.monotonic() - heard >= self.read_timeout:
+                    raise
+                yield [], []
+                continue
+            if not n:
                 raise OSError("connection closed by remote")
-            wall_now = time.time()
-            self._buf += chunk
-
-            # On first real data, verify the stream is beast format
-            # and resync past any pre-marker preamble.
-            if not self._detected:
-                if not _detect_format(self._buf):
-                    if len(self._buf) > _DETECT_CAP:
-                        raise UnsupportedStreamError(
-                            f"no beast marker (0x1a) in {_DETECT_CAP} bytes; "
-                            "stream is not Mode-S Beast binary format"
-                        )
-                    continue
-                self._detected = True
-                if self.on_detect is not None:
-                    self.on_detect("beast")
-                # Resync: drop any pre-marker bytes
-                self._buf = self._buf[self._buf.find(b"\x1a") :]
-
-            # Parse beast frames from the buffer
-            frames, remainder = _parse_beast_buffer(self._buf)
-            self._buf = remainder
-
-            if not frames:
+            heard = time.monotonic()
+            burst = self._consume(n, time.time())
+            if burst is not None:
+                yield burst
+
+    def _consume(
+        self, n: int, wall_now: float
+    ) -> tuple[list[str | bytes], list[float]] | None:
+        """Parse ``n`` bytes just received into the buffer.
+
+        Returns the burst's ``(msgs, timestamps)``, or None when it
+        completed no Mode-S frame. Shared by the blocking read loop
+        and :class:`MultiNetworkSource`, which owns the sockets and
+        only uses a NetworkSource per feed for parsing and MLAT
+        calibration.
+        """
+        buf = self._buf
+        filled = self._filled + n
+
+        # On first real data, verify the stream is beast format
+        # and resync past any pre-marker preamble.
+        start = 0
+        if not self._detected:
+            start = buf.find(b"\x1a", 0, filled)
+            if start == -1:
+                if filled > _DETECT_CAP:
+                    raise UnsupportedStreamError(
+                        f"no beast marker (0x1a) in {_DETECT_CAP} bytes; "
+                        "stream is not Mode-S Beast binary format"
+                    )
+                self._filled = filled
+                return None
+            self._detected = True
+            if start:
+                self.resyncs += 1
+            if self.on_detect is not None:
+                self.on_detect("beast")
+
+        # Parse beast frames in place, then move the incomplete
+        # tail (if any) to the front for the next recv_into.
+        frames, consumed, resyncs = _scan_frames(buf, start, filled)
+        self.resyncs += resyncs
+        if frames and self.relay is not None:
+            # Before the tail moves: the offsets index into buf.
+            self.relay(buf, frames)
+        rest = filled - consumed
+        if rest == len(buf):
+            # A status frame with no end in the whole buffer: not
+            # a real feed. Drop it and resync on the next marker.
+            self.resyncs += 1
+            rest = 0
+        elif rest:
+            buf[:rest] = buf[consumed:filled]
+        self._filled = rest
+
+        if not frames:
+            return None
+
+        # Per-burst anchor: the first frame's MLAT pairs with
+        # wall_now. Interpolate later frames against that.
+        burst_anchor_mlat = frames[0][1]
+
+        # Update the rate estimate from the delta between this
+        # burst's anchor and the previous one. Skip the very
+        # first burst (no prior) and any burst whose wall-clock
+        # delta is too small to give a stable estimate.
+        if self._prev_burst_wall is not None and self._prev_burst_mlat is not None:
+            dw = wall_now - self._prev_burst_wall
+            dm = burst_anchor_mlat - self._prev_burst_mlat
+            if dw >= _CALIB_MIN_DELTA_S and dm > 0:
+                self._rate_estimate = dm / dw
+        self._prev_burst_wall = wall_now
+        self._prev_burst_mlat = burst_anchor_mlat
+
+        rate = self._rate_estimate
+        if rate is not None and rate > 0:
+            timestamps = [
+                wall_now + (mlat - burst_anchor_mlat) / rate
+                for _offset, mlat, _payload in frames
+            ]
+        else:
+            # Pre-calibration fallback: every frame in the burst
+            # gets the same wall_now reading. Lasts only until
+            # the second burst (typically <1 s on a busy feed).
+            timestamps = [wall_now] * len(frames)
+        msgs: list[str | bytes]
+        if self.raw:
+            # Payloads are slices of the bytearray receive buffer;
+            # Message takes bytes, so copy the 7/14 bytes out.
+            msgs = [bytes(payload) for _offset, _mlat, payload in frames]
+        else:
+            msgs = [payload.hex().upper() for _offset, _mlat, payload in frames]
+        return msgs, timestamps
+
+
+class UnixSource(NetworkSource):
+    """Beast feed from a Unix stream socket, for a co-located receiver.
+
+    Parses, calibrates and reconnects exactly like
+    :class:`NetworkSource`; only the connection differs, and reads
+    are larger. While the socket path is gone (receiver restarting)
+    it keeps retrying and yields empty bursts in between, so
+    ``modes live`` still stops on SIGINT/SIGTERM.
+    """
+
+    _buf_size = _LOCAL_BUF_SIZE
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        super().__init__(path, 0, **kwargs)
+        self.path = path
+
+    @property
+    def name(self) -> str:
+        """``unix:PATH``, for status lines."""
+        return f"unix:{self.path}"
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(self.read_timeout)
+        self._sock = sock
+
+
+class PipeSource(NetworkSource):
+    """Beast feed read from a pipe, by default stdin.
+
+    Usage::
+
+        nc rx.local 30005 | modes live --beast-stdin
+
+    Same parser and MLAT calibration as :class:`NetworkSource`, with
+    larger reads, but a pipe can't be reopened: iteration ends at end
+    of input. Reads file descriptor ``fd`` directly, so it works in a
+    child process whose ``sys.stdin`` was replaced. A pipe that stays
+    quiet for ``_IDLE_POLL_S`` yields an empty burst.
+    """
+
+    _buf_size = _LOCAL_BUF_SIZE
+
+    def __init__(self, fd: int = 0, **kwargs: Any) -> None:
+        super().__init__("stdin", 0, **kwargs)
+        self.fd = fd
+
+    @property
+    def name(self) -> str:
+        """``stdin``, or ``fd:N`` for another descriptor."""
+        return "stdin" if self.fd == 0 else f"fd:{self.fd}"
+
+    def iter_batches(self) -> Iterator[tuple[list[str | bytes], list[float]]]:
+        """Yield one ``(msgs, timestamps)`` pair per read, until EOF."""
+        _grow_pipe(self.fd)
+        fd = self.fd
+        view = self._view
+        while True:
+            # A blocking read would outlast SIGINT/SIGTERM: the handler
+            # only sets a flag and the read is restarted (PEP 475).
+            if not select.select([fd], [], [], _IDLE_POLL_S)[0]:
+                yield [], []
                 continue
+            n = os.readv(fd, [view[self._filled :]])
+            if not n:
+                return
+            burst = self._consume(n, time.time())
+            if burst is not None:
+                yield burst
+
+
+def _grow_pipe(fd: int) -> None:
+    # Linux pipes hold 64 KiB by default; a larger one lets the
+    # writer run ahead instead of blocking. Not a pipe, not Linux or
+    # above the system limit: keep what there is.
+    with contextlib.suppress(ImportError, AttributeError, OSError):
+        import fcntl
+
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, _LOCAL_BUF_SIZE)
+
+
+class _Feed:
+    """Connection state for one endpoint of a :class:`MultiNetworkSource`."""
+
+    def __init__(self, source: NetworkSource) -> None:
+        self.source = source
+        self.name = source.name
+        self.sock: socket.socket | None = None
+        self.connected = False
+        # Monotonic deadline for the pending connect, or for the next
+        # byte once connected; retry_at gates the next connect.
+        self.deadline = 0.0
+        self.retry_at = 0.0
+        self.backoff = 0.5
+
 
-            # Per-burst anchor: the first frame's MLAT pairs with
-            # wall_now. Interpolate later frames against that.
-            burst_anchor_mlat = frames[0][0]
-
-            # Update the rate estimate from the delta between this
-            # burst's anchor and the previous one. Skip the very
-            # first burst (no prior) and any burst whose wall-clock
-            # delta is too small to give a stable estimate.
-            if self._prev_burst_wall is not None and self._prev_burst_mlat is not None:
-                dw = wall_now - self._prev_burst_wall
-                dm = burst_anchor_mlat - self._prev_burst_mlat
-                if dw >= _CALIB_MIN_DELTA_S and dm > 0:
-                    self._rate_estimate = dm / dw
-            self._prev_burst_wall = wall_now
-            self._prev_burst_mlat = burst_anchor_mlat
-
-            rate = self._rate_estimate
-            for mlat, hex_msg in frames:
-                if rate is not None and rate > 0:
-                    ts = wall_now + (mlat - burst_anchor_mlat) / rate
+class MultiNetworkSource:
+    """Merge several beast TCP feeds into one timestamp-ordered stream.
+
+    Usage::
+
+        src = MultiNetworkSource([("rx1.local", 30005), ("rx2.local", 30005)])
+        for msg, timestamp in src:
+            ...
+
+    A single thread multiplexes every connection with :mod:`selectors`.
+    Each feed gets its own :class:`NetworkSource` for parsing and MLAT
+    rate calibration (it never opens a socket itself) and its own
+    reconnect backoff, so a dead or slow receiver never stalls the
+    others. Frames are held for ``merge_window`` seconds of wall-clock
+    time and then released in timestamp order; a frame that arrives
+    after later ones have already been released goes out with the next
+    batch rather than being dropped. Frames heard by several receivers
+    are passed on once per receiver.
+
+    Yields the same ``(msg, timestamp)`` tuples and
+    :meth:`iter_batches` bursts as :class:`NetworkSource`; a ``relay``
+    is called per feed, as frames arrive rather than in merged order.
+    A feed that turns out not to be beast raises
+    :class:`UnsupportedStreamError`.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[tuple[str, int]],
+        *,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        on_detect: Callable[[str], None] | None = None,
+        silent: bool = False,
+        raw: bool = False,
+        relay: Relay | None = None,
+        merge_window: float = _MERGE_WINDOW_S,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.silent = silent
+        self.merge_window = merge_window
+        self._feeds = [
+            _Feed(
+                NetworkSource(
+                    host,
+                    port,
+                    on_detect=on_detect,
+                    silent=silent,
+                    raw=raw,
+                    relay=relay,
+                )
+            )
+            for host, port in endpoints
+        ]
+
+    @property
+    def name(self) -> str:
+        """The first feed's ``host:port`` and how many others follow."""
+        first = self._feeds[0].name
+        others = len(self._feeds) - 1
+        return f"{first} +{others}" if others else first
+
+    @property
+    def sources(self) -> list[NetworkSource]:
+        """The per-feed sources, with each feed's counters."""
+        return [feed.source for feed in self._feeds]
+
+    def __iter__(self) -> Iterator[tuple[str | bytes, float]]:
+        for msgs, timestamps in self.iter_batches():
+            yield from zip(msgs, timestamps, strict=True)
+
+    def iter_batches(self) -> Iterator[tuple[list[str | bytes], list[float]]]:
+        """Yield released frames as parallel ``(msgs, timestamps)`` lists.
+
+        Each batch holds every frame older than the merge window,
+        oldest first; it is empty when no frame was due at a poll.
+        Never terminates under normal operation.
+        """
+        sel = selectors.DefaultSelector()
+        # (timestamp, arrival seq, msg); seq keeps equal timestamps in
+        # arrival order and msgs out of the comparison.
+        pending: list[tuple[float, int, str | bytes]] = []
+        seq = 0
+        try:
+            while True:
+                mono = time.monotonic()
+                for feed in self._feeds:
+                    if feed.sock is None:
+                        if mono >= feed.retry_at:
+                            self._open(sel, feed, mono)
+                    elif mono >= feed.deadline:
+                        self._drop(sel, feed, TimeoutError("timed out"), mono)
+
+                if sel.get_map():
+                    events = sel.select(_MULTI_POLL_S)
                 else:
-                    # Pre-calibration fallback: every frame in the
-                    # burst gets the same wall_now reading. Lasts
-                    # only until the second burst (typically <1 s
-                    # on a busy feed).
-                    ts = wall_now
-                yield hex_msg, ts
+                    time.sleep(_MULTI_POLL_S)
+                    events = []
+                for key, _mask in events:
+                    feed = key.data
+                    mono = time.monotonic()
+                    try:
+                        if feed.connected:
+                            burst = self._read(feed, mono)
+                        else:
+                            self._finish_connect(sel, feed, mono)
+                            continue
+                    except UnsupportedStreamError as e:
+                        raise UnsupportedStreamError(f"{feed.name}: {e}") from e
+                    except OSError as e:
+                        self._drop(sel, feed, e, mono)
+                        continue
+                    if burst is not None:
+                        for msg, ts in zip(*burst, strict=True):
+                            heapq.heappush(pending, (ts, seq, msg))
+                            seq += 1
+
+                cutoff = time.time() - self.merge_window
+                msgs: list[str | bytes] = []
+                timestamps: list[float] = []
+                while pending and pending[0][0] <= cutoff:
+                    ts, _seq, msg = heapq.heappop(pending)
+                    msgs.append(msg)
+                    timestamps.append(ts)
+                yield msgs, timestamps
+        finally:
+            for feed in self._feeds:
+                if feed.sock is not None:
+                    feed.sock.close()
+                    feed.sock = None
+                    feed.connected = False
+            sel.close()
+
+    def _open(self, sel: selectors.BaseSelector, feed: _Feed, mono: float) -> None:
+        """Start a non-blocking connect; completion is a write event."""
+        src = feed.source
+        try:
+            family, type_, proto, _name, addr = socket.getaddrinfo(
+                src.host, src.port, type=socket.SOCK_STREAM
+            )[0]
+            sock = socket.socket(family, type_, proto)
+        except OSError as e:
+            self._drop(sel, feed, e, mono)
+            return
+        sock.setblocking(False)
+        err = sock.connect_ex(addr)
+        feed.sock = sock
+        if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            self._drop(sel, feed, OSError(err, os.strerror(err)), mono)
+            return
+        sel.register(sock, selectors.EVENT_WRITE, feed)
+        feed.deadline = mono + self.connect_timeout
+
+    def _finish_connect(
+        self, sel: selectors.BaseSelector, feed: _Feed, mono: float
+    ) -> None:
+        assert feed.sock is not None
+        err = feed.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err:
+            raise OSError(err, os.strerror(err))
+        sel.modify(feed.sock, selectors.EVENT_READ, feed)
+        feed.connected = True
+        feed.backoff = 0.5  # reset on successful connect
+        feed.deadline = mono + self.read_timeout
+
+    def _read(
+        self, feed: _Feed, mono: float
+    ) -> tuple[list[str | bytes], list[float]] | None:
+        assert feed.sock is not None
+        src = feed.source
+        n = feed.sock.recv_into(src._view[src._filled :])
+        if not n:
+            raise OSError("connection closed by remote")
+        feed.deadline = mono + self.read_timeout
+        return src._consume(n, time.time())
+
+    def _drop(
+        self,
+        sel: selectors.BaseSelector,
+        feed: _Feed,
+        error: OSError,
+        mono: float,
+    ) -> None:
+        """Close a feed's socket and schedule its reconnect."""
+        if feed.sock is not None:
+            with contextlib.suppress(KeyError, ValueError):
+                sel.unregister(feed.sock)
+            feed.sock.close()
+            feed.sock = None
+        feed.connected = False
+        feed.source.reconnects += 1
+        if not self.silent:
+            print(
+                f"[pyModeS.live] {feed.name}: connection dropped ({error}); "
+                f"retrying in {feed.backoff:.1f}s",
+                file=sys.stderr,
+            )
+        feed.retry_at = mono + feed.backoff
+        feed.backoff = min(feed.backoff * 2, 10.0)
+        feed.source._reset()
+
+
+def _frame_end(buf: _Buffer, i: int) -> int:
+    """Return the index just past the frame starting at ``buf[i]``.
+
+    Returns -1 when ``buf[i]`` does not start a complete frame (bad
+    type byte, truncated at end of buffer, or cut short by the next
+    frame marker).
+    """
+    n = len(buf)
+    if i + 1 >= n:
+        return -1
+    msg_type = buf[i + 1]
+    if msg_type == 0x34:
+        j = buf.find(b"\x1a", i + 2)
+        while j != -1 and j + 1 < n and buf[j + 1] == 0x1A:
+            j = buf.find(b"\x1a", j + 2)
+        return n if j == -1 else j
+    body_len = _BODY_LEN.get(msg_type)
+    if body_len is None:
+        return -1
+    body, next_i = _read_body(buf, i + 2, body_len, n)
+    return -1 if body is None else next_i
+
+
+def _iter_beast_frames(
+    buf: _Buffer, pos: int = 0
+) -> Iterator[tuple[int, int, int, bytes | bytearray]]:
+    """Yield ``(offset, next_offset, mlat_ticks, payload)`` per frame.
+
+    Scans a complete capture from ``pos`` in ``_FILE_WINDOW`` slices
+    so frame lists stay small however large the file. ``next_offset``
+    is where reading resumes after this frame. A truncated final
+    frame ends the iteration.
+    """
+    n = len(buf)
+    while pos < n:
+        end = min(pos + _FILE_WINDOW, n)
+        frames, consumed, _resyncs = _scan_frames(buf, pos, end, final=end == n)
+        if consumed == pos and end < n:
+            # A single frame larger than the window (only a runaway
+            # status frame can be): finish the scan in one go.
+            end = n
+            frames, consumed, _resyncs = _scan_frames(buf, pos, end, final=True)
+        for k, (offset, mlat, payload) in enumerate(frames):
+            nxt = frames[k + 1][0] if k + 1 < len(frames) else consumed
+            yield offset, nxt, mlat, payload
+        if end == n:
+            return
+        pos = consumed
+
+
+def _detect_mlat_hz(
+    frames: Iterator[tuple[int, int, int, bytes | bytearray]],
+) -> float:
+    """Infer the MLAT tick rate (12 MHz or 1 GHz) from capture frames.
+
+    Uses the median tick gap between consecutive DF17/18 frames of
+    the same aircraft (see ``_DETECT_GAP_SPLIT``). Falls back to the
+    dump1090 12 MHz rate when the sample has no repeat squitters.
+    """
+    last_seen: dict[bytes, int] = {}
+    gaps: list[int] = []
+    for count, (_offset, _next, mlat, payload) in enumerate(frames):
+        if count >= _DETECT_FRAMES:
+            break
+        if len(payload) != 14 or payload[0] >> 3 not in (17, 18):
+            continue
+        icao = bytes(payload[1:4])
+        prev = last_seen.get(icao)
+        if prev is not None and mlat > prev:
+            gaps.append(mlat - prev)
+        last_seen[icao] = mlat
+    if not gaps:
+        return _MLAT_HZ_DUMP1090
+    gaps.sort()
+    median = gaps[len(gaps) // 2]
+    return _MLAT_HZ_RADARCAPE if median > _DETECT_GAP_SPLIT else _MLAT_HZ_DUMP1090
+
+
+class BeastFileSource:
+    """Raw Beast capture file source, memory-mapped and parsed in place.
+
+    Usage::
+
+        with BeastFileSource("capture.beast") as src:
+            for hex_msg, timestamp in src:
+                ...
+
+    Timestamps are ``epoch + ticks / mlat_hz`` from each frame's MLAT
+    counter, unwrapped across counter resets (midnight for 1 GHz
+    radarcape-style receivers, the 48-bit limit for 12 MHz dump1090
+    ones). ``mlat_hz=None`` infers the rate from the capture; pass
+    ``epoch`` (e.g. the capture day's UTC midnight for 1 GHz
+    receivers) to get absolute times.
+
+    :meth:`seek` moves to the first frame at or after a byte offset,
+    and :attr:`offset` tracks the next unread frame, so a long capture
+    can be processed in slices or resumed. A ``.gz`` / ``.zst`` capture
+    is decompressed into memory instead of mapped, and offsets count
+    decompressed bytes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        mlat_hz: float | None = None,
+        epoch: float = 0.0,
+    ) -> None:
+        self.path = Path(path)
+        self.epoch = epoch
+        self._buf: bytes | mmap.mmap
+        if compression(self.path) is not None:
+            self._buf = read_bytes(self.path)
+        else:
+            self._map()
+        self._offset = 0
+        self._mlat_hz = mlat_hz
+
+    def _map(self) -> None:
+        with self.path.open("rb") as fh:
+            try:
+                self._buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                self._buf = b""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._buf = b""
+
+    @property
+    def offset(self) -> int:
+        """Byte offset of the next frame to be read."""
+        return self._offset
+
+    @property
+    def mlat_hz(self) -> float:
+        """MLAT tick rate in Hz, inferred from the capture if not given."""
+        if self._mlat_hz is None:
+            self._mlat_hz = _detect_mlat_hz(_iter_beast_frames(self._buf))
+        return self._mlat_hz
+
+    def seek(self, offset: int) -> int:
+        """Move to the first frame starting at or after ``offset``.
+
+        A byte offset may land inside a frame, where an escaped 0x1a
+        can look like a marker; a candidate only counts as a frame
+        start if the frame it begins is followed by another marker
+        or by end of file. Returns the resulting :attr:`offset`
+        (file size if no frame follows).
+        """
+        buf = self._buf
+        n = len(buf)
+        i = buf.find(b"\x1a", max(offset, 0))
+        while i != -1:
+            end = _frame_end(buf, i)
+            if end != -1 and (end == n or buf[end] == 0x1A):
+                break
+            i = buf.find(b"\x1a", i + 1)
+        self._offset = n if i == -1 else i
+        return self._offset
+
+    def frames(self) -> Iterator[tuple[int, int, str]]:
+        """Yield ``(offset, mlat_ticks, hex)`` from :attr:`offset` on."""
+        for offset, nxt, mlat, payload in _iter_beast_frames(self._buf, self._offset):
+            self._offset = nxt
+            yield offset, mlat, payload.hex().upper()
+        self._offset = len(self._buf)
+
+    def __iter__(self) -> Iterator[tuple[str, float]]:
+        hz = self.mlat_hz
+        wrap = _MLAT_WRAP_TICKS.get(hz, 1 << 48)
+        epoch = self.epoch
+        base = 0
+        prev: int | None = None
+        for _offset, mlat, hex_msg in self.frames():
+            # A backwards jump of more than half the counter range is
+            # a wrap, not reordering jitter.
+            if prev is not None and prev - mlat > wrap // 2:
+                base += wrap
+            prev = mlat
+            yield hex_msg, epoch + (base + mlat) / hz
+
+
+@contextlib.contextmanager
+def open_capture(
+    path: str, *, mlat_hz: float | None = None
+) -> Iterator[Iterable[tuple[str, float]]]:
+    """Open a capture file as an iterable of ``(hex, timestamp)`` records.
+
+    ``path`` is a hex / ``timestamp,hex`` text file, a raw Beast capture
+    (read by :class:`BeastFileSource` with ``mlat_hz``), either of them
+    ``.gz`` / ``.zst`` compressed, or ``-`` for stdin text.
+    """
+    if path == "-":
+        yield iter_records(sys.stdin)
+    elif is_beast_file(path):
+        with BeastFileSource(path, mlat_hz=mlat_hz) as source:
+            yield source
+    else:
+        with open_text(path) as stream:
+            yield iter_records(stream)
+
+
+def is_beast_file(path: str) -> bool:
+    """Return True if ``path`` is a raw Beast binary capture.
+
+    Beast captures start with the 0x1a frame marker, which never
+    begins a hex or CSV text file. Compressed files are checked on
+    their decompressed bytes; one that can't be read raises OSError.
+    """
+    try:
+        with open_binary(path) as fh:
+            return fh.read(1) == b"\x1a"
+    except OSError:
+        raise
+    except Exception as e:
+        raise _read_error(path, e) from e
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[tuple[str, float]]:
+    """Yield ``(hex, timestamp)`` records from an iterable of lines.
+
+    The format is auto-detected from the first non-blank line: if it
+    has two comma-separated fields and the first parses as ``float``,
+    the input is ``timestamp,hex`` CSV; otherwise it is one hex
+    message per line with list-position timestamps (0, 1, 2, ...).
+    Blank lines are skipped and don't count towards positions.
+    """
+    is_csv: bool | None = None
+    for i, line in enumerate(filter(None, (raw.strip() for raw in lines))):
+        if is_csv is None:
+            is_csv = _looks_like_csv(line)
+        if not is_csv:
+            yield line, float(i)
+            continue
+        left, _, right = line.partition(",")
+        try:
+            ts = float(left.strip())
+        except ValueError:
+            # Row doesn't match CSV shape; treat hex verbatim with a
+            # synthetic timestamp that preserves order
+            yield line, float(i)
+            continue
+        yield right.strip(), ts
+
+
+def _looks_like_csv(line: str) -> bool:
+    """Return True if ``line`` is a ``timestamp,hex`` CSV row."""
+    if "," not in line:
+        return False
+    left, _, _right = line.partition(",")
+    try:
+        float(left.strip())
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,184 @@
+"""SQLite output for ``--dump-to FILE.db``.
+
+``SqliteSink`` stores records in a ``messages`` table with one column
+per ``SCHEMA_COLUMNS`` key (``_FULL_SCHEMA`` plus ``timestamp``):
+INTEGER for int and bool values, REAL, TEXT, and JSON text for the
+list-valued keys. The database runs in WAL mode with
+``synchronous=NORMAL``, so other processes can query a capture while
+``modes live`` is still writing it.
+
+Rows are buffered and committed in one transaction once
+``batch_records`` are pending or the oldest is ``batch_delay`` seconds
+old (checked as records arrive and while the feed is idle), rather
+than one commit per row.
+Each INSERT names only the columns the record has a value for. A
+decoder emits the same keys for every message of a kind, so there is
+one statement per key layout, and consecutive rows sharing one go
+through a single ``executemany``; binding all ~125 columns per row,
+mostly NULL, is about ten times slower. ``close()`` commits the rest
+and then creates the ``(icao, timestamp)`` index, so a bulk load
+doesn't pay for index maintenance on every insert.
+
+An existing database is appended to; columns missing from a table
+written by an older pyModeS are added first.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import sqlite3
+import time
+from operator import itemgetter
+from typing import Any
+
+from pyModeS.cli._sink import SCHEMA_COLUMNS
+from pyModeS.message import Decoded
+
+TABLE = "messages"
+
+# Default commit policy: whichever comes first.
+BATCH_RECORDS = 10_000
+BATCH_DELAY = 1.0
+
+# Stop caching INSERT statements for new key layouts past this many.
+_MAX_PLANS = 1024
+
+# (INSERT statement, record positions to keep or None for all,
+# positions of list values to JSON-encode)
+_Plan = tuple[str, tuple[int, ...] | None, tuple[int, ...]]
+
+_SQL_TYPES = {
+    "int": "INTEGER",
+    "float": "REAL",
+    "bool": "INTEGER",
+    "str": "TEXT",
+    "list[str]": "TEXT",
+}
+
+
+class SqliteSink:
+    """Write decoded records to a SQLite database in batched transactions.
+
+    Raises OSError if ``path`` can't be opened as a database.
+    """
+
+    writes_raw_msg = True
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        batch_records: int | None = None,
+        batch_delay: float | None = None,
+    ) -> None:
+        self._batch_records = batch_records or BATCH_RECORDS
+        self._batch_delay = BATCH_DELAY if batch_delay is None else batch_delay
+        self._plans: dict[tuple[str, ...], _Plan] = {}
+        self._rows: list[tuple[str, tuple[Any, ...]]] = []
+        self._pending_since = 0.0
+        # Autocommit mode: transactions are opened explicitly in flush().
+        try:
+            self._conn = sqlite3.connect(path, isolation_level=None)
+        except sqlite3.Error as e:
+            raise OSError(f"{path}: {e}") from e
+        try:
+            self._create_table()
+        except sqlite3.Error as e:
+            self._conn.close()
+            raise OSError(f"{path}: {e}") from e
+
+    def _create_table(self) -> None:
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(
+            f'"{key}" {_SQL_TYPES[kind]}' for key, kind in SCHEMA_COLUMNS.items()
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {TABLE} ({columns})")
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({TABLE})")}
+        for key, kind in SCHEMA_COLUMNS.items():
+            if key not in existing:
+                conn.execute(
+                    f'ALTER TABLE {TABLE} ADD COLUMN "{key}" {_SQL_TYPES[kind]}'
+                )
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting for the next commit."""
+        return len(self._rows)
+
+    @staticmethod
+    def _plan(keys: tuple[str, ...]) -> _Plan:
+        """Build the INSERT for records with exactly these keys."""
+        keep = [i for i, key in enumerate(keys) if key in SCHEMA_COLUMNS]
+        names = [keys[i] for i in keep]
+        lists = tuple(
+            pos for pos, key in enumerate(names) if SCHEMA_COLUMNS[key] == "list[str]"
+        )
+        if names:
+            columns = ", ".join(f'"{key}"' for key in names)
+            marks = ", ".join("?" * len(names))
+            sql = f"INSERT INTO {TABLE} ({columns}) VALUES ({marks})"
+        else:
+            sql = f"INSERT INTO {TABLE} DEFAULT VALUES"
+        return sql, None if len(keep) == len(keys) else tuple(keep), lists
+
+    def write(self, decoded: Decoded) -> None:
+        # None values are left to the column default, so full_dict
+        # records share the layouts of the sparse ones.
+        keys = tuple(key for key, value in decoded.items() if value is not None)
+        plan = self._plans.get(keys)
+        if plan is None:
+            plan = self._plan(keys)
+            if len(self._plans) < _MAX_PLANS:
+                self._plans[keys] = plan
+        sql, keep, lists = plan
+        values = tuple(value for value in decoded.values() if value is not None)
+        if keep is not None:
+            values = tuple(values[i] for i in keep)
+        if lists:
+            encoded = list(values)
+            for i in lists:
+                encoded[i] = json.dumps(encoded[i])
+            values = tuple(encoded)
+        rows = self._rows
+        now = time.monotonic()
+        if not rows:
+            self._pending_since = now
+        rows.append((sql, values))
+        if (
+            len(rows) >= self._batch_records
+            or now - self._pending_since >= self._batch_delay
+        ):
+            self.flush()
+
+    def flush_due(self) -> None:
+        """Commit if the oldest pending row is ``batch_delay`` old."""
+        if self._rows and time.monotonic() - self._pending_since >= self._batch_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        """Insert the pending rows in one transaction."""
+        if not self._rows:
+            return
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            for sql, run in itertools.groupby(self._rows, key=itemgetter(0)):
+                conn.executemany(sql, [values for _sql, values in run])
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._rows.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {TABLE}_icao_timestamp "
+                f'ON {TABLE} (icao, "timestamp")'
+            )
+        finally:
+            self._conn.close()
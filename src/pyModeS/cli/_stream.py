@@ -0,0 +1,169 @@
+"""In-order release of streamed PipeDecoder results.
+
+``modes decode`` writes each result as soon as PipeDecoder can no
+longer change it (see :meth:`PipeDecoder.holds`). :class:`ReleaseQueue`
+implements that policy for one decoder; it is shared by the serial
+path and by every ``--jobs`` worker process, which is what keeps the
+two paths producing the same records.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, TextIO, TypeVar
+
+from pyModeS import PipeDecoder
+from pyModeS._json import dumps
+from pyModeS.message import Decoded
+
+T = TypeVar("T")
+
+
+class ReleaseQueue(Generic[T]):
+    """Feed messages through a PipeDecoder and release final results.
+
+    Every fed message is queued with an opaque ``tag`` (the source
+    ``(hex, timestamp)``, or ``(seq, hex, timestamp)`` in a worker).
+    ``emit(tag, result)`` is called in feed order once the head of the
+    queue is no longer held by the pipe; a held result blocks the ones
+    behind it so order is kept.
+    The queue spans at most the pipe's ``eviction_ttl`` of stream time.
+    """
+
+    def __init__(
+        self,
+        pipe: PipeDecoder,
+        emit: Callable[[T, Decoded], None],
+    ) -> None:
+        self._pipe = pipe
+        self._emit = emit
+        self._queue: deque[tuple[T, Decoded]] = deque()
+        # Expiring pending CPR frames by age is only safe while
+        # timestamps never go backwards; after the first regression,
+        # fall back to holding them until they pair or get evicted.
+        self._monotonic = True
+        self._latest: float | None = None
+
+    def feed(
+        self,
+        tag: T,
+        hex_msg: str,
+        timestamp: float,
+        *,
+        clock: float | None = None,
+    ) -> None:
+        """Decode one message and emit whatever has become final.
+
+        ``clock`` is the latest timestamp seen anywhere in the stream
+        since the previous feed, for a pipe that only sees part of it;
+        state is expired against it first when it is ahead of
+        ``timestamp``.
+        """
+        if clock is not None and clock > timestamp:
+            self._pipe.expire(clock)
+        if self._monotonic:
+            if self._latest is not None and timestamp < self._latest:
+                self._monotonic = False
+                self._latest = None
+            else:
+                self._latest = timestamp
+
+        queue = self._queue
+        queue.append((tag, self._pipe.decode(hex_msg, timestamp=timestamp)))
+        while queue and not self._pipe.holds(queue[0][1], now=self._latest):
+            self._emit(*queue.popleft())
+
+    def finish(self, *, timestamp: float | None = None) -> None:
+        """Flush the pipe and emit everything still queued.
+
+        ``timestamp``, if given, is the stream's clock at end of input;
+        state is expired against it before the flush.
+        """
+        if timestamp is not None:
+            self._pipe.expire(timestamp)
+        self._pipe.flush()
+        while self._queue:
+            self._emit(*self._queue.popleft())
+
+
+def format_record(
+    hex_msg: str, result: Decoded, *, compact: bool, timestamp: float | None = None
+) -> str:
+    """Serialise one result the way ``modes decode`` prints it.
+
+    Stamps the source hex as ``raw_msg`` (PipeDecoder already does
+    this for error dicts; we set it unconditionally so success records
+    carry it too, keeping the output self-describing). It is stamped
+    at release time so the key lands after any retro-filled position.
+    A ``timestamp``, if given, is stamped after it, as ``modes live``
+    does for its records.
+    """
+    result["raw_msg"] = hex_msg
+    if timestamp is not None:
+        result["timestamp"] = timestamp
+    if compact:
+        return dumps(result)
+    return json.dumps(result, indent=2, sort_keys=True, default=str)
+
+
+def decode_records(
+    records: Iterable[tuple[str, float]],
+    *,
+    surface_ref: Any,
+    full_dict: bool,
+    compact: bool,
+    write: Callable[[str], None],
+) -> None:
+    """Serial path: decode ``(hex, timestamp)`` records with one pipe.
+
+    ``write`` receives each formatted record in input order.
+    """
+
+    def emit(record: tuple[str, float], result: Decoded) -> None:
+        write(format_record(record[0], result, compact=compact))
+
+    decode_results(records, surface_ref=surface_ref, full_dict=full_dict, emit=emit)
+
+
+def decode_results(
+    records: Iterable[tuple[str, float]],
+    *,
+    surface_ref: Any,
+    full_dict: bool,
+    emit: Callable[[tuple[str, float], Decoded], None],
+) -> None:
+    """Like :func:`decode_records`, but hand over unformatted results.
+
+    ``emit((hex_msg, timestamp), result)`` is called in input order;
+    neither ``raw_msg`` nor ``timestamp`` is stamped.
+    """
+    pipe = PipeDecoder(surface_ref=surface_ref, full_dict=full_dict)
+    release: ReleaseQueue[tuple[str, float]] = ReleaseQueue(pipe, emit)
+    for hex_msg, ts in records:
+        release.feed((hex_msg, ts), hex_msg, ts)
+    # End of input: release whatever is still bootstrapping, exactly
+    # as the batch path does, then drain the queue.
+    release.finish()
+
+
+class RecordWriter:
+    """Write formatted records to a text stream.
+
+    Compact records are one per line; pretty records are separated by
+    a blank line, matching the single-message pretty output repeated
+    for each item.
+    """
+
+    def __init__(self, stream: TextIO, *, compact: bool) -> None:
+        self._stream = stream
+        self._separator = "" if compact else "\n"
+        self._count = 0
+
+    def write(self, text: str) -> None:
+        if self._count:
+            self._stream.write(self._separator)
+        self._stream.write(text)
+        self._stream.write("\n")
+        self._count += 1
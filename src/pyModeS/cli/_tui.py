@@ -15,18 +15,25 @@ Architecture:
 - ``ModesLiveApp`` is a textual App with a single DataTable widget.
 - On mount, we spawn a daemon worker thread that drains the
   blocking ``NetworkSource`` iterator, calls ``PipeDecoder.decode``
-  on each frame, and merges the decoded fields into a shared
-  ``dict[icao, state]`` that the UI thread reads from.
-- A 250 ms ``set_interval`` timer snapshots the shared dict,
-  applies any active search filter and sort, and rewrites the
-  DataTable rows. At 4 Hz with <=500 aircraft this is O(2000
-  cells/second) — negligible cost.
+  on each frame, and merges each burst into an ``AircraftStore``
+  (``pyModeS.cli._aircraft``), which records the aircraft whose
+  fields changed.
+- A 250 ms ``set_interval`` timer takes those dirty aircraft and
+  re-positions just them in an ``AircraftIndex``, a sorted list
+  maintained with bisect. Changing the sort key or the search
+  query rebuilds it once.
+- The DataTable is virtualised: it only ever holds the rows that
+  fit on screen. The app keeps the cursor (anchored to an ICAO)
+  and the scroll offset itself, and each refresh rewrites the
+  cells of the visible rows that differ from what is painted. A
+  refresh therefore costs O(changes · log n) plus one screenful,
+  however many aircraft are tracked.
 - Terminal width changes trigger a column-set swap (7 / 10 / 18
   columns) matching jet1090's breakpoints.
 
-Thread safety: the shared dict sees single-key writes from the
-worker thread (GIL-atomic under CPython) and snapshot reads from
-the UI thread via ``list(state.items())``. No locks needed.
+Thread safety: the worker writes single keys of the per-aircraft
+state dicts (GIL-atomic under CPython) and hands the dirty sets
+over under a lock once per burst.
 """
 
 from __future__ import annotations
@@ -34,6 +41,7 @@ from __future__ import annotations
 import argparse
 import contextlib
 import threading
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, ClassVar
 
@@ -45,35 +53,11 @@ from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Footer, Header, Input
 
 from pyModeS import PipeDecoder
-from pyModeS.cli._source import NetworkSource, UnsupportedStreamError
-
-# Fields the worker thread copies out of each decoded message into
-# the per-ICAO shared state dict. Covers every column across every
-# responsive breakpoint. Comm-B and ADS-B use slightly different
-# names for several concepts (vertical rate, track, altitude);
-# both are captured so the UI can render whichever was most
-# recently observed.
-_TRACKED_FIELDS: tuple[str, ...] = (
-    "callsign",
-    "squawk",
-    "latitude",
-    "longitude",
-    "altitude",
-    "selected_altitude_mcp",
-    "selected_altitude_fms",
-    "groundspeed",
-    "true_airspeed",
-    "indicated_airspeed",
-    "mach",
-    "vertical_rate",
-    "baro_vertical_rate",
-    "inertial_vertical_rate",
-    "track",
-    "true_track",
-    "heading",
-    "magnetic_heading",
-    "roll",
-    "nac_p",
+from pyModeS.cli._aircraft import AircraftIndex, AircraftStore
+from pyModeS.cli._source import (
+    MultiNetworkSource,
+    NetworkSource,
+    UnsupportedStreamError,
 )
 
 # Sort keys cycled by the `s` binding. Order mirrors the sequence
@@ -98,10 +82,6 @@ _SORT_LABELS: dict[str, str] = {
     "vertical_rate": "vrate",
 }
 
-# Aircraft older than this are hidden from the table (matches
-# PipeDecoder.eviction_ttl default of 300 seconds).
-_INTERACTIVE_EXPIRE: float = 300.0
-
 
 def _fmt_float(v: Any, digits: int = 4) -> str:
     """Format a float with a fixed decimal count; empty if None."""
@@ -264,36 +244,55 @@ def _row_for_state(
     return cells
 
 
-def _sort_value(icao: str, state: dict[str, Any], key: str) -> Any:
-    """Return a sortable value for the given sort key.
+class _AircraftTable(DataTable[str]):
+    """DataTable that holds only the visible rows.
 
-    Missing fields always sort to the end (largest value under
-    ascending, smallest under descending).
+    Its rows are screen slots, not aircraft, so the cursor and
+    scroll keys are handed to ``navigate`` to move through the whole
+    aircraft index instead.
     """
-    if key == "last_seen":
-        return state.get("_last_seen", 0.0)
-    if key == "icao":
-        return icao
-    if key == "callsign":
-        return state.get("callsign") or "\uffff"
-    if key == "altitude":
-        v = state.get("altitude")
-        return float("inf") if v is None else float(v)
-    if key == "groundspeed":
-        v = state.get("groundspeed")
-        return float("inf") if v is None else float(v)
-    if key == "vertical_rate":
-        v = state.get("vertical_rate") or state.get("baro_vertical_rate")
-        return float("inf") if v is None else float(v)
-    return 0
+
+    def __init__(self, navigate: Callable[[str], None], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._navigate = navigate
+
+    def action_cursor_up(self) -> None:
+        self._navigate("up")
+
+    def action_cursor_down(self) -> None:
+        self._navigate("down")
+
+    def action_page_up(self) -> None:
+        self._navigate("page_up")
+
+    def action_page_down(self) -> None:
+        self._navigate("page_down")
+
+    def action_scroll_top(self) -> None:
+        self._navigate("top")
+
+    def action_scroll_home(self) -> None:
+        self._navigate("top")
+
+    def action_scroll_bottom(self) -> None:
+        self._navigate("bottom")
+
+    def action_scroll_end(self) -> None:
+        self._navigate("bottom")
+
+    def on_mouse_scroll_up(self, event: Any) -> None:
+        self._navigate("up")
+
+    def on_mouse_scroll_down(self, event: Any) -> None:
+        self._navigate("down")
 
 
 class ModesLiveApp(App[int]):
     """Interactive textual App for ``modes live --tui``.
 
     Owns the terminal, spawns a worker thread to drain
-    ``NetworkSource``, and paints the shared per-aircraft state
-    dict into a ``DataTable`` on a 4 Hz timer.
+    ``NetworkSource``, and paints the visible slice of the sorted
+    aircraft index into a ``DataTable`` on a 4 Hz timer.
     """
 
     TITLE = "pyModeS live"
@@ -337,22 +336,20 @@ class ModesLiveApp(App[int]):
         self,
         args: argparse.Namespace,
         pipe: PipeDecoder,
-        source: NetworkSource,
+        source: NetworkSource | MultiNetworkSource,
     ) -> None:
         super().__init__()
         self._args = args
         self._pipe = pipe
         self._source = source
-        self._host = source.host
-        self._port = source.port
-        self.sub_title = f"{self._host}:{self._port}"
-
-        # Shared per-aircraft state. Writes from the worker thread
-        # are single-key dict assignments (GIL-atomic under
-        # CPython); reads from the UI thread snapshot via
-        # ``list(state.items())`` to dodge "dict changed during
-        # iteration" errors.
-        self._state: dict[str, dict[str, Any]] = {}
+        self._feed_name = source.name
+        self.sub_title = self._feed_name
+
+        # Per-aircraft state written by the worker thread, and the
+        # sorted view of it the UI thread maintains from the dirty
+        # aircraft the store hands over.
+        self._store = AircraftStore()
+        self._index = AircraftIndex(self._store.states)
         self._msg_count: int = 0
         self._worker_error: BaseException | None = None
         self._stop_flag: bool = False
@@ -370,13 +367,19 @@ class ModesLiveApp(App[int]):
         self._columns: tuple[str, ...] = _COLUMNS_SM
         self._last_width: int = -1
 
-        # Cache of what's currently painted in the DataTable, used
-        # to drive diff updates so a per-tick refresh only touches
-        # cells whose values actually changed. A full clear+re-add
-        # is done only when the set or order of rows changes.
-        self._rendered_keys: list[str] = []
-        self._rendered_columns: tuple[str, ...] = ()
-        self._rendered_cells: dict[str, list[str]] = {}
+        # Viewport over the index: the first visible row and the
+        # cursor row. The cursor follows its aircraft (by ICAO) as
+        # rows move, and the view scrolls to keep it on screen.
+        self._top: int = 0
+        self._cursor: int = 0
+        self._cursor_icao: str | None = None
+        # Cursor slot last set on the DataTable; a different value
+        # at the next paint means the user clicked another row.
+        self._cursor_slot: int = 0
+
+        # What each DataTable row (screen slot) currently shows, so
+        # a paint only writes the cells whose values changed.
+        self._painted: list[list[str]] = []
 
     # ------------------------------------------------------------------
     # Composition + lifecycle
@@ -385,7 +388,8 @@ class ModesLiveApp(App[int]):
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         with Container(id="aircraft-container"):
-            yield DataTable(
+            yield _AircraftTable(
+                self._navigate,
                 id="aircraft",
                 cursor_type="row",
                 zebra_stripes=True,
@@ -423,36 +427,33 @@ class ModesLiveApp(App[int]):
                 sock.close()
 
     def on_resize(self, event: Any) -> None:
-        # Re-lay out columns if the width bracket changed.
+        # Re-lay out columns if the width bracket changed, and fill
+        # or trim the row slots to the new height.
         self._apply_column_set(self.size.width)
+        self._paint()
 
     # ------------------------------------------------------------------
     # Worker thread
     # ------------------------------------------------------------------
 
     def _worker_loop(self) -> None:
+        decode = self._pipe.decode
+        store = self._store
         try:
-            for hex_msg, ts in self._source:
+            for msgs, timestamps in self._source.iter_batches():
                 if self._stop_flag:
                     break
-                try:
-                    decoded = self._pipe.decode(hex_msg, timestamp=ts)
-                except Exception:
-                    self._msg_count += 1
-                    continue
-                self._msg_count += 1
-                icao = decoded.get("icao")
-                if not icao:
-                    continue
-                state = self._state.get(icao)
-                if state is None:
-                    state = {"_first_seen": ts, "_last_seen": ts}
-                    self._state[icao] = state
-                for key in _TRACKED_FIELDS:
-                    val = decoded.get(key)
-                    if val is not None:
-                        state[key] = val
-                state["_last_seen"] = ts
+                burst = []
+                for msg, ts in zip(msgs, timestamps, strict=True):
+                    try:
+                        decoded = decode(msg, timestamp=ts)
+                    except Exception:
+                        continue
+                    icao = decoded.get("icao")
+                    if icao:
+                        burst.append((icao, decoded, ts))
+                store.merge(burst)
+                self._msg_count += len(msgs)
         except UnsupportedStreamError as e:
             self._worker_error = e
             with contextlib.suppress(Exception):
@@ -480,129 +481,112 @@ class ModesLiveApp(App[int]):
             return
         table.clear(columns=True)
         table.add_columns(*columns)
-        # Column set changed → invalidate the render cache so the
-        # next _refresh_table does a full rebuild.
-        self._rendered_keys = []
-        self._rendered_columns = columns
-        self._rendered_cells = {}
+        # Column set changed → no rows left, the next paint adds
+        # them back.
+        self._painted = []
 
     def _refresh_table(self) -> None:
-        try:
-            table = self.query_one("#aircraft", DataTable)
-        except Exception:
-            return
-
         # React to width bracket changes even if on_resize didn't
         # fire (textual occasionally coalesces resize events).
         if _pick_columns(self.size.width) != self._columns:
             self._apply_column_set(self.size.width)
+        changed, seen = self._store.drain()
+        self._index.apply(changed, seen, _now())
+        self._paint()
+
+    def _resort(self) -> None:
+        # Sort key or search query changed: rebuild the index once.
+        self._index.resort(
+            _now(),
+            sort_key=_SORT_KEYS[self._sort_index],
+            query=self._search_query,
+        )
+        self._index.ascending = self._sort_asc
+        self._refresh_table()
+        self._refresh_title()
 
-        now = _now()
-        cutoff = now - _INTERACTIVE_EXPIRE
-
-        # Snapshot — dict may mutate from the worker thread between
-        # calls, so copy the items out first.
-        snapshot: list[tuple[str, dict[str, Any]]] = list(self._state.items())
-
-        # Filter
-        filtered: list[tuple[str, dict[str, Any]]] = []
-        query = self._search_query.lower()
-        for icao, state in snapshot:
-            last_seen = state.get("_last_seen", 0.0)
-            if last_seen < cutoff:
-                continue
-            if query:
-                callsign = str(state.get("callsign") or "").lower()
-                if query not in icao.lower() and query not in callsign:
-                    continue
-            filtered.append((icao, state))
-
-        # Sort
-        key = _SORT_KEYS[self._sort_index]
-        filtered.sort(key=lambda item: _sort_value(item[0], item[1], key))
-        if not self._sort_asc:
-            filtered.reverse()
+    def _paint(self) -> None:
+        """Write the visible slice of the index into the DataTable."""
+        try:
+            table = self.query_one("#aircraft", DataTable)
+        except Exception:
+            return
+        index = self._index
+        n = len(index)
+        header = table.header_height if table.show_header else 0
+        height = max(0, table.scrollable_content_region.height - header)
+
+        # A click moved the DataTable cursor: adopt that row.
+        if self._painted and table.cursor_row != self._cursor_slot:
+            self._cursor = self._top + max(0, table.cursor_row)
+            self._cursor_icao = None
+        # Anchor the cursor to its aircraft, or clamp it if that
+        # aircraft is gone, then scroll just enough to show it.
+        position = index.position(self._cursor_icao) if self._cursor_icao else None
+        if position is None:
+            position = max(0, min(self._cursor, n - 1))
+        self._cursor = position
+        self._cursor_icao = index.at(position) if n else None
+        top = min(self._top, position)
+        if height and position >= top + height:
+            top = position - height + 1
+        self._top = top = max(0, min(top, n - height))
 
-        desired_keys = [icao for icao, _ in filtered]
+        now = _now()
         columns = self._columns
-
-        # Fast path: if the set AND order of rows is unchanged,
-        # update only cells whose values actually changed. Avoids
-        # the clear-and-rebuild that wipes cursor/scroll state and
-        # makes the whole table flash every tick.
-        if desired_keys == self._rendered_keys and columns == self._rendered_columns:
-            for icao, state in filtered:
-                new_cells = _row_for_state(icao, state, now, columns)
-                old_cells = self._rendered_cells.get(icao)
-                if old_cells == new_cells:
+        states = self._store.states
+        rows = [
+            _row_for_state(icao, states.get(icao, {}), now, columns)
+            for icao in index.window(top, height)
+        ]
+        if len(rows) != len(self._painted):
+            # The slot count changed (resize, or fewer aircraft than
+            # fit): rebuild the handful of rows.
+            table.clear(columns=False)
+            for slot, cells in enumerate(rows):
+                table.add_row(*cells, key=str(slot))
+        else:
+            for slot, (cells, old_cells) in enumerate(
+                zip(rows, self._painted, strict=True)
+            ):
+                if cells == old_cells:
                     continue
-                try:
-                    row_idx = table.get_row_index(icao)
-                except Exception:
-                    continue
-                for col_idx, new_val in enumerate(new_cells):
-                    if (
-                        old_cells is not None
-                        and col_idx < len(old_cells)
-                        and old_cells[col_idx] == new_val
-                    ):
-                        continue
-                    with contextlib.suppress(Exception):
-                        table.update_cell_at(
-                            Coordinate(row_idx, col_idx),
-                            new_val,
-                            update_width=False,
-                        )
-                self._rendered_cells[icao] = new_cells
-            return
-
-        # Rebuild path: row set or order changed (new aircraft,
-        # expired aircraft, user-triggered sort change). Save the
-        # ICAO under the cursor and the scroll offset so the view
-        # stays anchored across the rebuild.
-        prev_icao: str | None = None
-        try:
-            if table.row_count and table.cursor_row >= 0:
-                cell_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
-                prev_icao = cell_key.row_key.value
-        except Exception:
-            pass
-        prev_scroll_y = table.scroll_y
-
-        table.clear(columns=False)
-        rendered_cells: dict[str, list[str]] = {}
-        for icao, state in filtered:
-            cells = _row_for_state(icao, state, now, columns)
-            table.add_row(*cells, key=icao)
-            rendered_cells[icao] = cells
-        self._rendered_cells = rendered_cells
-        self._rendered_keys = desired_keys
-        self._rendered_columns = columns
-
-        # Restore cursor by ICAO key (not by row index — indices
-        # shift after a re-sort). scroll=False keeps the viewport
-        # where it was; scroll_to below then pins it exactly.
-        if prev_icao is not None:
+                for col_idx, value in enumerate(cells):
+                    if value != old_cells[col_idx]:
+                        with contextlib.suppress(Exception):
+                            table.update_cell_at(Coordinate(slot, col_idx), value)
+        self._painted = rows
+
+        self._cursor_slot = position - top
+        if rows and table.cursor_row != self._cursor_slot:
             with contextlib.suppress(Exception):
-                new_row = table.get_row_index(prev_icao)
-                table.move_cursor(row=new_row, scroll=False)
-        with contextlib.suppress(Exception):
-            table.scroll_to(y=prev_scroll_y, animate=False)
+                table.move_cursor(row=self._cursor_slot, scroll=False)
+
+    def _navigate(self, where: str) -> None:
+        """Move the cursor through the whole index and repaint."""
+        n = len(self._index)
+        if not n:
+            return
+        page = max(1, len(self._painted))
+        target = {
+            "up": self._cursor - 1,
+            "down": self._cursor + 1,
+            "page_up": self._cursor - page,
+            "page_down": self._cursor + page,
+            "top": 0,
+            "bottom": n - 1,
+        }.get(where, self._cursor)
+        self._cursor = max(0, min(target, n - 1))
+        self._cursor_icao = self._index.at(self._cursor)
+        self._paint()
 
     def _refresh_title(self) -> None:
-        now = _now()
-        cutoff = now - _INTERACTIVE_EXPIRE
-        n_aircraft = sum(
-            1
-            for st in list(self._state.values())
-            if st.get("_last_seen", 0.0) >= cutoff
-        )
         sort_label = _SORT_LABELS.get(_SORT_KEYS[self._sort_index], "?")
         direction = "asc" if self._sort_asc else "desc"
         search_bit = f" /{self._search_query}" if self._search_query else ""
         self.sub_title = (
-            f"{self._host}:{self._port}  "
-            f"{n_aircraft} a/c  {self._msg_count} msgs  "
+            f"{self._feed_name}  "
+            f"{self._index.tracked} a/c  {self._msg_count} msgs  "
             f"sort={sort_label}:{direction}{search_bit}"
         )
 
@@ -611,45 +595,26 @@ class ModesLiveApp(App[int]):
     # ------------------------------------------------------------------
 
     def action_cursor_down(self) -> None:
-        try:
-            table = self.query_one("#aircraft", DataTable)
-        except Exception:
-            return
-        table.action_cursor_down()
+        self._navigate("down")
 
     def action_cursor_up(self) -> None:
-        try:
-            table = self.query_one("#aircraft", DataTable)
-        except Exception:
-            return
-        table.action_cursor_up()
+        self._navigate("up")
 
     def action_cursor_home(self) -> None:
-        try:
-            table = self.query_one("#aircraft", DataTable)
-        except Exception:
-            return
-        if table.row_count:
-            with contextlib.suppress(Exception):
-                table.move_cursor(row=0)
+        self._navigate("top")
 
     def action_cursor_end(self) -> None:
-        try:
-            table = self.query_one("#aircraft", DataTable)
-        except Exception:
-            return
-        if table.row_count:
-            with contextlib.suppress(Exception):
-                table.move_cursor(row=table.row_count - 1)
+        self._navigate("bottom")
 
     def action_cycle_sort(self) -> None:
         self._sort_index = (self._sort_index + 1) % len(_SORT_KEYS)
-        self._refresh_table()
-        self._refresh_title()
+        self._resort()
 
     def action_toggle_sort_dir(self) -> None:
+        # The index is kept ascending; only how it is read flips.
         self._sort_asc = not self._sort_asc
-        self._refresh_table()
+        self._index.ascending = self._sort_asc
+        self._paint()
         self._refresh_title()
 
     def action_toggle_search(self) -> None:
@@ -674,8 +639,7 @@ class ModesLiveApp(App[int]):
         if self._search_visible:
             self._search_query = self._search_backup
             self._hide_search()
-            self._refresh_table()
-            self._refresh_title()
+            self._resort()
             return
         self.exit(0)
 
@@ -694,8 +658,7 @@ class ModesLiveApp(App[int]):
         if event.input.id != "search":
             return
         self._search_query = event.value
-        self._refresh_table()
-        self._refresh_title()
+        self._resort()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         # Enter commits the query (already applied via
@@ -715,7 +678,7 @@ def _now() -> float:
 def run_tui_app(
     args: argparse.Namespace,
     pipe: PipeDecoder,
-    source: NetworkSource,
+    source: NetworkSource | MultiNetworkSource,
 ) -> int:
     """Run the textual App until the user quits.
 
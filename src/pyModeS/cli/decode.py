@@ -11,24 +11,39 @@ Three input shapes:
   auto-detected: if the first non-blank line has two comma-separated
   fields and the first parses as ``float``, the file is treated as
   ``timestamp,hex`` CSV and timestamps are forwarded to PipeDecoder.
-  Otherwise the file is treated as one hex message per line.
+  Otherwise the file is treated as one hex message per line. A file
+  starting with the 0x1a frame marker is read as a raw Beast binary
+  capture instead, timestamped from its MLAT counter. Input
+  is streamed line by line; output matches decoding the whole file
+  as one batch.
 
 Malformed messages in batch (inline or file) mode produce error-dicts
 in the output stream (matching the existing batch-mode contract)
 rather than aborting. ``--reference`` is rejected in both batch modes
 because a single airborne reference cannot meaningfully apply to
 multiple aircraft at different positions.
+
+Batch output goes to ``--dump-to FILE`` instead of stdout when given:
+compact JSON lines, a SQLite database, or a Parquet / Arrow IPC file
+per ``--dump-format`` (see ``_sqlite`` and ``_columnar``).
 """
 
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
+import signal
 import sys
-from pathlib import Path
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TextIO
 
 from pyModeS import decode as pyModeS_decode
+from pyModeS._json import dumps
+from pyModeS.cli._args import interrupt_on_sigterm
+from pyModeS.cli._compress import open_text_write
+from pyModeS.cli._sink import open_file_sink
+from pyModeS.cli._stream import RecordWriter, decode_records, decode_results
 from pyModeS.message import Decoded
 
 
@@ -78,7 +93,7 @@ def _run_single(args: argparse.Namespace) -> int:
     result["raw_msg"] = args.message
 
     if args.compact:
-        print(json.dumps(result, separators=(",", ":"), default=str))
+        print(dumps(result))
     else:
         print(json.dumps(result, indent=2, sort_keys=True, default=str))
     return 0
@@ -87,39 +102,51 @@ def _run_single(args: argparse.Namespace) -> int:
 def _run_inline_batch(args: argparse.Namespace) -> int:
     """Inline-batch path: split the comma-separated MESSAGE and emit JSON lines."""
     hexes = [h.strip() for h in args.message.split(",") if h.strip()]
-    if not hexes:
-        return 0
-    return _emit_batch(hexes, None, args)
+    return _emit_stream(((h, float(i)) for i, h in enumerate(hexes)), args)
 
 
 def _run_file(args: argparse.Namespace) -> int:
-    """File-based path: emit one JSON line per input message."""
+    """File-based path: emit one JSON line per input message.
+
+    The file (or stdin) is read line by line and never held in memory
+    as a whole, so inputs far larger than RAM work. A ``.gz`` or
+    ``.zst`` file is decompressed on the fly in a background thread
+    (see ``_compress``); a compressed Beast capture is decompressed
+    into memory, since it can't be memory-mapped.
+    """
+    from pyModeS.cli._source import open_capture
+
     try:
-        hexes, timestamps = _read_file(args.file)
-    except FileNotFoundError as e:
-        print(f"modes decode: error: {e}", file=sys.stderr)
-        return 1
+        with open_capture(args.file, mlat_hz=args.mlat_hz) as records:
+            return _emit_stream(records, args)
     except OSError as e:
         print(f"modes decode: error: {e}", file=sys.stderr)
         return 1
-
-    if not hexes:
-        return 0
-
-    return _emit_batch(hexes, timestamps, args)
+    except ImportError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 3
 
 
-def _emit_batch(
-    hexes: list[str],
-    timestamps: list[float] | None,
+def _emit_stream(
+    records: Iterable[tuple[str, float]],
     args: argparse.Namespace,
 ) -> int:
-    """Batch decode and emit results to stdout.
+    """Decode ``(hex, timestamp)`` records and emit results to stdout.
 
     Shared by the inline (``HEX1,HEX2``) and file-based (``--file PATH``)
-    input shapes. Uses ``pyModeS.decode(list, timestamps=...)``'s
-    batch-mode contract: individual message errors become error-dicts
-    in the results list, so the stream stays line-aligned with input.
+    input shapes. Messages run through one :class:`PipeDecoder`, the
+    same way ``pyModeS.decode(list, timestamps=...)`` does in batch
+    mode: individual message errors become error-dicts, so the stream
+    stays line-aligned with input.
+
+    A result is written as soon as it is final — i.e. once
+    :meth:`PipeDecoder.holds` says no pending CPR pair or bootstrap
+    cluster can still fill in its position. Results are queued behind
+    a held one so output order matches input order. The queue only
+    spans the pipe's ``eviction_ttl`` of stream time, so peak memory
+    does not grow with input size, and the output is identical to
+    decoding the whole input as one batch. With ``--jobs N`` the same
+    happens in N worker processes, one ICAO partition each.
 
     Output format:
 
@@ -132,85 +159,179 @@ def _emit_batch(
       composable with ``jq``, suitable for redirecting to a file.
 
     When the caller doesn't have real timestamps (inline batch and the
-    plain-hex file format), we synthesize list-position timestamps
-    here. That's exactly what ``pyModeS.core.decode`` would do
-    internally anyway — doing it at the CLI layer suppresses core's
-    "no timestamps provided" stderr warning for the common case where
-    a user pastes hex messages into a terminal.
+    plain-hex file format), list-position timestamps are synthesized
+    by the record iterator. That's exactly what ``pyModeS.core.decode``
+    would do internally anyway — doing it at the CLI layer suppresses
+    core's "no timestamps provided" stderr warning for the common case
+    where a user pastes hex messages into a terminal.
     """
-    surface_ref = _parse_surface_ref(args.surface_ref)
-    if timestamps is None:
-        timestamps = [float(i) for i in range(len(hexes))]
-    results: list[Decoded] = pyModeS_decode(
-        hexes,
-        timestamps=timestamps,
-        surface_ref=surface_ref,
-        full_dict=args.full_dict,
-    )
+    options: dict[str, Any] = {
+        "surface_ref": _parse_surface_ref(args.surface_ref),
+        "full_dict": args.full_dict,
+        "compact": args.compact,
+    }
+    if args.check is not None:
+        return _run_check(records, args, options)
+    if args.dump_to is not None:
+        if args.dump_format != "jsonl":
+            return _dump_records(records, args, options)
+        options["compact"] = True
+        try:
+            stream = open_text_write(args.dump_to)
+        except OSError as e:
+            print(f"modes decode: error: {e}", file=sys.stderr)
+            return 1
+        with stream:
+            return _write_stream(records, args, options, stream)
+    return _write_stream(records, args, options, sys.stdout)
 
-    # Stamp the source hex on every result (pyModeS_decode already
-    # does this for error dicts; we set it unconditionally here so
-    # success records carry it too, keeping the batch output
-    # self-describing).
-    for hex_msg, result in zip(hexes, results, strict=True):
-        result["raw_msg"] = hex_msg
 
-    if args.compact:
-        for result in results:
-            print(json.dumps(result, separators=(",", ":"), default=str))
+def _write_stream(
+    records: Iterable[tuple[str, float]],
+    args: argparse.Namespace,
+    options: dict[str, Any],
+    stream: TextIO,
+) -> int:
+    """Decode ``records`` and write the formatted output to ``stream``."""
+    writer = RecordWriter(stream, compact=options["compact"])
+    if args.jobs <= 1:
+        decode_records(records, write=writer.write, **options)
         return 0
 
-    # Pretty: one JSON object per message, blank line between.
-    for i, result in enumerate(results):
-        if i > 0:
-            print()
-        print(json.dumps(result, indent=2, sort_keys=True, default=str))
-    return 0
+    from pyModeS.cli._parallel import run_parallel
 
+    try:
+        run_parallel(
+            records,
+            jobs=args.jobs,
+            ordered=not args.unordered,
+            write=writer.write,
+            **options,
+        )
+    except RuntimeError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 1
+    return 0
 
-def _read_file(path: str) -> tuple[list[str], list[float] | None]:
-    """Read hex strings (and optional timestamps) from file.
 
-    Returns (hexes, timestamps). ``timestamps`` is None for the
-    plain-hex-per-line format and a parallel list for ``timestamp,hex``
-    CSV format.
+def _dump_records(
+    records: Iterable[tuple[str, float]],
+    args: argparse.Namespace,
+    options: dict[str, Any],
+) -> int:
+    """``--dump-to`` with a sqlite, parquet or arrow ``--dump-format``.
+
+    Serial results go to the file sink as they are released, stamped
+    with ``raw_msg`` and the record's ``timestamp`` like ``modes live``
+    records. With ``--jobs`` the workers still send compact JSON,
+    which is parsed back here. A Parquet/Arrow file is unreadable without the footer
+    ``close()`` writes (and SQLite keeps only committed batches), so
+    SIGTERM is turned into KeyboardInterrupt while decoding and the
+    sink is closed either way.
     """
-    source = sys.stdin.read() if path == "-" else Path(path).read_text()
+    try:
+        sink = open_file_sink(
+            args.dump_to,
+            args.dump_format,
+            row_group_size=args.row_group_size,
+            rotate_bytes=args.rotate_bytes,
+            rotate_seconds=args.rotate_seconds,
+        )
+    except ImportError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 3
+    except OSError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 1
 
-    raw_lines = [line.strip() for line in source.splitlines()]
-    # Drop blank lines up front
-    lines = [line for line in raw_lines if line]
+    def emit(record: tuple[str, float], result: Decoded) -> None:
+        result["raw_msg"], result["timestamp"] = record
+        sink.write(result)
 
-    if not lines:
-        return [], None
+    def write(text: str) -> None:
+        sink.write(Decoded(json.loads(text)))
 
-    # Auto-detect CSV by inspecting the first non-blank line
-    first = lines[0]
-    if "," in first:
-        left, _, _right = first.partition(",")
-        try:
-            float(left.strip())
-            is_csv = True
-        except ValueError:
-            is_csv = False
-    else:
-        is_csv = False
+    options["compact"] = True
+
+    previous = interrupt_on_sigterm()
+    try:
+        if args.jobs <= 1:
+            decode_results(
+                records,
+                surface_ref=options["surface_ref"],
+                full_dict=options["full_dict"],
+                emit=emit,
+            )
+            return 0
+        from pyModeS.cli._parallel import run_parallel
+
+        run_parallel(
+            records,
+            jobs=args.jobs,
+            ordered=not args.unordered,
+            write=write,
+            timestamps=True,
+            **options,
+        )
+        return 0
+    except RuntimeError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("modes decode: interrupted", file=sys.stderr)
+        return 130
+    finally:
+        sink.close()
+        if previous is not None:
+            signal.signal(signal.SIGTERM, previous)
 
-    if not is_csv:
-        return lines, None
 
-    hexes: list[str] = []
-    timestamps: list[float] = []
-    for i, line in enumerate(lines):
-        left, _, right = line.partition(",")
-        try:
-            ts = float(left.strip())
-        except ValueError:
-            # Row doesn't match CSV shape; treat hex verbatim with a
-            # synthetic timestamp that preserves order
-            hexes.append(line)
-            timestamps.append(float(i))
-            continue
-        hexes.append(right.strip())
-        timestamps.append(ts)
-    return hexes, timestamps
+def _run_check(
+    records: Iterable[tuple[str, float]],
+    args: argparse.Namespace,
+    options: dict[str, Any],
+) -> int:
+    """``--check N``: diff ``--jobs`` output against serial on a sample.
+
+    Decodes the first N records both ways and reports whether the
+    output matches (exit 0) or where it first differs (exit 1). With
+    ``--unordered`` the two outputs are compared as sorted multisets.
+    """
+    from pyModeS.cli._parallel import run_parallel
+
+    sample = list(itertools.islice(records, args.check))
+    serial: list[str] = []
+    decode_records(sample, write=serial.append, **options)
+    parallel: list[str] = []
+    try:
+        run_parallel(
+            sample,
+            jobs=args.jobs,
+            ordered=not args.unordered,
+            write=parallel.append,
+            **options,
+        )
+    except RuntimeError as e:
+        print(f"modes decode: error: {e}", file=sys.stderr)
+        return 1
+    if args.unordered:
+        serial.sort()
+        parallel.sort()
+
+    label = f"--jobs {args.jobs}"
+    if serial == parallel:
+        print(f"check: {len(sample)} records, {label} output matches serial")
+        return 0
+    if len(serial) != len(parallel):
+        print(
+            f"check: MISMATCH — serial emitted {len(serial)} records, "
+            f"{label} emitted {len(parallel)}"
+        )
+        return 1
+    index = next(
+        i for i, (a, b) in enumerate(zip(serial, parallel, strict=True)) if a != b
+    )
+    print(f"check: MISMATCH at output record {index}")
+    print(f"  serial:   {serial[index]}")
+    print(f"  parallel: {parallel[index]}")
+    return 1
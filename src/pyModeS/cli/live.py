@@ -2,20 +2,44 @@
 
 Pipeline (non-TUI path)::
 
-    NetworkSource (TCP + beast frame parser)
-        │ yields (hex, timestamp)
+    NetworkSource (TCP + beast frame parser), or MultiNetworkSource
+    when --network is repeated (one selector loop, frames merged in
+    timestamp order), or UnixSource / PipeSource for --unix /
+    --beast-stdin
+        │ yields (payload bytes, timestamp)
         ▼
     PipeDecoder
         │ per-ICAO state, CPR pair matching, TTL eviction
         ▼
-    Sink (JsonLinesSink | TeeSink | NullSink)
+    Sink (JsonLinesSink | TeeSink | NullSink, plus SqliteSink or
+    ColumnarSink for a sqlite/parquet/arrow --dump-to)
+
+With ``--metrics`` a daemon thread also serves Prometheus metrics
+(``_metrics.py``); the loop records one observation per burst.
+
+With ``--shed`` a thread reads the source ahead into a bounded queue
+and drops frames by the chosen policies as it fills (``_overload.py``),
+so a slow decoder or sink no longer backs up into the TCP connection.
+
+With ``--relay`` / ``--relay-file`` the source also hands each burst's
+frames, before decoding, to a filter that re-emits the wanted ones as
+raw Beast (``_relay.py``).
+
+With ``--jobs N`` the same stages run as a pipeline of processes
+(``_pipeline.py``): a reader that only parses frames into shared-memory
+rings, N decoders partitioned by ICAO, and a writer that owns the
+sink. This process then only starts them, reports stats and drives
+shutdown.
 
 TUI path: the textual ``ModesLiveApp`` owns the NetworkSource and
 PipeDecoder directly — sinks don't apply because the app paints a
 DataTable rather than emitting JSON lines.
 
-Signal handling: SIGINT and SIGTERM set a stop flag that the iterator
-loop checks after each message. The main loop then flushes the sink,
+The loop consumes ``NetworkSource.iter_batches()``: one recv burst of
+payloads and timestamps at a time, decoded in a plain ``for`` loop.
+
+Signal handling: SIGINT and SIGTERM set a stop flag that the loop
+checks before each burst. The main loop then flushes the sink,
 closes the source, emits a final stats line to stderr, and returns 0.
 
 Full tracebacks only with ``PYMODES_CLI_DEBUG=1`` in the environment.
@@ -24,16 +48,35 @@ Full tracebacks only with ``PYMODES_CLI_DEBUG=1`` in the environment.
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import signal
 import sys
 import time
+from collections.abc import Callable
 from types import FrameType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pyModeS import PipeDecoder
-from pyModeS.cli._sink import JsonLinesSink, NullSink, TeeSink
-from pyModeS.cli._source import NetworkSource, UnsupportedStreamError
+from pyModeS.cli._args import parse_listen
+from pyModeS.cli._sink import (
+    JsonLinesSink,
+    NullSink,
+    Sink,
+    TeeSink,
+    open_file_sink,
+)
+from pyModeS.cli._source import (
+    MultiNetworkSource,
+    NetworkSource,
+    PipeSource,
+    Relay,
+    UnixSource,
+    UnsupportedStreamError,
+)
+
+if TYPE_CHECKING:
+    from pyModeS.cli._relay import BeastRelay
 
 
 class _StopFlag:
@@ -45,14 +88,38 @@ class _StopFlag:
 
 def run(args: argparse.Namespace) -> int:
     """Entry point for ``modes live``. Returns exit code."""
-    host, port = _parse_network(args.network)
-    if host is None:
-        print(
-            "modes live: error: --network must be in HOST:PORT form "
-            f"(got {args.network!r})",
-            file=sys.stderr,
-        )
-        return 2
+    endpoints: list[tuple[str, int]] = []
+    for value in args.network or ():
+        host, port = _parse_network(value)
+        if host is None:
+            print(
+                "modes live: error: --network must be in HOST:PORT form "
+                f"(got {value!r})",
+                file=sys.stderr,
+            )
+            return 2
+        endpoints.append((host, port))
+
+    metrics_at: tuple[str, int] | None = None
+    if args.metrics is not None:
+        metrics_host, metrics_port = parse_listen(args.metrics)
+        if metrics_host is None:
+            print(
+                "modes live: error: --metrics must be PORT or HOST:PORT "
+                f"(got {args.metrics!r})",
+                file=sys.stderr,
+            )
+            return 2
+        metrics_at = (metrics_host, metrics_port)
+
+    for flag, value in (("--serve", args.serve), ("--relay", args.relay)):
+        if value is not None and _parse_serve(value) is None:
+            print(
+                f"modes live: error: {flag} must be PORT, HOST:PORT or unix:PATH "
+                f"(got {value!r})",
+                file=sys.stderr,
+            )
+            return 2
 
     surface_ref = _parse_surface_ref(args.surface_ref)
 
@@ -77,56 +144,127 @@ def run(args: argparse.Namespace) -> int:
             return 3
         # silent=True because textual owns the terminal; any stderr
         # writes inside the alt-screen would corrupt the display.
-        source = NetworkSource(host, port, on_detect=None, silent=True)
+        source = _build_source(endpoints, on_detect=None, silent=True, unix=args.unix)
         return run_tui_app(args, pipe, source)
 
-    # Non-TUI sink pipeline
-    sink = _build_sink(args)
+    if args.jobs is not None:
+        return _run_pipeline(args, endpoints, surface_ref, metrics_at)
+
+    # Non-TUI sink pipeline. A parquet/arrow --dump-to needs the
+    # optional pyarrow package, imported only when asked for.
+    try:
+        sink = _build_sink(args)
+    except ImportError as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        return 3
+    except OSError as e:
+        print(f"modes live: error: {e}", file=sys.stderr)
+        return 1
+    try:
+        relay = _build_relay(args)
+    except ImportError as e:
+        sink.close()
+        print(f"modes live: error: {e}", file=sys.stderr)
+        return 3
+    except OSError as e:
+        sink.close()
+        print(f"modes live: error: {e}", file=sys.stderr)
+        return 1
 
     # Signal handling
     stop = _StopFlag()
     _install_signal_handlers(stop)
 
     silence_stderr = args.quiet
-    source = NetworkSource(
-        host,
-        port,
-        on_detect=(
-            None
-            if silence_stderr
-            else lambda fmt: print(
-                f"[pyModeS.live] detected {fmt} format, resyncing",
-                file=sys.stderr,
-            )
-        ),
+    source = _build_source(
+        endpoints,
+        on_detect=None if silence_stderr else _announce_format,
         silent=silence_stderr,
+        relay=relay,
+        unix=args.unix,
+        stdin=args.beast_stdin,
     )
 
+    intake = None
+    if args.shed is not None:
+        from pyModeS.cli._overload import QUEUE_FRAMES, IntakeQueue, LoadShedder
+
+        intake = IntakeQueue(
+            source,
+            LoadShedder(args.shed),
+            capacity=args.queue_frames or QUEUE_FRAMES,
+        )
+
+    # Optional Prometheus endpoint, served from its own thread; the
+    # loop only hands it one observation per burst.
+    metrics_server = None
+    observe = None
+    if metrics_at is not None:
+        from pyModeS.cli._metrics import LiveMetrics, MetricsServer
+
+        metrics = LiveMetrics(pipe, source, sink, intake=intake)
+        try:
+            metrics_server = MetricsServer(*metrics_at, metrics.render)
+        except OSError as e:
+            sink.close()
+            if relay is not None:
+                relay.close()
+            print(f"modes live: error: --metrics: {e}", file=sys.stderr)
+            return 1
+        observe = metrics.observe
+        if not silence_stderr:
+            bound_host, bound_port = metrics_server.address
+            print(
+                f"[pyModeS.live] metrics on http://{bound_host}:{bound_port}/metrics",
+                file=sys.stderr,
+            )
+
     last_stats_ts = time.monotonic()
 
     def _loop() -> int:
         nonlocal last_stats_ts
+        decode = pipe.decode
+        write = sink.write
+        clock = time.perf_counter_ns
+        started = 0
         try:
-            for hex_msg, ts in source:
+            for msgs, timestamps in (intake or source).iter_batches():
                 if stop.stopped:
                     break
-                result = pipe.decode(hex_msg, timestamp=ts)
-                # Preserve the source hex and MLAT-derived wall-clock
-                # timestamp on every emitted record so `--dump-to`
-                # captures are self-contained for offline analysis.
-                # PipeDecoder already sets raw_msg on error results;
-                # we set it unconditionally here to cover the success
-                # path. `ts` comes from NetworkSource._mlat_to_wall,
-                # so it is anchored to the first frame's wall-clock
-                # and then interpolated from the beast 12 MHz MLAT
-                # counter — more accurate than time.time() on every
-                # recv() because TCP batching doesn't perturb it.
-                result["raw_msg"] = hex_msg
-                result["timestamp"] = ts
-                sink.write(result)
+                if not msgs:
+                    # Idle: write out records held back under a time
+                    # limit (--flush-ms) instead of waiting for more.
+                    sink.flush_due()
+                if observe is not None:
+                    started = clock()
+                # Per burst: a --serve sink only needs raw_msg while a
+                # client is connected.
+                writes_raw_msg = sink.writes_raw_msg
+                for msg, ts in zip(msgs, timestamps, strict=True):
+                    result = decode(msg, timestamp=ts)
+                    # Preserve the source hex and MLAT-derived wall-clock
+                    # timestamp on every emitted record so `--dump-to`
+                    # captures are self-contained for offline analysis.
+                    # PipeDecoder already sets raw_msg on error results;
+                    # we set it here to cover the success path, but only
+                    # when a sink will actually serialise it — the
+                    # source hands us payload bytes, so the hex string
+                    # is built on demand rather than per frame. `ts` is
+                    # anchored to the burst's wall-clock and then
+                    # interpolated from the beast MLAT counter — more
+                    # accurate than time.time() on every recv() because
+                    # TCP batching doesn't perturb it.
+                    if writes_raw_msg:
+                        result["raw_msg"] = (
+                            msg if isinstance(msg, str) else msg.hex().upper()
+                        )
+                    result["timestamp"] = ts
+                    write(result)
+                if observe is not None:
+                    observe(msgs, clock() - started)
                 now = time.monotonic()
                 if now - last_stats_ts >= 60.0 and not silence_stderr:
-                    _emit_stats_line(pipe, args.quiet)
+                    _emit_stats_line(pipe, args.quiet, intake=intake)
                     last_stats_ts = now
         except UnsupportedStreamError as e:
             print(f"modes live: error: {e}", file=sys.stderr)
@@ -141,12 +279,102 @@ def run(args: argparse.Namespace) -> int:
     try:
         code = _loop()
     finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        if relay is not None:
+            relay.close()
         sink.close()
 
-    _emit_stats_line(pipe, args.quiet, prefix="final")
+    _emit_stats_line(pipe, args.quiet, prefix="final", intake=intake)
     return code
 
 
+def _run_pipeline(
+    args: argparse.Namespace,
+    endpoints: list[tuple[str, int]],
+    surface_ref: Any,
+    metrics_at: tuple[str, int] | None,
+) -> int:
+    """``modes live --jobs N``: run the reader / decoder / writer processes."""
+    from pyModeS.cli._pipeline import RING_SLOTS, LivePipeline
+
+    # The source and sink are built inside the reader and writer
+    # processes, so both are passed as picklable factories; sink
+    # errors (missing pyarrow, unwritable file) surface as the
+    # writer's exit code.
+    pipeline = LivePipeline(
+        functools.partial(
+            _build_source,
+            endpoints,
+            on_detect=None if args.quiet else _announce_format,
+            silent=args.quiet,
+            unix=args.unix,
+            stdin=args.beast_stdin,
+        ),
+        functools.partial(_build_sink, args),
+        jobs=args.jobs,
+        surface_ref=surface_ref,
+        full_dict=args.full_dict,
+        ring_slots=args.queue_frames or RING_SLOTS,
+        shed=args.shed,
+        make_relay=(
+            functools.partial(_build_relay, args)
+            if args.relay is not None or args.relay_file is not None
+            else None
+        ),
+    )
+
+    metrics_server = None
+    if metrics_at is not None:
+        from pyModeS.cli._metrics import MetricsServer, PipelineMetrics
+
+        try:
+            metrics_server = MetricsServer(
+                *metrics_at, PipelineMetrics(pipeline).render
+            )
+        except OSError as e:
+            print(f"modes live: error: --metrics: {e}", file=sys.stderr)
+            return 1
+        if not args.quiet:
+            bound_host, bound_port = metrics_server.address
+            print(
+                f"[pyModeS.live] metrics on http://{bound_host}:{bound_port}/metrics",
+                file=sys.stderr,
+            )
+
+    stop = _StopFlag()
+    _install_signal_handlers(stop)
+    code: int | None = None
+    last_stats_ts = time.monotonic()
+    try:
+        pipeline.start()
+        while not stop.stopped:
+            code = pipeline.poll()
+            if code is not None:
+                break
+            time.sleep(0.1)
+            now = time.monotonic()
+            if now - last_stats_ts >= 60.0 and not args.quiet:
+                print(pipeline.stats_line(), file=sys.stderr)
+                last_stats_ts = now
+    finally:
+        stop_code = pipeline.stop()
+        if metrics_server is not None:
+            metrics_server.close()
+
+    if not args.quiet:
+        print(pipeline.stats_line(prefix="final"), file=sys.stderr)
+    return code or stop_code
+
+
+def _announce_format(fmt: str) -> None:
+    _log(f"detected {fmt} format, resyncing")
+
+
+def _log(line: str) -> None:
+    print(f"[pyModeS.live] {line}", file=sys.stderr)
+
+
 def _parse_network(value: str) -> tuple[str | None, int]:
     """Split a HOST:PORT string. Returns (None, 0) on parse failure."""
     if ":" not in value:
@@ -159,6 +387,48 @@ def _parse_network(value: str) -> tuple[str | None, int]:
     return host, port
 
 
+def _parse_serve(value: str) -> tuple[str, int] | str | None:
+    """``--serve``: ``unix:PATH`` or ``[HOST:]PORT``; None if invalid."""
+    if value.startswith("unix:"):
+        return value.removeprefix("unix:") or None
+    host, port = parse_listen(value)
+    if host is None:
+        return None
+    return host, port
+
+
+def _build_source(
+    endpoints: list[tuple[str, int]],
+    *,
+    on_detect: Callable[[str], None] | None,
+    silent: bool,
+    relay: Relay | None = None,
+    unix: str | None = None,
+    stdin: bool = False,
+) -> NetworkSource | MultiNetworkSource:
+    """One feed reads through NetworkSource, several through a merger.
+
+    ``--unix`` and ``--beast-stdin`` read through UnixSource and
+    PipeSource instead. Either way the source yields payload bytes
+    (``raw=True``); the loop builds hex only for sinks that write
+    ``raw_msg``.
+    """
+    if stdin:
+        return PipeSource(on_detect=on_detect, silent=silent, raw=True, relay=relay)
+    if unix is not None:
+        return UnixSource(
+            unix, on_detect=on_detect, silent=silent, raw=True, relay=relay
+        )
+    if len(endpoints) == 1:
+        host, port = endpoints[0]
+        return NetworkSource(
+            host, port, on_detect=on_detect, silent=silent, raw=True, relay=relay
+        )
+    return MultiNetworkSource(
+        endpoints, on_detect=on_detect, silent=silent, raw=True, relay=relay
+    )
+
+
 def _parse_surface_ref(value: str | None) -> Any:
     """Accept either an ICAO airport code or a 'lat,lon' string."""
     if value is None:
@@ -169,22 +439,91 @@ def _parse_surface_ref(value: str | None) -> Any:
     return value
 
 
-def _build_sink(
-    args: argparse.Namespace,
-) -> JsonLinesSink | NullSink | TeeSink:
+def _build_sink(args: argparse.Namespace) -> Sink:
     """Construct the appropriate non-TUI sink for the given args.
 
     The TUI path does NOT go through this function — it has its
     own branch in ``run()`` that hands the NetworkSource straight
-    to the textual App.
+    to the textual App. Raises ImportError for a parquet/arrow
+    ``--dump-to`` without pyarrow installed, OSError if the file
+    can't be opened or the ``--serve`` address bound.
     """
     stdout_sink: JsonLinesSink | NullSink = (
         NullSink() if args.quiet else JsonLinesSink(sys.stdout)
     )
+    sink: Sink = stdout_sink
     if args.dump_to is not None:
-        file_sink = JsonLinesSink.to_file(args.dump_to)
-        return TeeSink(stdout_sink, file_sink)
-    return stdout_sink
+        file_sink = open_file_sink(
+            args.dump_to,
+            args.dump_format,
+            flush_records=args.flush_records,
+            flush_bytes=args.flush_bytes,
+            flush_delay=None if args.flush_ms is None else args.flush_ms / 1000.0,
+            row_group_size=args.row_group_size,
+            rotate_bytes=args.rotate_bytes,
+            rotate_seconds=args.rotate_seconds,
+        )
+        sink = TeeSink(stdout_sink, file_sink)
+    serve_at = None if args.serve is None else _parse_serve(args.serve)
+    if serve_at is not None:
+        from pyModeS.cli._broadcast import Broadcaster, BroadcastSink
+
+        try:
+            server = Broadcaster(serve_at, log=None if args.quiet else _log)
+        except OSError as e:
+            sink.close()
+            raise OSError(f"--serve: {e}") from e
+        if not args.quiet:
+            _log(f"serving JSON lines on {_describe(server.address)}")
+        sink = TeeSink(sink, BroadcastSink(server))
+    return sink
+
+
+def _build_relay(args: argparse.Namespace) -> BeastRelay | None:
+    """The ``--relay`` / ``--relay-file`` frame hook, or None.
+
+    Raises OSError if the relay address can't be bound or the file
+    opened, ImportError for a ``.zst`` file without zstandard.
+    """
+    if args.relay is None and args.relay_file is None:
+        return None
+    from pyModeS.cli._broadcast import Broadcaster
+    from pyModeS.cli._compress import open_binary_write
+    from pyModeS.cli._relay import BeastRelay
+
+    log = None if args.quiet else _log
+    file = None
+    if args.relay_file is not None:
+        try:
+            file = open_binary_write(args.relay_file)
+        except OSError as e:
+            raise OSError(f"--relay-file: {e}") from e
+    server = None
+    relay_at = None if args.relay is None else _parse_serve(args.relay)
+    if relay_at is not None:
+        try:
+            server = Broadcaster(relay_at, log=log)
+        except OSError as e:
+            if file is not None:
+                file.close()
+            raise OSError(f"--relay: {e}") from e
+        if log is not None:
+            log(f"relaying Beast frames on {_describe(server.address)}")
+    return BeastRelay(
+        server=server,
+        file=file,
+        dfs=args.relay_df,
+        icaos=args.relay_icao,
+        crc=args.relay_crc,
+        log=log,
+    )
+
+
+def _describe(address: tuple[str, int] | str) -> str:
+    """A Broadcaster address as given on the command line."""
+    if isinstance(address, str):
+        return f"unix:{address}"
+    return "{}:{}".format(*address)
 
 
 def _install_signal_handlers(stop: _StopFlag) -> None:
@@ -203,15 +542,23 @@ def _install_signal_handlers(stop: _StopFlag) -> None:
         pass
 
 
-def _emit_stats_line(pipe: PipeDecoder, quiet: bool, *, prefix: str = "") -> None:
+def _emit_stats_line(
+    pipe: PipeDecoder, quiet: bool, *, prefix: str = "", intake: Any = None
+) -> None:
     if quiet:
         return
     stats = pipe.stats
     label = f"[pyModeS.live{' ' + prefix if prefix else ''}]"
-    print(
+    line = (
         f"{label} {stats['total']} msgs, "
         f"{stats['decoded']} decoded, "
         f"{stats['crc_fail']} crc_fail, "
-        f"{stats['pending_pairs']} pending pairs",
-        file=sys.stderr,
+        f"{stats['pending_pairs']} pending pairs"
     )
+    if intake is not None:
+        from pyModeS.cli._overload import shed_summary
+
+        line += (
+            f"; queue {intake.depth}/{intake.capacity}, {shed_summary(intake.dropped)}"
+        )
+    print(line, file=sys.stderr)
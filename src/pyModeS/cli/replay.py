@@ -0,0 +1,310 @@
+"""``modes replay`` — serve a recorded capture as a live Beast feed.
+
+Pipeline::
+
+    open_capture (hex / CSV text or raw Beast, optionally .gz / .zst)
+        │ yields (hex, capture timestamp)
+        ▼
+    schedule: each frame is due at start + (ts - ts_0) / speed
+        │ frames that are already due go out together
+        ▼
+    Beast encoder (0x1a, type, 12 MHz MLAT counter, signal, payload)
+        ▼
+    ReplayServer: every connected TCP client
+
+The replay starts when the first client connects, so ``modes live
+--network 127.0.0.1:30005`` (or any other Beast consumer) sees the
+capture from its first frame. Later clients join the stream where it
+is. If the last client disconnects, the replay pauses until another
+one connects and the schedule is shifted by the pause.
+
+Timing: frames are spaced by the capture's gaps divided by
+``--speed``; ``--speed max`` sends as fast as the clients read. The
+frames that are due when the replay wakes up are sent in one
+``sendall``, so bursts in the capture stay bursts on the wire. The
+MLAT counter runs at 12 MHz in replay time, so a consumer's
+MLAT/wall-clock calibration sees a dump1090-like receiver; with
+``--speed max`` it follows capture time instead. A hex-only file has
+no timestamps, and its messages are replayed one second apart.
+
+``sendall`` blocks while a client's receive window is full, so a
+consumer that can't keep up holds the replay back instead of losing
+frames. That shows up as lag: how far behind its due time a frame
+went out. The stats line on stderr, every ``--stats-interval``
+seconds and once at the end, reports the frames sent, the frames/s
+achieved, the largest lag and the number of clients.
+
+SIGINT and SIGTERM end the replay early with exit status 0, like
+reaching the end of the capture.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import signal
+import socket
+import sys
+import time
+from collections.abc import Iterable
+
+from pyModeS.cli._args import interrupt_on_sigterm, parse_listen
+from pyModeS.cli._source import open_capture
+
+# MLAT counter rate of the replayed feed (dump1090 / readsb).
+MLAT_HZ = 12_000_000
+_MLAT_WRAP = 1 << 48
+
+# Beast frame type by payload length: Mode-S short and long.
+_FRAME_TYPES = {7: 0x32, 14: 0x33}
+
+# Send a burst early once it reaches this size (mostly --speed max).
+_SEND_BYTES = 1 << 16
+
+
+def beast_frame(hex_msg: str, ticks: int) -> bytes | None:
+    """Encode ``hex_msg`` as a Beast frame with MLAT counter ``ticks``.
+
+    Returns None for anything that isn't a 7- or 14-byte Mode-S
+    message. Every 0x1a byte after the frame marker is doubled.
+    """
+    try:
+        payload = bytes.fromhex(hex_msg)
+    except ValueError:
+        return None
+    msg_type = _FRAME_TYPES.get(len(payload))
+    if msg_type is None:
+        return None
+    body = (ticks % _MLAT_WRAP).to_bytes(6, "big") + b"\x00" + payload
+    return bytes((0x1A, msg_type)) + body.replace(b"\x1a", b"\x1a\x1a")
+
+
+class ReplayServer:
+    """Listening TCP socket that sends the same bytes to every client.
+
+    ``address`` is the bound ``(host, port)``, useful with port 0.
+    Raises OSError if the address can't be bound.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self._listener = socket.create_server((host, port))
+        self.address: tuple[str, int] = self._listener.getsockname()[:2]
+        self._clients: list[socket.socket] = []
+
+    @property
+    def clients(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    def wait_for_client(self) -> None:
+        """Block until a client connects."""
+        self._listener.setblocking(True)
+        conn, _addr = self._listener.accept()
+        self._add(conn)
+
+    def accept_pending(self) -> None:
+        """Accept every client waiting to connect, without blocking."""
+        self._listener.setblocking(False)
+        while True:
+            try:
+                conn, _addr = self._listener.accept()
+            except BlockingIOError:
+                return
+            self._add(conn)
+
+    def _add(self, conn: socket.socket) -> None:
+        conn.setblocking(True)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._clients.append(conn)
+
+    def send(self, data: bytes) -> None:
+        """Send ``data`` to every client, dropping those that went away."""
+        for conn in list(self._clients):
+            try:
+                conn.sendall(data)
+            except OSError:
+                self._clients.remove(conn)
+                conn.close()
+
+    def close(self) -> None:
+        for conn in self._clients:
+            conn.close()
+        self._clients.clear()
+        self._listener.close()
+
+
+class ReplayStats:
+    """Counters behind the ``[pyModeS.replay]`` stats lines."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.skipped = 0
+        # Largest lag seen since the last report / over the whole run.
+        self.lag: float | None = None
+        self.max_lag: float | None = None
+        self.started = time.monotonic()
+        self._mark_time = self.started
+        self._mark_frames = 0
+
+    def begin(self) -> None:
+        """Restart the clock, when the first client connects."""
+        self.started = self._mark_time = time.monotonic()
+
+    def record_lag(self, lag: float) -> None:
+        lag = max(lag, 0.0)
+        if self.lag is None or lag > self.lag:
+            self.lag = lag
+        if self.max_lag is None or lag > self.max_lag:
+            self.max_lag = lag
+
+    def line(self, clients: int, *, final: bool = False) -> str:
+        """Format a stats line and start a new reporting interval.
+
+        The rate and lag cover the interval since the previous line,
+        or the whole run for the ``final`` one.
+        """
+        now = time.monotonic()
+        if final:
+            since, frames, lag = self.started, self.frames, self.max_lag
+        else:
+            since, lag = self._mark_time, self.lag
+            frames = self.frames - self._mark_frames
+        elapsed = now - since
+        rate = frames / elapsed if elapsed > 0 else 0.0
+        label = f"[pyModeS.replay{' final' if final else ''}]"
+        parts = [f"{self.frames} frames", f"{rate:.0f} frames/s"]
+        if lag is not None:
+            parts.append(f"lag {lag:.3f} s")
+        parts.append(f"{clients} client{'' if clients == 1 else 's'}")
+        if self.skipped:
+            parts.append(f"{self.skipped} skipped")
+        self._mark_time = now
+        self._mark_frames = self.frames
+        self.lag = None
+        return f"{label} {', '.join(parts)}"
+
+
+def replay(
+    records: Iterable[tuple[str, float]],
+    server: ReplayServer,
+    *,
+    speed: float = 1.0,
+    stats: ReplayStats | None = None,
+    stats_interval: float | None = None,
+) -> ReplayStats:
+    """Send ``records`` to ``server``'s clients on the capture's schedule.
+
+    Waits for the first client before starting. ``speed`` is the
+    speed-up factor, ``math.inf`` for as fast as possible. With
+    ``stats_interval`` a stats line is printed to stderr at most that
+    often. Returns ``stats`` (a new :class:`ReplayStats` if None).
+    """
+    if stats is None:
+        stats = ReplayStats()
+    realtime = math.isfinite(speed)
+    burst = bytearray()
+    pending = 0
+    t0: float | None = None
+    last_ticks = 0
+    offset = 0.0
+
+    server.wait_for_client()
+    stats.begin()
+    start = stats.started
+    next_report = start + stats_interval if stats_interval else math.inf
+
+    def flush() -> None:
+        nonlocal start, pending, next_report
+        server.accept_pending()
+        if not server.clients:
+            paused = time.monotonic()
+            server.wait_for_client()
+            start += time.monotonic() - paused
+        server.send(bytes(burst))
+        now = time.monotonic()
+        if realtime:
+            stats.record_lag(now - (start + offset))
+        stats.frames += pending
+        burst.clear()
+        pending = 0
+        if now >= next_report:
+            print(stats.line(server.clients), file=sys.stderr)
+            next_report = now + (stats_interval or math.inf)
+
+    for hex_msg, ts in records:
+        if t0 is None:
+            t0 = ts
+        elapsed = ts - t0
+        if realtime:
+            elapsed /= speed
+        # A receiver's counter never runs backwards; out-of-order
+        # capture timestamps are sent with the previous tick.
+        ticks = max(last_ticks, round(elapsed * MLAT_HZ))
+        frame = beast_frame(hex_msg, ticks)
+        if frame is None:
+            stats.skipped += 1
+            continue
+        last_ticks = ticks
+        if realtime:
+            delay = start + elapsed - time.monotonic()
+            if delay > 0:
+                if burst:
+                    flush()
+                    delay = start + elapsed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+        offset = max(offset, elapsed)
+        burst += frame
+        pending += 1
+        if len(burst) >= _SEND_BYTES:
+            flush()
+    if burst:
+        flush()
+    return stats
+
+
+def run(args: argparse.Namespace) -> int:
+    """Entry point for ``modes replay``. Returns exit code."""
+    host, port = parse_listen(args.listen)
+    if host is None:
+        print(
+            "modes replay: error: --listen must be PORT or HOST:PORT "
+            f"(got {args.listen!r})",
+            file=sys.stderr,
+        )
+        return 2
+
+    stats = ReplayStats()
+    server: ReplayServer | None = None
+    previous = interrupt_on_sigterm()
+    try:
+        with open_capture(args.file, mlat_hz=args.mlat_hz) as records:
+            server = ReplayServer(host, port)
+            bound_host, bound_port = server.address
+            print(
+                f"[pyModeS.replay] serving {args.file} on {bound_host}:{bound_port}",
+                file=sys.stderr,
+            )
+            replay(
+                records,
+                server,
+                speed=args.speed,
+                stats=stats,
+                stats_interval=args.stats_interval,
+            )
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"modes replay: error: {e}", file=sys.stderr)
+        return 1
+    except ImportError as e:
+        print(f"modes replay: error: {e}", file=sys.stderr)
+        return 3
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGTERM, previous)
+        if server is not None:
+            clients = server.clients
+            server.close()
+            print(stats.line(clients, final=True), file=sys.stderr)
+    return 0
@@ -77,7 +77,9 @@ def decode(
         known: Optional aircraft state dict (e.g. {"groundspeed":
             420, "track": 90, "altitude": 35000}) used by the
             Comm-B BDS inference to disambiguate BDS 5,0 vs 6,0
-            when both heuristic validators pass. Ignored for
+            when both heuristic validators pass. A
+            ``supported_bds`` list (as decoded from BDS 1,7) limits
+            inference to the registers it names. Ignored for
             non-Comm-B downlink formats.
         full_dict: When True, the result dict is augmented with
             every key from `_FULL_SCHEMA`, defaulting missing keys
@@ -4,4912 +4,141 @@ Generated from OurAirports dataset by scripts/build_airport_db.py.
 Source: https://davidmegginson.github.io/ourairports-data/airports.csv
 Filter: large_airport + medium_airport with an assigned 4-letter ICAO code.
 
-Do not edit by hand — rerun the build script to regenerate.
+The table ships as a compact binary resource (``airports.bin``) next
+to this module rather than as a Python dict literal, so importing the
+position package doesn't unmarshal and allocate ~5,000 tuples up
+front. Layout (all integers little-endian)::
+
+    <magic "PMSA"> <count: u32>
+    <codes: count x 4 ASCII bytes, sorted>
+    <lat:   count x i32, units of 1e-5 degree>
+    <lon:   count x i32, units of 1e-5 degree>
+
+Fixed-point 1e-5 degree matches the five decimals the build script
+has always kept, and ``i / 100_000`` rounds to exactly the float the
+old ``52.30806``-style literals produced.
+
+The file is only opened on the first lookup, memory-mapped by default
+so worker processes share the page cache. ``AIRPORTS`` keeps the
+read-only ``Mapping[str, tuple[float, float]]`` interface of the old
+dict. Do not edit ``airports.bin`` by hand — rerun the build script.
 """
 
-AIRPORTS: dict[str, tuple[float, float]] = {
-    "AGGH": (-9.42800, 160.05499),
-    "AGGM": (-8.32797, 157.26300),
-    "ANYN": (-0.54789, 166.91952),
-    "AQBC": (-74.73937, 164.03539),
-    "AYBA": (-7.49695, 144.82176),
-    "AYBK": (-5.42230, 154.67270),
-    "AYBM": (-8.05000, 142.93300),
-    "AYCH": (-6.02429, 144.97099),
-    "AYDU": (-9.08676, 143.20799),
-    "AYGA": (-6.08169, 145.39200),
-    "AYGN": (-10.31150, 150.33400),
-    "AYGR": (-8.80454, 148.30901),
-    "AYHK": (-5.46385, 150.40733),
-    "AYKM": (-7.96361, 145.77100),
-    "AYKV": (-2.57940, 150.80800),
-    "AYMD": (-5.20708, 145.78900),
-    "AYMH": (-5.82821, 144.29941),
-    "AYMN": (-6.14774, 143.65700),
-    "AYMO": (-2.06189, 147.42400),
-    "AYNZ": (-6.56799, 146.72654),
-    "AYPY": (-9.44338, 147.22000),
-    "AYTK": (-4.34046, 152.38001),
-    "AYVN": (-2.69260, 141.30280),
-    "AYWD": (-5.63529, 143.89223),
-    "AYWK": (-3.58383, 143.66901),
-    "BGAA": (68.72180, -52.78470),
-    "BGBW": (61.16050, -45.42600),
-    "BGCO": (70.74310, -22.65050),
-    "BGGH": (64.19107, -51.67914),
-    "BGJN": (69.24320, -51.05710),
-    "BGKK": (65.57360, -37.12360),
-    "BGQQ": (77.48860, -69.38870),
-    "BGSF": (67.01045, -50.71529),
-    "BGSS": (66.95130, -53.72930),
-    "BGTL": (76.53063, -68.70054),
-    "BIAR": (65.65657, -18.07202),
-    "BIBD": (65.64130, -23.54620),
-    "BIEG": (65.28330, -14.40140),
-    "BIGR": (66.54580, -18.01730),
-    "BIHN": (64.29560, -15.22720),
-    "BIHU": (65.95230, -17.42600),
-    "BIIS": (66.05810, -23.13530),
-    "BIKF": (63.98500, -22.60560),
-    "BIRK": (64.12873, -21.93759),
-    "BIRL": (65.65580, -16.91810),
-    "BISI": (66.13785, -18.90816),
-    "BIVM": (63.42430, -20.27890),
-    "BIVO": (65.72060, -14.85060),
-    "BKPR": (42.57280, 21.03580),
-    "CBBC": (52.18500, -128.15699),
-    "CYAG": (48.65575, -93.44349),
-    "CYAH": (53.75470, -73.67530),
-    "CYAM": (46.48322, -84.50847),
-    "CYAQ": (53.52470, -88.64280),
-    "CYAV": (50.05640, -97.03250),
-    "CYAX": (50.29440, -96.01000),
-    "CYAY": (51.39191, -56.08321),
-    "CYAZ": (49.07983, -125.77558),
-    "CYBC": (49.13250, -68.20440),
-    "CYBD": (52.38750, -126.59600),
-    "CYBF": (54.30420, -110.74400),
-    "CYBG": (48.33012, -70.99201),
-    "CYBK": (64.29890, -96.07780),
-    "CYBL": (49.95080, -125.27100),
-    "CYBR": (49.91000, -99.95190),
-    "CYBU": (53.33250, -104.00800),
-    "CYBW": (51.10398, -114.36938),
-    "CYBX": (51.44360, -57.18530),
-    "CYCB": (69.10810, -105.13800),
-    "CYCC": (45.09264, -74.56772),
-    "CYCD": (49.05497, -123.86986),
-    "CYCE": (43.28560, -81.50830),
-    "CYCG": (49.29640, -117.63200),
-    "CYCH": (47.00780, -65.44920),
-    "CYCL": (47.99080, -66.33030),
-    "CYCN": (49.10560, -81.01360),
-    "CYCP": (52.11670, -119.28300),
-    "CYCQ": (55.68720, -121.62700),
-    "CYDA": (64.04310, -139.12801),
-    "CYDB": (61.37110, -139.04100),
-    "CYDF": (49.20816, -57.39615),
-    "CYDM": (61.97060, -132.42300),
-    "CYDN": (51.10080, -100.05200),
-    "CYDO": (48.77850, -72.37500),
-    "CYDQ": (55.74124, -120.18326),
-    "CYEE": (44.68330, -79.92830),
-    "CYEG": (53.30970, -113.58000),
-    "CYEL": (46.35140, -82.56140),
-    "CYEM": (45.84244, -81.85760),
-    "CYEN": (49.21030, -102.96600),
-    "CYET": (53.57890, -116.46500),
-    "CYEV": (68.30420, -133.48300),
-    "CYEY": (48.56390, -78.24970),
-    "CYFB": (63.75640, -68.55580),
-    "CYFC": (45.86870, -66.52989),
-    "CYFD": (43.13140, -80.34250),
-    "CYFE": (48.74610, -69.09720),
-    "CYFJ": (46.40940, -74.78000),
-    "CYFR": (61.18080, -113.69000),
-    "CYFS": (61.76020, -121.23700),
-    "CYGD": (43.76690, -81.71060),
-    "CYGE": (51.29920, -116.98200),
-    "CYGK": (44.22530, -76.59690),
-    "CYGL": (53.62530, -77.70420),
-    "CYGM": (50.62810, -97.04330),
-    "CYGP": (48.77492, -64.48189),
-    "CYGQ": (49.77830, -86.93940),
-    "CYGR": (47.42524, -61.77861),
-    "CYGV": (50.28190, -63.61140),
-    "CYGW": (55.28190, -77.76530),
-    "CYHD": (49.83170, -92.74420),
-    "CYHF": (49.71420, -83.68610),
-    "CYHM": (43.17348, -79.93118),
-    "CYHN": (49.19310, -84.75890),
-    "CYHT": (60.78920, -137.54601),
-    "CYHU": (45.51750, -73.41690),
-    "CYHY": (60.83970, -115.78300),
-    "CYHZ": (44.88080, -63.50860),
-    "CYIB": (48.77390, -91.63860),
-    "CYID": (44.54585, -65.78542),
-    "CYIF": (51.21170, -58.65830),
-    "CYIV": (53.85720, -94.65360),
-    "CYJF": (60.23580, -123.46900),
-    "CYJN": (45.29440, -73.28110),
-    "CYJT": (48.54339, -58.55289),
-    "CYKA": (50.70304, -120.44864),
-    "CYKF": (43.46080, -80.37860),
-    "CYKJ": (57.25610, -105.61800),
-    "CYKL": (54.80530, -66.80530),
-    "CYKM": (44.20140, -81.60670),
-    "CYKX": (48.21030, -79.98140),
-    "CYKY": (51.51750, -109.18100),
-    "CYLD": (47.82000, -83.34670),
-    "CYLJ": (54.12530, -108.52300),
-    "CYLL": (53.30920, -110.07300),
-    "CYLR": (56.51330, -99.98530),
-    "CYLS": (44.48506, -79.55466),
-    "CYLT": (82.51726, -62.28304),
-    "CYLW": (49.95610, -119.37800),
-    "CYMA": (63.61640, -135.86800),
-    "CYME": (48.85690, -67.45330),
-    "CYMG": (49.08390, -85.86060),
-    "CYMJ": (50.33030, -105.55900),
-    "CYML": (47.59750, -70.22390),
-    "CYMM": (56.65330, -111.22200),
-    "CYMO": (51.29110, -80.60780),
-    "CYMT": (49.77190, -74.52810),
-    "CYMX": (45.67950, -74.03870),
-    "CYNA": (50.19011, -61.78898),
-    "CYND": (45.52170, -75.56360),
-    "CYNJ": (49.10080, -122.63100),
-    "CYNL": (58.27670, -104.08200),
-    "CYNM": (49.76170, -77.80280),
-    "CYNN": (59.48750, -97.78030),
-    "CYOA": (64.69890, -110.61500),
-    "CYOD": (54.40500, -110.27900),
-    "CYOJ": (58.62140, -117.16500),
-    "CYOO": (43.92280, -78.89500),
-    "CYOP": (58.49140, -119.40800),
-    "CYOS": (44.59030, -80.83750),
-    "CYOW": (45.32250, -75.66920),
-    "CYPA": (53.21420, -105.67300),
-    "CYPD": (45.65670, -61.36810),
-    "CYPE": (56.22690, -117.44700),
-    "CYPG": (49.90310, -98.27382),
-    "CYPK": (49.21488, -122.70929),
-    "CYPL": (51.44640, -90.21420),
-    "CYPN": (49.83640, -64.28860),
-    "CYPQ": (44.23225, -78.36205),
-    "CYPR": (54.28610, -130.44501),
-    "CYPW": (49.83420, -124.50000),
-    "CYPX": (60.05060, -77.28690),
-    "CYPY": (58.76720, -111.11700),
-    "CYPZ": (54.37640, -125.95100),
-    "CYQA": (44.97538, -79.30655),
-    "CYQB": (46.79110, -71.39330),
-    "CYQD": (53.97140, -101.09100),
-    "CYQF": (52.18220, -113.89400),
-    "CYQG": (42.27560, -82.95560),
-    "CYQH": (60.11684, -128.82199),
-    "CYQI": (43.82690, -66.08810),
-    "CYQK": (49.78830, -94.36310),
-    "CYQL": (49.63030, -112.80000),
-    "CYQM": (46.11319, -64.67719),
-    "CYQN": (50.18280, -86.69640),
-    "CYQQ": (49.71080, -124.88700),
-    "CYQR": (50.43194, -104.66091),
-    "CYQS": (42.77000, -81.11080),
-    "CYQT": (48.37190, -89.32390),
-    "CYQU": (55.17970, -118.88500),
-    "CYQV": (51.26470, -102.46200),
-    "CYQW": (52.76941, -108.24374),
-    "CYQX": (48.93626, -54.56772),
-    "CYQY": (46.16107, -60.04976),
-    "CYQZ": (53.02610, -122.51000),
-    "CYRB": (74.71690, -94.96940),
-    "CYRI": (47.76440, -69.58470),
-    "CYRJ": (48.51967, -72.26574),
-    "CYRL": (51.06690, -93.79310),
-    "CYRO": (45.46050, -75.64400),
-    "CYRP": (45.31920, -76.02220),
-    "CYRQ": (46.35280, -72.67940),
-    "CYRT": (62.81140, -92.11580),
-    "CYRV": (50.96225, -118.18426),
-    "CYSB": (46.62500, -80.79890),
-    "CYSC": (45.43860, -71.69140),
-    "CYSF": (59.25030, -105.84100),
-    "CYSG": (46.09640, -70.71470),
-    "CYSH": (44.94580, -75.94060),
-    "CYSJ": (45.31610, -65.89030),
-    "CYSL": (47.15710, -67.83624),
-    "CYSM": (60.02030, -111.96200),
-    "CYSN": (43.19160, -79.17169),
-    "CYSP": (48.75530, -86.34440),
-    "CYSU": (46.44060, -63.83360),
-    "CYTA": (45.86440, -77.25170),
-    "CYTF": (48.50890, -71.64190),
-    "CYTH": (55.80110, -97.86420),
-    "CYTR": (44.11890, -77.52810),
-    "CYTS": (48.56970, -81.37670),
-    "CYTZ": (43.62785, -79.39553),
-    "CYUL": (45.46784, -73.74229),
-    "CYUX": (68.77610, -81.24250),
-    "CYUY": (48.20610, -78.83560),
-    "CYVB": (48.07110, -65.46030),
-    "CYVC": (55.15140, -105.26200),
-    "CYVD": (49.87830, -100.91800),
-    "CYVK": (50.24616, -119.33096),
-    "CYVO": (48.05330, -77.78280),
-    "CYVP": (58.09610, -68.42690),
-    "CYVQ": (65.28160, -126.79800),
-    "CYVR": (49.19390, -123.18400),
-    "CYVV": (44.74580, -81.10720),
-    "CYWG": (49.91000, -97.23990),
-    "CYWK": (52.92190, -66.86440),
-    "CYWL": (52.18310, -122.05400),
-    "CYWY": (63.20940, -123.43700),
-    "CYXC": (49.61080, -115.78200),
-    "CYXE": (52.17072, -106.70079),
-    "CYXH": (50.01890, -110.72100),
-    "CYXJ": (56.23810, -120.74000),
-    "CYXK": (48.47764, -68.49632),
-    "CYXL": (50.11390, -91.90530),
-    "CYXQ": (62.41030, -140.86700),
-    "CYXR": (47.69740, -79.84735),
-    "CYXS": (53.88431, -122.66655),
-    "CYXT": (54.46850, -128.57601),
-    "CYXU": (43.03285, -81.14900),
-    "CYXX": (49.02530, -122.36100),
-    "CYXY": (60.70853, -135.06571),
-    "CYXZ": (47.96670, -84.78670),
-    "CYYB": (46.36360, -79.42280),
-    "CYYC": (51.11882, -114.00993),
-    "CYYD": (54.82470, -127.18300),
-    "CYYE": (58.83640, -122.59700),
-    "CYYF": (49.46310, -119.60200),
-    "CYYG": (46.28891, -63.12517),
-    "CYYJ": (48.64720, -123.42779),
-    "CYYL": (56.86390, -101.07600),
-    "CYYN": (50.29190, -107.69100),
-    "CYYQ": (58.73920, -94.06500),
-    "CYYR": (53.31920, -60.42580),
-    "CYYT": (47.61860, -52.75190),
-    "CYYU": (49.41159, -82.46964),
-    "CYYW": (50.29030, -88.90970),
-    "CYYY": (48.60860, -68.20810),
-    "CYYZ": (43.67594, -79.62942),
-    "CYZE": (45.88530, -82.56780),
-    "CYZF": (62.46280, -114.44000),
-    "CYZH": (55.29295, -114.77728),
-    "CYZP": (53.25430, -131.81400),
-    "CYZR": (42.99940, -82.30890),
-    "CYZS": (64.19330, -83.35940),
-    "CYZT": (50.68060, -127.36700),
-    "CYZU": (54.14390, -115.78700),
-    "CYZV": (50.22330, -66.26560),
-    "CYZW": (60.17280, -132.74300),
-    "CYZX": (44.98440, -64.91690),
-    "CYZY": (55.29779, -123.13391),
-    "CZAM": (50.68280, -119.22900),
-    "CZBB": (49.07434, -123.00688),
-    "CZBF": (47.62970, -65.73890),
-    "CZBM": (45.29080, -72.74140),
-    "CZEE": (56.03750, -96.50970),
-    "CZFA": (62.20750, -133.37601),
-    "CZGF": (49.01560, -118.43100),
-    "CZJG": (54.51890, -98.04610),
-    "CZJN": (52.12060, -101.23600),
-    "CZLQ": (55.31890, -97.70780),
-    "CZMN": (55.58890, -97.16420),
-    "CZMT": (54.02750, -132.12500),
-    "CZPC": (49.52043, -113.99700),
-    "CZSJ": (53.06420, -93.34440),
-    "CZST": (55.93541, -129.98243),
-    "CZUC": (49.42820, -91.72042),
-    "DAAB": (36.50360, 2.81417),
-    "DAAD": (35.33250, 4.20639),
-    "DAAE": (36.71255, 5.06991),
-    "DAAG": (36.69389, 3.21453),
-    "DAAJ": (24.28545, 9.46365),
-    "DAAK": (36.54580, 2.87611),
-    "DAAP": (26.72350, 8.62265),
-    "DAAS": (36.17849, 5.32991),
-    "DAAT": (22.81099, 5.45083),
-    "DAAV": (36.79413, 5.87365),
-    "DAAY": (33.53590, -0.24235),
-    "DAAZ": (35.75296, 0.62588),
-    "DABB": (36.82678, 7.81334),
-    "DABC": (36.27600, 6.62039),
-    "DABS": (35.43160, 8.12072),
-    "DABT": (35.75210, 6.30859),
-    "DAFH": (32.93040, 3.31154),
-    "DAOB": (35.34110, 1.46315),
-    "DAOF": (27.70040, -8.16710),
-    "DAOI": (36.21661, 1.34111),
-    "DAOL": (35.54240, -0.53228),
-    "DAON": (35.01273, -1.45712),
-    "DAOO": (35.62065, -0.62249),
-    "DAOR": (31.64570, -2.26986),
-    "DAOV": (35.20770, 0.14714),
-    "DAUA": (27.83760, -0.18641),
-    "DAUB": (34.79318, 5.73890),
-    "DAUE": (30.58073, 2.86159),
-    "DAUG": (32.38410, 3.79411),
-    "DAUH": (31.67300, 6.14044),
-    "DAUI": (27.25100, 2.51202),
-    "DAUK": (33.06780, 6.08867),
-    "DAUL": (33.76440, 2.92834),
-    "DAUO": (33.51140, 6.77679),
-    "DAUT": (29.23710, 0.27603),
-    "DAUU": (31.91720, 5.41278),
-    "DAUZ": (28.05150, 9.64291),
-    "DBBB": (6.35723, 2.38435),
-    "DFFD": (12.35320, -1.51242),
-    "DFOO": (11.16010, -4.33097),
-    "DGAA": (5.60519, -0.16679),
-    "DGAH": (6.57969, 0.53255),
-    "DGLE": (9.55391, -0.86606),
-    "DGSI": (6.71456, -1.59082),
-    "DGSN": (7.36183, -2.32876),
-    "DGTK": (4.89606, -1.77476),
-    "DIAP": (5.26139, -3.92629),
-    "DIBK": (7.73880, -5.07367),
-    "DIDL": (6.79281, -6.47319),
-    "DIKO": (9.38718, -5.55666),
-    "DIMN": (7.27207, -7.58736),
-    "DISP": (4.74672, -6.66082),
-    "DIYO": (6.90317, -5.36558),
-    "DNAA": (9.00679, 7.26317),
-    "DNAI": (4.87250, 8.09300),
-    "DNAK": (7.24674, 5.30101),
-    "DNAS": (6.20417, 6.66528),
-    "DNBC": (10.48283, 9.74400),
-    "DNBE": (6.31698, 5.59950),
-    "DNBY": (4.95759, 6.20333),
-    "DNCA": (4.97602, 8.34720),
-    "DNEN": (6.47372, 7.56046),
-    "DNGO": (10.29889, 10.90000),
-    "DNGU": (12.17286, 6.69614),
-    "DNIB": (7.36246, 3.97833),
-    "DNIL": (8.44021, 4.49392),
-    "DNIM": (5.42706, 7.20603),
-    "DNJO": (9.63983, 8.86905),
-    "DNKA": (10.69600, 7.32011),
-    "DNKN": (12.04561, 8.52357),
-    "DNMA": (11.85416, 13.08070),
-    "DNMK": (7.70388, 8.61394),
-    "DNMM": (6.57737, 3.32116),
-    "DNMN": (9.65217, 6.46226),
-    "DNPO": (5.01549, 6.94959),
-    "DNSO": (12.91573, 5.20755),
-    "DNSU": (5.59821, 5.81870),
-    "DNYO": (9.25755, 12.43040),
-    "DNZA": (11.13020, 7.68581),
-    "DRRM": (13.50250, 7.12675),
-    "DRRN": (13.48150, 2.18361),
-    "DRRT": (14.87570, 5.26536),
-    "DRZA": (16.96600, 8.00011),
-    "DRZR": (13.77900, 8.98376),
-    "DTKA": (36.98000, 8.87694),
-    "DTMB": (35.75810, 10.75470),
-    "DTNH": (36.07583, 10.43861),
-    "DTTA": (36.85100, 10.22720),
-    "DTTB": (37.24236, 9.78702),
-    "DTTD": (32.30620, 10.38210),
-    "DTTF": (34.42200, 8.82250),
-    "DTTG": (33.73369, 9.91941),
-    "DTTJ": (33.87372, 10.77730),
-    "DTTR": (31.70430, 9.25462),
-    "DTTX": (34.71800, 10.69100),
-    "DTTZ": (33.93970, 8.11056),
-    "DXNG": (9.76667, 1.09094),
-    "DXXX": (6.16561, 1.25451),
-    "EBAW": (51.19067, 4.46315),
-    "EBBE": (50.75860, 4.76833),
-    "EBBL": (51.16830, 5.47000),
-    "EBBR": (50.90140, 4.48444),
-    "EBCI": (50.46196, 4.45956),
-    "EBCV": (50.57580, 3.83100),
-    "EBFN": (51.09030, 2.65278),
-    "EBFS": (50.24330, 4.64583),
-    "EBKT": (50.81888, 3.20955),
-    "EBLG": (50.63857, 5.44390),
-    "EBOS": (51.19980, 2.87467),
-    "EDAC": (50.98195, 12.50639),
-    "EDAH": (53.87870, 14.15230),
-    "EDBN": (53.60220, 13.30600),
-    "EDBR": (51.36333, 14.95000),
-    "EDDB": (52.36174, 13.50234),
-    "EDDC": (51.13412, 13.76783),
-    "EDDE": (50.97828, 10.96071),
-    "EDDF": (50.02671, 8.55835),
-    "EDDG": (52.13382, 7.68848),
-    "EDDH": (53.63040, 9.98823),
-    "EDDK": (50.86590, 7.14274),
-    "EDDL": (51.28950, 6.76678),
-    "EDDM": (48.35380, 11.78610),
-    "EDDN": (49.49870, 11.07806),
-    "EDDP": (51.42066, 12.23270),
-    "EDDR": (49.21455, 7.10973),
-    "EDDS": (48.68990, 9.22196),
-    "EDDV": (52.46110, 9.68508),
-    "EDDW": (53.04679, 8.78932),
-    "EDFE": (49.96000, 8.64304),
-    "EDFH": (49.94635, 7.26173),
-    "EDFM": (49.47306, 8.51417),
-    "EDFZ": (49.96750, 8.14722),
-    "EDGE": (50.99160, 10.47973),
-    "EDGS": (50.70770, 8.08297),
-    "EDHI": (53.53528, 9.83556),
-    "EDHK": (54.37957, 10.14527),
-    "EDHL": (53.80540, 10.71920),
-    "EDJA": (47.98809, 10.23825),
-    "EDLI": (51.96472, 8.54444),
-    "EDLN": (51.23028, 6.50444),
-    "EDLP": (51.61253, 8.61746),
-    "EDLV": (51.60136, 6.14123),
-    "EDLW": (51.51830, 7.61224),
-    "EDMA": (48.42528, 10.93167),
-    "EDML": (48.51202, 12.03486),
-    "EDMO": (48.08140, 11.28310),
-    "EDNY": (47.67130, 9.51149),
-    "EDQA": (49.92040, 10.91423),
-    "EDQD": (49.98500, 11.64000),
-    "EDQM": (50.28854, 11.85288),
-    "EDSB": (48.77940, 8.08050),
-    "EDTD": (47.97333, 8.52222),
-    "EDTL": (48.36930, 7.82772),
-    "EDTM": (48.05389, 9.37278),
-    "EDTY": (49.11833, 9.78389),
-    "EDUZ": (52.00083, 12.14861),
-    "EDVE": (52.31920, 10.55610),
-    "EDVK": (51.41839, 9.39164),
-    "EDXW": (54.91320, 8.34047),
-    "EEEI": (59.25960, 24.20480),
-    "EEKA": (58.99080, 22.83070),
-    "EEKE": (58.22990, 22.50950),
-    "EEPU": (58.41900, 24.47280),
-    "EETN": (59.41325, 24.83264),
-    "EETU": (58.30744, 26.68647),
-    "EFET": (68.36260, 23.42430),
-    "EFHA": (61.85604, 24.78669),
-    "EFHK": (60.31836, 24.96334),
-    "EFIT": (62.16610, 30.07360),
-    "EFIV": (68.60730, 27.40530),
-    "EFJO": (62.65881, 29.61940),
-    "EFJY": (62.39950, 25.67830),
-    "EFKA": (63.12710, 23.05140),
-    "EFKE": (65.77870, 24.58210),
-    "EFKI": (64.28550, 27.69240),
-    "EFKJ": (62.46321, 22.39082),
-    "EFKK": (63.72120, 23.14310),
-    "EFKS": (65.98760, 29.23940),
-    "EFKT": (67.70100, 24.84680),
-    "EFKU": (63.00710, 27.79780),
-    "EFLP": (61.04460, 28.14474),
-    "EFMA": (60.12220, 19.89820),
-    "EFMI": (61.68660, 27.20180),
-    "EFOU": (64.93010, 25.35460),
-    "EFPO": (61.46170, 21.80000),
-    "EFPR": (60.47917, 26.59389),
-    "EFRO": (66.56333, 25.82975),
-    "EFSA": (61.94310, 28.94510),
-    "EFSI": (62.69210, 22.83230),
-    "EFSO": (67.39500, 26.61910),
-    "EFTP": (61.41410, 23.60440),
-    "EFTU": (60.51410, 22.26280),
-    "EFUT": (60.89640, 26.93840),
-    "EFVA": (63.05023, 21.76254),
-    "EFVR": (62.17110, 27.86860),
-    "EFYL": (64.05472, 24.72528),
-    "EGAA": (54.65750, -6.21583),
-    "EGAB": (54.39827, -7.65118),
-    "EGAC": (54.61810, -5.87250),
-    "EGAE": (55.04280, -7.16111),
-    "EGBB": (52.45390, -1.74803),
-    "EGBE": (52.36970, -1.47972),
-    "EGBJ": (51.89420, -2.16722),
-    "EGBN": (52.92000, -1.07917),
-    "EGCC": (53.34938, -2.27952),
-    "EGDC": (51.08720, -4.15034),
-    "EGDM": (51.15220, -1.74741),
-    "EGDR": (50.08610, -5.25571),
-    "EGDX": (51.40523, -3.43325),
-    "EGDY": (51.00940, -2.63882),
-    "EGEC": (55.43720, -5.68639),
-    "EGED": (59.19060, -2.77222),
-    "EGFE": (51.83310, -4.96111),
-    "EGFF": (51.39670, -3.34333),
-    "EGFH": (51.60137, -4.07101),
-    "EGGD": (51.38233, -2.71645),
-    "EGGP": (53.33486, -2.84964),
-    "EGGW": (51.87470, -0.36833),
-    "EGHH": (50.78048, -1.83958),
-    "EGHI": (50.95030, -1.35680),
-    "EGHL": (51.18744, -1.03166),
-    "EGHQ": (50.44060, -4.99541),
-    "EGJA": (49.70610, -2.21472),
-    "EGJB": (49.43500, -2.60197),
-    "EGJJ": (49.20790, -2.19551),
-    "EGKA": (50.83560, -0.29722),
-    "EGKB": (51.33080, 0.03250),
-    "EGKK": (51.14874, -0.18574),
-    "EGLC": (51.50530, 0.05528),
-    "EGLF": (51.27580, -0.77633),
-    "EGLK": (51.32390, -0.84750),
-    "EGLL": (51.47075, -0.45991),
-    "EGMC": (51.57056, 0.69363),
-    "EGMD": (50.95625, 0.93907),
-    "EGNC": (54.93750, -2.80917),
-    "EGNH": (53.77170, -3.02861),
-    "EGNJ": (53.57615, -0.34954),
-    "EGNL": (54.12861, -3.26750),
-    "EGNM": (53.86590, -1.66057),
-    "EGNO": (53.74510, -2.88306),
-    "EGNR": (53.17810, -2.97778),
-    "EGNS": (54.08308, -4.62387),
-    "EGNT": (55.03796, -1.68958),
-    "EGNV": (54.50920, -1.42941),
-    "EGNX": (52.83110, -1.32806),
-    "EGOM": (55.05000, -2.55000),
-    "EGOS": (52.79820, -2.66804),
-    "EGOV": (53.24810, -4.53534),
-    "EGPA": (58.95790, -2.90508),
-    "EGPB": (59.87890, -1.29556),
-    "EGPC": (58.45890, -3.09306),
-    "EGPD": (57.20190, -2.19778),
-    "EGPE": (57.54250, -4.04750),
-    "EGPF": (55.87190, -4.43306),
-    "EGPH": (55.95014, -3.37229),
-    "EGPI": (55.68271, -6.25753),
-    "EGPK": (55.50150, -4.57718),
-    "EGPL": (57.48110, -7.36278),
-    "EGPN": (56.45250, -3.02583),
-    "EGPO": (58.21560, -6.33111),
-    "EGPR": (57.02280, -7.44306),
-    "EGPU": (56.49920, -6.86917),
-    "EGQL": (56.37398, -2.86886),
-    "EGQS": (57.70520, -3.33917),
-    "EGSC": (52.20500, 0.17500),
-    "EGSH": (52.67580, 1.28278),
-    "EGSS": (51.88500, 0.23500),
-    "EGTC": (52.07220, -0.61667),
-    "EGTE": (50.73426, -3.41398),
-    "EGTK": (51.83690, -1.32000),
-    "EGUB": (51.61437, -1.09599),
-    "EGUL": (52.40954, 0.56116),
-    "EGUN": (52.36190, 0.48641),
-    "EGUW": (52.12745, 0.95619),
-    "EGVA": (51.68357, -1.78917),
-    "EGVN": (51.75000, -1.58362),
-    "EGVO": (51.23410, -0.94283),
-    "EGWC": (52.64052, -2.30533),
-    "EGWU": (51.55300, -0.41817),
-    "EGXC": (53.09300, -0.16601),
-    "EGXE": (54.29719, -1.53894),
-    "EGXG": (53.83475, -1.19468),
-    "EGXH": (52.34260, 0.77294),
-    "EGXT": (52.61260, -0.47645),
-    "EGXW": (53.16620, -0.52381),
-    "EGXZ": (54.20412, -1.38027),
-    "EGYD": (53.02731, -0.49310),
-    "EGYE": (52.96062, -0.55943),
-    "EGYM": (52.64840, 0.55069),
-    "EGYP": (-51.82264, -58.44578),
-    "EHAM": (52.30860, 4.76389),
-    "EHBD": (51.25530, 5.60139),
-    "EHBK": (50.91109, 5.76940),
-    "EHDL": (52.06060, 5.87306),
-    "EHEH": (51.45010, 5.37453),
-    "EHGG": (53.11911, 6.57765),
-    "EHGR": (51.56740, 4.93183),
-    "EHKD": (52.92340, 4.78062),
-    "EHLE": (52.45319, 5.51462),
-    "EHLW": (53.22860, 5.76056),
-    "EHRD": (51.95690, 4.43722),
-    "EHTW": (52.27583, 6.88917),
-    "EHVK": (51.65722, 5.70778),
-    "EHWO": (51.44910, 4.34203),
-    "EICK": (51.84130, -8.49111),
-    "EIDL": (55.04420, -8.34100),
-    "EIDW": (53.42871, -6.26212),
-    "EIKN": (53.91044, -8.81700),
-    "EIKY": (52.18090, -9.52378),
-    "EIME": (53.30170, -6.45133),
-    "EINN": (52.70200, -8.92482),
-    "EISG": (54.28020, -8.59921),
-    "EIWF": (52.18720, -7.08696),
-    "EIWT": (53.35162, -6.49036),
-    "EKAH": (56.30333, 10.61829),
-    "EKBI": (55.74034, 9.15702),
-    "EKCH": (55.61790, 12.65600),
-    "EKEB": (55.52590, 8.55340),
-    "EKKA": (56.29714, 9.10431),
-    "EKMB": (54.69945, 11.43816),
-    "EKOD": (55.47531, 10.32721),
-    "EKRK": (55.58560, 12.13140),
-    "EKRN": (55.06330, 14.75960),
-    "EKSB": (54.96440, 9.79173),
-    "EKSN": (57.50350, 10.22940),
-    "EKSP": (55.22105, 9.26702),
-    "EKSV": (56.55020, 9.17298),
-    "EKTS": (57.06880, 8.70522),
-    "EKVD": (55.43630, 9.33092),
-    "EKVG": (62.06326, -7.27578),
-    "EKVJ": (55.99010, 8.35391),
-    "EKYT": (57.09476, 9.84993),
-    "ELLX": (49.62685, 6.21213),
-    "ENAL": (62.56044, 6.11085),
-    "ENAN": (69.29519, 16.13938),
-    "ENAT": (69.97610, 23.37170),
-    "ENBN": (65.46110, 12.21750),
-    "ENBO": (67.26920, 14.36530),
-    "ENBR": (60.29340, 5.21814),
-    "ENBS": (70.60025, 29.69261),
-    "ENBV": (70.87152, 29.03410),
-    "ENCN": (58.20420, 8.08537),
-    "ENDU": (69.05580, 18.54040),
-    "ENEV": (68.49130, 16.67810),
-    "ENFL": (61.58360, 5.02472),
-    "ENGM": (60.19390, 11.10040),
-    "ENHD": (59.34530, 5.20836),
-    "ENHF": (70.67970, 23.66860),
-    "ENHV": (71.00970, 25.98360),
-    "ENKB": (63.11180, 7.82452),
-    "ENKR": (69.72580, 29.89130),
-    "ENLK": (68.15250, 13.60940),
-    "ENMH": (71.02970, 27.82670),
-    "ENML": (62.74470, 7.26250),
-    "ENMS": (65.78400, 13.21490),
-    "ENNA": (70.06880, 24.97350),
-    "ENNO": (59.56507, 9.21315),
-    "ENOL": (63.69890, 9.60400),
-    "ENOV": (62.18000, 6.07410),
-    "ENRA": (66.36390, 14.30140),
-    "ENRM": (64.83830, 11.14610),
-    "ENRO": (62.57840, 11.34230),
-    "ENRY": (59.37882, 10.78544),
-    "ENSB": (78.24610, 15.46560),
-    "ENSH": (68.24330, 14.66920),
-    "ENSK": (68.57883, 15.03342),
-    "ENSN": (59.18500, 9.56694),
-    "ENSO": (59.79190, 5.34085),
-    "ENSR": (69.78680, 20.95940),
-    "ENSS": (70.35540, 31.04490),
-    "ENST": (65.95680, 12.46890),
-    "ENTC": (69.68330, 18.91890),
-    "ENTO": (59.18670, 10.25860),
-    "ENVA": (63.45780, 10.92400),
-    "ENVD": (70.06530, 29.84470),
-    "ENZV": (58.87670, 5.63778),
-    "EPBY": (53.09680, 17.97770),
-    "EPCE": (54.41653, 17.76573),
-    "EPDE": (51.55102, 21.89232),
-    "EPGD": (54.37760, 18.46620),
-    "EPIR": (52.82940, 18.33060),
-    "EPKK": (50.07770, 19.78480),
-    "EPKS": (52.33170, 16.96640),
-    "EPKT": (50.47601, 19.08070),
-    "EPLB": (51.24016, 22.71346),
-    "EPLK": (51.55170, 19.17910),
-    "EPLL": (51.72190, 19.39810),
-    "EPLY": (52.00494, 19.14379),
-    "EPMB": (54.02660, 19.13572),
-    "EPMI": (53.39510, 16.08280),
-    "EPMM": (52.19550, 21.65590),
-    "EPMO": (52.45110, 20.65180),
-    "EPPO": (52.42160, 16.82336),
-    "EPPW": (52.38009, 17.85316),
-    "EPRA": (51.38937, 21.21474),
-    "EPRZ": (50.10979, 22.02416),
-    "EPSC": (53.58470, 14.90220),
-    "EPSN": (53.79060, 15.82630),
-    "EPSY": (53.48190, 20.93770),
-    "EPTM": (51.58440, 20.09780),
-    "EPWA": (52.16570, 20.96710),
-    "EPWR": (51.10372, 16.88210),
-    "EPZG": (52.13850, 15.79860),
-    "ESCF": (58.39767, 15.52242),
-    "ESDF": (56.26670, 15.26500),
-    "ESFR": (58.49810, 13.05320),
-    "ESGG": (57.66280, 12.27980),
-    "ESGJ": (57.75760, 14.06870),
-    "ESGP": (57.77470, 11.87040),
-    "ESGR": (58.45640, 13.97270),
-    "ESGT": (58.31810, 12.34500),
-    "ESIB": (58.42640, 12.71440),
-    "ESKK": (59.34590, 14.49590),
-    "ESKM": (60.95790, 14.51140),
-    "ESKN": (58.78966, 16.91148),
-    "ESKS": (61.16508, 12.83352),
-    "ESMK": (55.92170, 14.08550),
-    "ESMQ": (56.68550, 16.28760),
-    "ESMS": (55.53556, 13.37633),
-    "ESMT": (56.69110, 12.82020),
-    "ESMX": (56.92910, 14.72800),
-    "ESNG": (67.13240, 20.81460),
-    "ESNK": (63.04860, 17.76890),
-    "ESNL": (64.54830, 18.71620),
-    "ESNN": (62.52810, 17.44390),
-    "ESNO": (63.40830, 18.99000),
-    "ESNQ": (67.82200, 20.33680),
-    "ESNS": (64.62480, 21.07690),
-    "ESNU": (63.79180, 20.28280),
-    "ESNV": (64.57910, 16.83360),
-    "ESNX": (65.59030, 19.28190),
-    "ESNY": (61.26150, 17.09910),
-    "ESNZ": (63.19355, 14.50417),
-    "ESOE": (59.22370, 15.03800),
-    "ESOK": (59.44470, 13.33740),
-    "ESOW": (59.58940, 16.63360),
-    "ESPA": (65.54380, 22.12200),
-    "ESSA": (59.64849, 17.92883),
-    "ESSB": (59.35440, 17.94170),
-    "ESSD": (60.42200, 15.51520),
-    "ESSK": (60.59330, 16.95140),
-    "ESSL": (58.40491, 15.68450),
-    "ESSP": (58.58630, 16.25060),
-    "ESST": (60.15760, 12.99130),
-    "ESSU": (59.35110, 16.70840),
-    "ESSV": (57.66280, 18.34620),
-    "ESTA": (56.29610, 12.84710),
-    "ESTL": (56.08280, 13.21250),
-    "ESUD": (64.96090, 17.69660),
-    "ETAD": (49.97651, 6.69841),
-    "ETAR": (49.43690, 7.60028),
-    "ETHB": (52.27850, 9.08217),
-    "ETHC": (52.59120, 10.02210),
-    "ETHF": (51.11460, 9.28600),
-    "ETHL": (48.22030, 9.91002),
-    "ETHN": (49.39162, 9.95675),
-    "ETHS": (52.91940, 10.18583),
-    "ETIC": (49.69870, 11.94020),
-    "ETIH": (49.21654, 11.83606),
-    "ETMN": (53.76769, 8.65920),
-    "ETND": (52.58556, 8.34222),
-    "ETNG": (50.96080, 6.04242),
-    "ETNH": (54.31220, 9.53817),
-    "ETNL": (53.91820, 12.27830),
-    "ETNN": (50.83120, 6.65817),
-    "ETNS": (54.45930, 9.51633),
-    "ETNT": (53.54780, 7.66733),
-    "ETNW": (52.45730, 9.42717),
-    "ETOU": (50.04980, 8.32540),
-    "ETSB": (50.17380, 7.06333),
-    "ETSH": (51.76780, 13.16770),
-    "ETSI": (48.71570, 11.53400),
-    "ETSL": (48.18550, 10.86120),
-    "ETSN": (48.71100, 11.21150),
-    "EVKA": (56.53470, 25.89250),
-    "EVLA": (56.51750, 21.09690),
-    "EVRA": (56.92075, 23.97071),
-    "EVTA": (56.94220, 23.22390),
-    "EYKA": (54.96397, 24.08582),
-    "EYKD": (55.31170, 23.95640),
-    "EYPA": (55.97320, 21.09390),
-    "EYPP": (55.72940, 24.46080),
-    "EYSA": (55.89390, 23.39500),
-    "EYSB": (56.07060, 23.55810),
-    "EYVI": (54.63410, 25.28580),
-    "FAAB": (-28.57500, 16.53330),
-    "FAAG": (-29.28180, 18.81390),
-    "FABE": (-32.89710, 27.27910),
-    "FABL": (-29.09270, 26.30240),
-    "FABR": (-25.71715, 30.97497),
-    "FACT": (-33.97403, 18.60433),
-    "FAEL": (-33.03560, 27.82590),
-    "FAEO": (-26.49560, 29.97980),
-    "FAFB": (-28.82310, 27.90890),
-    "FAGC": (-25.98630, 28.14010),
-    "FAGG": (-34.00560, 22.37890),
-    "FAGM": (-26.24250, 28.15120),
-    "FAHR": (-28.23510, 29.10620),
-    "FAHT": (-24.36186, 31.05292),
-    "FAKD": (-26.87110, 26.71800),
-    "FAKM": (-28.80540, 24.76487),
-    "FAKN": (-25.38333, 31.10533),
-    "FAKU": (-27.45660, 23.41195),
-    "FAKZ": (-29.68840, 17.09400),
-    "FALA": (-25.93896, 27.92664),
-    "FALC": (-28.36010, 23.43910),
-    "FALE": (-29.61444, 31.11972),
-    "FALW": (-32.96890, 18.16030),
-    "FALY": (-28.58170, 29.74970),
-    "FAMD": (-24.81687, 31.54408),
-    "FAMG": (-30.85740, 30.34300),
-    "FAMM": (-25.79840, 25.54800),
-    "FAMS": (-25.70450, 26.90900),
-    "FAMU": (-27.62610, 32.04430),
-    "FANC": (-27.77060, 29.97690),
-    "FAOH": (-33.60700, 22.18900),
-    "FAOR": (-26.14008, 28.24680),
-    "FAPE": (-33.98971, 25.61735),
-    "FAPG": (-34.08816, 23.32872),
-    "FAPH": (-23.93720, 31.15540),
-    "FAPI": (-23.92610, 29.48440),
-    "FAPJ": (-31.60612, 29.52175),
-    "FAPM": (-29.64900, 30.39870),
-    "FAPN": (-25.33380, 27.17340),
-    "FAPP": (-23.84527, 29.45862),
-    "FAPS": (-26.67100, 27.08190),
-    "FAQT": (-31.92020, 26.88220),
-    "FARB": (-28.74100, 32.09210),
-    "FARG": (-25.64430, 27.27110),
-    "FARS": (-33.81220, 19.90280),
-    "FASB": (-29.68930, 17.93960),
-    "FASC": (-26.52410, 29.17010),
-    "FASD": (-32.96410, 17.96930),
-    "FASK": (-25.80970, 28.16460),
-    "FASS": (-27.64860, 22.99930),
-    "FASZ": (-24.96085, 31.58859),
-    "FATZ": (-23.82440, 30.32930),
-    "FAUL": (-28.32060, 31.41650),
-    "FAUP": (-28.40025, 21.26359),
-    "FAUT": (-31.54636, 28.67336),
-    "FAVB": (-26.98240, 24.72880),
-    "FAVG": (-29.77060, 31.05840),
-    "FAVR": (-31.64100, 18.54480),
-    "FAVV": (-26.56640, 27.96080),
-    "FAWB": (-25.65390, 28.22420),
-    "FAWK": (-25.83000, 28.22250),
-    "FAYP": (-33.90020, 18.49830),
-    "FBFT": (-21.15918, 27.46883),
-    "FBJW": (-24.60230, 24.69100),
-    "FBKE": (-17.83165, 25.16619),
-    "FBMN": (-19.97049, 23.43141),
-    "FBSK": (-24.55520, 25.91820),
-    "FBSN": (-20.55340, 26.11580),
-    "FBSP": (-22.05830, 27.82880),
-    "FCBB": (-4.25170, 15.25300),
-    "FCOD": (-1.22667, 15.91000),
-    "FCOO": (-0.52457, 15.93782),
-    "FCOU": (1.61599, 16.03790),
-    "FCPL": (-4.20635, 12.65990),
-    "FCPP": (-4.81603, 11.88660),
-    "FDMS": (-26.52892, 31.30758),
-    "FDSK": (-26.35861, 31.71694),
-    "FEFF": (4.39848, 18.51880),
-    "FEFT": (4.22158, 15.78640),
-    "FGBT": (1.90547, 9.80568),
-    "FGMY": (1.67644, 11.02490),
-    "FGSL": (3.75527, 8.70872),
-    "FHAW": (-7.97018, -14.39274),
-    "FHSH": (-15.95890, -5.64607),
-    "FIMP": (-20.43020, 57.68360),
-    "FIMR": (-19.75670, 63.35933),
-    "FJDG": (-7.31327, 72.41110),
-    "FKKC": (4.08919, 9.36053),
-    "FKKD": (4.00608, 9.71948),
-    "FKKL": (10.45140, 14.25740),
-    "FKKM": (5.63692, 10.75080),
-    "FKKN": (7.35701, 13.55920),
-    "FKKR": (9.33479, 13.37213),
-    "FKKU": (5.53692, 10.35460),
-    "FKKV": (6.03924, 10.12260),
-    "FKKY": (3.83604, 11.52350),
-    "FKYS": (3.72256, 11.55330),
-    "FLKE": (-12.57280, 27.89390),
-    "FLLC": (-15.41380, 28.33070),
-    "FLLI": (-17.82152, 25.81964),
-    "FLLS": (-15.33083, 28.45272),
-    "FLMF": (-13.25890, 31.93660),
-    "FLMG": (-15.25450, 23.16230),
-    "FLND": (-12.99722, 28.66389),
-    "FLSK": (-12.96513, 28.51562),
-    "FLSO": (-12.90050, 28.14990),
-    "FMCH": (-11.53370, 43.27190),
-    "FMCI": (-12.29810, 43.76650),
-    "FMCV": (-12.13105, 44.43004),
-    "FMCZ": (-12.80932, 45.28182),
-    "FMEE": (-20.89009, 55.51889),
-    "FMEP": (-21.31936, 55.42251),
-    "FMMI": (-18.79690, 47.47880),
-    "FMMN": (-19.56280, 45.45080),
-    "FMMS": (-17.09390, 49.81580),
-    "FMMT": (-18.11354, 49.39226),
-    "FMMV": (-20.28470, 44.31760),
-    "FMNA": (-12.34940, 49.29170),
-    "FMNC": (-16.16390, 49.77380),
-    "FMND": (-14.65170, 49.62060),
-    "FMNH": (-14.99940, 50.32020),
-    "FMNL": (-14.62951, 47.76355),
-    "FMNM": (-15.66684, 46.35123),
-    "FMNN": (-13.31210, 48.31480),
-    "FMNQ": (-16.74453, 44.48248),
-    "FMNR": (-15.43774, 49.68908),
-    "FMNS": (-14.27860, 50.17470),
-    "FMNV": (-13.37580, 50.00280),
-    "FMNW": (-14.89880, 47.99390),
-    "FMSD": (-25.03810, 46.95610),
-    "FMSF": (-21.44160, 47.11170),
-    "FMSK": (-22.11970, 48.02170),
-    "FMSM": (-21.20180, 48.35830),
-    "FMSR": (-21.75384, 43.37475),
-    "FMST": (-23.38340, 43.72850),
-    "FNBC": (-6.26990, 14.24700),
-    "FNBG": (-12.60900, 13.40370),
-    "FNBJ": (-9.05073, 13.49908),
-    "FNCA": (-5.59839, 12.18815),
-    "FNCT": (-12.47920, 13.48690),
-    "FNDU": (-7.40089, 20.81850),
-    "FNGI": (-17.04350, 15.68380),
-    "FNHU": (-12.80890, 15.76050),
-    "FNKU": (-12.40460, 16.94740),
-    "FNLU": (-8.85837, 13.23120),
-    "FNMA": (-9.52509, 16.31240),
-    "FNME": (-14.65760, 17.71980),
-    "FNMO": (-15.26120, 12.14680),
-    "FNNG": (-7.75451, 15.28770),
-    "FNPA": (-10.72200, 13.76550),
-    "FNSA": (-9.68907, 20.43190),
-    "FNSO": (-6.14109, 12.37180),
-    "FNSU": (-11.16790, 13.84750),
-    "FNUB": (-14.92484, 13.57665),
-    "FNUE": (-11.76810, 19.89770),
-    "FNUG": (-7.60307, 15.02780),
-    "FNXA": (-16.75540, 14.96530),
-    "FOGK": (-1.18461, 12.44130),
-    "FOGM": (-1.84514, 11.05670),
-    "FOGO": (1.54311, 11.58140),
-    "FOGQ": (-0.66521, 13.67310),
-    "FOGR": (-0.70439, 10.24570),
-    "FOOB": (2.07564, 11.49320),
-    "FOOG": (-0.71174, 8.75438),
-    "FOOH": (-1.57473, 9.26269),
-    "FOOK": (0.57921, 12.89090),
-    "FOOL": (0.45895, 9.41214),
-    "FOON": (-1.65616, 13.43800),
-    "FPPR": (1.66115, 7.41108),
-    "FPST": (0.37817, 6.71215),
-    "FQBR": (-19.79640, 34.90760),
-    "FQCH": (-19.15130, 33.42900),
-    "FQIN": (-23.87640, 35.40850),
-    "FQLC": (-13.27400, 35.26630),
-    "FQMA": (-25.92080, 32.57260),
-    "FQMD": (-11.67290, 39.56310),
-    "FQMP": (-11.36180, 40.35490),
-    "FQNC": (-14.48820, 40.71220),
-    "FQNP": (-15.10560, 39.28180),
-    "FQPB": (-12.99330, 40.52487),
-    "FQQL": (-17.85550, 36.86910),
-    "FQTT": (-16.10480, 33.64020),
-    "FQVL": (-22.01840, 35.31330),
-    "FSIA": (-4.67434, 55.52180),
-    "FSPP": (-4.31926, 55.69156),
-    "FTFY": (18.52793, 20.18864),
-    "FTTC": (13.84700, 20.84430),
-    "FTTD": (8.62850, 16.07424),
-    "FTTJ": (12.13370, 15.03400),
-    "FTTY": (17.91710, 19.11110),
-    "FVBU": (-20.01628, 28.62290),
-    "FVCZ": (-21.00810, 31.57860),
-    "FVFA": (-18.09744, 25.83687),
-    "FVHA": (-17.93180, 31.09280),
-    "FVKB": (-16.51980, 28.88500),
-    "FVMT": (-17.43190, 32.18450),
-    "FVMV": (-20.05530, 30.85910),
-    "FVTL": (-19.43672, 29.86194),
-    "FVWN": (-18.62990, 27.02100),
-    "FWCL": (-15.67719, 34.97232),
-    "FWDW": (-12.51753, 34.13188),
-    "FWKA": (-9.95357, 33.89326),
-    "FWKI": (-13.78940, 33.78100),
-    "FWUU": (-11.44470, 34.01180),
-    "FXMM": (-29.45628, 27.55446),
-    "FYAR": (-22.46187, 14.97932),
-    "FYGF": (-19.60220, 18.12270),
-    "FYKM": (-17.63426, 24.17669),
-    "FYKT": (-26.53980, 18.11140),
-    "FYLZ": (-26.68740, 15.24290),
-    "FYML": (-24.60540, 17.92540),
-    "FYOA": (-17.87820, 15.95260),
-    "FYOG": (-28.58532, 16.44638),
-    "FYRU": (-17.95650, 19.71940),
-    "FYTF": (-20.54424, 14.35879),
-    "FYTM": (-19.26208, 17.73251),
-    "FYWB": (-22.97933, 14.64710),
-    "FYWE": (-22.60492, 17.07900),
-    "FYWH": (-22.47990, 17.47090),
-    "FZAA": (-4.38575, 15.44460),
-    "FZAB": (-4.32666, 15.32750),
-    "FZBO": (-3.31132, 17.38170),
-    "FZCA": (-5.03577, 18.78560),
-    "FZEA": (0.02260, 18.28870),
-    "FZFD": (4.25274, 20.97527),
-    "FZFK": (3.23537, 19.77130),
-    "FZGA": (2.17066, 21.49690),
-    "FZIC": (0.48164, 25.33800),
-    "FZJH": (2.82761, 27.58830),
-    "FZKA": (1.56574, 30.22068),
-    "FZKJ": (2.81806, 24.79400),
-    "FZMA": (-2.30898, 28.80880),
-    "FZNA": (-1.66676, 29.23804),
-    "FZOA": (-2.91918, 25.91540),
-    "FZQA": (-11.59149, 27.53075),
-    "FZQM": (-10.76590, 25.50570),
-    "FZRF": (-5.87556, 29.25000),
-    "FZSA": (-8.64202, 25.25290),
-    "FZUA": (-5.90005, 22.46920),
-    "FZWA": (-6.12124, 23.56900),
-    "GABS": (12.53350, -7.94994),
-    "GAGO": (16.24847, -0.00539),
-    "GAKY": (14.48252, -11.39934),
-    "GAMB": (14.51280, -4.07956),
-    "GATB": (16.73050, -3.00758),
-    "GBYD": (13.33800, -16.65220),
-    "GCFV": (28.45270, -13.86380),
-    "GCHI": (27.81480, -17.88710),
-    "GCLA": (28.62650, -17.75560),
-    "GCLP": (27.93190, -15.38660),
-    "GCRR": (28.94550, -13.60520),
-    "GCTS": (28.04450, -16.57250),
-    "GCXO": (28.48275, -16.34171),
-    "GEML": (35.27980, -2.95626),
-    "GFBO": (7.94440, -11.76100),
-    "GFKE": (7.89636, -11.17413),
-    "GFLL": (8.61644, -13.19550),
-    "GFYE": (8.61047, -11.04540),
-    "GGOV": (11.89426, -15.65360),
-    "GLGE": (5.03212, -9.06424),
-    "GLMR": (6.28906, -10.75870),
-    "GLRB": (6.23379, -10.36230),
-    "GMAD": (30.32248, -9.41200),
-    "GMAT": (28.44756, -11.16175),
-    "GMAZ": (30.26579, -5.86081),
-    "GMFB": (32.51431, -1.98306),
-    "GMFF": (33.92730, -4.97796),
-    "GMFK": (31.94750, -4.39833),
-    "GMFM": (33.87910, -5.51512),
-    "GMFO": (34.78956, -1.92604),
-    "GMMA": (26.73199, -11.68365),
-    "GMMD": (32.40190, -6.31590),
-    "GMME": (34.05150, -6.75152),
-    "GMMH": (23.71830, -15.93200),
-    "GMMI": (31.39750, -9.68167),
-    "GMML": (27.14247, -13.22495),
-    "GMMN": (33.36750, -7.58997),
-    "GMMW": (34.98880, -3.02821),
-    "GMMX": (31.60481, -8.03579),
-    "GMMY": (34.29890, -6.59588),
-    "GMMZ": (30.93910, -6.90943),
-    "GMTA": (35.17710, -3.83952),
-    "GMTN": (35.59430, -5.32002),
-    "GMTT": (35.73174, -5.92146),
-    "GOBD": (14.67088, -17.07283),
-    "GOGG": (12.55559, -16.28330),
-    "GOGS": (12.39533, -16.74800),
-    "GOOK": (14.14690, -16.05130),
-    "GOOY": (14.74234, -17.47922),
-    "GOSM": (15.59360, -13.32280),
-    "GOSS": (16.04981, -16.46104),
-    "GOTB": (14.84730, -12.46830),
-    "GOTK": (12.57230, -12.22030),
-    "GOTT": (13.73680, -13.65310),
-    "GQNO": (18.31000, -15.96972),
-    "GQPA": (20.50582, -13.04374),
-    "GQPP": (20.93240, -17.03020),
-    "GQPZ": (22.75735, -12.48223),
-    "GUCY": (9.57689, -13.61200),
-    "GVAC": (16.74140, -22.94940),
-    "GVBA": (16.13650, -22.88890),
-    "GVMA": (15.15590, -23.21370),
-    "GVNP": (14.94113, -23.48473),
-    "GVSN": (16.58885, -24.28413),
-    "GVSV": (16.83336, -25.05531),
-    "HAAB": (8.97789, 38.79930),
-    "HAAM": (6.03939, 37.59050),
-    "HAAX": (14.14680, 38.77280),
-    "HABD": (11.60810, 37.32160),
-    "HADR": (9.62355, 41.85503),
-    "HAGM": (8.12876, 34.56310),
-    "HAGN": (12.51990, 37.43400),
-    "HAGO": (5.93513, 43.57860),
-    "HAHM": (8.71630, 39.00590),
-    "HAJJ": (9.33191, 42.91181),
-    "HAJK": (5.74965, 36.56016),
-    "HAJM": (7.66609, 36.81660),
-    "HAKD": (6.73258, 44.24134),
-    "HALA": (7.10061, 38.39646),
-    "HAMK": (13.46740, 39.53350),
-    "HASO": (10.01850, 34.58630),
-    "HBBA": (-3.32402, 29.31850),
-    "HBBE": (-3.41721, 29.91131),
-    "HCMF": (11.27524, 49.13923),
-    "HCMH": (9.51408, 44.08347),
-    "HCMI": (10.38504, 44.93672),
-    "HCMK": (-0.37735, 42.45920),
-    "HCMM": (2.01444, 45.30470),
-    "HDAM": (11.54730, 43.15950),
-    "HEAL": (30.92432, 28.46161),
-    "HEAR": (31.05532, 33.82796),
-    "HEAT": (27.04596, 31.01276),
-    "HEAZ": (30.09170, 31.35974),
-    "HEBA": (30.93249, 29.69644),
-    "HEBL": (22.37592, 31.61173),
-    "HEBS": (29.20224, 31.01347),
-    "HECA": (30.11153, 31.39669),
-    "HECP": (30.06465, 31.83997),
-    "HECW": (30.11643, 30.91553),
-    "HEGN": (27.17678, 33.79669),
-    "HEGR": (31.07814, 34.15313),
-    "HEGS": (30.81980, 30.19120),
-    "HEIS": (30.59795, 32.23569),
-    "HELX": (25.67102, 32.70645),
-    "HEMA": (25.55555, 34.59245),
-    "HEMM": (31.32431, 27.22227),
-    "HEPS": (31.27929, 32.24058),
-    "HESC": (28.68429, 34.06441),
-    "HESG": (26.34251, 31.74302),
-    "HESH": (27.97727, 34.39472),
-    "HESN": (23.96108, 32.82038),
-    "HESX": (30.10818, 30.89573),
-    "HETB": (29.59450, 34.77575),
-    "HHAS": (15.29190, 38.91070),
-    "HHMS": (15.67000, 39.37010),
-    "HHSB": (13.07180, 42.64500),
-    "HJJJ": (4.87201, 31.60110),
-    "HKAM": (-2.64479, 37.25292),
-    "HKEL": (0.40446, 35.23890),
-    "HKJK": (-1.31889, 36.92823),
-    "HKKI": (-0.08614, 34.72890),
-    "HKKT": (0.97199, 34.95860),
-    "HKLK": (4.20412, 34.34820),
-    "HKLO": (3.12197, 35.60870),
-    "HKLU": (-2.25243, 40.91289),
-    "HKML": (-3.22931, 40.10170),
-    "HKMO": (-4.03483, 39.59420),
-    "HKMS": (-1.40459, 35.00835),
-    "HKNK": (-0.29842, 36.15919),
-    "HKNL": (-0.06235, 37.04130),
-    "HKNW": (-1.32172, 36.81480),
-    "HKNY": (0.02902, 37.02520),
-    "HKRE": (-1.27727, 36.86230),
-    "HKWJ": (1.73324, 40.09160),
-    "HLGD": (31.05858, 16.59709),
-    "HLGT": (25.14560, 10.14260),
-    "HLKF": (24.17870, 23.31400),
-    "HLLB": (32.09680, 20.26950),
-    "HLLM": (32.89177, 13.28788),
-    "HLLQ": (32.78904, 21.95486),
-    "HLLS": (26.99245, 14.46616),
-    "HLMB": (30.37810, 19.57640),
-    "HLTD": (30.14548, 9.70209),
-    "HRYG": (-1.67720, 29.25890),
-    "HRYR": (-1.96863, 30.13950),
-    "HRZA": (-2.46224, 28.90790),
-    "HSDN": (19.15367, 30.43007),
-    "HSFA": (10.52917, 32.50056),
-    "HSFS": (13.61490, 25.32460),
-    "HSKA": (15.38750, 36.32880),
-    "HSMN": (18.44333, 31.84333),
-    "HSNN": (12.05350, 24.95620),
-    "HSOB": (13.15320, 30.23270),
-    "HSPN": (19.43456, 37.23412),
-    "HSSG": (13.47740, 22.53722),
-    "HSSK": (15.58950, 32.55320),
-    "HSSM": (9.55874, 31.65194),
-    "HSWW": (7.72583, 27.97500),
-    "HTAR": (-3.36779, 36.63330),
-    "HTDA": (-6.87350, 39.20729),
-    "HTDO": (-6.17056, 35.75604),
-    "HTGW": (-8.91994, 33.27398),
-    "HTIR": (-7.66863, 35.75210),
-    "HTKJ": (-3.42705, 37.07353),
-    "HTLM": (-3.37631, 35.81830),
-    "HTMT": (-10.33620, 40.18200),
-    "HTMW": (-2.44656, 32.93605),
-    "HTPE": (-5.25726, 39.81140),
-    "HTTG": (-5.09236, 39.07120),
-    "HTZA": (-6.22202, 39.22490),
-    "HUAR": (3.04915, 30.91171),
-    "HUEN": (0.04239, 32.44350),
-    "HUGU": (2.80556, 32.27180),
-    "HUSO": (1.72769, 33.62280),
-    "KABE": (40.65177, -75.44280),
-    "KABI": (32.41130, -99.68190),
-    "KABQ": (35.03998, -106.60892),
-    "KABR": (45.44910, -98.42180),
-    "KABY": (31.53295, -84.19621),
-    "KACK": (41.25310, -70.06020),
-    "KACT": (31.61130, -97.23050),
-    "KACV": (40.97810, -124.10900),
-    "KACY": (39.45620, -74.57751),
-    "KADH": (34.80521, -96.67199),
-    "KADW": (38.81080, -76.86700),
-    "KAEG": (35.14520, -106.79500),
-    "KAEX": (31.32583, -92.54670),
-    "KAFW": (32.99044, -97.31947),
-    "KAGC": (40.35440, -79.93020),
-    "KAGS": (33.36990, -81.96450),
-    "KAHN": (33.94884, -83.32563),
-    "KAIA": (42.05254, -102.80397),
-    "KAKR": (41.03735, -81.46784),
-    "KALB": (42.74830, -73.80170),
-    "KALI": (27.74090, -98.02690),
-    "KALM": (32.83782, -105.99315),
-    "KALN": (38.89030, -90.04600),
-    "KALO": (42.55710, -92.40030),
-    "KALS": (37.43490, -105.86700),
-    "KALW": (46.09490, -118.28800),
-    "KAMA": (35.21786, -101.70644),
-    "KANB": (33.58820, -85.85810),
-    "KAND": (34.49460, -82.70940),
-    "KAOO": (40.29640, -78.32000),
-    "KAPA": (39.57010, -104.84900),
-    "KAPF": (26.15260, -81.77530),
-    "KAPG": (39.46620, -76.16880),
-    "KAPN": (45.07810, -83.56030),
-    "KARA": (30.03780, -91.88390),
-    "KART": (43.99190, -76.02170),
-    "KASE": (39.22320, -106.86900),
-    "KAST": (46.15800, -123.87900),
-    "KATL": (33.63670, -84.42810),
-    "KATW": (44.25852, -88.51900),
-    "KATY": (44.91400, -97.15470),
-    "KAUG": (44.32060, -69.79730),
-    "KAUS": (30.19753, -97.66201),
-    "KAUW": (44.92620, -89.62660),
-    "KAVL": (35.43549, -82.54185),
-    "KAVP": (41.33706, -75.72423),
-    "KAWO": (48.16145, -122.15844),
-    "KAXN": (45.86630, -95.39470),
-    "KAZO": (42.23210, -85.54964),
-    "KBAB": (39.13610, -121.43700),
-    "KBAD": (32.50180, -93.66270),
-    "KBAF": (42.15780, -72.71560),
-    "KBAK": (39.26239, -85.89558),
-    "KBAZ": (29.70450, -98.04220),
-    "KBBD": (31.17893, -99.32473),
-    "KBBG": (36.53208, -93.20054),
-    "KBCE": (37.70640, -112.14500),
-    "KBCT": (26.37850, -80.10770),
-    "KBDE": (48.72840, -94.61220),
-    "KBDL": (41.93856, -72.68802),
-    "KBDR": (41.16350, -73.12620),
-    "KBED": (42.47000, -71.28900),
-    "KBFD": (41.80310, -78.64010),
-    "KBFF": (41.87400, -103.59600),
-    "KBFI": (47.52704, -122.29995),
-    "KBFL": (35.43360, -119.05700),
-    "KBFM": (30.62680, -88.06810),
-    "KBGM": (42.20870, -75.97980),
-    "KBGR": (44.80636, -68.82667),
-    "KBHB": (44.45000, -68.36150),
-    "KBHM": (33.56288, -86.75071),
-    "KBIF": (31.84950, -106.38000),
-    "KBIH": (37.37310, -118.36400),
-    "KBIL": (45.80893, -108.54124),
-    "KBIS": (46.77273, -100.74687),
-    "KBIX": (30.41040, -88.92440),
-    "KBJC": (39.90880, -105.11700),
-    "KBJI": (47.50940, -94.93370),
-    "KBKE": (44.83730, -117.80900),
-    "KBKF": (39.70170, -104.75200),
-    "KBKL": (41.51750, -81.68330),
-    "KBKW": (37.78730, -81.12420),
-    "KBLF": (37.29580, -81.20770),
-    "KBLH": (33.61920, -114.71700),
-    "KBLI": (48.79280, -122.53800),
-    "KBLV": (38.54520, -89.83520),
-    "KBMG": (39.14600, -86.61670),
-    "KBMI": (40.47710, -88.91590),
-    "KBNA": (36.12450, -86.67820),
-    "KBNO": (43.59046, -118.95515),
-    "KBOI": (43.56440, -116.22300),
-    "KBOS": (42.36197, -71.00790),
-    "KBPI": (42.58510, -110.11100),
-    "KBPK": (36.36890, -92.47050),
-    "KBPT": (29.95080, -94.02070),
-    "KBQK": (31.25880, -81.46650),
-    "KBRD": (46.40286, -94.12973),
-    "KBRL": (40.78320, -91.12550),
-    "KBRO": (25.90724, -97.42524),
-    "KBTL": (42.30730, -85.25150),
-    "KBTM": (45.95480, -112.49700),
-    "KBTR": (30.53320, -91.14960),
-    "KBTV": (44.47190, -73.15330),
-    "KBUF": (42.94050, -78.73220),
-    "KBUR": (34.20283, -118.35805),
-    "KBVI": (40.77250, -80.39140),
-    "KBVY": (42.58420, -70.91650),
-    "KBWG": (36.96450, -86.41970),
-    "KBWI": (39.17540, -76.66830),
-    "KBXM": (43.89220, -69.93860),
-    "KBYH": (35.96430, -89.94400),
-    "KBYI": (42.54260, -113.77200),
-    "KBYS": (35.28050, -116.63000),
-    "KBZN": (45.77885, -111.15371),
-    "KCAE": (33.93817, -81.12302),
-    "KCAK": (40.91610, -81.44220),
-    "KCAR": (46.87150, -68.01790),
-    "KCBM": (33.64380, -88.44380),
-    "KCCR": (37.98970, -122.05700),
-    "KCCY": (43.07260, -92.61080),
-    "KCDC": (37.70100, -113.09900),
-    "KCDR": (42.83760, -103.09500),
-    "KCDS": (34.43380, -100.28800),
-    "KCEC": (41.77893, -124.23640),
-    "KCEF": (42.19400, -72.53480),
-    "KCEW": (30.77880, -86.52210),
-    "KCEZ": (37.30300, -108.62800),
-    "KCGF": (41.56510, -81.48640),
-    "KCGI": (37.22530, -89.57080),
-    "KCHA": (35.03530, -85.20380),
-    "KCHO": (38.13860, -78.45290),
-    "KCHS": (32.89616, -80.03815),
-    "KCID": (41.88470, -91.71080),
-    "KCIU": (46.24204, -84.46208),
-    "KCKB": (39.29660, -80.22810),
-    "KCLE": (41.41170, -81.84980),
-    "KCLL": (30.58860, -96.36380),
-    "KCLM": (48.12020, -123.50000),
-    "KCLT": (35.21400, -80.94310),
-    "KCMA": (34.21370, -119.09400),
-    "KCMH": (39.99800, -82.89190),
-    "KCMI": (40.03982, -88.27625),
-    "KCMX": (47.16840, -88.48910),
-    "KCNM": (32.33750, -104.26300),
-    "KCNU": (37.66817, -95.48673),
-    "KCNY": (38.75500, -109.75500),
-    "KCOD": (44.52020, -109.02400),
-    "KCOE": (47.77430, -116.82000),
-    "KCOF": (28.23490, -80.61010),
-    "KCON": (43.20270, -71.50230),
-    "KCOS": (38.80580, -104.70100),
-    "KCOU": (38.81810, -92.21960),
-    "KCPR": (42.90738, -106.46161),
-    "KCRE": (33.81170, -78.72390),
-    "KCRG": (30.33630, -81.51440),
-    "KCRP": (27.77040, -97.50120),
-    "KCRQ": (33.12830, -117.28000),
-    "KCRW": (38.37310, -81.59320),
-    "KCSG": (32.51642, -84.93960),
-    "KCSV": (35.95131, -85.08499),
-    "KCTB": (48.60866, -112.37818),
-    "KCUB": (33.97050, -80.99520),
-    "KCVG": (39.04880, -84.66780),
-    "KCVN": (34.42659, -103.07879),
-    "KCVO": (44.49720, -123.29000),
-    "KCVS": (34.38280, -103.32200),
-    "KCWA": (44.77745, -89.67024),
-    "KCXO": (30.35180, -95.41450),
-    "KCXP": (39.19433, -119.73431),
-    "KCYS": (41.15570, -104.81200),
-    "KDAA": (38.71500, -77.18100),
-    "KDAB": (29.18255, -81.05946),
-    "KDAG": (34.85370, -116.78700),
-    "KDAL": (32.84478, -96.84765),
-    "KDAN": (36.57290, -79.33610),
-    "KDAY": (39.90240, -84.21940),
-    "KDBQ": (42.40200, -90.70950),
-    "KDCA": (38.85210, -77.03770),
-    "KDDC": (37.76340, -99.96560),
-    "KDEC": (39.83460, -88.86570),
-    "KDEN": (39.86003, -104.67379),
-    "KDET": (42.40920, -83.00990),
-    "KDFW": (32.89680, -97.03800),
-    "KDHN": (31.32130, -85.44960),
-    "KDHT": (36.02260, -102.54700),
-    "KDIK": (46.79753, -102.80191),
-    "KDLF": (29.35950, -100.77800),
-    "KDLH": (46.84187, -92.19875),
-    "KDLS": (45.62098, -121.17078),
-    "KDMA": (32.16650, -110.88300),
-    "KDMN": (32.26230, -107.72100),
-    "KDNL": (33.46650, -82.03940),
-    "KDOV": (39.12950, -75.46600),
-    "KDPA": (41.90780, -88.24860),
-    "KDRA": (36.61940, -116.03300),
-    "KDRI": (30.83170, -93.33990),
-    "KDRO": (37.15150, -107.75400),
-    "KDRT": (29.37420, -100.92700),
-    "KDSM": (41.53403, -93.65672),
-    "KDTS": (30.40010, -86.47150),
-    "KDTW": (42.21377, -83.35379),
-    "KDUA": (33.93968, -96.39507),
-    "KDUG": (31.46414, -109.60456),
-    "KDUJ": (41.17830, -78.89870),
-    "KDVL": (48.11545, -98.90880),
-    "KDXR": (41.37166, -73.48223),
-    "KDYS": (32.42080, -99.85460),
-    "KEAR": (40.72700, -99.00680),
-    "KEAT": (47.39890, -120.20700),
-    "KEAU": (44.86580, -91.48430),
-    "KECG": (36.26060, -76.17460),
-    "KECP": (30.35711, -85.79541),
-    "KEDC": (30.39805, -97.56691),
-    "KEDW": (34.91078, -117.88639),
-    "KEED": (34.76630, -114.62300),
-    "KEEN": (42.89840, -72.27080),
-    "KEET": (33.17700, -86.78280),
-    "KEFD": (29.60730, -95.15880),
-    "KEGE": (39.64260, -106.91800),
-    "KEGI": (30.65040, -86.52290),
-    "KEKA": (40.80340, -124.11300),
-    "KEKN": (38.88976, -79.85765),
-    "KEKO": (40.82490, -115.79200),
-    "KELD": (33.22100, -92.81330),
-    "KELM": (42.15990, -76.89160),
-    "KELO": (47.82450, -91.83070),
-    "KELP": (31.80991, -106.37561),
-    "KELY": (39.29970, -114.84200),
-    "KEND": (36.33920, -97.91650),
-    "KENV": (40.71870, -114.03100),
-    "KENW": (42.59570, -87.92780),
-    "KERI": (42.08313, -80.17387),
-    "KESC": (45.72320, -87.08862),
-    "KESF": (31.39427, -92.29408),
-    "KEUG": (44.12460, -123.21200),
-    "KEVV": (38.03700, -87.53240),
-    "KEVW": (41.27480, -111.03500),
-    "KEWB": (41.67610, -70.95690),
-    "KEWN": (35.07300, -77.04290),
-    "KEWR": (40.68940, -74.17055),
-    "KEYW": (24.55612, -81.75958),
-    "KFAF": (37.13250, -76.60880),
-    "KFAR": (46.92070, -96.81580),
-    "KFAT": (36.77577, -119.71802),
-    "KFAY": (34.99120, -78.88030),
-    "KFBG": (35.13180, -78.93670),
-    "KFCS": (38.67840, -104.75700),
-    "KFDY": (41.01350, -83.66870),
-    "KFFO": (39.82610, -84.04830),
-    "KFHR": (48.52365, -123.02465),
-    "KFHU": (31.58738, -110.34822),
-    "KFKL": (41.37790, -79.86040),
-    "KFLG": (35.13976, -111.66983),
-    "KFLL": (26.07260, -80.15270),
-    "KFLO": (34.18540, -79.72390),
-    "KFME": (39.08540, -76.75940),
-    "KFMN": (36.74120, -108.23000),
-    "KFMY": (26.58660, -81.86330),
-    "KFNL": (40.44969, -105.01127),
-    "KFNT": (42.96929, -83.74335),
-    "KFOD": (42.55262, -94.19124),
-    "KFOE": (38.95090, -95.66360),
-    "KFPR": (27.49510, -80.36830),
-    "KFRG": (40.72858, -73.41427),
-    "KFRI": (39.05302, -96.76420),
-    "KFSD": (43.58546, -96.74115),
-    "KFSI": (34.64980, -98.40220),
-    "KFSM": (35.33660, -94.36740),
-    "KFST": (30.91570, -102.91600),
-    "KFTK": (37.90710, -85.97210),
-    "KFTW": (32.81992, -97.36082),
-    "KFTY": (33.77910, -84.52140),
-    "KFWA": (40.97890, -85.19446),
-    "KFXE": (26.19730, -80.17070),
-    "KFYV": (36.00510, -94.17010),
-    "KGCC": (44.34890, -105.53900),
-    "KGCK": (37.92750, -100.72400),
-    "KGCN": (35.95240, -112.14700),
-    "KGDV": (47.13766, -104.80691),
-    "KGEG": (47.61990, -117.53400),
-    "KGFK": (47.94930, -97.17610),
-    "KGFL": (43.34120, -73.61030),
-    "KGGG": (32.38400, -94.71150),
-    "KGGW": (48.21250, -106.61500),
-    "KGJT": (39.12666, -108.52939),
-    "KGLD": (39.37070, -101.69975),
-    "KGLH": (33.48290, -90.98560),
-    "KGLS": (29.26530, -94.86040),
-    "KGMU": (34.84790, -82.35022),
-    "KGNV": (29.69010, -82.27180),
-    "KGON": (41.33010, -72.04510),
-    "KGPI": (48.31050, -114.25600),
-    "KGPT": (30.40558, -89.06984),
-    "KGRB": (44.48346, -88.13080),
-    "KGRF": (47.07920, -122.58100),
-    "KGRI": (40.96750, -98.30960),
-    "KGRK": (31.06720, -97.82890),
-    "KGRR": (42.88080, -85.52280),
-    "KGSB": (35.33940, -77.96060),
-    "KGSO": (36.09937, -79.93726),
-    "KGSP": (34.89570, -82.21890),
-    "KGTB": (44.05560, -75.71950),
-    "KGTF": (47.48200, -111.37100),
-    "KGTR": (33.45030, -88.59140),
-    "KGUC": (38.53467, -106.93457),
-    "KGUP": (35.51165, -108.78817),
-    "KGUS": (40.64810, -86.15210),
-    "KGUY": (36.68510, -101.50800),
-    "KGWO": (33.49502, -90.08820),
-    "KGYI": (33.71410, -96.67370),
-    "KGYY": (41.61709, -87.41321),
-    "KHBG": (31.26480, -89.25280),
-    "KHBR": (34.99132, -99.05131),
-    "KHDN": (40.48120, -107.21800),
-    "KHEF": (38.72140, -77.51540),
-    "KHFD": (41.73670, -72.64940),
-    "KHGR": (39.70877, -77.72801),
-    "KHHR": (33.92280, -118.33500),
-    "KHIB": (47.38483, -92.83691),
-    "KHIF": (41.12403, -111.97309),
-    "KHII": (34.57051, -114.35774),
-    "KHIO": (45.54040, -122.95000),
-    "KHKY": (35.74110, -81.38950),
-    "KHLG": (40.17500, -80.64630),
-    "KHLN": (46.60680, -111.98300),
-    "KHMN": (32.85250, -106.10700),
-    "KHOB": (32.68750, -103.21700),
-    "KHON": (44.38520, -98.22850),
-    "KHOP": (36.67415, -87.48974),
-    "KHOT": (34.47880, -93.09626),
-    "KHOU": (29.64534, -95.27681),
-    "KHPN": (41.06700, -73.70760),
-    "KHQM": (46.97120, -123.93700),
-    "KHRL": (26.22850, -97.65440),
-    "KHRO": (36.26150, -93.15470),
-    "KHRT": (30.42780, -86.68930),
-    "KHST": (25.48860, -80.38360),
-    "KHSV": (34.63624, -86.77438),
-    "KHTS": (38.36670, -82.55800),
-    "KHUA": (34.67870, -86.68480),
-    "KHUF": (39.45150, -87.30760),
-    "KHUL": (46.12310, -67.79210),
-    "KHUT": (38.06550, -97.86060),
-    "KHVN": (41.26287, -72.88769),
-    "KHVR": (48.54139, -109.76286),
-    "KHWO": (26.00120, -80.24070),
-    "KHXD": (32.22440, -80.69750),
-    "KHYA": (41.66930, -70.28040),
-    "KHYI": (29.89270, -97.86300),
-    "KHYR": (46.02520, -91.44430),
-    "KHYS": (38.84452, -99.27315),
-    "KHZY": (41.77800, -80.69550),
-    "KIAB": (37.62190, -97.26820),
-    "KIAD": (38.94450, -77.45580),
-    "KIAG": (43.10730, -78.94620),
-    "KIAH": (29.98440, -95.34140),
-    "KICT": (37.65031, -97.42858),
-    "KIDA": (43.51460, -112.07100),
-    "KIFP": (35.15473, -114.55932),
-    "KIGM": (35.25950, -113.93800),
-    "KIKK": (41.07140, -87.84630),
-    "KILG": (39.67870, -75.60650),
-    "KILM": (34.27235, -77.90512),
-    "KILN": (39.42790, -83.79210),
-    "KIMT": (45.81911, -88.11456),
-    "KIND": (39.71730, -86.29440),
-    "KINK": (31.77960, -103.20100),
-    "KINL": (48.56620, -93.40310),
-    "KINT": (36.13370, -80.22200),
-    "KINW": (35.02190, -110.72300),
-    "KIPL": (32.83539, -115.57403),
-    "KIPT": (41.24213, -76.92245),
-    "KIRK": (40.09350, -92.54490),
-    "KISM": (28.28980, -81.43710),
-    "KISO": (35.33140, -77.60880),
-    "KISP": (40.79632, -73.10170),
-    "KITH": (42.49100, -76.45840),
-    "KIWA": (33.30780, -111.65500),
-    "KJAC": (43.60730, -110.73800),
-    "KJAN": (32.31120, -90.07590),
-    "KJAX": (30.49247, -81.68781),
-    "KJBR": (35.83170, -90.64640),
-    "KJCT": (30.51130, -99.76350),
-    "KJFK": (40.63945, -73.77932),
-    "KJHW": (42.15425, -79.25401),
-    "KJKL": (37.59390, -83.31730),
-    "KJLN": (37.15180, -94.49830),
-    "KJMS": (46.92970, -98.67820),
-    "KJNX": (35.54090, -78.39030),
-    "KJQF": (35.38780, -80.70910),
-    "KJST": (40.31610, -78.83390),
-    "KJWY": (32.45870, -96.91240),
-    "KJXN": (42.26051, -84.46302),
-    "KKLS": (46.11800, -122.89800),
-    "KLAA": (38.06641, -102.69137),
-    "KLAF": (40.41287, -86.93936),
-    "KLAL": (27.98927, -82.02071),
-    "KLAN": (42.77758, -84.58572),
-    "KLAR": (41.31210, -105.67500),
-    "KLAS": (36.08336, -115.15182),
-    "KLAW": (34.56770, -98.41660),
-    "KLAX": (33.94250, -118.40800),
-    "KLBB": (33.66360, -101.82300),
-    "KLBE": (40.27590, -79.40480),
-    "KLBF": (41.12620, -100.68400),
-    "KLBL": (37.04420, -100.96000),
-    "KLBT": (34.61077, -79.05943),
-    "KLBX": (29.10860, -95.46210),
-    "KLCH": (30.12610, -93.22330),
-    "KLCK": (39.81380, -82.92780),
-    "KLEB": (43.62610, -72.30420),
-    "KLEE": (28.82310, -81.80870),
-    "KLEX": (38.03507, -84.60674),
-    "KLFI": (37.08290, -76.36050),
-    "KLFK": (31.23400, -94.75000),
-    "KLFT": (30.20530, -91.98760),
-    "KLGA": (40.77720, -73.87260),
-    "KLGB": (33.81652, -118.14989),
-    "KLGU": (41.79120, -111.85200),
-    "KLIT": (34.72922, -92.22359),
-    "KLLQ": (33.63860, -91.75100),
-    "KLMT": (42.15610, -121.73300),
-    "KLND": (42.81520, -108.73000),
-    "KLNK": (40.84488, -96.76178),
-    "KLNS": (40.12170, -76.29610),
-    "KLOL": (40.06640, -118.56500),
-    "KLOU": (38.22800, -85.66370),
-    "KLOZ": (37.08220, -84.08490),
-    "KLRD": (27.54380, -99.46160),
-    "KLRF": (34.91690, -92.14970),
-    "KLRU": (32.28940, -106.92200),
-    "KLSE": (43.87900, -91.25670),
-    "KLSF": (32.33255, -84.98800),
-    "KLSV": (36.23620, -115.03400),
-    "KLTS": (34.66710, -99.26670),
-    "KLUF": (33.53500, -112.38300),
-    "KLUK": (39.10236, -84.41894),
-    "KLVM": (45.69940, -110.44800),
-    "KLVS": (35.65420, -105.14200),
-    "KLWB": (37.85791, -80.40044),
-    "KLWM": (42.71720, -71.12340),
-    "KLWS": (46.37450, -117.01500),
-    "KLWT": (47.04843, -109.46614),
-    "KLYH": (37.32670, -79.20040),
-    "KMAF": (31.94250, -102.20200),
-    "KMBG": (45.54650, -100.40800),
-    "KMBS": (43.53318, -84.08310),
-    "KMCB": (31.17850, -90.47190),
-    "KMCC": (38.66760, -121.40100),
-    "KMCE": (37.28470, -120.51400),
-    "KMCF": (27.84930, -82.52120),
-    "KMCI": (39.30170, -94.71389),
-    "KMCK": (40.20779, -100.59279),
-    "KMCN": (32.69280, -83.64920),
-    "KMCO": (28.42940, -81.30900),
-    "KMCW": (43.15980, -93.32972),
-    "KMDH": (37.77810, -89.25200),
-    "KMDT": (40.19284, -76.76233),
-    "KMDW": (41.78600, -87.75240),
-    "KMEI": (32.33260, -88.75190),
-    "KMEM": (35.04384, -89.97634),
-    "KMER": (37.38050, -120.56800),
-    "KMFD": (40.82140, -82.51660),
-    "KMFE": (26.17614, -98.23797),
-    "KMFR": (42.37420, -122.87300),
-    "KMGC": (41.70330, -86.82120),
-    "KMGE": (33.91540, -84.51630),
-    "KMGM": (32.30060, -86.39400),
-    "KMGW": (39.64330, -79.91760),
-    "KMHK": (39.14100, -96.67080),
-    "KMHR": (38.55474, -121.29799),
-    "KMHT": (42.93260, -71.43570),
-    "KMHV": (35.05639, -118.14534),
-    "KMIA": (25.79601, -80.28975),
-    "KMIB": (48.41560, -101.35800),
-    "KMIE": (40.24230, -85.39590),
-    "KMIV": (39.36780, -75.07220),
-    "KMKC": (39.12320, -94.59280),
-    "KMKE": (42.94720, -87.89660),
-    "KMKG": (43.16950, -86.23820),
-    "KMKL": (35.59990, -88.91560),
-    "KMLB": (28.10201, -80.64109),
-    "KMLC": (34.88240, -95.78350),
-    "KMLI": (41.44850, -90.50750),
-    "KMLS": (46.42727, -105.88537),
-    "KMLU": (32.51090, -92.03770),
-    "KMMT": (33.92080, -80.80130),
-    "KMMU": (40.79906, -74.41495),
-    "KMMV": (45.19440, -123.13600),
-    "KMOB": (30.69120, -88.24280),
-    "KMOD": (37.62580, -120.95400),
-    "KMOT": (48.25801, -101.27912),
-    "KMPV": (44.20350, -72.56230),
-    "KMQY": (36.00900, -86.52010),
-    "KMRB": (39.40190, -77.98460),
-    "KMRY": (36.58678, -121.84418),
-    "KMSL": (34.74512, -87.61298),
-    "KMSN": (43.13990, -89.33750),
-    "KMSO": (46.91582, -114.09111),
-    "KMSP": (44.88008, -93.22174),
-    "KMSS": (44.93616, -74.84430),
-    "KMSY": (29.99340, -90.26467),
-    "KMTC": (42.61346, -82.83692),
-    "KMTH": (24.72601, -81.05138),
-    "KMTJ": (38.50980, -107.89400),
-    "KMTN": (39.32570, -76.41380),
-    "KMUI": (40.43521, -76.56866),
-    "KMUO": (43.04360, -115.87200),
-    "KMWA": (37.75121, -89.01657),
-    "KMWH": (47.20770, -119.32000),
-    "KMWL": (32.78160, -98.06020),
-    "KMXF": (32.38290, -86.36580),
-    "KMYL": (44.88884, -116.10111),
-    "KMYR": (33.67970, -78.92830),
-    "KMYV": (39.09780, -121.57000),
-    "KNBC": (32.47740, -80.72320),
-    "KNBG": (29.82530, -90.03500),
-    "KNCA": (34.70840, -77.43970),
-    "KNDZ": (30.70440, -87.02300),
-    "KNEL": (40.03330, -74.35330),
-    "KNEW": (30.04240, -90.02830),
-    "KNFG": (33.30130, -117.35500),
-    "KNFL": (39.41660, -118.70100),
-    "KNFW": (32.76920, -97.44150),
-    "KNGP": (27.69260, -97.29110),
-    "KNGU": (36.93760, -76.28930),
-    "KNHK": (38.28600, -76.41180),
-    "KNID": (35.68540, -117.69200),
-    "KNIP": (30.23580, -81.68060),
-    "KNJK": (32.82920, -115.67200),
-    "KNKT": (34.90090, -76.88070),
-    "KNKX": (32.86840, -117.14300),
-    "KNLC": (36.33300, -119.95200),
-    "KNMM": (32.55310, -88.55406),
-    "KNPA": (30.35270, -87.31860),
-    "KNQA": (35.35670, -89.87030),
-    "KNQI": (27.50720, -97.80970),
-    "KNQX": (24.57580, -81.68890),
-    "KNRB": (30.39110, -81.42470),
-    "KNSE": (30.72420, -87.02190),
-    "KNTD": (34.12030, -119.12100),
-    "KNTU": (36.82070, -76.03350),
-    "KNUQ": (37.41610, -122.04900),
-    "KNUW": (48.35180, -122.65600),
-    "KNXP": (34.29620, -116.16200),
-    "KNYG": (38.50170, -77.30530),
-    "KNYL": (32.65094, -114.60938),
-    "KNZY": (32.69920, -117.21500),
-    "KOAJ": (34.82920, -77.61210),
-    "KOAK": (37.72008, -122.22118),
-    "KOFF": (41.11931, -95.90851),
-    "KOFK": (41.98550, -97.43510),
-    "KOGB": (33.45680, -80.85950),
-    "KOGD": (41.19590, -112.01200),
-    "KOGS": (44.68190, -75.46550),
-    "KOKB": (33.21795, -117.35168),
-    "KOKC": (35.39339, -97.59825),
-    "KOLF": (48.09450, -105.57500),
-    "KOLM": (46.96940, -122.90300),
-    "KOLS": (31.41770, -110.84800),
-    "KOLU": (41.44814, -97.34017),
-    "KOMA": (41.30320, -95.89410),
-    "KONO": (44.01980, -117.01329),
-    "KONP": (44.58040, -124.05800),
-    "KONT": (34.05600, -117.60100),
-    "KOPF": (25.90700, -80.27840),
-    "KOQU": (41.59710, -71.41210),
-    "KORD": (41.97860, -87.90480),
-    "KORF": (36.89534, -76.20100),
-    "KORH": (42.26730, -71.87570),
-    "KORL": (28.54550, -81.33290),
-    "KORS": (48.70820, -122.91000),
-    "KOSH": (43.98440, -88.55700),
-    "KOSU": (40.07980, -83.07300),
-    "KOTH": (43.41710, -124.24600),
-    "KOTM": (41.10637, -92.44984),
-    "KOWB": (37.74010, -87.16680),
-    "KOWD": (42.19050, -71.17290),
-    "KOXB": (38.31040, -75.12400),
-    "KOXR": (34.20080, -119.20700),
-    "KOZR": (31.27570, -85.71340),
-    "KPAE": (47.90630, -122.28200),
-    "KPAH": (37.06080, -88.77380),
-    "KPAM": (30.06960, -85.57540),
-    "KPAO": (37.46110, -122.11500),
-    "KPBF": (34.17412, -91.93564),
-    "KPBG": (44.65090, -73.46810),
-    "KPBI": (26.68320, -80.09560),
-    "KPCW": (41.51565, -82.86833),
-    "KPDK": (33.87633, -84.30213),
-    "KPDT": (45.69510, -118.84100),
-    "KPDX": (45.58870, -122.59800),
-    "KPGA": (36.92423, -111.44772),
-    "KPGD": (26.92020, -81.99050),
-    "KPGV": (35.63553, -77.38426),
-    "KPHF": (37.13190, -76.49300),
-    "KPHL": (39.87190, -75.24110),
-    "KPHX": (33.43530, -112.00590),
-    "KPIA": (40.66384, -89.69263),
-    "KPIB": (31.46710, -89.33710),
-    "KPIE": (27.91020, -82.68740),
-    "KPIH": (42.90980, -112.59600),
-    "KPIR": (44.38270, -100.28600),
-    "KPIT": (40.49150, -80.23290),
-    "KPKB": (39.34510, -81.43920),
-    "KPLN": (45.57090, -84.79670),
-    "KPMD": (34.62940, -118.08500),
-    "KPNA": (42.79550, -109.80700),
-    "KPNC": (36.73200, -97.09980),
-    "KPNE": (40.08241, -75.01061),
-    "KPNS": (30.47272, -87.18664),
-    "KPOB": (35.17090, -79.01450),
-    "KPOE": (31.04480, -93.19170),
-    "KPOU": (41.62660, -73.88420),
-    "KPQI": (46.68900, -68.04480),
-    "KPRB": (35.67290, -120.62700),
-    "KPRC": (34.65350, -112.41988),
-    "KPRX": (33.63660, -95.45080),
-    "KPSC": (46.26470, -119.11900),
-    "KPSM": (43.07790, -70.82330),
-    "KPSP": (33.82970, -116.50700),
-    "KPTK": (42.66550, -83.42010),
-    "KPUB": (38.28910, -104.49700),
-    "KPUW": (46.74160, -117.11163),
-    "KPVD": (41.72504, -71.42567),
-    "KPVU": (40.21889, -111.72244),
-    "KPWK": (42.11422, -87.90149),
-    "KPWM": (43.64620, -70.30930),
-    "KPWT": (47.49020, -122.76500),
-    "KRAL": (33.95190, -117.44500),
-    "KRAP": (44.04530, -103.05700),
-    "KRBL": (40.15070, -122.25200),
-    "KRCA": (44.14500, -103.10400),
-    "KRDD": (40.50900, -122.29300),
-    "KRDG": (40.37850, -75.96520),
-    "KRDM": (44.25410, -121.15000),
-    "KRDR": (47.96110, -97.40120),
-    "KRDU": (35.87866, -78.78730),
-    "KRFD": (42.19540, -89.09720),
-    "KRHI": (45.63120, -89.46750),
-    "KRHP": (35.19520, -83.86300),
-    "KRIC": (37.50520, -77.31970),
-    "KRIL": (39.52630, -107.72700),
-    "KRIV": (33.88070, -117.25900),
-    "KRIW": (43.06420, -108.46000),
-    "KRKD": (44.06010, -69.09920),
-    "KRKS": (41.59420, -109.06500),
-    "KRME": (43.23380, -75.40700),
-    "KRMG": (34.35060, -85.15800),
-    "KRND": (29.52970, -98.27890),
-    "KRNH": (45.14830, -92.53810),
-    "KRNO": (39.49910, -119.76800),
-    "KROA": (37.32550, -79.97540),
-    "KROC": (43.11890, -77.67240),
-    "KROW": (33.30160, -104.53100),
-    "KRSL": (38.87210, -98.81180),
-    "KRST": (43.90830, -92.50000),
-    "KRSW": (26.53468, -81.75282),
-    "KRUT": (43.52940, -72.94960),
-    "KRVS": (36.03960, -95.98460),
-    "KRWF": (44.54720, -95.08230),
-    "KRWI": (35.85630, -77.89190),
-    "KRWL": (41.80560, -107.20000),
-    "KRYY": (34.01316, -84.59721),
-    "KSAC": (38.51250, -121.49300),
-    "KSAF": (35.61710, -106.08900),
-    "KSAN": (32.73360, -117.19000),
-    "KSAT": (29.53370, -98.46980),
-    "KSAV": (32.12659, -81.19998),
-    "KSAW": (46.35150, -87.39588),
-    "KSBA": (34.42620, -119.84000),
-    "KSBD": (34.09672, -117.23660),
-    "KSBN": (41.70830, -86.31692),
-    "KSBP": (35.23680, -120.64200),
-    "KSBY": (38.34050, -75.51030),
-    "KSCH": (42.85250, -73.92890),
-    "KSCK": (37.89328, -121.23808),
-    "KSDF": (38.17060, -85.73508),
-    "KSDM": (32.57264, -116.98002),
-    "KSDY": (47.70514, -104.19442),
-    "KSEA": (47.44794, -122.31028),
-    "KSFB": (28.77428, -81.23463),
-    "KSFF": (47.68290, -117.32192),
-    "KSFO": (37.61981, -122.37482),
-    "KSGF": (37.24505, -93.38860),
-    "KSGH": (39.84030, -83.84020),
-    "KSGJ": (29.95920, -81.33980),
-    "KSGR": (29.62230, -95.65650),
-    "KSGU": (37.03639, -113.51031),
-    "KSHD": (38.26380, -78.89640),
-    "KSHR": (44.76920, -106.98000),
-    "KSHV": (32.44660, -93.82560),
-    "KSJC": (37.36245, -121.92919),
-    "KSJT": (31.35770, -100.49600),
-    "KSKA": (47.61510, -117.65600),
-    "KSKF": (29.38420, -98.58110),
-    "KSKX": (36.45249, -105.67749),
-    "KSLC": (40.78886, -111.97987),
-    "KSLE": (44.90950, -123.00300),
-    "KSLI": (33.79086, -118.05034),
-    "KSLK": (44.38691, -74.20463),
-    "KSLN": (38.79100, -97.65220),
-    "KSME": (37.05340, -84.61590),
-    "KSMF": (38.69540, -121.59100),
-    "KSMN": (45.12223, -113.88196),
-    "KSMO": (34.01580, -118.45100),
-    "KSMX": (34.89890, -120.45700),
-    "KSNA": (33.67506, -117.86928),
-    "KSNS": (36.66280, -121.60600),
-    "KSNY": (41.10130, -102.98500),
-    "KSOA": (30.58570, -100.64900),
-    "KSOW": (34.26406, -110.00709),
-    "KSPI": (39.84410, -89.67790),
-    "KSPS": (33.98880, -98.49190),
-    "KSQL": (37.51313, -122.25084),
-    "KSRQ": (27.39463, -82.55436),
-    "KSRR": (33.46280, -105.53500),
-    "KSSC": (33.97270, -80.47060),
-    "KSSF": (29.33700, -98.47110),
-    "KSSI": (31.15180, -81.39130),
-    "KSTC": (45.54660, -94.05990),
-    "KSTJ": (39.77190, -94.90970),
-    "KSTL": (38.74870, -90.37000),
-    "KSTP": (44.93479, -93.06004),
-    "KSTS": (38.50900, -122.81300),
-    "KSUN": (43.50440, -114.29600),
-    "KSUS": (38.66210, -90.65200),
-    "KSUU": (38.26270, -121.92700),
-    "KSUX": (42.39760, -96.38224),
-    "KSUZ": (34.59060, -92.47940),
-    "KSVC": (32.63670, -108.15474),
-    "KSVN": (32.01000, -81.14570),
-    "KSWF": (41.50421, -74.10890),
-    "KSWO": (36.16213, -97.08558),
-    "KSYR": (43.11120, -76.10630),
-    "KSZL": (38.73030, -93.54790),
-    "KTBN": (37.74160, -92.14070),
-    "KTCC": (35.18280, -103.60300),
-    "KTCL": (33.22060, -87.61140),
-    "KTCM": (47.13770, -122.47600),
-    "KTCS": (33.23690, -107.27200),
-    "KTEB": (40.85010, -74.06080),
-    "KTEX": (37.95380, -107.90800),
-    "KTIK": (35.41470, -97.38660),
-    "KTIW": (47.26741, -122.57730),
-    "KTIX": (28.51480, -80.79920),
-    "KTLH": (30.40121, -84.35433),
-    "KTMB": (25.64790, -80.43280),
-    "KTOI": (31.86040, -86.01210),
-    "KTOL": (41.58680, -83.80780),
-    "KTOP": (39.06990, -95.62261),
-    "KTPA": (27.97550, -82.53320),
-    "KTPH": (38.06020, -117.08700),
-    "KTPL": (31.15250, -97.40780),
-    "KTRI": (36.47520, -82.40740),
-    "KTRK": (39.31863, -120.14056),
-    "KTRM": (33.62670, -116.16000),
-    "KTTD": (45.54940, -122.40100),
-    "KTTN": (40.27670, -74.81350),
-    "KTTS": (28.61500, -80.69450),
-    "KTUL": (36.19708, -95.88622),
-    "KTUP": (34.26810, -88.76990),
-    "KTUS": (32.11500, -110.93805),
-    "KTVC": (44.74140, -85.58220),
-    "KTVF": (48.06570, -96.18500),
-    "KTVL": (38.89390, -119.99500),
-    "KTWF": (42.48180, -114.48800),
-    "KTXK": (33.45370, -93.99100),
-    "KTYR": (32.35410, -95.40240),
-    "KTYS": (35.81100, -83.99400),
-    "KUAO": (45.24710, -122.77000),
-    "KUIN": (39.94270, -91.19460),
-    "KUKI": (39.12600, -123.20100),
-    "KUNV": (40.84937, -77.84852),
-    "KUOX": (34.38430, -89.53680),
-    "KUTS": (30.74690, -95.58720),
-    "KUUU": (41.53221, -71.28104),
-    "KVAD": (30.96780, -83.19300),
-    "KVBG": (34.73730, -120.58400),
-    "KVCT": (28.85260, -96.91850),
-    "KVEL": (40.43621, -109.51166),
-    "KVGT": (36.20907, -115.19398),
-    "KVIS": (36.31870, -119.39300),
-    "KVLD": (30.78250, -83.27670),
-    "KVNY": (34.20980, -118.49000),
-    "KVOK": (43.93900, -90.25340),
-    "KVPS": (30.48131, -86.51584),
-    "KVPZ": (41.45400, -87.00710),
-    "KVQQ": (30.21870, -81.87670),
-    "KVRB": (27.65560, -80.41790),
-    "KVTN": (42.85621, -100.54919),
-    "KWJF": (34.74110, -118.21900),
-    "KWMC": (40.89660, -117.80600),
-    "KWRB": (32.64010, -83.59190),
-    "KWRI": (40.01560, -74.59170),
-    "KWRL": (43.96570, -107.95100),
-    "KWST": (41.34960, -71.80340),
-    "KWWD": (39.00850, -74.90830),
-    "KWWR": (36.43800, -99.52267),
-    "KWYS": (44.68840, -111.11800),
-    "KXMR": (28.46760, -80.56660),
-    "KXNA": (36.28190, -94.30680),
-    "KXTA": (37.23500, -115.81100),
-    "KXWA": (48.26086, -103.75116),
-    "KYIP": (42.23790, -83.53040),
-    "KYKM": (46.56820, -120.54400),
-    "KYKN": (42.91670, -97.38590),
-    "KYNG": (41.26070, -80.67910),
-    "KZZV": (39.94440, -81.89210),
-    "LAKU": (42.03580, 20.41596),
-    "LAKV": (40.77190, 19.90190),
-    "LATI": (41.41470, 19.72060),
-    "LBBG": (42.56992, 27.51517),
-    "LBGO": (43.15140, 25.71290),
-    "LBPD": (42.06780, 24.85080),
-    "LBPG": (42.29040, 24.71400),
-    "LBPL": (43.45177, 24.50242),
-    "LBSF": (42.69636, 23.41767),
-    "LBWB": (43.42380, 28.18130),
-    "LBWN": (43.23210, 27.82510),
-    "LCEN": (35.15306, 33.50735),
-    "LCGK": (35.23591, 33.72009),
-    "LCLK": (34.87510, 33.62490),
-    "LCPH": (34.71800, 32.48570),
-    "LCRA": (34.59040, 32.98790),
-    "LDDU": (42.56225, 18.26554),
-    "LDOS": (45.46236, 18.81128),
-    "LDPL": (44.89350, 13.92220),
-    "LDRI": (45.21638, 14.57085),
-    "LDSB": (43.28445, 16.67836),
-    "LDSP": (43.53890, 16.29800),
-    "LDZA": (45.74290, 16.06880),
-    "LDZD": (44.09699, 15.35356),
-    "LEAB": (38.94850, -1.86352),
-    "LEAL": (38.28220, -0.55816),
-    "LEAM": (36.84390, -2.37010),
-    "LEAS": (43.56360, -6.03462),
-    "LEBA": (37.84200, -4.84888),
-    "LEBB": (43.30110, -2.91061),
-    "LEBG": (42.35760, -3.62076),
-    "LEBL": (41.29710, 2.07846),
-    "LEBZ": (38.89130, -6.82133),
-    "LECH": (40.21389, 0.07333),
-    "LECO": (43.30210, -8.37726),
-    "LECU": (40.37070, -3.78514),
-    "LEDA": (41.72819, 0.53502),
-    "LEGA": (37.13320, -3.63569),
-    "LEGE": (41.90464, 2.76177),
-    "LEGR": (37.18870, -3.77736),
-    "LEGT": (40.29410, -3.72383),
-    "LEIB": (38.87290, 1.37312),
-    "LEJR": (36.74460, -6.06011),
-    "LELC": (37.77500, -0.81239),
-    "LELN": (42.59071, -5.65341),
-    "LELO": (42.46095, -2.32224),
-    "LEMD": (40.49341, -3.57225),
-    "LEMG": (36.67490, -4.49911),
-    "LEMH": (39.86260, 4.21865),
-    "LEMI": (37.80285, -1.12488),
-    "LEMO": (37.17490, -5.61594),
-    "LEPA": (39.55170, 2.73881),
-    "LEPP": (42.77000, -1.64633),
-    "LERI": (37.95110, -1.23032),
-    "LERL": (38.85648, -3.96994),
-    "LERS": (41.14751, 1.16835),
-    "LERT": (36.64520, -6.34946),
-    "LESA": (40.95210, -5.50199),
-    "LESO": (43.35650, -1.79061),
-    "LEST": (42.89630, -8.41514),
-    "LESU": (42.33860, 1.40917),
-    "LETL": (40.41027, -1.21737),
-    "LETO": (40.48788, -3.45681),
-    "LEVC": (39.48916, -0.48096),
-    "LEVD": (41.70610, -4.85194),
-    "LEVT": (42.88280, -2.72447),
-    "LEVX": (42.23180, -8.62677),
-    "LEXJ": (43.42710, -3.82001),
-    "LEZG": (41.66620, -1.04155),
-    "LEZL": (37.41800, -5.89311),
-    "LFAC": (50.96210, 1.95476),
-    "LFAG": (49.86887, 3.02957),
-    "LFAT": (50.51828, 1.62166),
-    "LFAV": (50.32782, 3.46106),
-    "LFAY": (49.87300, 2.38707),
-    "LFBA": (44.17417, 0.59309),
-    "LFBC": (44.53330, -1.12500),
-    "LFBD": (44.82865, -0.71536),
-    "LFBE": (44.82530, 0.51861),
-    "LFBF": (43.54560, 1.36750),
-    "LFBG": (45.65830, -0.31750),
-    "LFBH": (46.17920, -1.19528),
-    "LFBI": (46.58770, 0.30667),
-    "LFBK": (46.22260, 2.36396),
-    "LFBL": (45.86280, 1.17944),
-    "LFBM": (43.91170, -0.50750),
-    "LFBN": (46.31348, -0.39453),
-    "LFBO": (43.62910, 1.36382),
-    "LFBP": (43.38000, -0.41861),
-    "LFBT": (43.17870, -0.00644),
-    "LFBU": (45.72920, 0.22146),
-    "LFBX": (45.19810, 0.81556),
-    "LFBZ": (43.46837, -1.52322),
-    "LFCC": (44.35140, 1.47528),
-    "LFCG": (43.00780, 1.10315),
-    "LFCH": (44.59640, -1.11083),
-    "LFCI": (43.91390, 2.11306),
-    "LFCK": (43.55630, 2.28918),
-    "LFCR": (44.40790, 2.48267),
-    "LFCY": (45.62810, -0.97250),
-    "LFDH": (43.68361, 0.59975),
-    "LFDN": (45.88780, -0.98306),
-    "LFGA": (48.10990, 7.35901),
-    "LFGJ": (47.03896, 5.42759),
-    "LFGW": (49.12240, 5.46905),
-    "LFHO": (44.54437, 4.37219),
-    "LFJL": (48.98210, 6.25132),
-    "LFJR": (47.56030, -0.31222),
-    "LFKB": (42.55270, 9.48373),
-    "LFKC": (42.53042, 8.79298),
-    "LFKF": (41.50185, 9.09709),
-    "LFKJ": (41.92360, 8.80292),
-    "LFKS": (41.92440, 9.40600),
-    "LFLA": (47.85020, 3.49711),
-    "LFLB": (45.63810, 5.88023),
-    "LFLC": (45.78670, 3.16917),
-    "LFLD": (47.06016, 2.36963),
-    "LFLI": (46.19200, 6.26839),
-    "LFLL": (45.72600, 5.09014),
-    "LFLM": (46.29513, 4.79598),
-    "LFLN": (46.41402, 4.01418),
-    "LFLO": (46.05382, 3.99902),
-    "LFLP": (45.92895, 6.09870),
-    "LFLS": (45.36290, 5.32937),
-    "LFLU": (44.92160, 4.96990),
-    "LFLV": (46.16969, 3.40364),
-    "LFLW": (44.89140, 2.42194),
-    "LFLX": (46.86022, 1.72833),
-    "LFLY": (45.72795, 4.94399),
-    "LFMC": (43.38470, 6.38714),
-    "LFMD": (43.54800, 6.95518),
-    "LFMH": (45.54060, 4.29639),
-    "LFMI": (43.52270, 4.92384),
-    "LFMK": (43.21600, 2.30632),
-    "LFML": (43.43809, 5.21250),
-    "LFMN": (43.65840, 7.21587),
-    "LFMO": (44.14050, 4.86672),
-    "LFMP": (42.74040, 2.87067),
-    "LFMQ": (43.25250, 5.78519),
-    "LFMS": (44.06970, 4.14212),
-    "LFMT": (43.57620, 3.96301),
-    "LFMU": (43.32350, 3.35390),
-    "LFMV": (43.90730, 4.90183),
-    "LFMY": (43.60640, 5.10925),
-    "LFNB": (44.50210, 3.53282),
-    "LFOA": (47.05330, 2.63250),
-    "LFOB": (49.45440, 2.11278),
-    "LFOC": (48.05791, 1.37931),
-    "LFOE": (49.02870, 1.21986),
-    "LFOH": (49.53404, 0.08841),
-    "LFOI": (50.14350, 1.83189),
-    "LFOJ": (47.98780, 1.76056),
-    "LFOK": (48.77333, 4.20611),
-    "LFOP": (49.38489, 1.17914),
-    "LFOT": (47.43220, 0.72761),
-    "LFOV": (48.03221, -0.74400),
-    "LFPB": (48.96228, 2.43654),
-    "LFPC": (49.25350, 2.51914),
-    "LFPG": (49.00896, 2.55412),
-    "LFPM": (48.60470, 2.67112),
-    "LFPN": (48.75190, 2.10619),
-    "LFPO": (48.72950, 2.35896),
-    "LFPT": (49.09606, 2.03554),
-    "LFPV": (48.77441, 2.20310),
-    "LFQB": (48.32210, 4.01670),
-    "LFQE": (49.22690, 5.67222),
-    "LFQG": (47.00291, 3.11311),
-    "LFQP": (48.76620, 7.20055),
-    "LFQQ": (50.56656, 3.10243),
-    "LFQT": (50.61840, 2.64224),
-    "LFQV": (49.78390, 4.64708),
-    "LFQW": (47.63859, 6.20444),
-    "LFRB": (48.44790, -4.41854),
-    "LFRC": (49.65010, -1.47028),
-    "LFRD": (48.58770, -2.07996),
-    "LFRE": (47.28940, -2.34639),
-    "LFRF": (48.88310, -1.56417),
-    "LFRG": (49.36524, 0.15448),
-    "LFRH": (47.76060, -3.44000),
-    "LFRI": (46.70190, -1.37863),
-    "LFRJ": (48.53030, -4.15164),
-    "LFRK": (49.17678, -0.45488),
-    "LFRL": (48.28170, -4.44502),
-    "LFRM": (47.94860, 0.20170),
-    "LFRN": (48.06950, -1.73479),
-    "LFRO": (48.75440, -3.47166),
-    "LFRQ": (47.97303, -4.16965),
-    "LFRS": (47.15320, -1.61073),
-    "LFRT": (48.53863, -2.85352),
-    "LFRU": (48.60320, -3.81578),
-    "LFRV": (47.72330, -2.71856),
-    "LFRZ": (47.31142, -2.15263),
-    "LFSB": (47.60068, 7.52112),
-    "LFSD": (47.26890, 5.09000),
-    "LFSG": (48.32500, 6.06998),
-    "LFSI": (48.63600, 4.89942),
-    "LFSL": (45.03972, 1.48556),
-    "LFSM": (47.48700, 6.79054),
-    "LFSN": (48.69210, 6.23046),
-    "LFSO": (48.58310, 5.95500),
-    "LFST": (48.53830, 7.62823),
-    "LFSX": (47.78775, 6.35342),
-    "LFTH": (43.09730, 6.14603),
-    "LFTW": (43.75740, 4.41635),
-    "LFVP": (46.76265, -56.17499),
-    "LFXA": (45.98730, 5.32844),
-    "LGAD": (37.92070, 21.29260),
-    "LGAL": (40.85590, 25.95630),
-    "LGAV": (37.93640, 23.94450),
-    "LGBL": (39.21960, 22.79430),
-    "LGEL": (38.06380, 23.55600),
-    "LGHI": (38.34320, 26.14060),
-    "LGIO": (39.69640, 20.82250),
-    "LGIR": (35.33970, 25.18030),
-    "LGKF": (38.12010, 20.50050),
-    "LGKL": (37.06830, 22.02550),
-    "LGKO": (36.79452, 27.09115),
-    "LGKP": (35.42140, 27.14600),
-    "LGKR": (39.60145, 19.91218),
-    "LGKV": (40.91330, 24.61920),
-    "LGKZ": (40.28610, 21.84080),
-    "LGMK": (37.43510, 25.34810),
-    "LGMT": (39.05741, 26.59863),
-    "LGPZ": (38.92550, 20.76530),
-    "LGRP": (36.40540, 28.08620),
-    "LGRX": (38.15110, 21.42560),
-    "LGSA": (35.53121, 24.15067),
-    "LGSK": (39.17710, 23.50370),
-    "LGSM": (37.69000, 26.91170),
-    "LGSR": (36.40004, 25.47864),
-    "LGST": (35.21610, 26.10130),
-    "LGTG": (38.33980, 23.56500),
-    "LGTS": (40.51928, 22.97001),
-    "LGZA": (37.75090, 20.88430),
-    "LHBP": (47.43018, 19.26239),
-    "LHDC": (47.48947, 21.61628),
-    "LHKE": (46.91750, 19.74920),
-    "LHPP": (45.98889, 18.24204),
-    "LHPR": (47.62844, 17.80472),
-    "LHSM": (46.68639, 17.15908),
-    "LHSN": (47.12290, 20.23550),
-    "LHTA": (46.39310, 17.91750),
-    "LHTL": (47.34530, 18.98080),
-    "LIBA": (41.53844, 15.71718),
-    "LIBC": (38.99720, 17.08020),
-    "LIBD": (41.13890, 16.76060),
-    "LIBF": (41.43360, 15.53457),
-    "LIBG": (40.51750, 17.40320),
-    "LIBN": (40.23920, 18.13330),
-    "LIBP": (42.43108, 14.18298),
-    "LIBR": (40.65760, 17.94700),
-    "LIBV": (40.76780, 16.93330),
-    "LICA": (38.90621, 16.24601),
-    "LICB": (36.99583, 14.60889),
-    "LICC": (37.46680, 15.06640),
-    "LICD": (35.49790, 12.61810),
-    "LICG": (36.81650, 11.96890),
-    "LICJ": (38.17600, 13.09100),
-    "LICP": (38.11592, 13.31337),
-    "LICR": (38.07120, 15.65160),
-    "LICT": (37.91140, 12.48800),
-    "LICZ": (37.40170, 14.92240),
-    "LIDT": (46.02333, 11.12500),
-    "LIEA": (40.63210, 8.29077),
-    "LIED": (39.35420, 8.97248),
-    "LIEE": (39.25150, 9.05428),
-    "LIEO": (40.89895, 9.51846),
-    "LIET": (39.91880, 9.68298),
-    "LILE": (45.49530, 8.10278),
-    "LILN": (45.74220, 8.88823),
-    "LIMA": (45.08444, 7.60306),
-    "LIMC": (45.63060, 8.72811),
-    "LIME": (45.66936, 9.70885),
-    "LIMF": (45.20080, 7.64963),
-    "LIMG": (44.05060, 8.12743),
-    "LIMJ": (44.41204, 8.84073),
-    "LIML": (45.44510, 9.27674),
-    "LIMN": (45.52960, 8.66922),
-    "LIMP": (44.82635, 10.29705),
-    "LIMR": (44.78000, 8.78639),
-    "LIMS": (44.91442, 9.72232),
-    "LIMW": (45.73855, 7.36830),
-    "LIMZ": (44.54746, 7.62305),
-    "LIPA": (46.03190, 12.59650),
-    "LIPB": (46.45925, 11.32612),
-    "LIPC": (44.22420, 12.30720),
-    "LIPE": (44.53540, 11.28870),
-    "LIPH": (45.64840, 12.19440),
-    "LIPI": (45.97870, 13.04930),
-    "LIPK": (44.19480, 12.07010),
-    "LIPL": (45.43255, 10.26861),
-    "LIPO": (45.42890, 10.33060),
-    "LIPQ": (45.82750, 13.47220),
-    "LIPR": (44.02002, 12.61220),
-    "LIPS": (45.68436, 12.08711),
-    "LIPU": (45.39532, 11.84712),
-    "LIPX": (45.39496, 10.88730),
-    "LIPY": (43.61630, 13.36230),
-    "LIPZ": (45.50530, 12.35190),
-    "LIQS": (43.25630, 11.25500),
-    "LIQW": (44.08738, 9.98788),
-    "LIRA": (41.79877, 12.59533),
-    "LIRE": (41.65450, 12.44520),
-    "LIRF": (41.80453, 12.25200),
-    "LIRG": (41.99030, 12.74080),
-    "LIRI": (40.62040, 14.91130),
-    "LIRJ": (42.76087, 10.23981),
-    "LIRL": (41.54240, 12.90900),
-    "LIRM": (41.06080, 14.08190),
-    "LIRN": (40.88600, 14.29080),
-    "LIRP": (43.68390, 10.39270),
-    "LIRQ": (43.80856, 11.20282),
-    "LIRS": (42.75970, 11.07190),
-    "LIRU": (41.95210, 12.50223),
-    "LIRV": (42.43020, 12.06420),
-    "LIRZ": (43.09590, 12.51320),
-    "LJCE": (45.90000, 15.53020),
-    "LJLJ": (46.22370, 14.45760),
-    "LJMB": (46.47990, 15.68610),
-    "LJPZ": (45.47201, 13.61595),
-    "LKCS": (48.94817, 14.42832),
-    "LKCV": (49.93970, 15.38180),
-    "LKKB": (50.12140, 14.54360),
-    "LKKU": (49.02940, 17.43970),
-    "LKKV": (50.20300, 12.91500),
-    "LKLN": (49.67520, 13.27460),
-    "LKMT": (49.69630, 18.11110),
-    "LKNA": (49.16627, 16.12398),
-    "LKPD": (50.01505, 15.73981),
-    "LKPO": (49.42580, 17.40470),
-    "LKPR": (50.10087, 14.25991),
-    "LKTB": (49.15128, 16.69397),
-    "LKVO": (50.21660, 14.39580),
-    "LLBG": (32.01140, 34.88670),
-    "LLEK": (31.83950, 34.82180),
-    "LLER": (29.72701, 35.01412),
-    "LLHA": (32.81022, 35.04372),
-    "LLIB": (32.98100, 35.57190),
-    "LLMZ": (31.32820, 35.38860),
-    "LLNV": (31.20830, 35.01230),
-    "LLRD": (32.66510, 35.17950),
-    "LLRM": (30.77610, 34.66670),
-    "LMML": (35.84593, 14.49155),
-    "LOAN": (47.84330, 16.26010),
-    "LOWG": (46.99110, 15.43960),
-    "LOWI": (47.26020, 11.34400),
-    "LOWK": (46.64250, 14.33770),
-    "LOWL": (48.23536, 14.18813),
-    "LOWS": (47.79330, 13.00430),
-    "LOWW": (48.11030, 16.56970),
-    "LOXN": (47.83693, 16.22184),
-    "LOXZ": (47.20280, 14.74420),
-    "LPAR": (38.88330, -9.03010),
-    "LPAZ": (36.97140, -25.17060),
-    "LPBG": (41.85780, -6.70713),
-    "LPBJ": (38.07890, -7.93240),
-    "LPBR": (41.58700, -8.44519),
-    "LPCB": (39.84453, -7.43987),
-    "LPCO": (40.15876, -8.47081),
-    "LPCS": (38.72500, -9.35523),
-    "LPEV": (38.53350, -7.88964),
-    "LPFL": (39.45530, -31.13140),
-    "LPFR": (37.01591, -7.97094),
-    "LPGR": (39.09220, -28.02980),
-    "LPHR": (38.51990, -28.71590),
-    "LPLA": (38.76180, -27.09080),
-    "LPMA": (32.69781, -16.77461),
-    "LPMR": (39.82834, -8.88750),
-    "LPMT": (38.70929, -9.03368),
-    "LPOV": (40.91590, -8.64592),
-    "LPPD": (37.74120, -25.69790),
-    "LPPI": (38.55430, -28.44130),
-    "LPPM": (37.14930, -8.58396),
-    "LPPR": (41.24810, -8.68139),
-    "LPPS": (33.07340, -16.35000),
-    "LPPT": (38.78130, -9.13592),
-    "LPSJ": (38.66550, -28.17580),
-    "LPSO": (39.21155, -8.05779),
-    "LPST": (38.83110, -9.33955),
-    "LPTN": (39.47510, -8.36458),
-    "LPVL": (41.27729, -8.51621),
-    "LPVR": (41.27430, -7.72047),
-    "LPVZ": (40.72550, -7.88899),
-    "LQBK": (44.94140, 17.29750),
-    "LQMO": (43.28249, 17.84610),
-    "LQSA": (43.82460, 18.33150),
-    "LQTZ": (44.45986, 18.72363),
-    "LRAR": (46.17614, 21.26432),
-    "LRBC": (46.52190, 26.91030),
-    "LRBM": (47.65844, 23.46445),
-    "LRBS": (44.50313, 26.10294),
-    "LRBV": (45.70558, 25.52287),
-    "LRCK": (44.36220, 28.48830),
-    "LRCL": (46.78604, 23.68573),
-    "LRCS": (45.42014, 22.25251),
-    "LRCT": (46.50230, 23.88590),
-    "LRCV": (44.31810, 23.88860),
-    "LRIA": (47.17963, 27.62143),
-    "LROD": (47.02530, 21.90250),
-    "LROP": (44.57179, 26.10328),
-    "LRSB": (45.78584, 24.08667),
-    "LRSM": (47.70330, 22.88570),
-    "LRSV": (47.68750, 26.35410),
-    "LRTC": (45.06250, 28.71430),
-    "LRTM": (46.46770, 24.41250),
-    "LRTR": (45.80990, 21.33790),
-    "LSGC": (47.08390, 6.79284),
-    "LSGG": (46.23810, 6.10895),
-    "LSGS": (46.21917, 7.32694),
-    "LSMA": (46.94390, 8.28417),
-    "LSMD": (47.39860, 8.64823),
-    "LSME": (47.09244, 8.30518),
-    "LSMP": (46.84320, 6.91506),
-    "LSZA": (46.00430, 8.91058),
-    "LSZB": (46.91274, 7.49882),
-    "LSZG": (47.18160, 7.41719),
-    "LSZH": (47.45806, 8.54806),
-    "LSZR": (47.48500, 9.56077),
-    "LSZS": (46.53410, 9.88411),
-    "LTAC": (40.12810, 32.99510),
-    "LTAD": (39.94980, 32.68860),
-    "LTAE": (40.07890, 32.56560),
-    "LTAF": (36.98220, 35.28040),
-    "LTAG": (37.00210, 35.42590),
-    "LTAH": (38.72640, 30.60110),
-    "LTAI": (36.89870, 30.80050),
-    "LTAJ": (36.94720, 37.47870),
-    "LTAL": (41.31420, 33.79580),
-    "LTAN": (37.97900, 32.56190),
-    "LTAS": (41.50640, 32.08860),
-    "LTAT": (38.43530, 38.09100),
-    "LTAU": (38.77040, 35.49540),
-    "LTAV": (39.45150, 31.36530),
-    "LTAW": (40.32472, 36.39056),
-    "LTAY": (37.78560, 29.70130),
-    "LTAZ": (38.77190, 34.53450),
-    "LTBA": (40.97191, 28.82371),
-    "LTBF": (39.61930, 27.92600),
-    "LTBG": (40.31800, 27.97770),
-    "LTBH": (40.13770, 26.42680),
-    "LTBI": (39.78410, 30.58210),
-    "LTBJ": (38.29240, 27.15700),
-    "LTBL": (38.51300, 27.01010),
-    "LTBN": (39.42670, 30.01690),
-    "LTBO": (38.68150, 29.47170),
-    "LTBQ": (40.73500, 30.08330),
-    "LTBR": (40.25520, 29.56260),
-    "LTBS": (36.71310, 28.79250),
-    "LTBT": (38.80890, 27.83390),
-    "LTBU": (41.13820, 27.91910),
-    "LTBX": (40.99300, 29.21650),
-    "LTBY": (39.81164, 30.51927),
-    "LTCA": (38.59797, 39.28348),
-    "LTCB": (40.96687, 38.08599),
-    "LTCC": (37.89390, 40.20100),
-    "LTCD": (39.71020, 39.52700),
-    "LTCE": (39.95650, 41.17020),
-    "LTCF": (40.56220, 43.11500),
-    "LTCG": (40.99510, 39.78970),
-    "LTCI": (38.46820, 43.33230),
-    "LTCJ": (37.92900, 41.11660),
-    "LTCK": (38.74780, 41.66120),
-    "LTCL": (37.97890, 41.84040),
-    "LTCM": (42.01831, 35.07177),
-    "LTCN": (37.53883, 36.95352),
-    "LTCO": (39.65564, 43.02574),
-    "LTCP": (37.73140, 38.46890),
-    "LTCR": (37.22330, 40.63170),
-    "LTCS": (37.44566, 38.89559),
-    "LTCT": (39.97663, 43.87665),
-    "LTCV": (37.36470, 42.05820),
-    "LTCW": (37.54970, 44.23810),
-    "LTDA": (36.36079, 36.28559),
-    "LTDB": (36.89148, 35.07124),
-    "LTFC": (37.85540, 30.36840),
-    "LTFD": (39.55253, 27.01019),
-    "LTFE": (37.24931, 27.66401),
-    "LTFG": (36.29883, 32.29702),
-    "LTFH": (41.25399, 36.56755),
-    "LTFJ": (40.89860, 29.30920),
-    "LTFM": (41.27487, 28.73214),
-    "LTFO": (41.17977, 40.84880),
-    "LUBL": (47.83767, 27.78111),
-    "LUBM": (47.86270, 28.21280),
-    "LUCH": (45.84380, 28.26370),
-    "LUKK": (46.92774, 28.93170),
-    "LUTR": (46.86810, 29.59060),
-    "LWOH": (41.18000, 20.74230),
-    "LWSK": (41.95809, 21.62258),
-    "LXGB": (36.15168, -5.34978),
-    "LYBE": (44.81840, 20.30910),
-    "LYBT": (44.93530, 20.25750),
-    "LYKV": (43.81752, 20.58666),
-    "LYNI": (43.33654, 21.85624),
-    "LYPG": (42.35940, 19.25190),
-    "LYTV": (42.40470, 18.72330),
-    "LYUZ": (43.89890, 19.69770),
-    "LZIB": (48.17020, 17.21270),
-    "LZKZ": (48.66310, 21.24110),
-    "LZMC": (48.40200, 17.11840),
-    "LZPP": (48.62520, 17.82840),
-    "LZSL": (48.63780, 19.13410),
-    "LZTT": (49.07099, 20.24139),
-    "LZZI": (49.23329, 18.61339),
-    "MBGT": (21.44450, -71.14230),
-    "MBNC": (21.91609, -71.94295),
-    "MBPV": (21.77370, -72.26832),
-    "MBSC": (21.51570, -71.52850),
-    "MDBH": (18.25150, -71.12040),
-    "MDCR": (17.92900, -71.64480),
-    "MDCY": (19.26926, -69.73740),
-    "MDJB": (18.57250, -69.98560),
-    "MDLR": (18.45222, -68.91111),
-    "MDPC": (18.56709, -68.36456),
-    "MDPP": (19.75790, -70.57000),
-    "MDSD": (18.42970, -69.66890),
-    "MDSI": (18.50370, -69.76170),
-    "MDST": (19.40406, -70.60443),
-    "MGCB": (15.46900, -90.40670),
-    "MGGT": (14.58290, -90.52751),
-    "MGPB": (15.73090, -88.58380),
-    "MGRB": (15.99200, -90.44530),
-    "MGRT": (14.52143, -91.69700),
-    "MGSJ": (13.93620, -90.83580),
-    "MGTK": (16.91371, -89.86614),
-    "MHLC": (15.74250, -86.85300),
-    "MHLM": (15.45260, -87.92360),
-    "MHNJ": (16.44540, -85.90660),
-    "MHRO": (16.31680, -86.52300),
-    "MHSC": (14.38240, -87.62120),
-    "MHTE": (15.77590, -87.47580),
-    "MHTG": (14.06090, -87.21720),
-    "MHTJ": (15.92660, -85.93857),
-    "MKBS": (18.40408, -76.96975),
-    "MKJP": (17.93570, -76.78750),
-    "MKJS": (18.50342, -77.91323),
-    "MKKJ": (18.19880, -76.53450),
-    "MKTP": (17.98860, -76.82380),
-    "MMAA": (16.75713, -99.75311),
-    "MMAN": (25.86560, -100.23700),
-    "MMAS": (21.69959, -102.31837),
-    "MMBT": (15.77544, -96.26046),
-    "MMCB": (18.83392, -99.26182),
-    "MMCC": (29.33366, -101.10055),
-    "MMCE": (18.65152, -91.79936),
-    "MMCL": (24.76504, -107.47523),
-    "MMCM": (18.50499, -88.32802),
-    "MMCN": (27.39260, -109.83300),
-    "MMCP": (19.81597, -90.50012),
-    "MMCS": (31.63667, -106.42853),
-    "MMCU": (28.70265, -105.96376),
-    "MMCV": (23.70330, -98.95650),
-    "MMCY": (20.54600, -100.88654),
-    "MMCZ": (20.51492, -86.92854),
-    "MMDO": (24.12547, -104.52794),
-    "MMEP": (21.41983, -104.84247),
-    "MMES": (31.79452, -116.60238),
-    "MMGL": (20.52334, -103.31011),
-    "MMGM": (27.96900, -110.92500),
-    "MMHO": (29.09281, -111.05302),
-    "MMIA": (19.27700, -103.57700),
-    "MMIO": (25.53786, -100.92835),
-    "MMIT": (16.44596, -95.09371),
-    "MMJA": (19.47511, -96.79701),
-    "MMLC": (18.00167, -102.22032),
-    "MMLM": (25.68550, -109.08116),
-    "MMLO": (20.99270, -101.48028),
-    "MMLP": (24.07233, -110.36266),
-    "MMLT": (25.98955, -111.34841),
-    "MMMA": (25.76990, -97.52530),
-    "MMMD": (20.93049, -89.64546),
-    "MMML": (32.63063, -115.24281),
-    "MMMM": (19.84990, -101.02500),
-    "MMMT": (18.10340, -94.58070),
-    "MMMV": (26.95570, -101.47000),
-    "MMMX": (19.43582, -99.07033),
-    "MMMY": (25.77852, -100.10699),
-    "MMMZ": (23.16282, -106.26452),
-    "MMNG": (31.22576, -110.97693),
-    "MMNL": (27.44390, -99.57050),
-    "MMOX": (16.99877, -96.72609),
-    "MMPA": (20.60270, -97.46080),
-    "MMPB": (19.15846, -98.37158),
-    "MMPG": (28.62787, -100.53524),
-    "MMPN": (19.39670, -102.03900),
-    "MMPR": (20.67991, -105.25439),
-    "MMPS": (15.87681, -97.08910),
-    "MMQT": (20.61878, -100.18645),
-    "MMRX": (26.00890, -98.22850),
-    "MMSD": (23.15192, -109.72073),
-    "MMSL": (22.94907, -109.93948),
-    "MMSM": (19.74382, -99.01507),
-    "MMSP": (22.26203, -100.93569),
-    "MMTB": (16.73990, -93.17330),
-    "MMTC": (25.56227, -103.40461),
-    "MMTG": (16.56161, -93.02573),
-    "MMTJ": (32.54104, -116.96998),
-    "MMTL": (20.17210, -87.66027),
-    "MMTM": (22.29262, -97.86706),
-    "MMTO": (19.33690, -99.56583),
-    "MMTP": (14.79455, -92.36987),
-    "MMUN": (21.04082, -86.87347),
-    "MMVA": (17.99428, -92.81820),
-    "MMVR": (19.13959, -96.18860),
-    "MMZC": (22.89494, -102.68715),
-    "MMZH": (17.60177, -101.46063),
-    "MMZO": (19.14480, -104.55900),
-    "MNBL": (11.99100, -83.77410),
-    "MNMG": (12.14150, -86.16820),
-    "MNPC": (14.04720, -83.38670),
-    "MPBO": (9.34085, -82.25080),
-    "MPCE": (7.98784, -80.40984),
-    "MPCH": (9.45896, -82.51506),
-    "MPDA": (8.38898, -82.43642),
-    "MPEJ": (9.35664, -79.86740),
-    "MPMG": (8.97334, -79.55560),
-    "MPSA": (8.08560, -80.94530),
-    "MPTO": (9.07136, -79.38350),
-    "MRAN": (10.46931, -84.57907),
-    "MRAO": (10.42000, -83.60950),
-    "MRBA": (9.16395, -83.33017),
-    "MRBC": (10.76870, -83.58560),
-    "MRCC": (8.60156, -82.96875),
-    "MRGF": (8.65401, -83.18220),
-    "MRGP": (10.21720, -83.79700),
-    "MRLB": (10.59330, -85.54440),
-    "MRLC": (11.03530, -84.70610),
-    "MRLM": (9.95796, -83.02200),
-    "MRNS": (9.97649, -85.65300),
-    "MROC": (9.99386, -84.20880),
-    "MRPJ": (8.53333, -83.30000),
-    "MRPM": (8.95103, -83.46860),
-    "MRPV": (9.95705, -84.13980),
-    "MRQP": (9.44316, -84.12980),
-    "MRUP": (10.89220, -85.01620),
-    "MSLP": (13.44447, -89.05578),
-    "MSSS": (13.69950, -89.11990),
-    "MTCA": (18.27110, -73.78830),
-    "MTCH": (19.72555, -72.20071),
-    "MTJA": (18.24110, -72.51850),
-    "MTJE": (18.66310, -74.17030),
-    "MTPP": (18.58002, -72.29260),
-    "MTPX": (19.93405, -72.84801),
-    "MUBA": (20.36530, -74.50620),
-    "MUBY": (20.39640, -76.62140),
-    "MUCA": (22.02710, -78.78960),
-    "MUCC": (22.46100, -78.32840),
-    "MUCF": (22.15000, -80.41420),
-    "MUCL": (21.61650, -81.54600),
-    "MUCM": (21.41991, -77.84804),
-    "MUCU": (19.97474, -75.83550),
-    "MUGM": (19.90650, -75.20710),
-    "MUGT": (20.08530, -75.15830),
-    "MUHA": (22.98920, -82.40910),
-    "MUHG": (20.78515, -76.31553),
-    "MUKW": (23.12400, -81.30160),
-    "MUMO": (20.65390, -74.92220),
-    "MUMZ": (20.28861, -77.08755),
-    "MUNB": (22.75651, -81.92074),
-    "MUNG": (21.83470, -82.78380),
-    "MUPB": (23.03280, -82.57940),
-    "MUSC": (22.49222, -79.94312),
-    "MUSJ": (22.10053, -84.15738),
-    "MUSN": (21.64250, -82.95510),
-    "MUTD": (21.78830, -79.99720),
-    "MUVR": (23.03440, -81.43530),
-    "MUVT": (20.98760, -76.93580),
-    "MWCB": (19.68700, -79.88280),
-    "MWCL": (19.66016, -80.08883),
-    "MWCR": (19.29280, -81.35770),
-    "MYAB": (24.28770, -77.68460),
-    "MYAF": (24.69790, -77.79560),
-    "MYAK": (24.15870, -77.58980),
-    "MYAM": (26.51071, -77.08426),
-    "MYAN": (25.05380, -78.04900),
-    "MYAP": (22.44180, -73.97090),
-    "MYAT": (26.74530, -77.39130),
-    "MYBC": (25.41710, -77.88090),
-    "MYBG": (25.73830, -77.84010),
-    "MYBS": (25.69990, -79.26470),
-    "MYCA": (24.62940, -75.67380),
-    "MYCB": (24.31530, -75.45230),
-    "MYCI": (22.74560, -74.18240),
-    "MYEF": (23.56260, -75.87800),
-    "MYEH": (25.47582, -76.68078),
-    "MYEM": (25.28470, -76.33100),
-    "MYEN": (24.59430, -76.82020),
-    "MYER": (24.89165, -76.17760),
-    "MYES": (24.16910, -76.43910),
-    "MYGF": (26.55800, -78.69558),
-    "MYIG": (20.97500, -73.66690),
-    "MYLD": (23.17900, -75.09360),
-    "MYLR": (23.00993, -74.90485),
-    "MYLS": (23.58232, -75.26862),
-    "MYMM": (22.37950, -73.01349),
-    "MYNN": (25.03900, -77.46620),
-    "MYRD": (22.18180, -75.72950),
-    "MYSM": (24.06304, -74.52323),
-    "MZBZ": (17.53995, -88.30356),
-    "MZPL": (16.53696, -88.36151),
-    "NCRG": (-21.20270, -159.80600),
-    "NFFN": (-17.76182, 177.43784),
-    "NFNA": (-18.04423, 178.56149),
-    "NFNL": (-16.46670, 179.34000),
-    "NFTF": (-21.24144, -175.14916),
-    "NFTL": (-19.77700, -174.34100),
-    "NFTV": (-18.58530, -173.96201),
-    "NGFU": (-8.52388, 179.19698),
-    "NGTA": (1.38164, 173.14700),
-    "NGTE": (-1.22447, 174.77600),
-    "NIUE": (-19.08011, -169.92349),
-    "NLWW": (-13.23944, -176.19865),
-    "NSFA": (-13.83000, -172.00800),
-    "NSTU": (-14.33100, -170.71001),
-    "NTAA": (-17.55347, -149.60694),
-    "NTAR": (-22.43410, -151.36099),
-    "NTAT": (-23.36540, -149.52400),
-    "NTGA": (-17.35260, -145.51000),
-    "NTGB": (-15.82004, -140.88807),
-    "NTGC": (-15.11960, -148.23100),
-    "NTGE": (-18.46652, -136.43855),
-    "NTGF": (-16.05410, -145.65700),
-    "NTGI": (-14.43680, -146.07001),
-    "NTGJ": (-23.07990, -134.89000),
-    "NTGK": (-15.66330, -146.88500),
-    "NTGM": (-16.58390, -143.65801),
-    "NTGT": (-14.70950, -145.24600),
-    "NTGU": (-15.24830, -146.61700),
-    "NTGV": (-14.86810, -148.71700),
-    "NTHE": (-14.42810, -146.25700),
-    "NTKR": (-14.45580, -145.02499),
-    "NTMD": (-8.79560, -140.22900),
-    "NTMN": (-9.76879, -139.01100),
-    "NTTB": (-16.44440, -151.75101),
-    "NTTG": (-14.95430, -147.66100),
-    "NTTH": (-16.68708, -151.02159),
-    "NTTM": (-17.48979, -149.76178),
-    "NTTO": (-18.07480, -140.94600),
-    "NTTP": (-16.42650, -152.24400),
-    "NTTR": (-16.72290, -151.46600),
-    "NVSQ": (-14.21810, 167.58701),
-    "NVSS": (-15.50500, 167.22000),
-    "NVVV": (-17.69930, 168.32001),
-    "NVVW": (-19.45510, 169.22400),
-    "NWWA": (-21.09641, 167.80379),
-    "NWWD": (-21.05355, 164.83877),
-    "NWWE": (-22.58890, 167.45599),
-    "NWWL": (-20.77456, 167.23933),
-    "NWWM": (-22.25771, 166.47282),
-    "NWWR": (-21.48244, 168.03847),
-    "NWWU": (-20.79013, 165.25952),
-    "NWWV": (-20.64093, 166.57302),
-    "NWWW": (-22.01460, 166.21300),
-    "NZAA": (-37.01199, 174.78633),
-    "NZAP": (-38.73970, 176.08400),
-    "NZAR": (-37.02970, 174.97301),
-    "NZCH": (-43.48903, 172.53206),
-    "NZCI": (-43.81189, -176.46514),
-    "NZDN": (-45.92902, 170.19776),
-    "NZGS": (-38.66330, 177.97800),
-    "NZGT": (-43.90670, 170.12801),
-    "NZHK": (-42.71360, 170.98500),
-    "NZHN": (-37.86696, 175.33195),
-    "NZKK": (-35.25915, 173.91332),
-    "NZKT": (-35.06984, 173.28705),
-    "NZLX": (-45.21050, 169.37111),
-    "NZMC": (-43.76500, 170.13300),
-    "NZMO": (-45.53310, 167.64999),
-    "NZMS": (-40.97463, 175.63454),
-    "NZNP": (-39.00860, 174.17900),
-    "NZNR": (-39.46580, 176.86999),
-    "NZNS": (-41.29830, 173.22099),
-    "NZNV": (-46.41240, 168.31300),
-    "NZOH": (-40.20600, 175.38800),
-    "NZOU": (-44.97000, 171.08200),
-    "NZPM": (-40.32060, 175.61700),
-    "NZPP": (-40.90470, 174.98900),
-    "NZQN": (-45.01920, 168.74638),
-    "NZRO": (-38.10920, 176.31700),
-    "NZSP": (-90.00000, -1.00000),
-    "NZTG": (-37.67190, 176.19600),
-    "NZTU": (-44.30280, 171.22501),
-    "NZUK": (-44.23500, 170.11800),
-    "NZWB": (-41.51830, 173.87000),
-    "NZWD": (-77.86740, 167.05701),
-    "NZWF": (-44.72209, 169.24629),
-    "NZWK": (-37.92222, 176.91696),
-    "NZWN": (-41.32684, 174.80686),
-    "NZWO": (-39.01186, 177.40440),
-    "NZWP": (-36.78780, 174.63001),
-    "NZWR": (-35.76925, 174.36371),
-    "NZWS": (-41.73711, 171.57903),
-    "NZWU": (-39.96347, 175.02444),
-    "OAHR": (34.21000, 62.22830),
-    "OAIX": (34.94610, 69.26500),
-    "OAJL": (34.39980, 70.49860),
-    "OAKB": (34.56590, 69.21230),
-    "OAKN": (31.50577, 65.84796),
-    "OAKS": (33.28460, 69.80734),
-    "OAMN": (35.93080, 64.76090),
-    "OAMS": (36.70412, 67.21046),
-    "OAUZ": (36.66510, 68.91080),
-    "OBBI": (26.26730, 50.63764),
-    "OBBS": (25.91840, 50.59060),
-    "OEAB": (18.24040, 42.65660),
-    "OEAH": (25.28530, 49.48520),
-    "OEAO": (26.48363, 38.11705),
-    "OEBA": (20.29851, 41.63615),
-    "OEBH": (19.98440, 42.62090),
-    "OEDF": (26.46910, 49.79821),
-    "OEDM": (24.44990, 44.12120),
-    "OEDR": (26.26540, 50.15200),
-    "OEGN": (16.90110, 42.58580),
-    "OEGS": (26.30280, 43.77440),
-    "OEGT": (31.41241, 37.27890),
-    "OEHL": (27.43790, 41.68630),
-    "OEJB": (27.03900, 49.40510),
-    "OEJF": (21.34810, 39.17300),
-    "OEJN": (21.68024, 39.15744),
-    "OEKK": (27.90090, 45.52820),
-    "OEKM": (18.29730, 42.80350),
-    "OEMA": (24.55340, 39.70510),
-    "OENG": (17.61140, 44.41920),
-    "OENN": (27.92426, 35.29358),
-    "OEPA": (28.33573, 46.12711),
-    "OEPS": (24.06270, 47.58050),
-    "OERF": (29.62640, 43.49060),
-    "OERK": (24.95760, 46.69880),
-    "OERM": (28.07960, 48.61100),
-    "OERR": (30.90660, 41.13820),
-    "OERT": (26.72310, 50.03080),
-    "OESH": (17.46690, 47.12140),
-    "OESK": (29.78330, 40.10090),
-    "OETB": (28.37110, 36.62486),
-    "OETF": (21.48474, 40.54407),
-    "OETN": (27.86780, 48.76910),
-    "OETR": (31.69219, 38.73154),
-    "OEWD": (20.50430, 45.19960),
-    "OEWJ": (26.19860, 36.47640),
-    "OEYN": (24.14420, 38.06340),
-    "OIAA": (30.36789, 48.23007),
-    "OIAD": (32.43440, 48.39760),
-    "OIAG": (30.74440, 49.67720),
-    "OIAH": (30.33387, 50.83380),
-    "OIAI": (32.00172, 49.26860),
-    "OIAM": (30.55620, 49.15190),
-    "OIAW": (31.33640, 48.76379),
-    "OIBA": (25.87570, 55.03300),
-    "OIBB": (28.94480, 50.83460),
-    "OIBJ": (27.82050, 52.35220),
-    "OIBK": (26.52543, 53.98046),
-    "OIBL": (26.53228, 54.82484),
-    "OIBP": (27.37960, 52.73770),
-    "OIBQ": (29.26050, 50.32219),
-    "OIBS": (25.90890, 54.53940),
-    "OIBV": (26.81074, 53.35430),
-    "OICC": (34.34590, 47.15810),
-    "OICI": (33.58660, 46.40480),
-    "OICK": (33.43540, 48.28290),
-    "OICS": (35.24590, 47.00920),
-    "OIFK": (33.89530, 51.57700),
-    "OIFM": (32.75514, 51.88388),
-    "OIFP": (32.62110, 51.69700),
-    "OIFS": (32.29720, 50.84220),
-    "OIGG": (37.32333, 49.61778),
-    "OIHH": (34.86642, 48.56069),
-    "OIHS": (35.21160, 48.65340),
-    "OIIE": (35.41610, 51.15220),
-    "OIII": (35.68917, 51.31439),
-    "OIIK": (36.24010, 50.04710),
-    "OIIP": (35.77610, 50.82670),
-    "OIKB": (27.21830, 56.37780),
-    "OIKJ": (28.72352, 57.67504),
-    "OIKK": (30.27128, 56.94969),
-    "OIKM": (29.08420, 58.45000),
-    "OIKQ": (26.75464, 55.90235),
-    "OIKR": (30.29835, 56.04898),
-    "OIKY": (29.55090, 55.67270),
-    "OIMB": (32.89652, 59.28126),
-    "OIMC": (36.50120, 61.06490),
-    "OIMM": (36.23482, 59.64295),
-    "OIMN": (37.49300, 57.30820),
-    "OIMS": (36.16810, 57.59520),
-    "OIMT": (33.66780, 56.89270),
-    "OING": (36.90940, 54.40130),
-    "OINN": (36.66429, 51.46273),
-    "OINR": (36.90701, 50.68732),
-    "OINZ": (36.64441, 53.18876),
-    "OISF": (28.89180, 53.72330),
-    "OISL": (27.67470, 54.38330),
-    "OISR": (27.37270, 53.18880),
-    "OISS": (29.53920, 52.58980),
-    "OISY": (30.70224, 51.54299),
-    "OITL": (38.32570, 48.42440),
-    "OITR": (37.66810, 45.06870),
-    "OITT": (38.13390, 46.23500),
-    "OITU": (39.19129, 44.92851),
-    "OITZ": (36.77370, 48.35940),
-    "OIYY": (31.90490, 54.27650),
-    "OIZB": (31.09830, 61.54390),
-    "OIZC": (25.44319, 60.38217),
-    "OIZH": (29.47570, 60.90620),
-    "OIZI": (27.23610, 60.72000),
-    "OJAI": (31.72260, 35.99320),
-    "OJAM": (31.97270, 35.99160),
-    "OJAQ": (29.61160, 35.01810),
-    "OJMS": (31.82560, 36.78200),
-    "OKAJ": (28.93480, 47.79190),
-    "OKAS": (29.34690, 47.52012),
-    "OKKK": (29.22449, 47.96981),
-    "OLBA": (33.81983, 35.48744),
-    "OLKA": (34.58930, 36.01130),
-    "OLRA": (33.85080, 35.98770),
-    "OMAA": (24.44097, 54.64924),
-    "OMAD": (24.42706, 54.45987),
-    "OMAL": (24.26170, 55.60920),
-    "OMAM": (24.24820, 54.54770),
-    "OMBY": (24.28361, 52.58028),
-    "OMDB": (25.24979, 55.37099),
-    "OMDM": (25.02680, 55.36620),
-    "OMDW": (24.89617, 55.16235),
-    "OMFJ": (25.10841, 56.32806),
-    "OMRK": (25.61350, 55.93880),
-    "OMSJ": (25.32860, 55.51720),
-    "OOKB": (26.17100, 56.24060),
-    "OOMA": (20.67540, 58.89050),
-    "OOMS": (23.60022, 58.28527),
-    "OOSA": (17.03870, 54.09130),
-    "OOSH": (24.38604, 56.62541),
-    "OOTH": (17.66600, 54.02460),
-    "OPBW": (29.34810, 71.71800),
-    "OPCH": (35.88621, 71.79992),
-    "OPDG": (29.96100, 70.48590),
-    "OPDI": (31.90940, 70.89660),
-    "OPFA": (31.36492, 72.99532),
-    "OPGD": (25.29673, 62.49882),
-    "OPGT": (35.91880, 74.33360),
-    "OPIS": (33.54900, 72.82566),
-    "OPJA": (28.28420, 68.44970),
-    "OPKC": (24.90650, 67.16080),
-    "OPLA": (31.52160, 74.40360),
-    "OPMA": (33.05010, 73.63840),
-    "OPMI": (32.56310, 71.57070),
-    "OPMJ": (27.33520, 68.14310),
-    "OPMR": (24.89360, 66.93880),
-    "OPMS": (33.86910, 72.40090),
-    "OPMT": (30.20320, 71.41910),
-    "OPNH": (26.21940, 68.39010),
-    "OPPG": (26.95450, 64.13250),
-    "OPPI": (25.29050, 63.34510),
-    "OPPS": (33.99390, 71.51460),
-    "OPQT": (30.25140, 66.93780),
-    "OPRK": (28.38390, 70.27960),
-    "OPRN": (33.61670, 73.09920),
-    "OPRQ": (30.75810, 72.28250),
-    "OPRS": (34.08110, 71.97260),
-    "OPRT": (33.84970, 73.79810),
-    "OPSD": (35.33866, 75.53865),
-    "OPSF": (24.87420, 67.11850),
-    "OPSK": (27.72200, 68.79170),
-    "OPSN": (26.47310, 67.71720),
-    "OPSR": (32.04860, 72.66500),
-    "OPSS": (34.81360, 72.35280),
-    "OPST": (32.53594, 74.36462),
-    "OPSU": (28.64510, 69.17690),
-    "OPTU": (25.98477, 63.02886),
-    "OPZB": (31.35840, 69.46360),
-    "ORAA": (33.78560, 42.44120),
-    "ORAT": (33.33810, 43.59710),
-    "ORBD": (33.94020, 44.36160),
-    "ORBI": (33.26250, 44.23460),
-    "ORBM": (36.30580, 43.14740),
-    "ORER": (36.23605, 43.94662),
-    "ORKK": (35.46950, 44.34890),
-    "ORMM": (30.54910, 47.66210),
-    "ORNI": (31.99112, 44.40502),
-    "ORQW": (35.76720, 43.12510),
-    "ORSH": (34.67320, 43.54300),
-    "ORSU": (35.56175, 45.31674),
-    "ORTF": (36.28310, 42.40300),
-    "ORTI": (33.52390, 44.25670),
-    "ORTL": (30.93580, 46.09010),
-    "ORUB": (32.48200, 45.75710),
-    "OSAP": (36.18126, 37.22687),
-    "OSDI": (33.41150, 36.51560),
-    "OSDZ": (35.28540, 40.17600),
-    "OSKL": (37.02060, 41.19140),
-    "OSLK": (35.40110, 35.94870),
-    "OSPR": (34.55740, 38.31690),
-    "OTBD": (25.25943, 51.56553),
-    "OTBH": (25.11730, 51.31500),
-    "OTHH": (25.27306, 51.60806),
-    "OYAA": (12.82956, 45.02998),
-    "OYAT": (14.55130, 46.82620),
-    "OYGD": (16.19334, 52.17419),
-    "OYHD": (14.75204, 42.97597),
-    "OYRN": (14.66224, 49.37529),
-    "OYSN": (15.47630, 44.21970),
-    "OYSQ": (12.63209, 53.90617),
-    "OYSY": (15.96589, 48.78815),
-    "OYTZ": (13.68600, 44.13910),
-    "PAAQ": (61.59490, -149.08901),
-    "PABA": (70.13400, -143.58200),
-    "PABE": (60.77980, -161.83800),
-    "PABI": (63.99450, -145.72200),
-    "PABR": (71.28540, -156.76601),
-    "PABV": (61.41650, -149.50700),
-    "PACD": (55.20787, -162.72503),
-    "PACL": (64.29974, -149.11743),
-    "PACV": (60.49180, -145.47800),
-    "PACZ": (61.78030, -166.03900),
-    "PADE": (66.06890, -162.76691),
-    "PADK": (51.88356, -176.64278),
-    "PADL": (59.04470, -158.50500),
-    "PADQ": (57.75000, -152.49400),
-    "PADU": (53.89881, -166.54500),
-    "PAED": (61.25171, -149.80710),
-    "PAEH": (58.64640, -162.06300),
-    "PAEI": (64.66570, -147.10200),
-    "PAEM": (62.78610, -164.49100),
-    "PAEN": (60.57095, -151.24517),
-    "PAFA": (64.81510, -147.85600),
-    "PAFB": (64.83750, -147.61400),
-    "PAFE": (56.96131, -133.91020),
-    "PAFM": (67.10553, -157.85534),
-    "PAGA": (64.73620, -156.93700),
-    "PAGK": (62.15586, -145.45466),
-    "PAGM": (63.76769, -171.73330),
-    "PAGS": (58.42530, -135.70700),
-    "PAHC": (62.18830, -159.77499),
-    "PAHL": (65.69790, -156.35100),
-    "PAHN": (59.24392, -135.52392),
-    "PAHO": (59.64446, -151.47923),
-    "PAII": (58.18439, -157.37487),
-    "PAIK": (66.97613, -160.43901),
-    "PAIL": (59.75440, -154.91100),
-    "PAIM": (65.99280, -153.70399),
-    "PAJN": (58.35493, -134.57442),
-    "PAKN": (58.67784, -156.65196),
-    "PAKP": (68.13360, -151.74300),
-    "PAKT": (55.35560, -131.71400),
-    "PAKW": (55.57920, -133.07600),
-    "PALU": (68.87510, -166.11000),
-    "PAMC": (62.95290, -155.60600),
-    "PAMR": (61.21279, -149.84399),
-    "PAMY": (60.37234, -166.26975),
-    "PANC": (61.17900, -149.99256),
-    "PANI": (61.58160, -159.54300),
-    "PANN": (64.54877, -149.07452),
-    "PANT": (55.03766, -131.57261),
-    "PANV": (62.64670, -160.19099),
-    "PAOM": (64.51220, -165.44501),
-    "PAOR": (62.96130, -141.92900),
-    "PAOT": (66.88470, -162.59900),
-    "PAPB": (56.57735, -169.66382),
-    "PAPC": (65.25370, -166.85899),
-    "PAPG": (56.80170, -132.94501),
-    "PAPH": (56.95789, -158.63022),
-    "PAPM": (59.01767, -161.82793),
-    "PAQT": (70.21000, -151.00600),
-    "PARC": (68.11470, -145.57899),
-    "PARY": (64.72720, -155.47000),
-    "PASA": (63.68640, -170.49300),
-    "PASC": (70.19470, -148.46500),
-    "PASD": (55.31391, -160.52210),
-    "PASI": (57.04710, -135.36200),
-    "PASN": (57.16631, -170.22255),
-    "PASV": (61.09740, -155.57401),
-    "PASX": (60.47494, -151.03847),
-    "PASY": (52.71230, 174.11400),
-    "PATK": (62.32050, -150.09399),
-    "PATL": (62.89440, -155.97701),
-    "PATQ": (70.46704, -157.43601),
-    "PAUN": (63.88840, -160.79900),
-    "PAVD": (61.13271, -146.24657),
-    "PAWD": (60.13048, -149.41861),
-    "PAWG": (56.48430, -132.37000),
-    "PAWI": (70.63800, -159.99499),
-    "PAWS": (61.57170, -149.53999),
-    "PAYA": (59.50872, -139.66044),
-    "PCIS": (-2.76812, -171.71001),
-    "PFYU": (66.57165, -145.24999),
-    "PGRO": (14.17327, 145.24110),
-    "PGSN": (15.11938, 145.72885),
-    "PGUA": (13.58400, 144.93000),
-    "PGUM": (13.48500, 144.79728),
-    "PGWT": (15.00045, 145.61897),
-    "PHBK": (22.02280, -159.78500),
-    "PHHN": (20.79560, -156.01401),
-    "PHIK": (21.33528, -157.94833),
-    "PHJH": (20.96290, -156.67300),
-    "PHJR": (21.30740, -158.07001),
-    "PHKO": (19.73878, -156.04560),
-    "PHLI": (21.97439, -159.33715),
-    "PHMK": (21.15290, -157.09599),
-    "PHMU": (20.00130, -155.66800),
-    "PHNG": (21.45050, -157.76800),
-    "PHNL": (21.31839, -157.92567),
-    "PHNY": (20.78568, -156.95132),
-    "PHOG": (20.89626, -156.43184),
-    "PHTO": (19.72135, -155.04543),
-    "PKMJ": (7.06511, 171.27166),
-    "PKWA": (8.72012, 167.73199),
-    "PLCH": (1.98628, -157.35001),
-    "PMDY": (28.20170, -177.38100),
-    "PPIZ": (69.73290, -163.00501),
-    "PTKK": (7.46187, 151.84300),
-    "PTPN": (6.98508, 158.20992),
-    "PTRO": (7.36697, 134.54408),
-    "PTSA": (5.35698, 162.95799),
-    "PTYA": (9.49891, 138.08299),
-    "PWAK": (19.28244, 166.63664),
-    "RCAY": (22.78250, 120.26300),
-    "RCBS": (24.42790, 118.35900),
-    "RCDC": (22.67240, 120.46200),
-    "RCDI": (24.85359, 121.23639),
-    "RCFG": (26.15966, 119.95838),
-    "RCFN": (22.75500, 121.10200),
-    "RCKH": (22.57710, 120.35000),
-    "RCKU": (23.46258, 120.39054),
-    "RCKW": (22.04110, 120.73000),
-    "RCLY": (22.02700, 121.53500),
-    "RCMQ": (24.26470, 120.62100),
-    "RCMT": (26.22420, 120.00300),
-    "RCNN": (22.95040, 120.20600),
-    "RCPO": (24.81800, 120.93900),
-    "RCQC": (23.56870, 119.62800),
-    "RCQS": (22.79310, 121.18200),
-    "RCSQ": (22.70020, 120.48200),
-    "RCSS": (25.06724, 121.55282),
-    "RCTP": (25.07770, 121.23300),
-    "RCYU": (24.02316, 121.61799),
-    "RJAA": (35.76858, 140.38871),
-    "RJAF": (36.16680, 137.92300),
-    "RJAH": (36.18146, 140.41443),
-    "RJAW": (24.78415, 141.32261),
-    "RJBB": (34.42730, 135.24400),
-    "RJBD": (33.66220, 135.36400),
-    "RJBE": (34.63280, 135.22400),
-    "RJBT": (35.51280, 134.78700),
-    "RJCB": (42.73330, 143.21700),
-    "RJCC": (42.77475, 141.69041),
-    "RJCH": (41.77000, 140.82201),
-    "RJCJ": (42.79450, 141.66600),
-    "RJCK": (43.04100, 144.19299),
-    "RJCM": (43.88060, 144.16400),
-    "RJCN": (43.57750, 144.96001),
-    "RJCO": (43.11745, 141.38134),
-    "RJCS": (43.42515, 144.74135),
-    "RJCT": (42.89050, 143.15801),
-    "RJCW": (45.40420, 141.80099),
-    "RJDA": (32.48250, 130.15900),
-    "RJDB": (33.74900, 129.78500),
-    "RJDC": (33.93000, 131.27901),
-    "RJDT": (34.28490, 129.33099),
-    "RJEB": (44.30390, 143.40401),
-    "RJEC": (43.67080, 142.44701),
-    "RJEO": (42.07170, 139.43300),
-    "RJER": (45.24200, 141.18600),
-    "RJFA": (33.88310, 130.65300),
-    "RJFC": (30.38560, 130.65900),
-    "RJFE": (32.66630, 128.83299),
-    "RJFF": (33.58590, 130.45100),
-    "RJFG": (30.60510, 130.99100),
-    "RJFK": (31.80340, 130.71899),
-    "RJFM": (31.87720, 131.44900),
-    "RJFO": (33.47940, 131.73700),
-    "RJFR": (33.84590, 131.03500),
-    "RJFS": (33.14970, 130.30200),
-    "RJFT": (32.83730, 130.85500),
-    "RJFU": (32.91690, 129.91400),
-    "RJFY": (31.36672, 130.83881),
-    "RJFZ": (33.68500, 131.03999),
-    "RJGG": (34.85840, 136.80499),
-    "RJKA": (28.43060, 129.71300),
-    "RJKB": (27.43160, 128.70556),
-    "RJKI": (28.32130, 129.92799),
-    "RJKN": (27.83638, 128.88136),
-    "RJNA": (35.25576, 136.92409),
-    "RJNF": (36.14280, 136.22400),
-    "RJNG": (35.39410, 136.86999),
-    "RJNH": (34.75020, 137.70300),
-    "RJNK": (36.39341, 136.40689),
-    "RJNO": (36.17839, 133.32357),
-    "RJNS": (34.79502, 138.19098),
-    "RJNT": (36.64842, 137.18736),
-    "RJNW": (37.29310, 136.96201),
-    "RJNY": (34.81280, 138.29800),
-    "RJOA": (34.43610, 132.91901),
-    "RJOB": (34.75690, 133.85500),
-    "RJOC": (35.41360, 132.89000),
-    "RJOF": (34.03475, 131.54872),
-    "RJOH": (35.49220, 133.23599),
-    "RJOI": (34.14633, 132.24724),
-    "RJOK": (33.54522, 133.67017),
-    "RJOM": (33.82689, 132.70011),
-    "RJOO": (34.78085, 135.44083),
-    "RJOR": (35.53006, 134.16502),
-    "RJOS": (34.13256, 134.60782),
-    "RJOT": (34.21496, 134.01545),
-    "RJOW": (34.67640, 131.78999),
-    "RJOY": (34.59630, 135.60300),
-    "RJSA": (40.73378, 140.68948),
-    "RJSC": (38.41190, 140.37100),
-    "RJSD": (38.06020, 138.41400),
-    "RJSF": (37.22740, 140.43100),
-    "RJSH": (40.55118, 141.46543),
-    "RJSI": (39.42860, 141.13500),
-    "RJSK": (39.61560, 140.21899),
-    "RJSM": (40.70320, 141.36800),
-    "RJSN": (37.95417, 139.11219),
-    "RJSR": (40.19190, 140.37100),
-    "RJSS": (38.13970, 140.91701),
-    "RJST": (38.40490, 141.22000),
-    "RJSY": (38.81220, 139.78700),
-    "RJTA": (35.45460, 139.45000),
-    "RJTE": (34.98710, 139.82899),
-    "RJTF": (35.67170, 139.52800),
-    "RJTH": (33.11484, 139.78564),
-    "RJTJ": (35.84190, 139.41100),
-    "RJTK": (35.39830, 139.91000),
-    "RJTL": (35.79890, 140.01100),
-    "RJTO": (34.78200, 139.36000),
-    "RJTQ": (34.07360, 139.56000),
-    "RJTT": (35.54968, 139.78696),
-    "RJTU": (36.51450, 139.87101),
-    "RJTY": (35.74850, 139.34801),
-    "RKJB": (34.99141, 126.38281),
-    "RKJJ": (35.12317, 126.80544),
-    "RKJK": (35.90380, 126.61600),
-    "RKJY": (34.84230, 127.61700),
-    "RKNN": (37.75360, 128.94392),
-    "RKNW": (37.43711, 127.96005),
-    "RKNY": (38.06048, 128.66982),
-    "RKPC": (33.51206, 126.49255),
-    "RKPD": (33.39960, 126.71200),
-    "RKPK": (35.17950, 128.93800),
-    "RKPS": (35.08859, 128.07175),
-    "RKPU": (35.59350, 129.35201),
-    "RKSG": (36.96236, 127.03113),
-    "RKSI": (37.46910, 126.45100),
-    "RKSM": (37.44474, 127.11272),
-    "RKSO": (37.09146, 127.02945),
-    "RKSS": (37.55830, 126.79100),
-    "RKSW": (37.23940, 127.00700),
-    "RKTH": (35.98795, 129.42038),
-    "RKTI": (37.03024, 127.88635),
-    "RKTN": (35.89439, 128.65699),
-    "RKTU": (36.71556, 127.50029),
-    "RKTY": (36.63037, 128.34971),
-    "ROAH": (26.19244, 127.63980),
-    "RODN": (26.35167, 127.76944),
-    "ROIG": (24.39639, 124.24500),
-    "ROKJ": (26.36344, 126.71384),
-    "ROMD": (25.84650, 131.26300),
-    "ROMY": (24.78280, 125.29500),
-    "RORE": (26.72254, 127.78680),
-    "RORK": (25.94470, 131.32700),
-    "RORS": (24.82670, 125.14500),
-    "RORT": (24.65379, 124.67545),
-    "RORY": (27.04385, 128.40165),
-    "ROTM": (26.27430, 127.75600),
-    "ROYN": (24.46730, 122.97983),
-    "RPLB": (14.79483, 120.27188),
-    "RPLC": (15.18600, 120.56000),
-    "RPLH": (18.18239, 121.74622),
-    "RPLI": (18.17509, 120.53101),
-    "RPLK": (13.11191, 123.67683),
-    "RPLL": (14.50860, 121.02000),
-    "RPLS": (14.49540, 120.90400),
-    "RPLT": (20.72252, 121.80997),
-    "RPLU": (13.85540, 120.10500),
-    "RPMA": (6.36790, 124.75243),
-    "RPMB": (6.10548, 125.23488),
-    "RPMC": (7.16475, 124.20994),
-    "RPMD": (7.12552, 125.64600),
-    "RPME": (8.95150, 125.47880),
-    "RPMF": (8.19505, 126.32102),
-    "RPMG": (8.60198, 123.34188),
-    "RPMH": (9.25389, 124.70911),
-    "RPMJ": (6.05367, 121.01100),
-    "RPMN": (5.04820, 119.74334),
-    "RPMO": (8.17851, 123.84200),
-    "RPMP": (7.82563, 123.45964),
-    "RPMQ": (6.94909, 126.27368),
-    "RPMR": (6.05721, 125.09624),
-    "RPMS": (9.75584, 125.48095),
-    "RPMW": (9.07200, 126.17132),
-    "RPMY": (8.61220, 124.45650),
-    "RPMZ": (6.92242, 122.06000),
-    "RPSP": (9.57305, 123.77014),
-    "RPUB": (16.37503, 120.61995),
-    "RPUD": (14.12920, 122.98000),
-    "RPUH": (12.36150, 121.04700),
-    "RPUM": (13.20805, 120.60546),
-    "RPUN": (13.58490, 123.27000),
-    "RPUO": (20.45130, 121.98000),
-    "RPUR": (15.72931, 121.50003),
-    "RPUS": (16.59560, 120.30300),
-    "RPUT": (17.64337, 121.73315),
-    "RPUV": (13.57640, 124.20600),
-    "RPUW": (13.36100, 121.82600),
-    "RPUY": (16.92990, 121.75300),
-    "RPVA": (11.22776, 125.02778),
-    "RPVB": (10.77624, 123.01888),
-    "RPVC": (12.07257, 124.54508),
-    "RPVD": (9.33418, 123.30191),
-    "RPVE": (11.92450, 121.95400),
-    "RPVF": (12.50161, 124.63526),
-    "RPVI": (10.83302, 122.49336),
-    "RPVJ": (12.36968, 123.63009),
-    "RPVK": (11.67940, 122.37600),
-    "RPVM": (10.30926, 123.97974),
-    "RPVO": (11.05771, 124.56562),
-    "RPVP": (9.74204, 118.75911),
-    "RPVR": (11.59770, 122.75200),
-    "RPVS": (10.76664, 121.93251),
-    "RPVU": (12.31100, 122.08500),
-    "RPVV": (12.12186, 120.10080),
-    "SAAC": (-31.29690, -57.99660),
-    "SAAG": (-33.00557, -58.61283),
-    "SAAP": (-31.79480, -60.48040),
-    "SAAR": (-32.90360, -60.78500),
-    "SAAV": (-31.71170, -60.81170),
-    "SABE": (-34.55942, -58.41554),
-    "SACO": (-31.31235, -64.20833),
-    "SADF": (-34.45320, -58.58960),
-    "SADL": (-34.97220, -57.89470),
-    "SADP": (-34.60990, -58.61260),
-    "SAEZ": (-34.82220, -58.53580),
-    "SAHS": (-37.39060, -68.90420),
-    "SAHZ": (-38.97550, -70.11360),
-    "SAME": (-32.83170, -68.79290),
-    "SAMM": (-35.49360, -69.57430),
-    "SAMR": (-34.58830, -68.40390),
-    "SANC": (-28.59312, -65.75120),
-    "SANE": (-27.76556, -64.31000),
-    "SANL": (-29.38160, -66.79580),
-    "SANR": (-27.49660, -64.93595),
-    "SANT": (-26.83740, -65.10420),
-    "SANU": (-31.57150, -68.41820),
-    "SAOC": (-33.08510, -64.26130),
-    "SAOD": (-31.94520, -65.14630),
-    "SAOR": (-33.72990, -65.38740),
-    "SAOU": (-33.27320, -66.35640),
-    "SAOV": (-32.32010, -63.22663),
-    "SARC": (-27.44550, -58.76190),
-    "SARE": (-27.44991, -59.05613),
-    "SARF": (-26.21270, -58.22810),
-    "SARI": (-25.73730, -54.47340),
-    "SARL": (-29.68940, -57.15210),
-    "SARM": (-30.27190, -57.64020),
-    "SARP": (-27.38580, -55.97070),
-    "SASA": (-24.85600, -65.48620),
-    "SASJ": (-24.39280, -65.09780),
-    "SASO": (-23.15280, -64.32920),
-    "SAST": (-22.61688, -63.79301),
-    "SATG": (-29.10580, -59.21890),
-    "SATR": (-29.21028, -59.68333),
-    "SATU": (-29.77060, -57.97890),
-    "SAVB": (-41.94320, -71.53230),
-    "SAVC": (-45.78694, -67.46336),
-    "SAVE": (-42.90800, -71.13950),
-    "SAVH": (-46.53852, -68.96532),
-    "SAVT": (-43.21050, -65.27030),
-    "SAVV": (-40.86920, -63.00040),
-    "SAVY": (-42.75920, -65.10270),
-    "SAWC": (-50.28200, -72.05395),
-    "SAWD": (-47.73530, -65.90410),
-    "SAWE": (-53.77770, -67.74940),
-    "SAWG": (-51.60879, -69.30895),
-    "SAWH": (-54.84330, -68.29580),
-    "SAWJ": (-49.30682, -67.80260),
-    "SAWP": (-46.53790, -70.97870),
-    "SAWU": (-50.01650, -68.57920),
-    "SAZB": (-38.72500, -62.16930),
-    "SAZG": (-35.69620, -63.75830),
-    "SAZH": (-38.38690, -60.32970),
-    "SAZL": (-36.54230, -56.72180),
-    "SAZM": (-37.93420, -57.57330),
-    "SAZN": (-38.94900, -68.15570),
-    "SAZO": (-38.49075, -58.81634),
-    "SAZP": (-35.84460, -61.85760),
-    "SAZR": (-36.58830, -64.27570),
-    "SAZS": (-41.15120, -71.15750),
-    "SAZT": (-37.23463, -59.22865),
-    "SAZV": (-37.23540, -57.02920),
-    "SAZW": (-38.93970, -69.26460),
-    "SAZY": (-40.07540, -71.13730),
-    "SBAA": (-8.34835, -49.30150),
-    "SBAC": (-4.56890, -37.80513),
-    "SBAE": (-22.16076, -49.07032),
-    "SBAF": (-22.87510, -43.38470),
-    "SBAN": (-16.22920, -48.96430),
-    "SBAQ": (-21.81200, -48.13300),
-    "SBAR": (-10.98394, -37.07287),
-    "SBAT": (-9.86639, -56.10630),
-    "SBAU": (-21.14148, -50.42457),
-    "SBAX": (-19.56320, -46.96040),
-    "SBBE": (-1.37928, -48.47621),
-    "SBBG": (-31.39050, -54.11220),
-    "SBBH": (-19.85074, -43.95032),
-    "SBBI": (-25.40510, -49.23200),
-    "SBBQ": (-21.26720, -43.76101),
-    "SBBR": (-15.86917, -47.92083),
-    "SBBT": (-20.58463, -48.59412),
-    "SBBV": (2.84615, -60.69065),
-    "SBBW": (-15.86142, -52.38901),
-    "SBBZ": (-22.77088, -41.96308),
-    "SBCA": (-25.00032, -53.50121),
-    "SBCC": (-9.33394, -54.96540),
-    "SBCF": (-19.63571, -43.96693),
-    "SBCG": (-20.47000, -54.67399),
-    "SBCH": (-27.13420, -52.65660),
-    "SBCI": (-7.32044, -47.45870),
-    "SBCJ": (-6.11784, -50.00337),
-    "SBCM": (-28.72574, -49.42448),
-    "SBCO": (-29.94593, -51.14441),
-    "SBCP": (-21.69830, -41.30170),
-    "SBCR": (-19.01193, -57.67277),
-    "SBCT": (-25.52850, -49.17580),
-    "SBCV": (-17.65230, -39.25310),
-    "SBCX": (-29.19718, -51.18765),
-    "SBCY": (-15.65290, -56.11670),
-    "SBCZ": (-7.59991, -72.76950),
-    "SBDN": (-22.17510, -51.42460),
-    "SBEG": (-3.03861, -60.04970),
-    "SBEK": (-6.23316, -57.77690),
-    "SBFI": (-25.59417, -54.48944),
-    "SBFL": (-27.67028, -48.55250),
-    "SBFN": (-3.85453, -32.42302),
-    "SBFZ": (-3.77583, -38.53222),
-    "SBGL": (-22.81000, -43.25056),
-    "SBGM": (-10.78641, -65.28486),
-    "SBGO": (-16.63200, -49.22070),
-    "SBGR": (-23.43127, -46.46995),
-    "SBGV": (-18.89588, -41.98287),
-    "SBGW": (-22.79160, -45.20480),
-    "SBHT": (-3.25314, -52.25394),
-    "SBIC": (-3.12654, -58.48167),
-    "SBIH": (-4.24213, -56.00065),
-    "SBIL": (-14.81593, -39.03346),
-    "SBIP": (-19.47070, -42.48760),
-    "SBIZ": (-5.53129, -47.46000),
-    "SBJE": (-2.90643, -40.35734),
-    "SBJF": (-21.79148, -43.38607),
-    "SBJH": (-23.42689, -47.16566),
-    "SBJP": (-7.14869, -34.95055),
-    "SBJR": (-22.98677, -43.37219),
-    "SBJV": (-26.22450, -48.79740),
-    "SBKG": (-7.26966, -35.89606),
-    "SBKP": (-23.00740, -47.13450),
-    "SBLJ": (-27.78210, -50.28150),
-    "SBLN": (-21.66349, -49.72995),
-    "SBLO": (-23.33438, -51.12837),
-    "SBLP": (-13.26210, -43.40810),
-    "SBMA": (-5.36859, -49.13800),
-    "SBMC": (-13.54910, -48.19530),
-    "SBMD": (-0.88984, -52.60220),
-    "SBME": (-22.34300, -41.76600),
-    "SBMG": (-23.47606, -52.01619),
-    "SBMK": (-16.70692, -43.81890),
-    "SBML": (-22.19690, -49.92648),
-    "SBMN": (-3.14604, -59.98630),
-    "SBMO": (-9.51256, -35.79184),
-    "SBMQ": (0.05066, -51.07220),
-    "SBMS": (-5.20192, -37.36430),
-    "SBMT": (-23.50910, -46.63780),
-    "SBMY": (-5.81138, -61.27830),
-    "SBNF": (-26.87943, -48.65098),
-    "SBNM": (-28.28250, -54.16962),
-    "SBNT": (-5.91142, -35.24770),
-    "SBOI": (3.85412, -51.79706),
-    "SBPA": (-29.99398, -51.16748),
-    "SBPB": (-2.89375, -41.73200),
-    "SBPC": (-21.84253, -46.56977),
-    "SBPF": (-28.24398, -52.32777),
-    "SBPG": (-25.18448, -50.14382),
-    "SBPJ": (-10.29150, -48.35700),
-    "SBPK": (-31.71719, -52.32780),
-    "SBPL": (-9.36242, -40.56910),
-    "SBPN": (-10.71940, -48.39970),
-    "SBPP": (-22.54960, -55.70260),
-    "SBPS": (-16.43843, -39.08058),
-    "SBPV": (-8.70849, -63.90234),
-    "SBRB": (-9.86903, -67.89398),
-    "SBRD": (-16.58429, -54.72480),
-    "SBRF": (-8.12747, -34.92296),
-    "SBRJ": (-22.91040, -43.16282),
-    "SBRP": (-21.13431, -47.77405),
-    "SBSC": (-22.93240, -43.71910),
-    "SBSG": (-5.76982, -35.36661),
-    "SBSJ": (-23.22920, -45.86150),
-    "SBSL": (-2.58639, -44.23501),
-    "SBSM": (-29.71140, -53.68820),
-    "SBSN": (-2.42242, -54.79306),
-    "SBSP": (-23.62766, -46.65460),
-    "SBSR": (-20.81711, -49.40696),
-    "SBST": (-23.92819, -46.30020),
-    "SBSV": (-12.90861, -38.32250),
-    "SBTA": (-23.04010, -45.51615),
-    "SBTB": (-1.48960, -56.39680),
-    "SBTE": (-5.06025, -42.82371),
-    "SBTF": (-3.38294, -64.72410),
-    "SBTK": (-8.15553, -70.78298),
-    "SBTL": (-24.31780, -50.65160),
-    "SBTS": (2.22454, -55.94471),
-    "SBTT": (-4.25567, -69.93580),
-    "SBTU": (-3.78601, -49.72030),
-    "SBUA": (-0.14835, -66.98550),
-    "SBUF": (-9.40088, -38.25060),
-    "SBUG": (-29.78220, -57.03820),
-    "SBUL": (-18.88358, -48.22594),
-    "SBUR": (-19.76504, -47.96480),
-    "SBVG": (-21.59137, -45.47412),
-    "SBVH": (-12.69440, -60.09830),
-    "SBVT": (-20.25800, -40.28500),
-    "SBYS": (-21.98469, -47.34121),
-    "SBZM": (-21.51309, -43.17307),
-    "SCAR": (-18.34850, -70.33870),
-    "SCAT": (-27.26120, -70.77920),
-    "SCBA": (-45.91597, -71.68950),
-    "SCBE": (-22.14110, -70.06290),
-    "SCCC": (-46.58310, -71.68632),
-    "SCCF": (-22.49820, -68.90360),
-    "SCCH": (-36.58250, -72.03140),
-    "SCCI": (-53.00260, -70.85460),
-    "SCCY": (-45.59420, -72.10610),
-    "SCDA": (-20.53627, -70.18137),
-    "SCEL": (-33.39300, -70.78580),
-    "SCES": (-26.31110, -69.76520),
-    "SCFA": (-23.44527, -70.44523),
-    "SCFM": (-53.25370, -70.31920),
-    "SCGZ": (-54.93110, -67.62630),
-    "SCHR": (-47.24359, -72.58815),
-    "SCIE": (-36.77235, -73.06283),
-    "SCIP": (-27.16541, -109.42103),
-    "SCJO": (-40.61120, -73.06100),
-    "SCLL": (-28.59640, -70.75600),
-    "SCNT": (-51.67067, -72.52908),
-    "SCQP": (-38.92590, -72.65150),
-    "SCRA": (-26.33250, -70.60730),
-    "SCRG": (-34.17370, -70.77570),
-    "SCSE": (-29.91620, -71.19950),
-    "SCTC": (-38.76680, -72.63710),
-    "SCTE": (-41.44309, -73.09407),
-    "SCTL": (-35.37780, -71.60170),
-    "SCTN": (-42.78194, -72.83500),
-    "SCTO": (-38.24560, -72.34860),
-    "SCTT": (-25.56430, -70.37590),
-    "SCVD": (-39.65000, -73.08610),
-    "SCVM": (-32.94960, -71.47860),
-    "SDIY": (-12.20069, -38.90616),
-    "SEAM": (-1.21207, -78.57460),
-    "SECO": (-0.46289, -76.98680),
-    "SECU": (-2.88947, -78.98440),
-    "SEGS": (-0.45376, -90.26590),
-    "SEGU": (-2.15742, -79.88360),
-    "SEJD": (-1.06018, -77.58052),
-    "SELT": (-0.90683, -78.61580),
-    "SEMA": (-4.37823, -79.94100),
-    "SEMC": (-2.29917, -78.12080),
-    "SEMT": (-0.94608, -80.67880),
-    "SEPV": (-1.04165, -80.47220),
-    "SEQM": (-0.12540, -78.35431),
-    "SERO": (-3.44199, -79.99696),
-    "SESA": (-2.21006, -80.98507),
-    "SETN": (0.97852, -79.62660),
-    "SETR": (-0.12296, -76.33780),
-    "SETU": (0.80951, -77.70810),
-    "SGAS": (-25.24016, -57.51923),
-    "SGAY": (-27.37838, -56.85679),
-    "SGCO": (-23.44161, -57.42704),
-    "SGEN": (-27.22754, -55.83758),
-    "SGES": (-25.45719, -54.83954),
-    "SGGR": (-24.03284, -54.35267),
-    "SGIB": (-25.40782, -54.61946),
-    "SGME": (-22.04650, -60.62170),
-    "SGPI": (-26.88198, -58.31907),
-    "SGPJ": (-22.64143, -55.82999),
-    "SGST": (-22.62249, -56.63439),
-    "SKAP": (4.07607, -73.56270),
-    "SKAR": (4.45278, -75.76640),
-    "SKAS": (0.50523, -76.50080),
-    "SKBC": (9.04554, -73.97490),
-    "SKBG": (7.12650, -73.18480),
-    "SKBO": (4.70159, -74.14690),
-    "SKBQ": (10.88960, -74.78080),
-    "SKBS": (6.20292, -77.39470),
-    "SKBU": (3.81963, -76.98980),
-    "SKCC": (7.92757, -72.51150),
-    "SKCG": (10.44240, -75.51300),
-    "SKCL": (3.54272, -76.38190),
-    "SKCO": (1.81442, -78.74920),
-    "SKCU": (7.96847, -75.19850),
-    "SKCV": (9.40092, -75.69130),
-    "SKCZ": (9.33274, -75.28560),
-    "SKEB": (7.59647, -74.80890),
-    "SKEJ": (7.02433, -73.80680),
-    "SKFL": (1.58919, -75.56440),
-    "SKGI": (4.27624, -74.79670),
-    "SKGO": (4.75818, -75.95570),
-    "SKGP": (2.57013, -77.89797),
-    "SKIB": (4.42161, -75.13330),
-    "SKIP": (0.86195, -77.67178),
-    "SKLC": (7.81196, -76.71640),
-    "SKLM": (11.23250, -72.49010),
-    "SKLT": (-4.19115, -69.94200),
-    "SKMD": (6.21969, -75.59060),
-    "SKMG": (9.28474, -74.84610),
-    "SKMR": (8.82374, -75.82580),
-    "SKMU": (1.25366, -70.23390),
-    "SKMZ": (5.02960, -75.46470),
-    "SKNV": (2.95015, -75.29400),
-    "SKOC": (8.31506, -73.35830),
-    "SKPC": (6.18472, -67.49320),
-    "SKPD": (3.85353, -67.90620),
-    "SKPE": (4.81267, -75.73950),
-    "SKPI": (1.85777, -76.08570),
-    "SKPP": (2.45436, -76.60925),
-    "SKPQ": (5.48361, -74.65740),
-    "SKPS": (1.39672, -77.29093),
-    "SKPV": (13.35746, -81.35798),
-    "SKPZ": (5.87615, -71.88667),
-    "SKQU": (5.21256, -74.88360),
-    "SKRG": (6.16454, -75.42310),
-    "SKRH": (11.52620, -72.92600),
-    "SKSJ": (2.57969, -72.63940),
-    "SKSM": (11.11960, -74.23060),
-    "SKSP": (12.58360, -81.71120),
-    "SKSV": (2.15217, -74.76630),
-    "SKTJ": (5.54138, -73.34450),
-    "SKTM": (6.45108, -71.76030),
-    "SKTQ": (0.74590, -75.23400),
-    "SKUA": (5.52448, -68.68560),
-    "SKUC": (7.06888, -70.73690),
-    "SKUI": (5.69076, -76.64120),
-    "SKUL": (4.08836, -76.23510),
-    "SKVP": (10.43500, -73.24950),
-    "SKVV": (4.16787, -73.61380),
-    "SKYP": (5.31911, -72.38400),
-    "SLAL": (-19.24684, -65.14961),
-    "SLBJ": (-22.77330, -64.31290),
-    "SLCB": (-17.42111, -66.17710),
-    "SLCO": (-11.03911, -68.78277),
-    "SLET": (-17.81160, -63.17150),
-    "SLGM": (-10.88856, -65.38096),
-    "SLLP": (-16.51027, -68.18942),
-    "SLOR": (-17.95615, -67.07583),
-    "SLPO": (-19.54333, -65.72373),
-    "SLPS": (-18.97530, -57.82060),
-    "SLRI": (-11.00935, -66.07547),
-    "SLSA": (-13.76220, -65.43520),
-    "SLSU": (-19.00710, -65.28870),
-    "SLSV": (-16.40124, -61.04520),
-    "SLTJ": (-21.55570, -64.70130),
-    "SLTR": (-14.81870, -64.91800),
-    "SLVM": (-21.25520, -63.40560),
-    "SLVR": (-17.64480, -63.13540),
-    "SLYA": (-21.96090, -63.65170),
-    "SMJP": (5.45283, -55.18780),
-    "SNCP": (-27.63413, -50.35825),
-    "SNLN": (-19.35520, -40.07128),
-    "SNQX": (-4.97901, -38.98762),
-    "SOCA": (4.81996, -52.36133),
-    "SOOA": (3.65591, -54.03943),
-    "SOOG": (3.89760, -51.80410),
-    "SOOM": (5.48189, -54.03496),
-    "SPAY": (-10.72910, -73.76650),
-    "SPBC": (-3.91686, -70.50820),
-    "SPBR": (-11.41160, -69.48870),
-    "SPCL": (-8.37806, -74.57449),
-    "SPEO": (-9.14961, -78.52380),
-    "SPHI": (-6.78922, -79.82825),
-    "SPHO": (-13.15480, -74.20440),
-    "SPHZ": (-9.34744, -77.59840),
-    "SPIM": (-12.02190, -77.11431),
-    "SPJA": (-6.06786, -77.16000),
-    "SPJE": (-5.59248, -78.77400),
-    "SPJI": (-7.16910, -76.72860),
-    "SPJJ": (-11.78310, -75.47340),
-    "SPJL": (-15.46769, -70.15653),
-    "SPJR": (-7.13918, -78.48940),
-    "SPLO": (-17.69500, -71.34400),
-    "SPME": (-3.55207, -80.38109),
-    "SPMS": (-5.89377, -76.11820),
-    "SPNC": (-9.87881, -76.20480),
-    "SPPY": (-6.20191, -77.85619),
-    "SPQT": (-3.78474, -73.30880),
-    "SPQU": (-16.34079, -71.56949),
-    "SPRU": (-8.08238, -79.10882),
-    "SPSO": (-13.74490, -76.22030),
-    "SPST": (-6.50874, -76.37320),
-    "SPTN": (-18.05330, -70.27580),
-    "SPTU": (-12.61360, -69.22860),
-    "SPUR": (-5.20575, -80.61640),
-    "SPYL": (-4.57664, -81.25410),
-    "SPZA": (-14.85400, -74.96150),
-    "SPZO": (-13.53570, -71.93880),
-    "SUAA": (-34.78920, -56.26470),
-    "SUDU": (-33.35890, -56.49920),
-    "SULS": (-34.85510, -55.09430),
-    "SUMU": (-34.83565, -56.02650),
-    "SUPU": (-32.36330, -58.06190),
-    "SURV": (-30.97460, -55.47620),
-    "SUSO": (-31.43850, -57.98530),
-    "SVAC": (9.55338, -69.23787),
-    "SVAN": (9.43023, -64.47073),
-    "SVBC": (10.11111, -64.69222),
-    "SVBI": (8.61500, -70.21417),
-    "SVBL": (10.18337, -67.55732),
-    "SVBM": (10.04275, -69.35862),
-    "SVBS": (10.24998, -67.64942),
-    "SVCB": (8.12216, -63.53696),
-    "SVCD": (7.62551, -66.16280),
-    "SVCL": (8.92466, -67.41709),
-    "SVCN": (6.23199, -62.85485),
-    "SVCP": (10.66001, -63.26168),
-    "SVCR": (11.41494, -69.68090),
-    "SVCS": (10.28687, -66.81585),
-    "SVCU": (10.45033, -64.13047),
-    "SVED": (6.71573, -61.63879),
-    "SVEZ": (7.05968, -69.49670),
-    "SVFM": (10.48503, -66.84351),
-    "SVGD": (7.21083, -70.75639),
-    "SVGI": (10.57408, -62.31267),
-    "SVGU": (9.02694, -69.75515),
-    "SVJC": (11.78078, -70.15150),
-    "SVJM": (9.90695, -67.37964),
-    "SVLF": (8.23917, -72.27103),
-    "SVLO": (11.80823, -66.18077),
-    "SVMC": (10.55754, -71.72931),
-    "SVMD": (8.58208, -71.16104),
-    "SVMG": (10.91260, -63.96660),
-    "SVMI": (10.60221, -66.99117),
-    "SVMP": (10.13317, -66.78783),
-    "SVMT": (9.74902, -63.15335),
-    "SVPA": (5.61999, -67.60610),
-    "SVPC": (10.48050, -68.07300),
-    "SVPM": (7.80132, -72.20290),
-    "SVPR": (8.28853, -62.76040),
-    "SVPT": (7.57548, -70.17444),
-    "SVSA": (7.84081, -72.43988),
-    "SVSE": (4.55470, -61.14523),
-    "SVSO": (7.56538, -72.03510),
-    "SVSP": (10.27870, -68.75520),
-    "SVSR": (7.88332, -67.44400),
-    "SVST": (8.94515, -64.15108),
-    "SVSZ": (8.97455, -71.94325),
-    "SVTC": (9.08899, -62.09417),
-    "SVTM": (7.24938, -61.52893),
-    "SVVA": (10.14973, -67.92840),
-    "SVVG": (8.62414, -71.67267),
-    "SVVL": (9.34048, -70.58406),
-    "SVVP": (9.22203, -65.99358),
-    "SWGN": (-7.22787, -48.24050),
-    "SYCJ": (6.49855, -58.25410),
-    "SYGO": (6.80588, -58.10766),
-    "SYKA": (5.17735, -59.48898),
-    "SYLT": (3.37276, -59.78940),
-    "TAPA": (17.13670, -61.79270),
-    "TBPB": (13.07467, -59.49103),
-    "TDCF": (15.33669, -61.39211),
-    "TDPD": (15.54667, -61.30108),
-    "TFFF": (14.59100, -61.00320),
-    "TFFG": (18.10006, -63.04744),
-    "TFFJ": (17.90440, -62.84333),
-    "TFFM": (15.86893, -61.27009),
-    "TFFR": (16.26544, -61.53275),
-    "TGPY": (12.00400, -61.78530),
-    "TIST": (18.33709, -64.97725),
-    "TISX": (17.70141, -64.80261),
-    "TJAB": (18.45085, -66.67577),
-    "TJBQ": (18.49490, -67.12940),
-    "TJCP": (18.31295, -65.30389),
-    "TJIG": (18.45680, -66.09810),
-    "TJMZ": (18.25570, -67.14850),
-    "TJPS": (18.00830, -66.56300),
-    "TJRV": (18.24726, -65.63979),
-    "TJSJ": (18.43940, -66.00180),
-    "TJVQ": (18.13480, -65.49360),
-    "TKPK": (17.31085, -62.71912),
-    "TKPN": (17.20570, -62.58990),
-    "TLPC": (14.02020, -60.99290),
-    "TLPL": (13.73320, -60.95260),
-    "TNCA": (12.50106, -70.01428),
-    "TNCB": (12.13100, -68.26850),
-    "TNCC": (12.18890, -68.95980),
-    "TNCE": (17.49650, -62.97940),
-    "TNCM": (18.04100, -63.10890),
-    "TNCS": (17.64533, -63.22051),
-    "TQPF": (18.20477, -63.05383),
-    "TRPG": (16.79183, -62.19320),
-    "TTCP": (11.14957, -60.83130),
-    "TTPP": (10.59781, -61.33746),
-    "TUPJ": (18.44549, -64.54171),
-    "TUPW": (18.44663, -64.42793),
-    "TVSA": (13.15972, -61.14880),
-    "TVSB": (12.98840, -61.26200),
-    "TVSC": (12.69900, -61.34240),
-    "TVSM": (12.88790, -61.18020),
-    "TVSU": (12.60013, -61.41195),
-    "TXKF": (32.36380, -64.67824),
-    "UAAA": (43.35427, 77.04283),
-    "UAAH": (46.89425, 75.00453),
-    "UAAT": (45.12255, 78.44276),
-    "UACC": (51.02703, 71.46709),
-    "UACK": (53.32910, 69.59460),
-    "UACP": (54.77562, 69.18742),
-    "UADD": (42.85360, 71.30360),
-    "UAFM": (43.06130, 74.47760),
-    "UAFO": (40.60900, 72.79330),
-    "UAFP": (42.50810, 78.40780),
-    "UAFW": (42.85320, 74.84650),
-    "UAII": (42.36502, 69.47564),
-    "UAIT": (43.31109, 68.55035),
-    "UAKD": (47.70895, 67.73809),
-    "UAKK": (49.67080, 73.33440),
-    "UAOL": (45.62199, 63.21077),
-    "UAON": (46.05242, 63.24918),
-    "UAOO": (44.70690, 65.59250),
-    "UARR": (51.15198, 51.54365),
-    "UASA": (47.91922, 80.45219),
-    "UASB": (51.59100, 75.21500),
-    "UASK": (50.03503, 82.49606),
-    "UASP": (52.19498, 77.07309),
-    "UASS": (50.35130, 80.23440),
-    "UATE": (43.86009, 51.09086),
-    "UATG": (47.12132, 51.82034),
-    "UATR": (47.90500, 59.62000),
-    "UATT": (50.24812, 57.20414),
-    "UAUU": (53.20690, 63.55030),
-    "UBBB": (40.47278, 50.05093),
-    "UBBG": (40.73869, 46.32038),
-    "UBBN": (39.18880, 45.45840),
-    "UBBQ": (40.80862, 47.72539),
-    "UBBY": (41.55782, 46.66946),
-    "UCFL": (42.58558, 76.70118),
-    "UDSG": (40.75040, 43.85930),
-    "UDYE": (40.12210, 44.46500),
-    "UDYZ": (40.14894, 44.39789),
-    "UEEE": (62.09330, 129.77100),
-    "UELL": (56.91390, 124.91400),
-    "UEMA": (66.45086, 143.26155),
-    "UEMM": (62.10348, 129.54529),
-    "UEMO": (60.40183, 120.47609),
-    "UEMT": (64.55000, 143.11500),
-    "UENK": (63.88500, 122.77700),
-    "UENW": (63.75667, 121.69334),
-    "UERA": (65.95920, 111.54650),
-    "UERL": (60.72060, 114.82600),
-    "UERP": (66.40040, 112.03000),
-    "UERR": (62.53470, 114.03900),
-    "UERS": (71.92790, 114.08000),
-    "UESG": (68.55623, 146.22784),
-    "UESK": (67.48050, 153.73640),
-    "UESO": (70.62310, 147.90199),
-    "UESS": (68.74060, 161.33800),
-    "UEST": (71.69770, 128.90300),
-    "UESU": (65.74850, 150.88890),
-    "UEVV": (66.79650, 123.36100),
-    "UGAM": (42.52687, 43.13538),
-    "UGKO": (42.17745, 42.48535),
-    "UGSB": (41.60939, 41.60032),
-    "UGSS": (42.85820, 41.12810),
-    "UGTB": (41.66920, 44.95470),
-    "UHBB": (50.42540, 127.41200),
-    "UHHH": (48.52834, 135.18859),
-    "UHKD": (50.60560, 137.08099),
-    "UHKG": (49.23570, 140.19310),
-    "UHKK": (50.40900, 136.93401),
-    "UHKM": (48.92507, 140.03535),
-    "UHMA": (64.73490, 177.74100),
-    "UHMD": (64.37810, -173.24300),
-    "UHMF": (62.45700, 155.74499),
-    "UHMG": (61.83500, 160.54800),
-    "UHMK": (67.84500, 166.14000),
-    "UHMM": (59.91100, 150.72000),
-    "UHMP": (69.78330, 170.59700),
-    "UHMS": (62.92078, 152.42278),
-    "UHMT": (59.62330, 150.92200),
-    "UHMW": (61.92179, 159.22906),
-    "UHNN": (53.15500, 140.64999),
-    "UHOO": (59.41007, 143.05650),
-    "UHPL": (59.08206, 159.89158),
-    "UHPP": (53.16872, 158.45107),
-    "UHSS": (46.88546, 142.71747),
-    "UHWW": (43.39626, 132.14816),
-    "UIAA": (52.02484, 113.30584),
-    "UIAE": (50.03311, 118.06114),
-    "UIBB": (56.36960, 101.70182),
-    "UIBV": (56.48770, 104.10600),
-    "UIII": (52.26671, 104.39556),
-    "UITT": (56.85670, 105.73000),
-    "UIUU": (51.80861, 107.43965),
-    "UKBB": (50.34500, 30.89470),
-    "UKCM": (47.07610, 37.44960),
-    "UKDB": (46.81500, 36.75810),
-    "UKDD": (48.35720, 35.10060),
-    "UKDE": (47.86696, 35.31472),
-    "UKDR": (48.04330, 33.21000),
-    "UKFB": (44.69182, 33.57462),
-    "UKFF": (45.05220, 33.97510),
-    "UKFG": (45.11619, 33.97662),
-    "UKFI": (45.09061, 33.59854),
-    "UKFY": (45.70090, 34.41890),
-    "UKHH": (49.92694, 36.29081),
-    "UKKE": (49.41560, 31.99530),
-    "UKKK": (50.40194, 30.45194),
-    "UKKM": (50.60350, 30.19190),
-    "UKKO": (50.15830, 28.73830),
-    "UKLH": (49.35970, 26.93340),
-    "UKLI": (48.88420, 24.68610),
-    "UKLL": (49.81250, 23.95610),
-    "UKLN": (48.25930, 25.98080),
-    "UKLR": (50.60710, 26.14160),
-    "UKLU": (48.63430, 22.26340),
-    "UKOH": (46.67580, 32.50640),
-    "UKOO": (46.42720, 30.67265),
-    "UKWW": (49.24253, 28.61378),
-    "ULAA": (64.60030, 40.71670),
-    "ULAH": (64.44170, 40.42170),
-    "ULAM": (67.64000, 53.12190),
-    "ULDD": (69.76330, 61.55640),
-    "ULKK": (61.23580, 46.69750),
-    "ULLI": (59.80030, 30.26250),
-    "ULLP": (59.68500, 30.33830),
-    "ULMM": (68.78170, 32.75080),
-    "ULOO": (57.78132, 28.39384),
-    "ULPB": (61.88520, 34.15470),
-    "ULPP": (61.83194, 34.29556),
-    "ULWC": (59.27360, 38.01580),
-    "ULWU": (60.78830, 46.26000),
-    "ULWW": (59.28250, 39.94440),
-    "UMBB": (52.10814, 23.89676),
-    "UMGG": (52.52700, 31.01670),
-    "UMII": (55.12650, 30.34960),
-    "UMKK": (54.89161, 20.59856),
-    "UMMA": (53.10000, 26.05000),
-    "UMMG": (53.60200, 24.05380),
-    "UMMS": (53.88807, 28.03996),
-    "UMNB": (53.10500, 29.20500),
-    "UMOO": (53.95490, 30.09510),
-    "UNAA": (53.74000, 91.38500),
-    "UNBB": (53.36129, 83.53970),
-    "UNBG": (51.96920, 85.83654),
-    "UNEE": (55.27010, 86.10720),
-    "UNIB": (61.67670, 96.35500),
-    "UNII": (58.47420, 92.11250),
-    "UNIP": (61.58970, 89.99400),
-    "UNIS": (60.37330, 93.01170),
-    "UNIW": (60.35623, 102.30964),
-    "UNKL": (56.17574, 92.48579),
-    "UNKM": (56.17758, 92.54588),
-    "UNKS": (56.26919, 90.57511),
-    "UNKY": (51.66940, 94.40060),
-    "UNNE": (55.09240, 83.00450),
-    "UNNT": (55.01976, 82.61867),
-    "UNOO": (54.96312, 73.31242),
-    "UNOS": (54.97500, 73.55500),
-    "UNSS": (60.70940, 77.66000),
-    "UNTT": (56.38030, 85.20830),
-    "UNWW": (53.81140, 86.87720),
-    "UODD": (73.51781, 80.37967),
-    "UODN": (80.80321, 47.66359),
-    "UOHH": (71.97810, 102.49100),
-    "UOIG": (66.84000, 88.40334),
-    "UOII": (67.43720, 86.62190),
-    "UOOO": (69.30795, 87.32591),
-    "URKA": (45.00210, 37.34730),
-    "URKG": (44.58209, 38.01248),
-    "URKK": (45.03446, 39.17421),
-    "URMG": (43.38811, 45.69977),
-    "URML": (42.81680, 47.65230),
-    "URMM": (44.22510, 43.08190),
-    "URMN": (43.51290, 43.63660),
-    "URMO": (43.20510, 44.60660),
-    "URMS": (43.32327, 45.01257),
-    "URMT": (45.10920, 42.11280),
-    "UROD": (69.37500, 86.15667),
-    "URRP": (47.49389, 39.92472),
-    "URRT": (47.19833, 38.84917),
-    "URSS": (43.44990, 39.95660),
-    "URWA": (46.28284, 48.01051),
-    "URWI": (46.37390, 44.33090),
-    "URWW": (48.78134, 44.33919),
-    "USCC": (55.30314, 61.50493),
-    "USCM": (53.39199, 58.75523),
-    "USDA": (71.21917, 72.05222),
-    "USDB": (70.31528, 68.33361),
-    "USDD": (66.59080, 66.61100),
-    "USHB": (63.92100, 65.03050),
-    "USHH": (61.02850, 69.08610),
-    "USHN": (62.11000, 65.61500),
-    "USHQ": (63.68690, 66.69860),
-    "USHS": (61.32662, 63.60191),
-    "USHU": (60.10330, 64.82670),
-    "USII": (56.83452, 53.46217),
-    "USKK": (58.50388, 49.34783),
-    "USMM": (65.48090, 72.69890),
-    "USMU": (66.06940, 76.52030),
-    "USNN": (60.94930, 76.48360),
-    "USPP": (57.91450, 56.02120),
-    "USRK": (62.19040, 74.53380),
-    "USRN": (61.10830, 72.65000),
-    "USRO": (63.18330, 75.27000),
-    "USRR": (61.34050, 73.40578),
-    "USSK": (56.70170, 60.79000),
-    "USSS": (56.74310, 60.80270),
-    "USTJ": (58.05971, 68.34800),
-    "USTR": (57.17898, 65.32770),
-    "USUU": (55.47530, 65.41560),
-    "UTAA": (37.98680, 58.36100),
-    "UTAK": (40.06283, 53.00509),
-    "UTAM": (37.62353, 61.89567),
-    "UTAT": (41.75985, 59.83615),
-    "UTAV": (38.93066, 63.56398),
-    "UTDD": (38.54375, 68.82298),
-    "UTDK": (37.98810, 69.80500),
-    "UTDL": (40.21540, 69.69470),
-    "UTDT": (37.86632, 68.86447),
-    "UTFN": (40.98462, 71.55780),
-    "UTKA": (40.72770, 72.29400),
-    "UTKF": (40.35880, 71.74500),
-    "UTNN": (42.48840, 59.62330),
-    "UTNU": (41.58274, 60.64338),
-    "UTSA": (40.11760, 65.17266),
-    "UTSB": (39.77532, 64.48228),
-    "UTSS": (39.70184, 66.98147),
-    "UTST": (37.28726, 67.31187),
-    "UTTP": (41.31289, 69.39553),
-    "UTTT": (41.25790, 69.28120),
-    "UTTZ": (40.01402, 68.41103),
-    "UUBA": (57.79690, 41.01940),
-    "UUBC": (54.55000, 36.36667),
-    "UUBI": (56.93940, 40.94080),
-    "UUBK": (58.10420, 38.92940),
-    "UUBP": (53.21440, 34.17596),
-    "UUBW": (55.55330, 38.15000),
-    "UUDD": (55.40880, 37.90630),
-    "UUDL": (57.56070, 40.15740),
-    "UUEE": (55.97686, 37.41121),
-    "UUEM": (56.82470, 35.75770),
-    "UUMT": (54.90500, 39.02667),
-    "UUMU": (55.87830, 38.06170),
-    "UUOB": (50.64380, 36.59010),
-    "UUOK": (51.75060, 36.29560),
-    "UUOL": (52.70280, 39.53780),
-    "UUOO": (51.81368, 39.23171),
-    "UUOT": (52.80610, 41.48280),
-    "UUWW": (55.59150, 37.26150),
-    "UUYH": (63.56690, 53.80470),
-    "UUYI": (66.05337, 60.10579),
-    "UUYK": (63.82330, 57.28000),
-    "UUYP": (65.12110, 57.13080),
-    "UUYS": (66.00470, 57.36720),
-    "UUYV": (65.03170, 53.97000),
-    "UUYW": (67.48860, 63.99310),
-    "UUYX": (65.43729, 52.20034),
-    "UUYY": (61.64700, 50.84510),
-    "UWGG": (56.22735, 43.78515),
-    "UWKB": (54.64118, 52.80023),
-    "UWKD": (55.60620, 49.27870),
-    "UWKE": (55.56470, 52.09250),
-    "UWKG": (55.86670, 49.13330),
-    "UWKJ": (56.70060, 47.90470),
-    "UWKS": (56.09030, 47.34730),
-    "UWLL": (54.26830, 48.22670),
-    "UWLW": (54.40100, 48.80270),
-    "UWOO": (51.79267, 55.45723),
-    "UWOR": (51.07250, 58.59560),
-    "UWPP": (53.11060, 45.02110),
-    "UWPS": (54.12513, 45.21226),
-    "UWSB": (51.85830, 47.74560),
-    "UWSG": (51.71278, 46.17111),
-    "UWUU": (54.55750, 55.87440),
-    "UWWB": (53.71840, 52.37190),
-    "UWWG": (53.22000, 50.32500),
-    "UWWW": (53.50490, 50.16430),
-    "VAAH": (23.07720, 72.63470),
-    "VAAK": (20.69893, 77.05688),
-    "VAAU": (19.86287, 75.39631),
-    "VABB": (19.08870, 72.86790),
-    "VABJ": (23.28780, 69.67020),
-    "VABM": (15.85930, 74.61830),
-    "VABO": (22.33620, 73.22630),
-    "VABP": (23.28750, 77.33740),
-    "VABV": (21.75220, 72.18520),
-    "VADN": (20.43440, 72.84320),
-    "VAHB": (15.36108, 75.08210),
-    "VAHS": (22.37882, 71.03939),
-    "VAID": (22.72140, 75.80051),
-    "VAJB": (23.17780, 80.05200),
-    "VAJM": (22.46550, 70.01260),
-    "VAKE": (23.11270, 70.10030),
-    "VAKJ": (24.81720, 79.91860),
-    "VAKP": (16.66470, 74.28940),
-    "VAKS": (21.31710, 70.27040),
-    "VALT": (18.41150, 76.46470),
-    "VAND": (19.18330, 77.31670),
-    "VANP": (21.09220, 79.04720),
-    "VAOZ": (20.11910, 73.91290),
-    "VAPO": (18.58210, 73.91970),
-    "VAPR": (21.64952, 69.65641),
-    "VARG": (17.01360, 73.32780),
-    "VARK": (22.30920, 70.77950),
-    "VARP": (21.18040, 81.73880),
-    "VASD": (19.68921, 74.37365),
-    "VASL": (17.62800, 75.93480),
-    "VASU": (21.11553, 72.74325),
-    "VAUD": (24.61770, 73.89610),
-    "VCBI": (7.18076, 79.88410),
-    "VCCA": (8.30154, 80.42848),
-    "VCCB": (7.70507, 81.67716),
-    "VCCC": (6.82164, 79.88586),
-    "VCCG": (7.33674, 81.62387),
-    "VCCH": (8.04981, 80.98140),
-    "VCCJ": (9.79233, 80.07010),
-    "VCCK": (5.99368, 80.32030),
-    "VCCT": (8.53916, 81.18128),
-    "VCRI": (6.28388, 81.12416),
-    "VDBG": (13.09560, 103.22400),
-    "VDPP": (11.54716, 104.84470),
-    "VDRK": (13.73000, 106.98700),
-    "VDSA": (13.36974, 104.22383),
-    "VDSV": (10.57056, 103.63207),
-    "VEAN": (28.17530, 94.80200),
-    "VEAT": (23.88700, 91.24040),
-    "VEBD": (26.68120, 88.32860),
-    "VEBI": (25.70360, 91.97870),
-    "VEBN": (25.45217, 82.86255),
-    "VEBS": (20.25102, 85.81475),
-    "VEBU": (21.98840, 82.11100),
-    "VECC": (22.65401, 88.44765),
-    "VEDB": (23.83400, 86.42530),
-    "VEDG": (23.62250, 87.24300),
-    "VEDH": (26.19280, 85.91690),
-    "VEGK": (26.73970, 83.44970),
-    "VEGT": (26.10665, 91.58523),
-    "VEGY": (24.74430, 84.95120),
-    "VEHX": (26.69830, 89.36910),
-    "VEIM": (24.76000, 93.89670),
-    "VEJS": (22.81371, 86.16898),
-    "VEJT": (26.73046, 94.17542),
-    "VEKI": (26.77653, 83.88921),
-    "VEKR": (24.30866, 92.00768),
-    "VEKU": (24.91290, 92.97870),
-    "VELP": (23.84060, 92.61970),
-    "VELR": (27.29568, 94.09727),
-    "VEMN": (27.48390, 95.01690),
-    "VEMR": (25.88390, 93.77110),
-    "VEMZ": (26.11910, 85.31370),
-    "VEPH": (23.47430, 87.42750),
-    "VEPT": (25.59130, 85.08800),
-    "VERC": (23.31430, 85.32170),
-    "VERK": (22.25657, 84.81519),
-    "VETZ": (26.70910, 92.78470),
-    "VEVZ": (17.72351, 83.22773),
-    "VEZO": (27.58830, 93.82810),
-    "VGBR": (22.80100, 90.30120),
-    "VGCB": (21.45752, 91.96326),
-    "VGEG": (22.24960, 91.81330),
-    "VGHS": (23.84335, 90.39778),
-    "VGIS": (24.15250, 89.04940),
-    "VGJR": (23.18380, 89.16080),
-    "VGRJ": (24.43720, 88.61650),
-    "VGSD": (25.75920, 88.90890),
-    "VGSY": (24.96307, 91.86690),
-    "VHHH": (22.31184, 113.91486),
-    "VHSK": (22.43660, 114.08000),
-    "VIAG": (27.15798, 77.96103),
-    "VIAL": (25.44010, 81.73390),
-    "VIAM": (30.36810, 76.81670),
-    "VIAR": (31.70960, 74.79730),
-    "VIBK": (28.07060, 73.20720),
-    "VIBR": (31.87670, 77.15440),
-    "VIBT": (30.27010, 74.75580),
-    "VIBY": (28.42210, 79.45080),
-    "VICG": (30.67350, 76.78850),
-    "VICX": (26.40430, 80.41010),
-    "VIDD": (28.58545, 77.20356),
-    "VIDN": (30.18924, 78.17665),
-    "VIDP": (28.55563, 77.09519),
-    "VIGG": (32.16490, 76.26302),
-    "VIGR": (26.29330, 78.22780),
-    "VIHR": (29.18606, 75.74142),
-    "VIHX": (30.74850, 75.62980),
-    "VIJO": (26.25110, 73.04890),
-    "VIJP": (26.82420, 75.81220),
-    "VIJR": (26.88870, 70.86500),
-    "VIJU": (32.68885, 74.83815),
-    "VIKG": (26.59101, 74.81296),
-    "VIKO": (25.16020, 75.84560),
-    "VILD": (30.85470, 75.95260),
-    "VILH": (34.13590, 77.54650),
-    "VILK": (26.76060, 80.88930),
-    "VIMB": (28.81746, 78.92187),
-    "VIPK": (32.23361, 75.63444),
-    "VIPT": (29.03340, 79.47370),
-    "VISA": (29.56060, 75.00610),
-    "VISR": (33.98710, 74.77420),
-    "VIUX": (32.90215, 75.15571),
-    "VLLB": (19.90427, 102.16719),
-    "VLPS": (15.13397, 105.77987),
-    "VLSK": (16.55660, 104.76000),
-    "VLSN": (20.41840, 104.06700),
-    "VLVT": (17.98505, 102.56669),
-    "VMMC": (22.14960, 113.59200),
-    "VNBW": (27.50464, 83.41038),
-    "VNJP": (26.70880, 85.92240),
-    "VNKT": (27.69660, 85.35910),
-    "VNLK": (27.68677, 86.72948),
-    "VNNG": (28.10360, 81.66700),
-    "VNPK": (28.20062, 83.98120),
-    "VNTJ": (27.35090, 87.69525),
-    "VNVT": (26.48150, 87.26400),
-    "VOAT": (10.82370, 72.17600),
-    "VOBG": (12.95000, 77.66820),
-    "VOBI": (15.16280, 76.88280),
-    "VOBL": (13.19790, 77.70630),
-    "VOBR": (17.90810, 77.48710),
-    "VOBZ": (16.53001, 80.80489),
-    "VOCB": (11.03000, 77.04340),
-    "VOCI": (10.15105, 76.40084),
-    "VOCL": (11.13600, 75.95515),
-    "VOCP": (14.51315, 78.76918),
-    "VOCX": (9.15306, 92.81927),
-    "VODG": (17.62720, 78.40340),
-    "VOGA": (15.74426, 73.86062),
-    "VOGO": (15.38006, 73.83333),
-    "VOHS": (17.23132, 78.42986),
-    "VOHY": (17.45310, 78.46760),
-    "VOKN": (11.91634, 75.54498),
-    "VOKU": (15.71629, 78.16923),
-    "VOMD": (9.83451, 78.09340),
-    "VOML": (12.95471, 74.88681),
-    "VOMM": (12.99001, 80.16930),
-    "VOMY": (12.22975, 76.65368),
-    "VOPB": (11.64019, 92.72902),
-    "VOPC": (11.96800, 79.81200),
-    "VOPN": (14.14930, 77.79110),
-    "VORY": (17.10580, 81.81320),
-    "VOSM": (11.78330, 78.06560),
-    "VOTP": (13.63199, 79.53987),
-    "VOTR": (10.76291, 78.71774),
-    "VOTV": (8.48189, 76.92003),
-    "VQGP": (26.88456, 90.46412),
-    "VQPR": (27.40320, 89.42460),
-    "VRDA": (5.81741, 73.46840),
-    "VRMG": (-0.69298, 73.15263),
-    "VRMH": (6.74324, 73.16707),
-    "VRMK": (1.85917, 73.52190),
-    "VRMM": (4.19183, 73.52910),
-    "VRMT": (0.48813, 72.99690),
-    "VRMV": (3.47175, 72.83263),
-    "VTBD": (13.91260, 100.60700),
-    "VTBK": (14.10200, 99.91720),
-    "VTBL": (14.87462, 100.66340),
-    "VTBO": (12.27460, 102.31900),
-    "VTBS": (13.68110, 100.74700),
-    "VTBU": (12.67990, 101.00500),
-    "VTCC": (18.76680, 98.96260),
-    "VTCH": (19.30130, 97.97580),
-    "VTCL": (18.27090, 99.50420),
-    "VTCN": (18.80790, 100.78300),
-    "VTCP": (18.13220, 100.16500),
-    "VTCT": (19.95230, 99.88290),
-    "VTPB": (16.67600, 101.19500),
-    "VTPH": (12.63620, 99.95150),
-    "VTPI": (15.27730, 100.29600),
-    "VTPM": (16.69990, 98.54510),
-    "VTPO": (17.23800, 99.81820),
-    "VTPP": (16.78290, 100.27900),
-    "VTPT": (16.89600, 99.25330),
-    "VTSB": (9.13260, 99.13560),
-    "VTSC": (6.51992, 101.74300),
-    "VTSE": (10.71120, 99.36170),
-    "VTSF": (8.53962, 99.94470),
-    "VTSG": (8.09559, 98.98896),
-    "VTSH": (7.18656, 100.60800),
-    "VTSK": (6.78546, 101.15400),
-    "VTSM": (9.54779, 100.06200),
-    "VTSN": (8.47115, 99.95560),
-    "VTSP": (8.11326, 98.31740),
-    "VTSR": (9.77762, 98.58550),
-    "VTSS": (6.93321, 100.39300),
-    "VTST": (7.50874, 99.61660),
-    "VTUD": (17.38619, 102.78858),
-    "VTUI": (17.19510, 104.11900),
-    "VTUJ": (14.86830, 103.49800),
-    "VTUK": (16.46660, 102.78400),
-    "VTUL": (17.43910, 101.72200),
-    "VTUO": (15.22950, 103.25300),
-    "VTUQ": (14.94950, 102.31300),
-    "VTUU": (15.25130, 104.87000),
-    "VTUV": (16.11680, 103.77400),
-    "VTUW": (17.38380, 104.64300),
-    "VVBM": (12.66830, 108.12000),
-    "VVCI": (20.81743, 106.72432),
-    "VVCM": (9.17767, 105.17778),
-    "VVCR": (11.99820, 109.21900),
-    "VVCS": (8.73183, 106.63300),
-    "VVCT": (10.08340, 105.70937),
-    "VVDB": (21.39750, 103.00800),
-    "VVDH": (17.51500, 106.59056),
-    "VVDL": (11.75056, 108.36700),
-    "VVDN": (16.04390, 108.19900),
-    "VVGL": (21.04050, 105.88600),
-    "VVNB": (21.22120, 105.80700),
-    "VVPB": (16.40063, 107.70309),
-    "VVPC": (13.95500, 109.04200),
-    "VVPK": (14.00450, 108.01700),
-    "VVPQ": (10.16978, 103.99353),
-    "VVRG": (9.95803, 105.13238),
-    "VVTH": (13.04960, 109.33400),
-    "VVTS": (10.81880, 106.65200),
-    "VVVD": (21.12069, 107.41539),
-    "VVVH": (18.73760, 105.67100),
-    "VYDW": (14.10390, 98.20360),
-    "VYHH": (20.74714, 96.79203),
-    "VYKG": (21.30160, 99.63600),
-    "VYKP": (19.42640, 93.53480),
-    "VYKT": (10.04930, 98.53800),
-    "VYLK": (19.69150, 97.21480),
-    "VYLS": (22.97790, 97.75220),
-    "VYMD": (21.70220, 95.97790),
-    "VYME": (12.43980, 98.62150),
-    "VYMK": (25.38360, 97.35190),
-    "VYML": (20.88640, 95.89279),
-    "VYMO": (23.09250, 96.64530),
-    "VYMS": (20.51680, 99.25680),
-    "VYNP": (25.35440, 97.29520),
-    "VYNS": (20.89050, 97.73590),
-    "VYNT": (19.62350, 96.20100),
-    "VYPT": (27.32990, 97.42630),
-    "VYST": (20.94170, 95.91450),
-    "VYSW": (20.13317, 92.87069),
-    "VYTD": (18.46070, 94.30010),
-    "VYTL": (20.48380, 99.93540),
-    "VYYY": (16.90730, 96.13320),
-    "WAAA": (-5.07554, 119.55370),
-    "WABB": (-1.19002, 136.10800),
-    "WABI": (-3.39797, 135.39307),
-    "WABO": (-1.82842, 136.06240),
-    "WABP": (-4.52978, 136.88739),
-    "WADB": (-8.53718, 118.68500),
-    "WADD": (-8.74841, 115.16712),
-    "WADL": (-8.75996, 116.27817),
-    "WAEE": (0.83101, 127.38161),
-    "WAEW": (2.04599, 128.32500),
-    "WAFB": (-3.18583, 119.91775),
-    "WAFF": (-0.91646, 119.90865),
-    "WAFP": (-1.41412, 120.65924),
-    "WAFW": (-1.03589, 122.77393),
-    "WAGG": (-2.22715, 113.94339),
-    "WAHI": (-7.90534, 110.05726),
-    "WAHL": (-7.64506, 109.03400),
-    "WAJJ": (-2.57963, 140.51986),
-    "WAJO": (-4.90710, 140.62770),
-    "WAKK": (-8.52390, 140.41969),
-    "WAKT": (-6.09669, 140.30352),
-    "WALK": (-1.15861, 116.70805),
-    "WALL": (-1.26834, 116.89452),
-    "WALR": (3.32515, 117.56417),
-    "WALS": (-0.37448, 117.25013),
-    "WAMH": (3.68478, 125.52716),
-    "WAMM": (1.54859, 124.92625),
-    "WAON": (-2.21656, 115.43600),
-    "WAOO": (-3.44011, 114.76121),
-    "WAPF": (-5.76028, 132.75944),
-    "WAPN": (-3.14316, 126.97647),
-    "WAPP": (-3.71026, 128.08900),
-    "WAQT": (2.14776, 117.43071),
-    "WARA": (-7.92910, 112.71423),
-    "WARJ": (-7.78818, 110.43200),
-    "WARQ": (-7.51604, 110.75749),
-    "WARR": (-7.37983, 112.78700),
-    "WARS": (-6.97073, 110.37324),
-    "WASF": (-2.92051, 132.26701),
-    "WASK": (-3.64460, 133.69512),
-    "WASO": (-2.53224, 133.43900),
-    "WASR": (-0.89183, 134.04900),
-    "WASS": (-0.89400, 131.28700),
-    "WATT": (-10.17160, 123.67100),
-    "WAVV": (-4.09732, 138.95242),
-    "WAWD": (-5.29212, 123.63623),
-    "WAWP": (-4.33816, 121.52405),
-    "WBGB": (3.12385, 113.02000),
-    "WBGG": (1.48736, 110.35286),
-    "WBGJ": (4.80830, 115.01000),
-    "WBGK": (2.88194, 112.04333),
-    "WBGM": (4.17873, 114.33032),
-    "WBGR": (4.32201, 113.98700),
-    "WBGS": (2.26160, 111.98500),
-    "WBGZ": (3.73465, 115.47855),
-    "WBKD": (5.03241, 118.32376),
-    "WBKK": (5.93274, 116.04932),
-    "WBKL": (5.30167, 115.24833),
-    "WBKS": (5.90090, 118.05900),
-    "WBKW": (4.31338, 118.12152),
-    "WBMU": (4.04833, 114.80500),
-    "WBSB": (4.94420, 114.92800),
-    "WIBB": (0.45865, 101.44432),
-    "WIBD": (1.60903, 101.43349),
-    "WIBJ": (-0.35281, 102.33500),
-    "WICA": (-6.64738, 108.16556),
-    "WICC": (-6.90063, 107.57600),
-    "WIDD": (1.12103, 104.11900),
-    "WIDN": (0.92397, 104.53341),
-    "WIHH": (-6.26699, 106.89032),
-    "WIII": (-6.12557, 106.65600),
-    "WILL": (-5.24680, 105.18253),
-    "WIMB": (1.16627, 97.70520),
-    "WIME": (1.40010, 99.43050),
-    "WIMK": (3.55843, 98.67227),
-    "WIMM": (3.63785, 98.87057),
-    "WIMS": (1.55713, 98.88715),
-    "WIMU": (3.39146, 97.86373),
-    "WIOG": (-0.34864, 111.74616),
-    "WIOK": (-1.81716, 109.96347),
-    "WION": (3.90871, 108.38800),
-    "WIOO": (-0.15226, 109.40449),
-    "WIOP": (0.83458, 112.94022),
-    "WIOS": (-0.04521, 111.45805),
-    "WIPK": (-2.16220, 106.13900),
-    "WIPL": (-3.86370, 102.33900),
-    "WIPP": (-2.89765, 104.69815),
-    "WIPQ": (-3.28607, 103.88000),
-    "WIPT": (-0.78596, 100.28038),
-    "WITC": (4.04100, 96.25331),
-    "WITK": (4.72113, 96.85194),
-    "WITL": (5.06951, 97.25920),
-    "WITT": (5.52509, 95.41997),
-    "WMAP": (2.04139, 103.30700),
-    "WMBT": (2.81818, 104.16000),
-    "WMKA": (6.18967, 100.39800),
-    "WMKB": (5.46592, 100.39100),
-    "WMKC": (6.16685, 102.29300),
-    "WMKD": (3.77539, 103.20900),
-    "WMKE": (4.53722, 103.42700),
-    "WMKI": (4.56733, 101.09164),
-    "WMKJ": (1.64131, 103.67000),
-    "WMKK": (2.74558, 101.71000),
-    "WMKL": (6.32973, 99.72870),
-    "WMKM": (2.26561, 102.25278),
-    "WMKN": (5.38264, 103.10300),
-    "WMKP": (5.29630, 100.27618),
-    "WMSA": (3.13058, 101.54900),
-    "WPDB": (-9.30186, 125.28630),
-    "WPDL": (-8.54656, 125.52451),
-    "WPEC": (-8.48648, 126.39998),
-    "WPOC": (-9.19842, 124.33787),
-    "WSAC": (1.34414, 104.00900),
-    "WSAG": (1.42526, 103.81300),
-    "WSAP": (1.36042, 103.91000),
-    "WSAT": (1.38756, 103.70829),
-    "WSSL": (1.41555, 103.86673),
-    "WSSS": (1.35019, 103.99400),
-    "XRMU": (43.29810, 45.78410),
-    "XRWL": (50.20170, 45.20830),
-    "YABA": (-34.94333, 117.80889),
-    "YAMB": (-27.63538, 152.71122),
-    "YARA": (-37.30998, 142.98869),
-    "YARM": (-30.52810, 151.61700),
-    "YAYE": (-25.18591, 130.97703),
-    "YBAR": (-23.56627, 145.30209),
-    "YBAS": (-23.80659, 133.90343),
-    "YBBN": (-27.38420, 153.11700),
-    "YBCG": (-28.16596, 153.50664),
-    "YBCK": (-24.43168, 145.42972),
-    "YBCS": (-16.87892, 145.74948),
-    "YBCV": (-26.41330, 146.26199),
-    "YBDV": (-25.89750, 139.34801),
-    "YBHI": (-32.00140, 141.47200),
-    "YBHM": (-20.35810, 148.95200),
-    "YBIE": (-24.34610, 139.46001),
-    "YBKE": (-30.03920, 145.95200),
-    "YBLA": (-36.55190, 146.00700),
-    "YBMA": (-20.66638, 139.48847),
-    "YBMK": (-21.17082, 149.18259),
-    "YBNA": (-28.83324, 153.56147),
-    "YBNS": (-37.88754, 147.56938),
-    "YBOK": (-27.40926, 151.73673),
-    "YBOU": (-22.91330, 139.89999),
-    "YBPN": (-20.49442, 148.55358),
-    "YBRK": (-23.38002, 150.47536),
-    "YBRM": (-17.94919, 122.22830),
-    "YBRN": (-34.62483, 143.57711),
-    "YBRW": (-29.97579, 146.81438),
-    "YBSU": (-26.59332, 153.08319),
-    "YBTH": (-33.40682, 149.65116),
-    "YBTI": (-11.76497, 130.61577),
-    "YBTL": (-19.25290, 146.76651),
-    "YBTR": (-23.60310, 148.80701),
-    "YBUD": (-24.90504, 152.32261),
-    "YBWP": (-12.67749, 141.92262),
-    "YBWW": (-27.55833, 151.79334),
-    "YCAR": (-24.88434, 113.66639),
-    "YCBA": (-31.53830, 145.79401),
-    "YCBB": (-31.33250, 149.26700),
-    "YCBP": (-29.03831, 134.72217),
-    "YCCA": (-26.77195, 150.61757),
-    "YCCY": (-20.66860, 140.50400),
-    "YCDU": (-32.13060, 133.71001),
-    "YCEE": (-33.70970, 136.50501),
-    "YCFS": (-30.32060, 153.11600),
-    "YCIN": (-17.58139, 123.82833),
-    "YCKN": (-15.44365, 145.18322),
-    "YCMT": (-22.77310, 147.62100),
-    "YCMU": (-28.03000, 145.62199),
-    "YCNM": (-30.98095, 148.37783),
-    "YCOE": (-13.76113, 143.11331),
-    "YCOM": (-36.30045, 148.97241),
-    "YCOR": (-35.99470, 146.35700),
-    "YCRG": (-36.18280, 147.88800),
-    "YCTM": (-34.62428, 148.03664),
-    "YCWR": (-33.84689, 148.64801),
-    "YDBI": (-28.58791, 148.21716),
-    "YDBY": (-17.37193, 123.66221),
-    "YDLQ": (-35.55940, 144.94600),
-    "YDPO": (-41.16970, 146.42999),
-    "YDYS": (-22.62220, 148.36400),
-    "YECH": (-36.15720, 144.76199),
-    "YELD": (-12.01940, 135.57100),
-    "YEML": (-23.56750, 148.17900),
-    "YESP": (-33.68440, 121.82300),
-    "YEWA": (-22.42839, 116.88788),
-    "YFBS": (-33.36360, 147.93500),
-    "YFRT": (-30.83662, 128.11281),
-    "YFTZ": (-18.18360, 125.55978),
-    "YGDH": (-30.95751, 150.24898),
-    "YGEL": (-28.79610, 114.70700),
-    "YGFN": (-29.75480, 153.03123),
-    "YGLA": (-23.86976, 151.22544),
-    "YGLB": (-34.81030, 149.72600),
-    "YGLI": (-29.67603, 151.69116),
-    "YGPT": (-11.39969, 130.42557),
-    "YGTE": (-13.97241, 136.45855),
-    "YGTH": (-34.25080, 146.06700),
-    "YHAY": (-34.53140, 144.83000),
-    "YHBA": (-25.32013, 152.88066),
-    "YHID": (-10.58564, 142.29277),
-    "YHLC": (-18.23390, 127.67000),
-    "YHML": (-37.64890, 142.06500),
-    "YHOT": (-37.04750, 147.33400),
-    "YHPN": (-35.71530, 142.36000),
-    "YHSM": (-36.66970, 142.17300),
-    "YIVL": (-29.88830, 151.14400),
-    "YKER": (-35.75140, 143.93900),
-    "YKII": (-39.87750, 143.87801),
-    "YKMP": (-31.07232, 152.76531),
-    "YKOW": (-15.48537, 141.75257),
-    "YKRY": (-26.58108, 151.83993),
-    "YKSC": (-35.71390, 137.52100),
-    "YLEC": (-30.59830, 138.42600),
-    "YLEO": (-28.87810, 121.31500),
-    "YLHR": (-12.78690, 143.30499),
-    "YLIS": (-28.83069, 153.25842),
-    "YLRD": (-29.45286, 147.97715),
-    "YLRE": (-23.43420, 144.28000),
-    "YLST": (-27.84330, 120.70300),
-    "YLTV": (-38.21100, 146.47082),
-    "YMAV": (-38.04027, 144.46720),
-    "YMAY": (-36.06676, 146.95915),
-    "YMBA": (-17.07028, 145.42423),
-    "YMDG": (-32.56479, 149.60945),
-    "YMEK": (-26.61170, 118.54800),
-    "YMEN": (-37.72810, 144.90199),
-    "YMER": (-36.90860, 149.90100),
-    "YMES": (-38.09890, 147.14900),
-    "YMGD": (-12.05610, 134.23399),
-    "YMHB": (-42.83703, 147.51302),
-    "YMIA": (-34.22920, 142.08600),
-    "YMLT": (-41.54494, 147.21078),
-    "YMMB": (-37.97776, 145.09980),
-    "YMML": (-37.67073, 144.83790),
-    "YMNE": (-27.28733, 120.55494),
-    "YMOG": (-28.11610, 117.84200),
-    "YMOR": (-29.49890, 149.84500),
-    "YMRB": (-22.05780, 148.07700),
-    "YMRE": (-29.66330, 138.06500),
-    "YMRY": (-35.89780, 150.14400),
-    "YMTG": (-37.74438, 140.78056),
-    "YNAR": (-34.70220, 146.51199),
-    "YNBR": (-30.31920, 149.82700),
-    "YNGU": (-14.72280, 134.74699),
-    "YNRM": (-32.21470, 148.22501),
-    "YNTN": (-17.68409, 141.06966),
-    "YNWN": (-23.41780, 119.80300),
-    "YORG": (-33.38201, 149.13126),
-    "YPAD": (-34.94751, 138.53339),
-    "YPAG": (-32.50690, 137.71700),
-    "YPBO": (-23.17110, 117.74500),
-    "YPCC": (-12.19222, 96.83410),
-    "YPDN": (-12.41497, 130.88185),
-    "YPEA": (-31.66780, 116.01500),
-    "YPED": (-34.70571, 138.61556),
-    "YPGV": (-12.26940, 136.81799),
-    "YPIR": (-33.23890, 137.99499),
-    "YPJT": (-32.09750, 115.88100),
-    "YPKA": (-20.71220, 116.77300),
-    "YPKG": (-30.79154, 121.46459),
-    "YPKS": (-33.13140, 148.23900),
-    "YPKT": (-14.24970, 129.52954),
-    "YPKU": (-15.77810, 128.70799),
-    "YPLC": (-34.60530, 135.88000),
-    "YPLM": (-22.23520, 114.09002),
-    "YPMQ": (-31.43580, 152.86301),
-    "YPOD": (-38.31810, 141.47099),
-    "YPPD": (-20.38279, 118.62979),
-    "YPPH": (-31.94030, 115.96700),
-    "YPTN": (-14.52110, 132.37801),
-    "YPXM": (-10.45039, 105.69110),
-    "YQLP": (-26.60918, 144.25375),
-    "YREN": (-34.19640, 140.67400),
-    "YROM": (-26.54500, 148.77499),
-    "YSBK": (-33.92362, 150.99079),
-    "YSCB": (-35.30690, 149.19501),
-    "YSCN": (-34.03834, 150.68641),
-    "YSDU": (-32.21670, 148.57500),
-    "YSHK": (-25.89729, 113.57580),
-    "YSHL": (-34.56110, 150.78900),
-    "YSHT": (-36.42834, 145.39147),
-    "YSMI": (-40.83500, 145.08400),
-    "YSNB": (-11.41767, 130.64848),
-    "YSNF": (-29.04176, 167.93947),
-    "YSNW": (-34.94660, 150.54245),
-    "YSRI": (-33.60465, 150.78305),
-    "YSSY": (-33.94610, 151.17700),
-    "YSTW": (-31.07790, 150.84548),
-    "YSWG": (-35.16348, 147.46832),
-    "YSWH": (-35.37580, 143.53300),
-    "YSWL": (-37.07170, 142.74100),
-    "YTEF": (-21.71500, 122.22900),
-    "YTEM": (-34.42140, 147.51199),
-    "YTGM": (-27.98637, 143.81206),
-    "YTIB": (-29.45110, 142.05800),
-    "YTMU": (-35.26832, 148.24053),
-    "YTNG": (-24.49486, 150.57797),
-    "YTNK": (-19.63440, 134.18300),
-    "YTRE": (-31.88860, 152.51401),
-    "YWDH": (-25.41064, 142.66843),
-    "YWGT": (-36.41791, 146.30690),
-    "YWHA": (-33.05890, 137.51401),
-    "YWKB": (-36.32110, 142.41901),
-    "YWLG": (-30.03280, 148.12601),
-    "YWLM": (-32.79611, 151.83503),
-    "YWLU": (-26.62920, 120.22100),
-    "YWMC": (-28.90585, 136.34060),
-    "YWRN": (-31.73330, 147.80299),
-    "YWSL": (-38.09083, 146.96534),
-    "YWTN": (-22.36360, 143.08600),
-    "YWWL": (-33.93720, 147.19099),
-    "YWYY": (-40.99704, 145.72600),
-    "YYNG": (-34.25558, 148.24712),
-    "ZBAA": (40.07735, 116.59670),
-    "ZBAD": (39.50129, 116.41397),
-    "ZBBB": (39.95859, 116.25677),
-    "ZBCD": (41.12250, 118.07389),
-    "ZBCF": (42.15972, 118.84097),
-    "ZBDH": (39.66638, 119.06138),
-    "ZBDS": (39.49351, 109.85990),
-    "ZBDT": (40.06139, 113.48051),
-    "ZBER": (43.42408, 112.09108),
-    "ZBES": (47.31060, 119.91170),
-    "ZBHD": (36.52482, 114.42413),
-    "ZBHH": (40.84966, 111.82460),
-    "ZBHZ": (45.48722, 119.40722),
-    "ZBLA": (49.20862, 119.82230),
-    "ZBLF": (36.13263, 111.64124),
-    "ZBLL": (37.68333, 111.14278),
-    "ZBMZ": (49.56667, 117.33000),
-    "ZBOW": (40.56000, 109.99700),
-    "ZBSG": (39.27324, 112.69155),
-    "ZBSJ": (38.28070, 114.69700),
-    "ZBTJ": (39.12440, 117.34600),
-    "ZBTL": (43.55670, 122.20000),
-    "ZBUC": (41.13027, 113.10727),
-    "ZBUH": (39.79340, 106.79930),
-    "ZBXH": (43.91560, 115.96400),
-    "ZBYC": (35.11782, 111.03402),
-    "ZBYN": (37.74690, 112.62800),
-    "ZBYZ": (40.92636, 107.74093),
-    "ZBZJ": (40.73866, 114.93340),
-    "ZBZL": (47.86594, 122.76866),
-    "ZGBH": (21.53866, 109.29368),
-    "ZGBS": (23.72060, 106.96000),
-    "ZGCD": (28.91890, 111.64000),
-    "ZGCJ": (27.44309, 109.70467),
-    "ZGCZ": (25.75342, 112.84540),
-    "ZGDY": (29.10475, 110.44279),
-    "ZGFS": (23.08250, 113.07083),
-    "ZGGG": (23.39240, 113.29900),
-    "ZGHA": (28.18920, 113.22000),
-    "ZGHC": (24.80434, 107.71082),
-    "ZGHZ": (23.05000, 114.60000),
-    "ZGKL": (25.21983, 110.03955),
-    "ZGLG": (26.33866, 111.61004),
-    "ZGNN": (22.59807, 108.18192),
-    "ZGOW": (23.55200, 116.50330),
-    "ZGSD": (22.00640, 113.37600),
-    "ZGSY": (26.80612, 110.64104),
-    "ZGSZ": (22.63947, 113.80326),
-    "ZGWZ": (23.40316, 111.09331),
-    "ZGYL": (22.43304, 110.12000),
-    "ZGYY": (29.31170, 113.28157),
-    "ZGZH": (24.20750, 109.39100),
-    "ZGZJ": (21.48167, 110.59028),
-    "ZHCC": (34.52650, 113.84916),
-    "ZHEC": (30.34118, 115.03926),
-    "ZHES": (30.32030, 109.48500),
-    "ZHGH": (32.38866, 111.69425),
-    "ZHHH": (30.77480, 114.21372),
-    "ZHJZ": (30.29281, 112.44854),
-    "ZHLY": (34.74110, 112.38800),
-    "ZHSN": (31.62600, 110.34000),
-    "ZHSY": (32.59289, 110.90630),
-    "ZHXF": (32.15222, 112.29167),
-    "ZHXY": (32.54082, 114.07914),
-    "ZHYC": (30.55413, 111.48256),
-    "ZJHK": (19.93490, 110.45900),
-    "ZJQH": (19.14095, 110.45277),
-    "ZJSY": (18.30290, 109.41200),
-    "ZKHM": (41.42854, 129.64756),
-    "ZKPY": (39.22410, 125.67000),
-    "ZKSC": (39.41246, 125.89027),
-    "ZKSD": (39.74520, 127.47400),
-    "ZKWS": (39.16522, 127.48793),
-    "ZLDH": (40.16195, 94.81283),
-    "ZLDL": (37.12529, 97.26866),
-    "ZLGL": (34.41807, 100.30114),
-    "ZLGM": (36.40060, 94.78610),
-    "ZLGY": (36.07889, 106.21694),
-    "ZLHX": (38.20164, 90.83784),
-    "ZLHZ": (33.13353, 107.20382),
-    "ZLIC": (38.32276, 106.39321),
-    "ZLJC": (38.54222, 102.34833),
-    "ZLJQ": (39.85905, 98.33934),
-    "ZLLL": (36.51520, 103.62000),
-    "ZLLN": (33.78992, 105.79001),
-    "ZLQY": (35.80264, 107.59890),
-    "ZLSN": (34.37670, 109.12000),
-    "ZLTS": (34.56010, 105.86034),
-    "ZLXH": (34.81901, 102.62226),
-    "ZLXN": (36.52775, 102.04022),
-    "ZLXY": (34.44710, 108.75200),
-    "ZLYA": (36.47941, 109.46408),
-    "ZLYL": (38.35971, 109.59093),
-    "ZLYS": (32.83639, 97.03639),
-    "ZLZW": (37.57312, 105.15445),
-    "ZLZY": (38.80190, 100.67500),
-    "ZMAH": (46.25030, 102.80200),
-    "ZMAT": (46.37640, 96.22110),
-    "ZMBH": (46.16330, 100.70400),
-    "ZMBN": (48.85500, 103.47600),
-    "ZMBU": (46.66030, 113.28500),
-    "ZMCD": (48.13538, 114.64723),
-    "ZMCK": (47.64692, 106.81983),
-    "ZMDZ": (43.60863, 104.36773),
-    "ZMKD": (47.95410, 91.62820),
-    "ZMMN": (49.66368, 100.10003),
-    "ZMUB": (47.84310, 106.76700),
-    "ZMUG": (50.06659, 91.93827),
-    "ZMUL": (48.99330, 89.92250),
-    "ZPBS": (25.05330, 99.16830),
-    "ZPCW": (23.27633, 99.37317),
-    "ZPDL": (25.64940, 100.31900),
-    "ZPDQ": (27.79360, 99.67720),
-    "ZPJH": (21.97465, 100.76222),
-    "ZPJM": (22.41773, 99.78401),
-    "ZPLC": (23.73810, 100.02500),
-    "ZPLJ": (26.67748, 100.24494),
-    "ZPMS": (24.40110, 98.53170),
-    "ZPPP": (25.11031, 102.93674),
-    "ZPYM": (25.73750, 101.88200),
-    "ZPZT": (27.32755, 103.75617),
-    "ZSAM": (24.54389, 118.12745),
-    "ZSAQ": (30.58220, 117.05000),
-    "ZSBB": (32.84773, 117.32024),
-    "ZSCG": (31.92048, 119.77546),
-    "ZSCN": (28.86482, 115.90271),
-    "ZSDY": (37.50137, 118.78986),
-    "ZSFY": (32.88216, 115.73436),
-    "ZSFZ": (25.92925, 119.67252),
-    "ZSHC": (30.23609, 120.42887),
-    "ZSHZ": (35.21297, 115.73675),
-    "ZSJD": (29.33860, 117.17600),
-    "ZSJG": (35.64736, 116.74327),
-    "ZSJN": (36.85720, 117.21600),
-    "ZSJU": (28.96613, 118.89879),
-    "ZSLG": (34.41406, 119.17899),
-    "ZSLO": (25.67592, 116.74591),
-    "ZSLQ": (28.56220, 121.42900),
-    "ZSLY": (35.05292, 118.41183),
-    "ZSNB": (29.82670, 121.46200),
-    "ZSNJ": (31.73503, 118.86595),
-    "ZSNT": (32.07357, 120.98008),
-    "ZSOF": (31.98779, 116.97690),
-    "ZSPD": (31.14340, 121.80500),
-    "ZSQD": (36.36195, 120.08817),
-    "ZSQZ": (24.79585, 118.58860),
-    "ZSRG": (32.25834, 120.50113),
-    "ZSRZ": (35.40503, 119.32440),
-    "ZSSH": (33.79271, 119.12666),
-    "ZSSM": (26.42630, 117.83360),
-    "ZSSR": (28.37970, 117.96430),
-    "ZSSS": (31.19810, 121.33426),
-    "ZSSZ": (31.26310, 120.40100),
-    "ZSTX": (29.73330, 118.25600),
-    "ZSWA": (31.10450, 118.66687),
-    "ZSWF": (36.64670, 119.11900),
-    "ZSWH": (37.18710, 122.22900),
-    "ZSWX": (31.49695, 120.43038),
-    "ZSWY": (27.70190, 118.00100),
-    "ZSWZ": (27.91057, 120.85346),
-    "ZSXZ": (34.05906, 117.55528),
-    "ZSYA": (32.56340, 119.71980),
-    "ZSYC": (27.80250, 114.30620),
-    "ZSYN": (33.42832, 120.20545),
-    "ZSYT": (37.65972, 120.97812),
-    "ZSYW": (29.34210, 120.03116),
-    "ZSZS": (29.93387, 122.36231),
-    "ZUAL": (32.09794, 80.05397),
-    "ZUAS": (26.26056, 105.87333),
-    "ZUBD": (30.55360, 97.10830),
-    "ZUBJ": (27.26707, 105.47210),
-    "ZUCK": (29.71225, 106.65189),
-    "ZUDA": (31.04882, 107.43565),
-    "ZUDC": (29.31632, 100.06032),
-    "ZUDJ": (28.12100, 108.16310),
-    "ZUGH": (30.94850, 104.32960),
-    "ZUGU": (32.39025, 105.69457),
-    "ZUGY": (26.54181, 106.80402),
-    "ZUHY": (32.53154, 102.35224),
-    "ZUJZ": (32.85333, 103.68222),
-    "ZUKD": (30.14246, 101.73872),
-    "ZUKJ": (26.97200, 107.98800),
-    "ZULS": (29.29800, 90.91195),
-    "ZULZ": (29.03036, 105.46841),
-    "ZUMT": (27.96184, 106.43542),
-    "ZUMY": (31.42810, 104.74100),
-    "ZUNP": (26.32217, 109.14990),
-    "ZUNZ": (29.30330, 94.33530),
-    "ZUPS": (26.60942, 104.97900),
-    "ZUQJ": (29.51333, 108.83111),
-    "ZURK": (29.35088, 89.29916),
-    "ZUTC": (24.93806, 98.48583),
-    "ZUTF": (30.31252, 104.44128),
-    "ZUTR": (27.88333, 109.30889),
-    "ZUUU": (30.55826, 103.94597),
-    "ZUWL": (29.46566, 107.69366),
-    "ZUXC": (27.98910, 102.18400),
-    "ZUYB": (28.85843, 104.52616),
-    "ZUYI": (25.08342, 104.96080),
-    "ZUZH": (26.54000, 101.79852),
-    "ZUZY": (27.81072, 107.24719),
-    "ZWAK": (41.26250, 80.29170),
-    "ZWAT": (47.74989, 88.08581),
-    "ZWBL": (44.89546, 82.30007),
-    "ZWCM": (38.23452, 85.46546),
-    "ZWFY": (46.80417, 89.51201),
-    "ZWHM": (42.84140, 93.66920),
-    "ZWKL": (41.61498, 86.14082),
-    "ZWKN": (48.22230, 86.99590),
-    "ZWLK": (43.75654, 93.13716),
-    "ZWNL": (43.43180, 83.37860),
-    "ZWRQ": (38.97472, 88.00833),
-    "ZWSC": (38.24542, 77.05615),
-    "ZWSH": (39.54227, 76.02023),
-    "ZWSS": (42.91170, 90.24750),
-    "ZWTL": (43.03080, 89.09870),
-    "ZWTN": (37.03850, 79.86490),
-    "ZWWW": (43.91358, 87.47937),
-    "ZWYN": (43.95580, 81.33030),
-    "ZYAS": (41.10530, 122.85400),
-    "ZYBA": (45.50528, 123.01972),
-    "ZYBS": (42.06694, 127.60222),
-    "ZYCC": (43.99620, 125.68500),
-    "ZYCY": (41.53810, 120.43500),
-    "ZYDD": (40.02545, 124.28669),
-    "ZYDU": (48.44104, 126.12837),
-    "ZYFY": (48.19722, 134.36298),
-    "ZYHB": (45.62340, 126.25000),
-    "ZYHE": (50.17162, 127.30888),
-    "ZYJD": (50.37139, 124.11750),
-    "ZYJM": (46.84279, 130.46426),
-    "ZYJS": (47.10825, 132.65792),
-    "ZYJX": (45.29300, 131.19300),
-    "ZYJZ": (40.93603, 121.27711),
-    "ZYLD": (47.75206, 129.01913),
-    "ZYMD": (44.52517, 129.56863),
-    "ZYMH": (52.91687, 122.42276),
-    "ZYQQ": (47.22997, 123.91418),
-    "ZYSQ": (44.93114, 124.55212),
-    "ZYTL": (38.96572, 121.53848),
-    "ZYTN": (42.04843, 125.73396),
-    "ZYTX": (41.63980, 123.48367),
-    "ZYXC": (40.58033, 120.70037),
-    "ZYYJ": (42.88280, 129.45100),
-    "ZYYK": (40.54252, 122.35860),
-    "ZYYY": (41.78435, 123.49631),
-}
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+_MAGIC = b"PMSA"
+_HEADER = struct.Struct("<4sI")
+_COORD = struct.Struct("<i")
+_CODE_LEN = 4
+_SCALE = 100_000
+
+_DATA_PATH = Path(__file__).with_name("airports.bin")
+
+
+def encode_table(rows: Iterable[tuple[str, float, float]]) -> bytes:
+    """Pack ``(icao, lat, lon)`` rows into the ``airports.bin`` layout.
+
+    Rows are sorted by code here so lookups can bisect; callers don't
+    need to pre-sort. Codes must be 4 ASCII characters.
+    """
+    ordered = sorted(rows)
+    codes = bytearray()
+    for icao, _lat, _lon in ordered:
+        code = icao.encode("ascii")
+        if len(code) != _CODE_LEN:
+            raise ValueError(f"airport code must be 4 characters: {icao!r}")
+        codes += code
+    n = len(ordered)
+    lats = struct.pack(f"<{n}i", *(round(lat * _SCALE) for _, lat, _ in ordered))
+    lons = struct.pack(f"<{n}i", *(round(lon * _SCALE) for _, _, lon in ordered))
+    return _HEADER.pack(_MAGIC, n) + bytes(codes) + lats + lons
+
+
+class AirportTable(Mapping[str, tuple[float, float]]):
+    """Read-only ICAO code → (lat, lon) mapping over ``airports.bin``.
+
+    Nothing is read until the first lookup. Lookups bisect the sorted
+    code block and unpack two int32 values, so no per-airport Python
+    objects are kept alive between calls.
+
+    Args:
+        path: Table file in the layout produced by :func:`encode_table`.
+        use_mmap: Memory-map the file instead of reading it into a
+            ``bytes`` object. Falls back to a plain read when the
+            file can't be mapped (e.g. an empty file).
+    """
+
+    def __init__(self, path: str | Path = _DATA_PATH, *, use_mmap: bool = True) -> None:
+        self._path = Path(path)
+        self._use_mmap = use_mmap
+        self._buf: bytes | mmap.mmap | None = None
+        self._count = 0
+
+    def _load(self) -> bytes | mmap.mmap:
+        buf: bytes | mmap.mmap
+        if self._use_mmap:
+            try:
+                with self._path.open("rb") as fh:
+                    buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                buf = self._path.read_bytes()
+        else:
+            buf = self._path.read_bytes()
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"airport table too short: {self._path}")
+        magic, count = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or len(buf) != _HEADER.size + count * 12:
+            raise ValueError(f"malformed airport table: {self._path}")
+        self._count = count
+        self._buf = buf
+        return buf
+
+    def _index(self, buf: bytes | mmap.mmap, code: str) -> int:
+        """Return the row index of ``code``, or -1 if absent."""
+        if len(code) != _CODE_LEN or not code.isascii():
+            return -1
+        key = code.encode("ascii")
+        base = _HEADER.size
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            off = base + mid * _CODE_LEN
+            if buf[off : off + _CODE_LEN] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        off = base + lo * _CODE_LEN
+        if lo < self._count and buf[off : off + _CODE_LEN] == key:
+            return lo
+        return -1
+
+    def __getitem__(self, code: str) -> tuple[float, float]:
+        buf = self._buf if self._buf is not None else self._load()
+        idx = self._index(buf, code) if isinstance(code, str) else -1
+        if idx < 0:
+            raise KeyError(code)
+        lat_off = _HEADER.size + self._count * _CODE_LEN + idx * 4
+        lon_off = lat_off + self._count * 4
+        (lat,) = _COORD.unpack_from(buf, lat_off)
+        (lon,) = _COORD.unpack_from(buf, lon_off)
+        return lat / _SCALE, lon / _SCALE
+
+    def __len__(self) -> int:
+        if self._buf is None:
+            self._load()
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        buf = self._buf if self._buf is not None else self._load()
+        base = _HEADER.size
+        for i in range(self._count):
+            off = base + i * _CODE_LEN
+            yield buf[off : off + _CODE_LEN].decode("ascii")
+
+
+AIRPORTS: AirportTable = AirportTable()
@@ -29,6 +29,12 @@ Phase 2 -- heuristic slow path (Comm-B only)
     and produce false positives unless the caller opts in via
     ``include_meteo=True``.
 
+    When ``known`` carries the aircraft's BDS 1,7 capability report
+    as ``supported_bds`` (the list :func:`bds17.decode_bds17`
+    returns), heuristic validators for registers the aircraft does
+    not advertise are skipped. That both saves validator work and
+    removes false candidates for registers it can't be sending.
+
 Phase 3 -- reference-assisted disambiguation (Comm-B only)
     When multiple heuristic candidates (5,0 / 6,0) survive Phase 2
     and the caller passes ``known=`` aircraft state (groundspeed,
@@ -39,10 +45,28 @@ Phase 3 -- reference-assisted disambiguation (Comm-B only)
     the scorer can't disambiguate (e.g. no cached state at all),
     ``infer()`` returns the raw candidate list and the CommB class
     exposes it as ``bds_candidates`` so callers can choose.
+
+Memoisation
+    Phases 1-2 depend only on the payload bits, ``include_meteo`` and
+    the capability filter, not on the DF or on any other aircraft
+    state, and interrogated aircraft
+    return identical MB payloads for consecutive polls (BDS 1,0 / 1,7
+    capability registers, repeated BDS 2,0 callsigns, an unchanged
+    BDS 4,0 selected altitude). Their candidate tuple is kept in a
+    bounded LRU cache keyed by ``(payload, include_meteo, capability
+    filter)``. Phase 3
+    stays per call because ``known`` changes from reply to reply, but
+    it only runs when ``known`` carries at least one field the scorer
+    compares -- otherwise every candidate scores ``inf`` and the order
+    can't change -- and the decoded scoring fields per ``(bds, payload)``
+    are cached too. :func:`cache_info` reports hit/miss counters for
+    both caches (surfaced as the ``infer_*`` entries of
+    ``PipeDecoder.stats``); :func:`cache_clear` empties them.
 """
 
 from collections.abc import Callable
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from pyModeS.decoder.bds import (
     bds10,
@@ -79,6 +103,13 @@ _HEURISTIC_METEO: list[tuple[str, Callable[[int], bool]]] = [
     ("4,5", bds45.is_bds45),
 ]
 
+# Heuristic registers a BDS 1,7 capability report can rule out. The
+# format-ID registers are never filtered: 1,0 / 1,7 / 3,0 aren't in
+# the capability map, and 2,0 is mandatory.
+_HEURISTIC_CODES: frozenset[str] = frozenset(
+    code for code, _fn in _HEURISTIC + _HEURISTIC_METEO
+)
+
 # Field-by-field scoring config for Phase 3 disambiguation.
 # Each tuple: (decoded_key, known_key, scale). Lower normalized
 # distance = better match against the caller-supplied aircraft state.
@@ -94,12 +125,37 @@ _SCORE_FIELDS_BDS60: list[tuple[str, str, float]] = [
 ]
 
 
-def _score_candidate(bds_code: str, payload: int, known: dict[str, Any]) -> float:
-    """Score how well a candidate matches the known aircraft state.
+# Every `known` key any scorer reads. Phase 3 is skipped outright when
+# `known` carries none of them.
+_SCORE_KNOWN_KEYS: frozenset[str] = frozenset(
+    known_key for _d, known_key, _s in _SCORE_FIELDS_BDS50 + _SCORE_FIELDS_BDS60
+)
 
-    Lower score = better match. Returns inf if no fields could be
-    compared (i.e., `known` doesn't carry any of the fields this BDS
-    register would emit).
+# Bound on distinct payloads remembered by the Phase 1-2 cache. A busy
+# interrogated airspace produces a few thousand distinct MB payloads a
+# minute; 4096 entries keeps the steady-state working set while
+# capping memory at a few hundred KB.
+_CACHE_SIZE = 4096
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss counters for the inference caches (see :func:`cache_info`)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    score_hits: int
+    score_misses: int
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _score_values(bds_code: str, payload: int) -> tuple[tuple[str, float, float], ...]:
+    """Decoded (known_key, value, scale) triples a candidate is scored on.
+
+    Fields the register leaves unset (None) are dropped. Cached because
+    Phase 3 re-scores the same ambiguous payload against each new
+    ``known`` state.
     """
     if bds_code == "5,0":
         decoded = bds50.decode_bds50(payload)
@@ -108,16 +164,28 @@ def _score_candidate(bds_code: str, payload: int, known: dict[str, Any]) -> floa
         decoded = bds60.decode_bds60(payload)
         fields = _SCORE_FIELDS_BDS60
     else:
-        return float("inf")
+        return ()
+    return tuple(
+        (known_key, float(decoded[decoded_key]), scale)
+        for decoded_key, known_key, scale in fields
+        if decoded.get(decoded_key) is not None
+    )
 
+
+def _score_candidate(bds_code: str, payload: int, known: dict[str, Any]) -> float:
+    """Score how well a candidate matches the known aircraft state.
+
+    Lower score = better match. Returns inf if no fields could be
+    compared (i.e., `known` doesn't carry any of the fields this BDS
+    register would emit).
+    """
     score = 0.0
     matched = 0
-    for decoded_key, known_key, scale in fields:
-        d_val = decoded.get(decoded_key)
+    for known_key, d_val, scale in _score_values(bds_code, payload):
         k_val = known.get(known_key)
-        if d_val is None or k_val is None:
+        if k_val is None:
             continue
-        score += abs(float(d_val) - float(k_val)) / scale
+        score += abs(d_val - float(k_val)) / scale
         matched += 1
 
     return score if matched > 0 else float("inf")
@@ -209,7 +277,9 @@ def infer(
         include_meteo: Comm-B only. When True, also try BDS 4,4 and
             4,5 heuristic validators. Ignored for DF 17/18.
         known: Comm-B only. Optional aircraft state for Phase 3
-            disambiguation of BDS 5,0 / 6,0. Ignored for DF 17/18.
+            disambiguation of BDS 5,0 / 6,0. A ``supported_bds`` list
+            (from a prior BDS 1,7 report) restricts Phase 2 to the
+            heuristic registers it names. Ignored for DF 17/18.
 
     Returns:
         A list of BDS code strings (e.g. ``"1,0"``, ``"5,0"``,
@@ -230,6 +300,59 @@ def infer(
     if payload == 0:
         return []
 
+    supported = known.get("supported_bds") if known else None
+    allowed = (
+        _HEURISTIC_CODES.intersection(supported) if supported is not None else None
+    )
+    candidates = list(_commb_candidates(payload, include_meteo, allowed))
+
+    # Phase 3 -- known-state disambiguation.
+    # When multiple candidates survive AND the caller gave us a
+    # reference state, re-rank only the 5,0 / 6,0 heuristic block.
+    # Format-ID candidates (1,0 / 1,7 / 2,0 / 3,0) are mutually
+    # exclusive and keep their leading position. Meteo candidates
+    # (4,4 / 4,5) aren't scored and stay at the back in their
+    # original order.
+    if (
+        known
+        and len(candidates) > 1
+        and not _SCORE_KNOWN_KEYS.isdisjoint(
+            k for k, v in known.items() if v is not None
+        )
+    ):
+        heuristic_candidates = [c for c in candidates if c in ("5,0", "6,0")]
+        if len(heuristic_candidates) > 1:
+            scored = sorted(
+                heuristic_candidates,
+                key=lambda c: _score_candidate(c, payload, known),
+            )
+            first_heuristic_idx = next(
+                i for i, c in enumerate(candidates) if c in ("5,0", "6,0")
+            )
+            pre = candidates[:first_heuristic_idx]
+            tail = [
+                c for c in candidates[first_heuristic_idx:] if c not in ("5,0", "6,0")
+            ]
+            candidates = pre + scored + tail
+
+    return candidates
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _commb_candidates(
+    payload: int,
+    include_meteo: bool,
+    allowed: frozenset[str] | None,
+) -> tuple[str, ...]:
+    """Phases 1-2 of the Comm-B scan, memoised per payload.
+
+    ``allowed`` is the subset of heuristic registers the aircraft
+    advertises in BDS 1,7, or None when no capability report is known
+    (every heuristic validator runs).
+
+    Returns a tuple so cached results can't be mutated by callers;
+    :func:`infer` copies it into a fresh list before Phase 3.
+    """
     candidates: list[str] = []
 
     # Phase 1 -- format-ID fast path.
@@ -248,35 +371,32 @@ def infer(
 
     # Phase 2 -- heuristic slow path.
     for code, validator in _HEURISTIC:
-        if validator(payload):
+        if (allowed is None or code in allowed) and validator(payload):
             candidates.append(code)
 
     if include_meteo:
         for code, validator in _HEURISTIC_METEO:
-            if validator(payload):
+            if (allowed is None or code in allowed) and validator(payload):
                 candidates.append(code)
 
-    # Phase 3 -- known-state disambiguation.
-    # When multiple candidates survive AND the caller gave us a
-    # reference state, re-rank only the 5,0 / 6,0 heuristic block.
-    # Format-ID candidates (1,0 / 1,7 / 2,0 / 3,0) are mutually
-    # exclusive and keep their leading position. Meteo candidates
-    # (4,4 / 4,5) aren't scored and stay at the back in their
-    # original order.
-    if known and len(candidates) > 1:
-        heuristic_candidates = [c for c in candidates if c in ("5,0", "6,0")]
-        if len(heuristic_candidates) > 1:
-            scored = sorted(
-                heuristic_candidates,
-                key=lambda c: _score_candidate(c, payload, known),
-            )
-            first_heuristic_idx = next(
-                i for i, c in enumerate(candidates) if c in ("5,0", "6,0")
-            )
-            pre = candidates[:first_heuristic_idx]
-            tail = [
-                c for c in candidates[first_heuristic_idx:] if c not in ("5,0", "6,0")
-            ]
-            candidates = pre + scored + tail
+    return tuple(candidates)
 
-    return candidates
+
+def cache_info() -> CacheInfo:
+    """Return hit/miss counters for the Phase 1-2 and Phase 3 caches."""
+    phases = _commb_candidates.cache_info()
+    score = _score_values.cache_info()
+    return CacheInfo(
+        hits=phases.hits,
+        misses=phases.misses,
+        maxsize=phases.maxsize or 0,
+        currsize=phases.currsize,
+        score_hits=score.hits,
+        score_misses=score.misses,
+    )
+
+
+def cache_clear() -> None:
+    """Empty both inference caches and reset their counters."""
+    _commb_candidates.cache_clear()
+    _score_values.cache_clear()
@@ -56,7 +56,13 @@ class Decoded(dict[str, Any]):
         Uses `default=str` as a defensive fallback for any
         non-JSON-native value, but every pyModeS-decoded field is
         already JSON-native (int, float, str, bool, None, list, dict).
+        Without ``indent`` the schema-aware encoder in ``_json`` is
+        used; the output is the same as ``json.dumps``.
         """
+        if indent is None:
+            from pyModeS._json import dumps
+
+            return dumps(self, compact=False)
         return json.dumps(self, indent=indent, default=str)
 
 
@@ -256,8 +262,10 @@ class Message:
             known: Optional aircraft state dict (e.g. {"groundspeed":
                 420, "track": 90, "altitude": 35000}) used by the
                 Comm-B BDS inference to disambiguate BDS 5,0 vs 6,0
-                when both heuristic validators pass. Ignored for
-                non-Comm-B downlink formats.
+                when both heuristic validators pass. A
+                ``supported_bds`` list (as decoded from BDS 1,7)
+                limits inference to the registers it names. Ignored
+                for non-Comm-B downlink formats.
             full_dict: When True, the result dict is augmented with
                 every key from `_FULL_SCHEMA`, defaulting missing
                 keys to `None`. Useful for pandas/parquet workflows
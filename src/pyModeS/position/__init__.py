@@ -1,4 +1,12 @@
-"""CPR position decoding and surface-reference lookup."""
+"""CPR position decoding and surface-reference lookup.
+
+The ``*_array`` resolvers are NumPy-vectorised variants of the scalar
+functions for bulk reprocessing. They need the optional ``numpy``
+extra and are imported on first access, so ``import pyModeS.position``
+never pulls numpy in.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from pyModeS.position._airports import resolve_surface_ref
 from pyModeS.position._cpr import (
@@ -9,11 +17,43 @@ from pyModeS.position._cpr import (
     surface_position_with_ref,
 )
 
+if TYPE_CHECKING:
+    from pyModeS.position._cpr_array import (
+        airborne_position_pair_array,
+        airborne_position_with_ref_array,
+        cprNL_array,
+        surface_position_pair_array,
+        surface_position_with_ref_array,
+    )
+
 __all__ = [
     "airborne_position_pair",
+    "airborne_position_pair_array",
     "airborne_position_with_ref",
+    "airborne_position_with_ref_array",
     "cprNL",
+    "cprNL_array",
     "resolve_surface_ref",
     "surface_position_pair",
+    "surface_position_pair_array",
     "surface_position_with_ref",
+    "surface_position_with_ref_array",
 ]
+
+_ARRAY_NAMES: frozenset[str] = frozenset(
+    {
+        "airborne_position_pair_array",
+        "airborne_position_with_ref_array",
+        "cprNL_array",
+        "surface_position_pair_array",
+        "surface_position_with_ref_array",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ARRAY_NAMES:
+        from pyModeS.position import _cpr_array
+
+        return getattr(_cpr_array, name)
+    raise AttributeError(f"module 'pyModeS.position' has no attribute {name!r}")
@@ -0,0 +1,205 @@
+"""NumPy array variants of the CPR position resolvers.
+
+Each function mirrors its scalar counterpart in :mod:`._cpr`
+operation for operation, so every element of the output is
+bit-identical to calling the scalar function on that element.
+Where the scalar pair resolvers return ``None`` (latitude-zone
+mismatch or an out-of-range result), the array variants emit NaN
+in both the latitude and longitude slot.
+
+Inputs broadcast against each other: raw CPR fields are typically
+int arrays of equal length, while references and ``even_is_newer``
+may be scalars or arrays.
+
+numpy is an optional dependency (``pip install "pyModeS[numpy]"``).
+This module is only imported on first access to one of the
+``*_array`` names in :mod:`pyModeS.position`, so the scalar decode
+path never pays for it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover - exercised without numpy only
+    raise ImportError(
+        "vectorised CPR decoding requires the optional `numpy` package; "
+        'install via: pip install "pyModeS[numpy]"'
+    ) from e
+
+from pyModeS.position._cpr import _CPR_DENOM, _NL_BOUNDARIES
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+_NL_TABLE: FloatArray = np.asarray(_NL_BOUNDARIES, dtype=np.float64)
+
+
+def cprNL_array(lat: npt.ArrayLike) -> IntArray:
+    """Vectorised :func:`~pyModeS.position.cprNL`.
+
+    A single ``searchsorted`` over the NL boundary table replaces the
+    per-element bisect; the ±87° special cases are patched in after.
+    """
+    abs_lat = np.abs(np.asarray(lat, dtype=np.float64))
+    nl = 59 - np.searchsorted(_NL_TABLE, abs_lat, side="right").astype(np.int64)
+    nl = np.where(abs_lat == 87.0, 2, nl)
+    return np.where(abs_lat > 87.0, 1, nl)
+
+
+def airborne_position_with_ref_array(
+    cpr_format: npt.ArrayLike,
+    cpr_lat_raw: npt.ArrayLike,
+    cpr_lon_raw: npt.ArrayLike,
+    lat_ref: npt.ArrayLike,
+    lon_ref: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Vectorised :func:`~pyModeS.position.airborne_position_with_ref`."""
+    return _with_ref(cpr_format, cpr_lat_raw, cpr_lon_raw, lat_ref, lon_ref, 360.0)
+
+
+def surface_position_with_ref_array(
+    cpr_format: npt.ArrayLike,
+    cpr_lat_raw: npt.ArrayLike,
+    cpr_lon_raw: npt.ArrayLike,
+    lat_ref: npt.ArrayLike,
+    lon_ref: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Vectorised :func:`~pyModeS.position.surface_position_with_ref`."""
+    return _with_ref(cpr_format, cpr_lat_raw, cpr_lon_raw, lat_ref, lon_ref, 90.0)
+
+
+def _with_ref(
+    cpr_format: npt.ArrayLike,
+    cpr_lat_raw: npt.ArrayLike,
+    cpr_lon_raw: npt.ArrayLike,
+    lat_ref: npt.ArrayLike,
+    lon_ref: npt.ArrayLike,
+    span: float,
+) -> tuple[FloatArray, FloatArray]:
+    """Shared airborne (360° span) / surface (90° span) reference resolver."""
+    fmt = np.asarray(cpr_format, dtype=np.int64)
+    cpr_lat = np.asarray(cpr_lat_raw) / _CPR_DENOM
+    cpr_lon = np.asarray(cpr_lon_raw) / _CPR_DENOM
+    d_lat = np.where(fmt != 0, span / 59, span / 60)
+
+    j = np.floor(0.5 + np.asarray(lat_ref, dtype=np.float64) / d_lat - cpr_lat)
+    lat = d_lat * (j + cpr_lat)
+
+    ni = cprNL_array(lat) - fmt
+    d_lon = np.where(ni > 0, span / np.maximum(ni, 1), span)
+
+    m = np.floor(0.5 + np.asarray(lon_ref, dtype=np.float64) / d_lon - cpr_lon)
+    lon = d_lon * (m + cpr_lon)
+    return lat, lon
+
+
+def _pair_zones(
+    cpr_lat_even_raw: npt.ArrayLike,
+    cpr_lon_even_raw: npt.ArrayLike,
+    cpr_lat_odd_raw: npt.ArrayLike,
+    cpr_lon_odd_raw: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray, FloatArray]:
+    """Normalised CPR fractions plus the shared latitude index ``j``."""
+    cprlat_even = np.asarray(cpr_lat_even_raw) / _CPR_DENOM
+    cprlon_even = np.asarray(cpr_lon_even_raw) / _CPR_DENOM
+    cprlat_odd = np.asarray(cpr_lat_odd_raw) / _CPR_DENOM
+    cprlon_odd = np.asarray(cpr_lon_odd_raw) / _CPR_DENOM
+    j = np.floor(59 * cprlat_even - 60 * cprlat_odd + 0.5)
+    return cprlat_even, cprlon_even, cprlat_odd, cprlon_odd, j
+
+
+def _pair_lon(
+    lat_even: FloatArray,
+    lat_odd: FloatArray,
+    cprlon_even: FloatArray,
+    cprlon_odd: FloatArray,
+    even_is_newer: npt.ArrayLike,
+    span: float,
+) -> tuple[FloatArray, FloatArray, Any]:
+    """Pick the newer frame's latitude and compute its base longitude.
+
+    Returns ``(lat, lon, zones_match)``; ``zones_match`` is the
+    ``cprNL(lat_even) == cprNL(lat_odd)`` mask.
+    """
+    newer_even = np.asarray(even_is_newer, dtype=bool)
+    nl_even = cprNL_array(lat_even)
+    zones_match = nl_even == cprNL_array(lat_odd)
+
+    lat = np.where(newer_even, lat_even, lat_odd)
+    nl = cprNL_array(lat)
+    ni = np.where(newer_even, np.maximum(nl, 1), np.maximum(nl - 1, 1))
+    m = np.floor(cprlon_even * (nl - 1) - cprlon_odd * nl + 0.5)
+    cprlon = np.where(newer_even, cprlon_even, cprlon_odd)
+    lon = (span / ni) * (m % ni + cprlon)
+    return lat, lon, zones_match
+
+
+def airborne_position_pair_array(
+    cpr_lat_even_raw: npt.ArrayLike,
+    cpr_lon_even_raw: npt.ArrayLike,
+    cpr_lat_odd_raw: npt.ArrayLike,
+    cpr_lon_odd_raw: npt.ArrayLike,
+    *,
+    even_is_newer: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Vectorised :func:`~pyModeS.position.airborne_position_pair`.
+
+    Elements the scalar resolver would reject (``None``) come back
+    as NaN in both outputs.
+    """
+    cprlat_even, cprlon_even, cprlat_odd, cprlon_odd, j = _pair_zones(
+        cpr_lat_even_raw, cpr_lon_even_raw, cpr_lat_odd_raw, cpr_lon_odd_raw
+    )
+    lat_even = (360.0 / 60) * (j % 60 + cprlat_even)
+    lat_odd = (360.0 / 59) * (j % 59 + cprlat_odd)
+    lat_even = np.where(lat_even >= 270, lat_even - 360, lat_even)
+    lat_odd = np.where(lat_odd >= 270, lat_odd - 360, lat_odd)
+
+    lat, lon, ok = _pair_lon(
+        lat_even, lat_odd, cprlon_even, cprlon_odd, even_is_newer, 360.0
+    )
+    lon = np.where(lon > 180, lon - 360, lon)
+    ok = ok & (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+    return np.where(ok, lat, np.nan), np.where(ok, lon, np.nan)
+
+
+def surface_position_pair_array(
+    cpr_lat_even_raw: npt.ArrayLike,
+    cpr_lon_even_raw: npt.ArrayLike,
+    cpr_lat_odd_raw: npt.ArrayLike,
+    cpr_lon_odd_raw: npt.ArrayLike,
+    *,
+    lat_ref: npt.ArrayLike,
+    lon_ref: npt.ArrayLike,
+    even_is_newer: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Vectorised :func:`~pyModeS.position.surface_position_pair`.
+
+    Elements whose even/odd latitudes fall in different NL zones come
+    back as NaN in both outputs.
+    """
+    cprlat_even, cprlon_even, cprlat_odd, cprlon_odd, j = _pair_zones(
+        cpr_lat_even_raw, cpr_lon_even_raw, cpr_lat_odd_raw, cpr_lon_odd_raw
+    )
+    lat_even_n = (90.0 / 60) * (j % 60 + cprlat_even)
+    lat_odd_n = (90.0 / 59) * (j % 59 + cprlat_odd)
+    north = np.asarray(lat_ref, dtype=np.float64) > 0
+    lat_even = np.where(north, lat_even_n, lat_even_n - 90)
+    lat_odd = np.where(north, lat_odd_n, lat_odd_n - 90)
+
+    lat, lon_base, ok = _pair_lon(
+        lat_even, lat_odd, cprlon_even, cprlon_odd, even_is_newer, 90.0
+    )
+
+    # Four quadrant candidates stacked on a trailing axis; argmin picks
+    # the first closest one, matching the scalar ``min(..., key=...)``.
+    quadrants = np.array([0, 90, 180, 270], dtype=np.float64)
+    candidates = ((lon_base[..., np.newaxis] + quadrants + 180) % 360) - 180
+    dist = np.abs(np.asarray(lon_ref, dtype=np.float64)[..., np.newaxis] - candidates)
+    pick = np.argmin(dist, axis=-1)[..., np.newaxis]
+    lon = np.take_along_axis(candidates, pick, axis=-1)[..., 0]
+    return np.where(ok, lat, np.nan), np.where(ok, lon, np.nan)
@@ -27,3 +27,52 @@ class TestResolveSurfaceRef:
 
         for code in ("EHAM", "KJFK", "NZCH", "LFPG", "EGLL", "RJTT"):
             assert code in AIRPORTS
+
+
+class TestAirportTable:
+    def _table(self, tmp_path, **kwargs):
+        from pyModeS.data.airports import AirportTable, encode_table
+
+        path = tmp_path / "airports.bin"
+        path.write_bytes(
+            encode_table(
+                [
+                    ("LFBO", 43.63500, 1.36778),
+                    ("EHAM", 52.30806, 4.76417),
+                    ("SCEL", -33.39300, -70.78580),
+                ]
+            )
+        )
+        return AirportTable(path, **kwargs)
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_lookup_round_trips_five_decimals(self, tmp_path, use_mmap):
+        table = self._table(tmp_path, use_mmap=use_mmap)
+        assert table["EHAM"] == (52.30806, 4.76417)
+        assert table["SCEL"] == (-33.393, -70.7858)
+        assert len(table) == 3
+        assert list(table) == ["EHAM", "LFBO", "SCEL"]
+
+    def test_missing_codes(self, tmp_path):
+        table = self._table(tmp_path)
+        assert "ZZZZ" not in table
+        assert "EHA" not in table
+        assert "ÉHAM" not in table
+        assert table.get("AAAA") is None
+        with pytest.raises(KeyError):
+            table["ZZZZ"]
+
+    def test_load_is_lazy(self, tmp_path):
+        from pyModeS.data.airports import AirportTable
+
+        table = AirportTable(tmp_path / "does-not-exist.bin")
+        with pytest.raises(FileNotFoundError):
+            table["EHAM"]
+
+    def test_malformed_file_rejected(self, tmp_path):
+        from pyModeS.data.airports import AirportTable
+
+        path = tmp_path / "airports.bin"
+        path.write_bytes(b"NOPE\x00\x00\x00\x00")
+        with pytest.raises(ValueError, match="malformed"):
+            len(AirportTable(path))
@@ -1,8 +1,8 @@
 """Offline smoke test for scripts/build_airport_db.py.
 
 We do not hit the network in CI. Instead we exercise filter_and_sort
-and write_module with a synthetic row set and verify the output
-contract: sorted, deterministic, correct dict shape.
+and write_table with a synthetic row set and verify the output
+contract: sorted, deterministic, readable by AirportTable.
 """
 
 from __future__ import annotations
@@ -112,19 +112,18 @@ def test_filter_drops_invalid_coords():
     assert [r["icao"] for r in out] == ["OKAY"]
 
 
-def test_write_module_produces_importable_file(tmp_path, monkeypatch):
+def test_write_table_produces_loadable_file(tmp_path, monkeypatch):
+    from pyModeS.data.airports import AirportTable
+
     mod = _load_script()
-    target = tmp_path / "airports.py"
+    target = tmp_path / "airports.bin"
     monkeypatch.setattr(mod, "OUTPUT", target)
     rows = [
-        {"icao": "AAAA", "lat": 1.0, "lon": 2.0},
         {"icao": "BBBB", "lat": 3.5, "lon": 4.25},
+        {"icao": "AAAA", "lat": 1.0, "lon": -2.0},
     ]
-    mod.write_module(rows)  # type: ignore[attr-defined]
-    text = target.read_text()
-    assert '"AAAA": (1.00000, 2.00000)' in text
-    assert '"BBBB": (3.50000, 4.25000)' in text
-    # Generated file should NOT contain a names dict
-    assert "AIRPORT_NAMES" not in text
-    # Compile the generated file as a sanity check
-    compile(text, str(target), "exec")
+    mod.write_table(rows)  # type: ignore[attr-defined]
+    table = AirportTable(target)
+    assert list(table) == ["AAAA", "BBBB"]
+    assert table["AAAA"] == (1.0, -2.0)
+    assert table["BBBB"] == (3.5, 4.25)
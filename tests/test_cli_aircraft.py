@@ -0,0 +1,136 @@
+"""Tests for the TUI's aircraft store and sorted index (pyModeS.cli._aircraft)."""
+
+from __future__ import annotations
+
+import random
+
+from pyModeS.cli._aircraft import (
+    EXPIRE_SECONDS,
+    AircraftIndex,
+    AircraftStore,
+    sort_value,
+)
+
+NOW = 1_000_000.0
+
+
+def _full_sort(states, key, ascending=True, query=""):
+    """What the TUI used to compute every tick: filter, then sort it all."""
+    rows = [
+        icao
+        for icao, st in states.items()
+        if st["_last_seen"] >= NOW - EXPIRE_SECONDS
+        and (
+            not query or query in icao or query in str(st.get("callsign") or "").lower()
+        )
+    ]
+    rows.sort(key=lambda icao: (sort_value(icao, states[icao], key), icao))
+    return rows if ascending else rows[::-1]
+
+
+class TestAircraftStore:
+    def test_merge_tracks_changed_and_seen(self):
+        store = AircraftStore()
+        store.merge(
+            [
+                ("abc123", {"icao": "abc123", "altitude": 35000, "df": 17}, NOW),
+                ("def456", {"icao": "def456", "callsign": None}, NOW),
+            ]
+        )
+        assert store.drain() == ({"abc123", "def456"}, {"abc123", "def456"})
+        assert store.states["abc123"] == {
+            "_first_seen": NOW,
+            "_last_seen": NOW,
+            "altitude": 35000,
+        }
+        assert "callsign" not in store.states["def456"]
+
+        # Same altitude again: seen, not changed.
+        store.merge([("abc123", {"altitude": 35000}, NOW + 1)])
+        store.merge([("def456", {"squawk": "7000"}, NOW + 1)])
+        assert store.drain() == ({"def456"}, {"abc123", "def456"})
+        assert store.states["abc123"]["_last_seen"] == NOW + 1
+        assert store.drain() == (set(), set())
+
+
+class TestAircraftIndex:
+    def _store(self, n, seed=0):
+        rng = random.Random(seed)
+        store = AircraftStore()
+        store.merge(
+            (
+                f"{i:06x}",
+                {
+                    "altitude": rng.choice([None, rng.randrange(0, 40000, 25)]),
+                    "callsign": rng.choice([None, f"KLM{i % 50}"]),
+                    "groundspeed": rng.randrange(100, 500),
+                },
+                NOW - rng.uniform(0, 2 * EXPIRE_SECONDS),
+            )
+            for i in range(n)
+        )
+        return store, rng
+
+    def test_incremental_updates_match_full_sort(self):
+        store, rng = self._store(500)
+        index = AircraftIndex(store.states, sort_key="altitude")
+        index.apply(*store.drain(), NOW)
+        assert index.window(0, 1000) == _full_sort(store.states, "altitude")
+        for _ in range(20):
+            burst = []
+            for icao in rng.sample(sorted(store.states), 30):
+                burst.append((icao, {"altitude": rng.randrange(0, 40000)}, NOW))
+            store.merge(burst)
+            index.apply(*store.drain(), NOW)
+            assert index.window(0, 1000) == _full_sort(store.states, "altitude")
+
+    def test_descending_positions_and_windows(self):
+        store, _ = self._store(200)
+        index = AircraftIndex(store.states, sort_key="groundspeed", ascending=False)
+        index.apply(*store.drain(), NOW)
+        expected = _full_sort(store.states, "groundspeed", ascending=False)
+        assert len(index) == len(expected)
+        assert index.window(0, 10) == expected[:10]
+        assert index.window(len(expected) - 3, 10) == expected[-3:]
+        for pos in (0, 7, len(expected) - 1):
+            assert index.at(pos) == expected[pos]
+            assert index.position(expected[pos]) == pos
+
+    def test_resort_applies_query_and_key(self):
+        store, _ = self._store(300)
+        index = AircraftIndex(store.states)
+        index.apply(*store.drain(), NOW)
+        index.resort(NOW, sort_key="callsign", query="klm1")
+        expected = _full_sort(store.states, "callsign", query="klm1")
+        assert expected
+        assert index.window(0, 1000) == expected
+        # A callsign change moves the aircraft into or out of the filter.
+        outsider = next(i for i in store.states if i not in expected)
+        store.merge([(outsider, {"callsign": "KLM123"}, NOW)])
+        index.apply(*store.drain(), NOW)
+        assert outsider in index.window(0, 1000)
+
+    def test_last_seen_sort_follows_seen_aircraft(self):
+        store = AircraftStore()
+        store.merge([("aaaaaa", {}, NOW - 2), ("bbbbbb", {}, NOW - 1)])
+        index = AircraftIndex(store.states, sort_key="last_seen")
+        index.apply(*store.drain(), NOW)
+        assert index.window(0, 2) == ["aaaaaa", "bbbbbb"]
+        store.merge([("aaaaaa", {}, NOW)])
+        index.apply(*store.drain(), NOW)
+        assert index.window(0, 2) == ["bbbbbb", "aaaaaa"]
+
+    def test_expiry(self):
+        store = AircraftStore()
+        store.merge([("aaaaaa", {}, NOW), ("bbbbbb", {}, NOW + 10)])
+        index = AircraftIndex(store.states)
+        index.apply(*store.drain(), NOW + 10)
+        assert index.tracked == len(index) == 2
+        index.apply(set(), set(), NOW + EXPIRE_SECONDS + 5)
+        assert index.window(0, 10) == ["bbbbbb"]
+        assert index.position("aaaaaa") is None
+        assert index.tracked == 1
+        # Heard again: listed again.
+        store.merge([("aaaaaa", {}, NOW + EXPIRE_SECONDS + 6)])
+        index.apply(*store.drain(), NOW + EXPIRE_SECONDS + 6)
+        assert index.window(0, 10) == ["aaaaaa", "bbbbbb"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import pytest
 
 from pyModeS.cli._args import build_parser
@@ -92,6 +94,104 @@ class TestDecodeSubcommand:
         )
         assert args.surface_ref == "LFBO"
 
+    def test_decode_jobs_flags(self):
+        parser = build_parser()
+        args = parser.parse_args(
+            ["decode", "--file", "in.csv", "-j", "4", "--unordered", "--check"]
+        )
+        assert args.jobs == 4
+        assert args.unordered is True
+        assert args.check == 10000
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["decode", "8D406B902015A678D4D220AA4BDA", "--jobs", "2"],
+            ["decode", "--file", "in.csv", "--jobs", "0"],
+            ["decode", "--file", "in.csv", "--unordered"],
+            ["decode", "--file", "in.csv", "--check", "100"],
+            ["decode", "8D406B902015A678D4D220AA4BDA", "--mlat-hz", "1e9"],
+        ],
+    )
+    def test_decode_jobs_misuse_errors(self, argv):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(argv)
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
+    @pytest.mark.parametrize(
+        ("path", "extra", "expected"),
+        [
+            ("day.parquet", [], "parquet"),
+            ("day.PQ", [], "parquet"),
+            ("day.feather", [], "arrow"),
+            ("day.jsonl", [], "jsonl"),
+            ("day.db", [], "sqlite"),
+            ("day.sqlite3", [], "sqlite"),
+            ("day.jsonl.gz", [], "jsonl"),
+            ("day.zst", [], "jsonl"),
+            ("day.out", ["--dump-format", "arrow"], "arrow"),
+            ("day.parquet", ["--dump-format", "jsonl"], "jsonl"),
+        ],
+    )
+    def test_decode_dump_format(self, path, extra, expected):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            ["decode", "--file", "in.csv", "--dump-to", path, *extra]
+        )
+        validate_args(args, parser)
+        assert args.dump_format == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["decode", "8D406B902015A678D4D220AA4BDA", "--dump-to", "x.parquet"],
+            ["decode", "--file", "in.csv", "--dump-format", "parquet"],
+            [
+                "decode",
+                "--file",
+                "in.csv",
+                "--dump-to",
+                "x.jsonl",
+                "--rotate-bytes",
+                "1",
+            ],
+            [
+                "decode",
+                "--file",
+                "in.csv",
+                "--dump-to",
+                "x.pq",
+                "--row-group-size",
+                "0",
+            ],
+            ["decode", "--file", "in.csv", "-j", "2", "--check", "--dump-to", "x.pq"],
+            ["decode", "--file", "in.csv", "--dump-to", "x.parquet.gz"],
+            [
+                "decode",
+                "--file",
+                "in.csv",
+                "--dump-to",
+                "x.zst",
+                "--dump-format",
+                "sqlite",
+            ],
+        ],
+    )
+    def test_decode_dump_misuse_errors(self, argv):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(argv)
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
 
 class TestLiveSubcommand:
     def test_live_help_exits_zero(self):
@@ -106,11 +206,28 @@ class TestLiveSubcommand:
             parser.parse_args(["live"])
         assert excinfo.value.code == 2
 
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--network", "h:1", "--unix", "/tmp/beast.sock"],
+            ["--unix", "/tmp/beast.sock", "--beast-stdin"],
+            ["--beast-stdin", "--tui"],
+        ],
+    )
+    def test_live_feed_conflicts_error(self, argv):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        with pytest.raises(SystemExit) as excinfo:
+            args = parser.parse_args(["live", *argv])
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
     def test_live_with_network(self):
         parser = build_parser()
         args = parser.parse_args(["live", "--network", "host.example:10003"])
         assert args.command == "live"
-        assert args.network == "host.example:10003"
+        assert args.network == ["host.example:10003"]
         assert args.tui is False
         assert args.quiet is False
         assert args.dump_to is None
@@ -131,11 +248,121 @@ class TestLiveSubcommand:
                 "out.jsonl",
             ]
         )
-        assert args.network == "host.example:10003"
+        assert args.network == ["host.example:10003"]
         assert args.surface_ref == "EHAM"
         assert args.full_dict is True
         assert args.dump_to == "out.jsonl"
 
+    def test_live_repeated_network(self):
+        parser = build_parser()
+        args = parser.parse_args(
+            ["live", "--network", "rx1:30005", "--network", "rx2:30005"]
+        )
+        assert args.network == ["rx1:30005", "rx2:30005"]
+
+    def test_live_flush_policy(self):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            [
+                "live",
+                "--network",
+                "h:1",
+                "--dump-to",
+                "out.jsonl",
+                "--flush-records",
+                "500",
+                "--flush-bytes",
+                "65536",
+                "--flush-ms",
+                "250",
+            ]
+        )
+        validate_args(args, parser)
+        assert args.flush_records == 500
+        assert args.flush_bytes == 65536
+        assert args.flush_ms == 250.0
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--flush-records", "10"],
+            ["--dump-to", "out.jsonl", "--flush-ms", "0"],
+            ["--dump-to", "out.jsonl", "--flush-bytes", "-1"],
+        ],
+    )
+    def test_live_flush_policy_misuse_errors(self, extra):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(["live", "--network", "h:1", *extra])
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
+    def test_live_columnar_dump(self):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            [
+                "live",
+                "--network",
+                "h:1",
+                "--dump-to",
+                "flight.parquet",
+                "--row-group-size",
+                "10000",
+                "--rotate-bytes",
+                "1000000",
+                "--rotate-seconds",
+                "3600",
+            ]
+        )
+        validate_args(args, parser)
+        assert args.dump_format == "parquet"
+        assert args.row_group_size == 10000
+        assert args.rotate_bytes == 1000000
+        assert args.rotate_seconds == 3600.0
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--dump-to", "f.arrow", "--flush-ms", "5"],
+            ["--dump-to", "f.db", "--flush-bytes", "4096"],
+            ["--dump-to", "f.db", "--rotate-seconds", "60"],
+        ],
+    )
+    def test_live_dump_flag_mismatch_errors(self, extra):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(["live", "--network", "h:1", *extra])
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
+    def test_live_sqlite_batch_flags(self):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            [
+                "live",
+                "--network",
+                "h:1",
+                "--dump-to",
+                "traffic.db",
+                "--flush-records",
+                "5000",
+                "--flush-ms",
+                "250",
+            ]
+        )
+        validate_args(args, parser)
+        assert args.dump_format == "sqlite"
+
     def test_live_tui_with_dump_to_errors(self):
         """--tui is incompatible with --dump-to (TUI owns terminal)."""
         from pyModeS.cli._args import validate_args
@@ -148,6 +375,29 @@ class TestLiveSubcommand:
             validate_args(args, parser)
         assert excinfo.value.code == 2
 
+    def test_live_tui_with_metrics_errors(self):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            ["live", "--network", "host:1234", "--tui", "--metrics", "9108"]
+        )
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
+    @pytest.mark.parametrize("extra", [["--tui"], []])
+    def test_live_bad_jobs_errors(self, extra):
+        """--jobs needs N >= 1 and can't drive the TUI."""
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        jobs = "2" if extra else "0"
+        args = parser.parse_args(["live", "--network", "h:1", "--jobs", jobs, *extra])
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
+
     def test_live_tui_with_quiet_errors(self):
         """--tui is incompatible with --quiet (nothing to suppress)."""
         from pyModeS.cli._args import validate_args
@@ -157,3 +407,39 @@ class TestLiveSubcommand:
         with pytest.raises(SystemExit) as excinfo:
             validate_args(args, parser)
         assert excinfo.value.code == 2
+
+
+class TestReplaySubcommand:
+    def test_defaults(self):
+        args = build_parser().parse_args(["replay", "--file", "day.beast"])
+        assert args.listen == "127.0.0.1:30005"
+        assert args.speed == 1.0
+        assert args.stats_interval == 10.0
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("10", 10.0), ("0.5", 0.5), ("MAX", math.inf)]
+    )
+    def test_speed(self, value, expected):
+        args = build_parser().parse_args(
+            ["replay", "--file", "day.beast", "--speed", value]
+        )
+        assert args.speed == expected
+
+    @pytest.mark.parametrize("value", ["0", "-2", "fast", "nan"])
+    def test_bad_speed_errors(self, value):
+        with pytest.raises(SystemExit) as excinfo:
+            build_parser().parse_args(
+                ["replay", "--file", "day.beast", "--speed", value]
+            )
+        assert excinfo.value.code == 2
+
+    def test_stats_interval_must_be_positive(self):
+        from pyModeS.cli._args import validate_args
+
+        parser = build_parser()
+        args = parser.parse_args(
+            ["replay", "--file", "day.beast", "--stats-interval", "0"]
+        )
+        with pytest.raises(SystemExit) as excinfo:
+            validate_args(args, parser)
+        assert excinfo.value.code == 2
@@ -0,0 +1,218 @@
+"""Tests for `modes live --serve` (pyModeS.cli._broadcast)."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pyModeS._json import dumps
+from pyModeS.cli._broadcast import Broadcaster, BroadcastSink
+from pyModeS.message import Decoded
+
+DF17 = bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _read_all(conn: socket.socket) -> bytes:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class TestBroadcaster:
+    def test_every_client_gets_every_byte(self):
+        server = Broadcaster(("127.0.0.1", 0))
+        clients = [socket.create_connection(server.address) for _ in range(3)]
+        try:
+            _wait(lambda: server.clients == 3)
+            for i in range(100):
+                server.send(b"line %d\n" % i)
+            server.close()
+            expected = b"".join(b"line %d\n" % i for i in range(100))
+            assert [_read_all(c) for c in clients] == [expected] * 3
+        finally:
+            for c in clients:
+                c.close()
+
+    def test_slow_client_is_dropped_others_keep_up(self):
+        logged: list[str] = []
+        server = Broadcaster(("127.0.0.1", 0), max_buffer=1 << 20, log=logged.append)
+        slow = socket.create_connection(server.address)
+        fast = socket.create_connection(server.address)
+        received = bytearray()
+        reader = threading.Thread(target=lambda: received.extend(_read_all(fast)))
+        try:
+            _wait(lambda: server.clients == 2)
+            reader.start()
+            chunk = b"x" * 16384
+            sent = 0
+            while server.dropped == 0:
+                server.send(chunk)
+                sent += len(chunk)
+                # Let the fast client's writes keep pace.
+                time.sleep(0.001)
+            assert server.clients == 1
+            server.close()
+            reader.join(5)
+            assert len(received) == sent
+            assert any(line.startswith("dropped slow client") for line in logged)
+        finally:
+            slow.close()
+            fast.close()
+
+    def test_unix_socket_replaces_stale_file(self, tmp_path):
+        path = str(tmp_path / "feed.sock")
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(path)
+        stale.close()
+        server = Broadcaster(path)
+        assert server.address == path
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(path)
+        try:
+            _wait(lambda: server.clients == 1)
+            server.send(b"hello\n")
+            server.close()
+            assert _read_all(client) == b"hello\n"
+        finally:
+            client.close()
+        assert not (tmp_path / "feed.sock").exists()
+
+    def test_refuses_to_replace_a_regular_file(self, tmp_path):
+        path = tmp_path / "not-a-socket"
+        path.write_text("keep me")
+        with pytest.raises(OSError):
+            Broadcaster(str(path))
+        assert path.read_text() == "keep me"
+
+
+class TestBroadcastSink:
+    def test_encodes_once_only_with_clients(self):
+        sent: list[bytes] = []
+        server = SimpleNamespace(clients=0, send=sent.append)
+        sink = BroadcastSink(server)
+        record = Decoded({"df": 17, "icao": "406B90"})
+        sink.write(record)
+        assert sent == []
+        assert not sink.writes_raw_msg
+        server.clients = 2
+        sink.write(record)
+        assert sent == [(dumps(record) + "\n").encode()]
+        assert sink.writes_raw_msg
+
+    def test_tee_shares_one_encoding_with_stdout(self, monkeypatch):
+        import io
+
+        from pyModeS.cli import _sink
+        from pyModeS.cli._sink import JsonLinesSink, NullSink, TeeSink
+
+        encoded: list[dict] = []
+
+        def counting_dumps(obj):
+            encoded.append(obj)
+            return dumps(obj)
+
+        monkeypatch.setattr(_sink, "dumps", counting_dumps)
+        sent: list[bytes] = []
+        server = SimpleNamespace(clients=1, send=sent.append)
+        stdout = io.StringIO()
+        record = Decoded({"df": 17, "icao": "406B90"})
+        tee = TeeSink(TeeSink(JsonLinesSink(stdout), NullSink()), BroadcastSink(server))
+        tee.write(record)
+        assert len(encoded) == 1
+        assert sent == [stdout.getvalue().encode()]
+        # Without a client the line is neither served nor encoded for it.
+        server.clients = 0
+        TeeSink(NullSink(), BroadcastSink(server)).write(record)
+        assert len(encoded) == 1
+
+
+class TestLiveServeCli:
+    @pytest.fixture
+    def servers(self, monkeypatch):
+        import pyModeS.cli._broadcast as broadcast_mod
+
+        created: list[Broadcaster] = []
+
+        class _Recording(Broadcaster):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(broadcast_mod, "Broadcaster", _Recording)
+        return created
+
+    def test_live_serves_json_lines(self, monkeypatch, servers, tmp_path, capsys):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        path = str(tmp_path / "live.sock")
+        client = socket.socket(socket.AF_UNIX)
+
+        class _Source:
+            sources = ()
+
+            def iter_batches(self):
+                client.connect(path)
+                _wait(lambda: servers[0].clients == 1)
+                yield [DF17, DF17], [1000.0, 1000.5]
+
+        monkeypatch.setattr(live_mod, "NetworkSource", lambda *a, **k: _Source())
+        try:
+            assert main(["live", "--network", "h:1", "--serve", f"unix:{path}"]) == 0
+            lines = _read_all(client).decode().splitlines()
+        finally:
+            client.close()
+        out, err = capsys.readouterr()
+        assert lines == out.splitlines()
+        assert [json.loads(line)["timestamp"] for line in lines] == [1000.0, 1000.5]
+        assert f"serving JSON lines on unix:{path}" in err
+        assert "client unix connected" in err
+
+    def test_quiet_serve_stamps_raw_msg_for_clients(
+        self, monkeypatch, servers, tmp_path, capsys
+    ):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        path = str(tmp_path / "live.sock")
+        client = socket.socket(socket.AF_UNIX)
+
+        class _Source:
+            sources = ()
+
+            def iter_batches(self):
+                # Nobody listening yet: nothing to serve or stamp.
+                yield [DF17], [999.0]
+                client.connect(path)
+                _wait(lambda: servers[0].clients == 1)
+                yield [DF17], [1000.0]
+
+        monkeypatch.setattr(live_mod, "NetworkSource", lambda *a, **k: _Source())
+        argv = ["live", "--network", "h:1", "--quiet", "--serve", f"unix:{path}"]
+        try:
+            assert main(argv) == 0
+            lines = _read_all(client).decode().splitlines()
+        finally:
+            client.close()
+        assert capsys.readouterr().out == ""
+        assert [json.loads(line)["raw_msg"] for line in lines] == [DF17.hex().upper()]
+
+    @pytest.mark.parametrize("value", ["unix:", "host:port", "70000"])
+    def test_bad_serve_address_exits_two(self, value, capsys):
+        from pyModeS.cli import main
+
+        assert main(["live", "--network", "h:1", "--serve", value]) == 2
+        assert "--serve must be PORT, HOST:PORT or unix:PATH" in capsys.readouterr().err
@@ -0,0 +1,178 @@
+"""Tests for the Parquet / Arrow IPC sink in pyModeS.cli._columnar."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pyModeS import PipeDecoder  # noqa: E402
+from pyModeS._schema import _FULL_SCHEMA  # noqa: E402
+from pyModeS.cli._columnar import SCHEMA, ColumnarSink  # noqa: E402
+from pyModeS.message import Decoded  # noqa: E402
+
+CORPUS = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+
+
+def _corpus() -> list[Decoded]:
+    pipe = PipeDecoder()
+    out = []
+    for line in CORPUS.read_text().splitlines():
+        fields = line.split(",")
+        hex_msg = fields[1].strip('"')
+        result = pipe.decode(hex_msg, timestamp=float(fields[0]))
+        result["raw_msg"] = hex_msg
+        result["timestamp"] = float(fields[0])
+        out.append(result)
+    return out
+
+
+def _read(path: Path, fmt: str) -> list[dict]:
+    if fmt == "parquet":
+        table = pq.read_table(path)
+    else:
+        with pa.OSFile(str(path), "rb") as fh:
+            table = pa.ipc.open_file(fh).read_all()
+    return table.to_pylist()
+
+
+def _full(record: dict) -> dict:
+    return {key: record.get(key) for key in SCHEMA.names}
+
+
+class TestColumnarSink:
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_round_trip_matches_records(self, tmp_path, fmt):
+        records = _corpus()
+        path = tmp_path / f"dump.{fmt}"
+        sink = ColumnarSink(str(path), fmt=fmt, row_group_size=1000)
+        for record in records:
+            sink.write(record)
+        sink.close()
+        assert _read(path, fmt) == [_full(r) for r in records]
+
+    def test_schema_covers_full_schema_plus_timestamp(self):
+        assert SCHEMA.names == [*_FULL_SCHEMA, "timestamp"]
+        assert SCHEMA.field("altitude").type == pa.int64()
+        assert SCHEMA.field("latitude").type == pa.float64()
+        assert SCHEMA.field("crc_valid").type == pa.bool_()
+        assert SCHEMA.field("bds_candidates").type == pa.list_(pa.string())
+
+    def test_row_groups(self, tmp_path):
+        path = tmp_path / "dump.parquet"
+        sink = ColumnarSink(str(path), row_group_size=100)
+        for record in _corpus()[:250]:
+            sink.write(record)
+        sink.close()
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_rows == 250
+        assert [meta.row_group(i).num_rows for i in range(3)] == [100, 100, 50]
+
+    def test_mismatched_values_are_coerced(self, tmp_path):
+        path = tmp_path / "dump.parquet"
+        sink = ColumnarSink(str(path))
+        sink.write(Decoded({"df": 17, "altitude": True, "config": 1}))
+        sink.write(Decoded({"df": 17, "altitude": 1.5, "callsign": 42}))
+        sink.write(Decoded({"df": 17.0, "supported_bds": ("1,0",), "extra": 1}))
+        sink.close()
+        rows = _read(path, "parquet")
+        assert [r["altitude"] for r in rows] == [1, None, None]
+        assert [r["df"] for r in rows] == [17, 17, 17]
+        assert rows[0]["config"] is True
+        assert rows[1]["callsign"] == "42"
+        assert rows[2]["supported_bds"] == ["1,0"]
+        assert "extra" not in rows[2]
+
+    def test_rotate_by_bytes(self, tmp_path):
+        records = _corpus()[:600]
+        sink = ColumnarSink(
+            str(tmp_path / "dump.parquet"), row_group_size=100, rotate_bytes=1
+        )
+        for record in records:
+            sink.write(record)
+        sink.close()
+        assert [p.name for p in sink.paths] == [
+            f"dump.{i:04d}.parquet" for i in range(6)
+        ]
+        rows = [row for p in sink.paths for row in _read(p, "parquet")]
+        assert rows == [_full(r) for r in records]
+
+    def test_rotate_by_time(self, tmp_path, monkeypatch):
+        import pyModeS.cli._columnar as columnar_mod
+
+        now = [0.0]
+        monkeypatch.setattr(columnar_mod.time, "monotonic", lambda: now[0])
+        records = _corpus()[:30]
+        sink = ColumnarSink(
+            str(tmp_path / "dump.arrow"), fmt="arrow", rotate_seconds=60
+        )
+        for i, record in enumerate(records):
+            now[0] = i * 5.0
+            sink.write(record)
+        sink.close()
+        # Records at t=0..55 land in the first file, 60..115 in the
+        # second, 120..145 in the third.
+        counts = [len(_read(p, "arrow")) for p in sink.paths]
+        assert counts == [12, 12, 6]
+
+    def test_close_without_records_leaves_valid_file(self, tmp_path):
+        path = tmp_path / "dump.parquet"
+        ColumnarSink(str(path)).close()
+        assert pq.read_table(path).num_rows == 0
+
+
+class TestColumnarCli:
+    @pytest.fixture
+    def capture(self, tmp_path):
+        rows = [line.split(",") for line in CORPUS.read_text().splitlines()]
+        p = tmp_path / "capture.csv"
+        p.write_text("".join(f"{r[0]},{r[1].strip(chr(34))}\n" for r in rows))
+        return p
+
+    def test_decode_jobs_matches_serial(self, capture, tmp_path, capsys):
+        from pyModeS.cli import main
+
+        serial = tmp_path / "serial.parquet"
+        parallel = tmp_path / "parallel.parquet"
+        base = ["decode", "--file", str(capture)]
+        assert main([*base, "--dump-to", str(serial)]) == 0
+        assert main([*base, "--jobs", "2", "--dump-to", str(parallel)]) == 0
+        assert capsys.readouterr().out == ""
+        assert pq.read_table(serial).equals(pq.read_table(parallel))
+
+    def test_decode_dump_matches_compact_output(self, capture, tmp_path, capsys):
+        from pyModeS.cli import main
+
+        path = tmp_path / "out.arrow"
+        assert main(["decode", "--file", str(capture), "--compact"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert main(["decode", "--file", str(capture), "--dump-to", str(path)]) == 0
+        # The dump also carries each record's input timestamp.
+        stamps = [float(row.split(",")[0]) for row in capture.read_text().splitlines()]
+        assert _read(path, "arrow") == [
+            _full({**json.loads(line), "timestamp": ts})
+            for line, ts in zip(lines, stamps, strict=True)
+        ]
+
+    def test_live_dump_to_parquet(self, tmp_path, monkeypatch, capsys):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        frames = [("8D406B902015A678D4D220AA4BDA", 1000.0)]
+
+        class _Source:
+            def iter_batches(self):
+                yield [bytes.fromhex(h) for h, _ in frames], [t for _, t in frames]
+
+        monkeypatch.setattr(live_mod, "NetworkSource", lambda *a, **k: _Source())
+        path = tmp_path / "flight.parquet"
+        argv = ["live", "--network", "h:1", "--quiet", "--dump-to", str(path)]
+        assert main(argv) == 0
+        rows = pq.read_table(path).to_pylist()
+        assert [(r["icao"], r["raw_msg"], r["timestamp"]) for r in rows] == [
+            ("406B90", "8D406B902015A678D4D220AA4BDA", 1000.0)
+        ]
@@ -0,0 +1,107 @@
+"""Tests for transparent gzip / zstd files in pyModeS.cli._compress."""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+
+import pytest
+
+from pyModeS.cli import _compress
+from pyModeS.cli._compress import (
+    compression,
+    open_binary,
+    open_text,
+    open_text_write,
+    read_bytes,
+)
+
+
+@pytest.fixture(params=["gz", "zst"])
+def suffix(request):
+    if request.param == "zst" and importlib.util.find_spec("zstandard") is None:
+        pytest.skip("zstandard not installed")
+    return request.param
+
+
+def test_compression_from_extension():
+    assert compression("day.log.gz") == "gzip"
+    assert compression("day.log.ZST") == "zstd"
+    assert compression("day.jsonl.zstd") == "zstd"
+    assert compression("day.log") is None
+    assert compression("gz") is None
+
+
+class TestRoundTrip:
+    def test_write_then_read_lines(self, tmp_path, suffix):
+        path = tmp_path / f"out.jsonl.{suffix}"
+        lines = [f'{{"n":{i}}}\n' for i in range(1000)]
+        with open_text_write(path) as fh:
+            for line in lines:
+                fh.write(line)
+                fh.flush()
+        assert path.stat().st_size < sum(map(len, lines)) // 4
+        with open_text(path) as fh:
+            assert list(fh) == lines
+        assert read_bytes(path) == "".join(lines).encode()
+
+    def test_reader_spans_many_chunks(self, tmp_path, monkeypatch, suffix):
+        monkeypatch.setattr(_compress, "_CHUNK", 4096)
+        monkeypatch.setattr(_compress, "_READ_AHEAD", 2)
+        path = tmp_path / f"big.txt.{suffix}"
+        text = "".join(f"{i:08d},8D406B902015A678D4D220AA4BDA\n" for i in range(20_000))
+        with open_text_write(path) as fh:
+            fh.write(text)
+        with open_text(path) as fh:
+            assert fh.read() == text
+
+    def test_close_before_eof_stops_reader(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_compress, "_CHUNK", 1024)
+        monkeypatch.setattr(_compress, "_READ_AHEAD", 1)
+        path = tmp_path / "big.txt.gz"
+        path.write_bytes(gzip.compress(b"x" * 1_000_000))
+        fh = open_text(path)
+        assert fh.read(10) == "x" * 10
+        fh.close()
+        assert not fh.buffer.raw._thread.is_alive()
+
+    def test_plain_paths_are_untouched(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        with open_text_write(path, line_buffered=True) as fh:
+            fh.write("a\n")
+            assert path.read_text() == "a\n"
+        with open_text(path) as fh:
+            assert fh.read() == "a\n"
+        with open_binary(path) as fh:
+            assert fh.read() == b"a\n"
+
+
+class TestErrors:
+    def test_truncated_gzip_raises_oserror(self, tmp_path):
+        path = tmp_path / "cut.txt.gz"
+        path.write_bytes(gzip.compress(b"abc\n" * 10_000)[:-20])
+        with pytest.raises(OSError, match=r"cut\.txt\.gz"), open_text(path) as fh:
+            fh.read()
+        with pytest.raises(OSError, match="corrupt or truncated gzip"):
+            read_bytes(path)
+
+    def test_not_gzip_raises_oserror(self, tmp_path):
+        path = tmp_path / "plain.txt.gz"
+        path.write_text("8D406B902015A678D4D220AA4BDA\n")
+        with pytest.raises(OSError), open_text(path) as fh:
+            fh.read()
+
+    def test_zstd_without_zstandard_raises_import_error(self, tmp_path, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "zstandard":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        path = tmp_path / "out.jsonl.zst"
+        with pytest.raises(ImportError, match=r"pyModeS\[zstd\]"):
+            open_text_write(path)
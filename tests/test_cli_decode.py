@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import gzip
+import importlib.util
 import io
 import json
 
@@ -279,3 +281,285 @@ class TestDecodeFile:
         code, _out, err = _run(["decode", "--file", "/nonexistent/file.log"], capsys)
         assert code == 1
         assert "error" in err.lower() or "no such file" in err.lower()
+
+
+class TestDecodeFileStreaming:
+    def test_matches_batch_decode(self, tmp_path, capsys):
+        """Streaming output is line-for-line identical to decoding the
+        whole capture as one batch, retro-filled positions included."""
+        from pathlib import Path
+
+        from pyModeS import decode
+
+        src = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+        rows = [line.split(",") for line in src.read_text().splitlines()]
+        timestamps = [float(r[0]) for r in rows]
+        hexes = [r[1].strip('"') for r in rows]
+        p = tmp_path / "capture.csv"
+        p.write_text(
+            "".join(f"{t},{h}\n" for t, h in zip(timestamps, hexes, strict=True))
+        )
+
+        expected = decode(hexes, timestamps=timestamps)
+        code, out, _err = _run(["decode", "--file", str(p), "--compact"], capsys)
+        assert code == 0
+        lines = out.splitlines()
+        assert len(lines) == len(expected)
+        for hex_msg, want, line in zip(hexes, expected, lines, strict=True):
+            want["raw_msg"] = hex_msg
+            assert json.loads(line) == want
+
+    def test_emits_before_end_of_input(self, capsys, monkeypatch):
+        """Final results are written while stdin is still being read."""
+        seen_before_last: list[str] = []
+
+        def lines():
+            yield "8D406B902015A678D4D220AA4BDA\n"
+            yield "8D485020994409940838175B284F\n"
+            seen_before_last.append(capsys.readouterr().out)
+            yield "8D4840D6202CC371C32CE0576098\n"
+
+        monkeypatch.setattr("sys.stdin", lines())
+        code, out, _err = _run(["decode", "--file", "-", "--compact"], capsys)
+        assert code == 0
+        assert len(seen_before_last[0].splitlines()) == 2
+        assert len(out.splitlines()) == 1
+
+    def test_held_position_keeps_input_order(self, tmp_path, capsys):
+        p = tmp_path / "pair.csv"
+        p.write_text(
+            "1000.0,8D40058B58C901375147EFD09357\n"
+            "1000.5,8D406B902015A678D4D220AA4BDA\n"
+            "1001.0,8D40058B58C904A87F402D3B8C59\n"
+        )
+        code, out, _err = _run(["decode", "--file", str(p), "--compact"], capsys)
+        assert code == 0
+        records = [json.loads(line) for line in out.splitlines()]
+        assert [r["icao"] for r in records] == ["40058B", "406B90", "40058B"]
+        # Bootstrap released at end of input fills both halves.
+        assert records[0]["latitude"] is not None
+        assert records[2]["latitude"] is not None
+
+
+class TestDecodeFileJobs:
+    @pytest.fixture
+    def capture(self, tmp_path):
+        """Interleaved ADS-B and Comm-B traffic from the sample corpus."""
+        from pathlib import Path
+
+        data = Path(__file__).parent / "data"
+        rows = []
+        for line in (data / "sample_data_adsb.csv").read_text().splitlines():
+            fields = line.split(",")
+            rows.append((float(fields[0]), fields[1].strip('"')))
+        df20 = (data / "sample_data_commb_df20.csv").read_text(encoding="utf-8-sig")
+        for line in df20.splitlines()[:1000]:
+            fields = line.split(",")
+            rows.append((float(fields[0]), fields[2]))
+        rows.sort(key=lambda r: r[0])
+        p = tmp_path / "capture.csv"
+        p.write_text("".join(f"{t},{h}\n" for t, h in rows))
+        return p
+
+    def test_ordered_output_matches_serial(self, capture, capsys):
+        _code, serial, _err = _run(
+            ["decode", "--file", str(capture), "--compact"], capsys
+        )
+        code, parallel, _err = _run(
+            ["decode", "--file", str(capture), "--compact", "--jobs", "3"], capsys
+        )
+        assert code == 0
+        assert parallel == serial
+
+    def test_unordered_output_is_same_multiset(self, capture, capsys):
+        _code, serial, _err = _run(
+            ["decode", "--file", str(capture), "--compact"], capsys
+        )
+        code, parallel, _err = _run(
+            ["decode", "--file", str(capture), "--compact", "-j", "3", "--unordered"],
+            capsys,
+        )
+        assert code == 0
+        assert sorted(parallel.splitlines()) == sorted(serial.splitlines())
+
+    def test_pretty_output_matches_serial(self, capture, capsys):
+        _code, serial, _err = _run(["decode", "--file", str(capture)], capsys)
+        _code, parallel, _err = _run(
+            ["decode", "--file", str(capture), "-j", "2"], capsys
+        )
+        assert parallel == serial
+
+    def test_backwards_timestamps_match_serial(self, tmp_path, capsys):
+        """A late timestamp on another worker's aircraft still evicts
+        this worker's pending CPR half, exactly as in the serial run."""
+        p = tmp_path / "jumpy.csv"
+        p.write_text(
+            "1000.0,8D40058B58C901375147EFD09357\n"
+            "2000.0,8D485020994409940838175B284F\n"
+            "1001.0,8D40058B58C904A87F402D3B8C59\n"
+        )
+        _code, serial, _err = _run(["decode", "--file", str(p), "--compact"], capsys)
+        code, parallel, _err = _run(
+            ["decode", "--file", str(p), "--compact", "-j", "2"], capsys
+        )
+        assert code == 0
+        assert parallel == serial
+        assert "latitude" not in json.loads(serial.splitlines()[2])
+
+    def test_check_mode_reports_match(self, capture, capsys):
+        code, out, _err = _run(
+            ["decode", "--file", str(capture), "-j", "2", "--check", "500"], capsys
+        )
+        assert code == 0
+        assert out.strip() == "check: 500 records, --jobs 2 output matches serial"
+
+
+class TestDecodeDumpTo:
+    @pytest.fixture
+    def capture(self, tmp_path):
+        from pathlib import Path
+
+        src = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+        rows = [line.split(",") for line in src.read_text().splitlines()]
+        p = tmp_path / "capture.csv"
+        p.write_text("".join(f"{r[0]},{r[1].strip(chr(34))}\n" for r in rows))
+        return p
+
+    def test_jsonl_dump_matches_compact_stdout(self, capture, tmp_path, capsys):
+        _code, expected, _err = _run(
+            ["decode", "--file", str(capture), "--compact"], capsys
+        )
+        out_path = tmp_path / "out.jsonl"
+        code, out, _err = _run(
+            ["decode", "--file", str(capture), "--dump-to", str(out_path)], capsys
+        )
+        assert code == 0
+        assert out == ""
+        assert out_path.read_text() == expected
+
+    def test_gzip_input_and_dump(self, capture, tmp_path, capsys):
+        _code, expected, _err = _run(
+            ["decode", "--file", str(capture), "--compact"], capsys
+        )
+        packed = tmp_path / "capture.csv.gz"
+        packed.write_bytes(gzip.compress(capture.read_bytes()))
+        code, out, _err = _run(["decode", "--file", str(packed), "--compact"], capsys)
+        assert code == 0
+        assert out == expected
+        out_path = tmp_path / "out.jsonl.gz"
+        code, _out, _err = _run(
+            ["decode", "--file", str(packed), "--dump-to", str(out_path)], capsys
+        )
+        assert code == 0
+        assert gzip.decompress(out_path.read_bytes()).decode() == expected
+
+    def test_corrupt_gzip_input_exits_one(self, tmp_path, capsys):
+        packed = tmp_path / "capture.csv.gz"
+        packed.write_text("8D406B902015A678D4D220AA4BDA\n")
+        code, _out, err = _run(["decode", "--file", str(packed)], capsys)
+        assert code == 1
+        assert "modes decode: error:" in err
+
+    @pytest.mark.parametrize(
+        ("name", "data"),
+        [
+            # Cut before the first byte decompresses: EOFError.
+            (
+                "capture.csv.gz",
+                gzip.compress(b"8D406B902015A678D4D220AA4BDA\n" * 100)[:12],
+            ),
+            # zstd magic followed by garbage: ZstdError.
+            ("capture.csv.zst", b"\x28\xb5\x2f\xfd" + b"garbage" * 10),
+        ],
+    )
+    def test_unreadable_compressed_input_exits_one(self, tmp_path, capsys, name, data):
+        if name.endswith(".zst") and importlib.util.find_spec("zstandard") is None:
+            pytest.skip("zstandard not installed")
+        packed = tmp_path / name
+        packed.write_bytes(data)
+        code, _out, err = _run(["decode", "--file", str(packed)], capsys)
+        assert code == 1
+        assert f"modes decode: error: {packed}: corrupt or truncated" in err
+
+    @pytest.mark.parametrize("name", ["x.jsonl", "x.db", "x.parquet"])
+    def test_unwritable_dump_path_exits_one(self, tmp_path, capsys, name):
+        if name.endswith(".parquet") and importlib.util.find_spec("pyarrow") is None:
+            pytest.skip("pyarrow not installed")
+        out_path = tmp_path / "missing" / name
+        hexes = "8D406B902015A678D4D220AA4BDA,8D485020994409940838175B284F"
+        code, _out, err = _run(["decode", hexes, "--dump-to", str(out_path)], capsys)
+        assert code == 1
+        assert err.startswith("modes decode: error:")
+        assert "Traceback" not in err
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_sqlite_dump_matches_compact_stdout(self, capture, tmp_path, capsys, jobs):
+        import sqlite3
+
+        _code, expected, _err = _run(
+            ["decode", "--file", str(capture), "--compact"], capsys
+        )
+        db = tmp_path / "out.db"
+        code, _out, _err = _run(
+            ["decode", "--file", str(capture), "-j", jobs, "--dump-to", str(db)],
+            capsys,
+        )
+        assert code == 0
+        conn = sqlite3.connect(db)
+        rows = conn.execute("SELECT icao, raw_msg, altitude FROM messages").fetchall()
+        conn.close()
+        records = [json.loads(line) for line in expected.splitlines()]
+        assert rows == [(r["icao"], r["raw_msg"], r.get("altitude")) for r in records]
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_sqlite_dump_keeps_record_timestamps(self, capture, tmp_path, capsys, jobs):
+        import sqlite3
+
+        db = tmp_path / "out.db"
+        code, _out, _err = _run(
+            ["decode", "--file", str(capture), "-j", jobs, "--dump-to", str(db)],
+            capsys,
+        )
+        assert code == 0
+        conn = sqlite3.connect(db)
+        stamps = conn.execute('SELECT "timestamp" FROM messages').fetchall()
+        conn.close()
+        lines = capture.read_text().splitlines()
+        assert stamps == [(float(line.split(",")[0]),) for line in lines]
+
+
+class TestDecodeBeastFile:
+    def test_beast_capture_matches_csv(self, tmp_path, capsys):
+        """A raw Beast capture decodes like the same traffic as CSV."""
+        from pathlib import Path
+
+        src = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+        rows = [line.split(",") for line in src.read_text().splitlines()]
+        t0 = float(rows[0][0])
+        csv_path = tmp_path / "capture.csv"
+        beast_path = tmp_path / "capture.beast"
+        csv_lines = []
+        frames = []
+        for ts_str, hex_field, *_ in rows:
+            hex_msg = hex_field.strip('"')
+            ticks = round((float(ts_str) - t0) * 12_000_000)
+            csv_lines.append(f"{ticks / 12_000_000},{hex_msg}\n")
+            body = ticks.to_bytes(6, "big") + b"\x00" + bytes.fromhex(hex_msg)
+            frames.append(b"\x1a\x33" + body.replace(b"\x1a", b"\x1a\x1a"))
+        csv_path.write_text("".join(csv_lines))
+        beast_path.write_bytes(b"".join(frames))
+
+        _code, expected, _err = _run(
+            ["decode", "--file", str(csv_path), "--compact"], capsys
+        )
+        code, out, _err = _run(
+            ["decode", "--file", str(beast_path), "--compact"], capsys
+        )
+        assert code == 0
+        assert out == expected
+
+        packed = tmp_path / "capture.beast.gz"
+        packed.write_bytes(gzip.compress(beast_path.read_bytes()))
+        code, out, _err = _run(["decode", "--file", str(packed), "--compact"], capsys)
+        assert code == 0
+        assert out == expected
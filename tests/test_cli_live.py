@@ -3,22 +3,36 @@
 from __future__ import annotations
 
 import json
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
 import threading
 import time
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 
 class FakeSource:
-    """Test double that yields a canned list of (hex, timestamp) tuples."""
+    """Test double that yields a canned list of (hex, timestamp) tuples.
 
-    def __init__(self, frames: list[tuple[str, float]]) -> None:
+    ``iter_batches`` hands the whole list over as a single burst.
+    """
+
+    def __init__(self, frames: list[tuple[str | bytes, float]]) -> None:
         self._frames = frames
 
     def __iter__(self):
         yield from self._frames
 
+    def iter_batches(self):
+        if self._frames:
+            msgs, timestamps = zip(*self._frames, strict=True)
+            yield list(msgs), list(timestamps)
+
 
 class TestLiveMainLoop:
     @pytest.fixture(autouse=True)
@@ -65,6 +79,217 @@ class TestLiveMainLoop:
         text = outfile.read_text()
         assert '"icao":"406B90"' in text
 
+    def test_binary_payloads_keep_hex_raw_msg(self, capsys):
+        hex_msg = "8D406B902015A678D4D220AA4BDA"
+        self._fake_source = FakeSource([(bytes.fromhex(hex_msg), 1000.0)])
+        from pyModeS.cli import main
+
+        code = main(["live", "--network", "h:1"])
+        assert code == 0
+        data = json.loads(capsys.readouterr().out.strip())
+        assert data["icao"] == "406B90"
+        assert data["raw_msg"] == hex_msg
+
+    def test_repeated_network_merges_feeds(self, capsys, monkeypatch):
+        import pyModeS.cli.live as live_mod
+
+        seen: dict[str, Any] = {}
+
+        def _fake_multi_source(endpoints, **kwargs):
+            seen["endpoints"] = endpoints
+            return FakeSource(
+                [
+                    ("8D406B902015A678D4D220AA4BDA", 1000.0),
+                    ("8D485020994409940838175B284F", 1000.5),
+                ]
+            )
+
+        monkeypatch.setattr(live_mod, "MultiNetworkSource", _fake_multi_source)
+        from pyModeS.cli import main
+
+        code = main(["live", "--network", "rx1:30005", "--network", "rx2:10006"])
+        assert code == 0
+        assert seen["endpoints"] == [("rx1", 30005), ("rx2", 10006)]
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["icao"] for line in lines] == ["406B90", "485020"]
+
+    def test_beast_stdin_decodes_until_eof(self, capsys, monkeypatch):
+        import os
+
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli._source import PipeSource
+        from pyModeS.cli.replay import beast_frame
+
+        hexes = ["8D406B902015A678D4D220AA4BDA", "8D485020994409940838175B284F"]
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"".join(beast_frame(h, 0) or b"" for h in hexes))
+        os.close(write_fd)
+        monkeypatch.setattr(
+            live_mod, "PipeSource", lambda **kwargs: PipeSource(read_fd, **kwargs)
+        )
+        from pyModeS.cli import main
+
+        try:
+            assert main(["live", "--beast-stdin"]) == 0
+        finally:
+            os.close(read_fd)
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["raw_msg"] for line in lines] == hexes
+
+    def test_beast_stdin_stops_on_idle_pipe(self, monkeypatch):
+        import os
+
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli._source import PipeSource
+
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setattr(
+            live_mod, "PipeSource", lambda **kwargs: PipeSource(read_fd, **kwargs)
+        )
+        stop_holder: dict[str, Any] = {}
+
+        def capturing_install(stop):
+            stop_holder["flag"] = stop
+
+        monkeypatch.setattr(live_mod, "_install_signal_handlers", capturing_install)
+        from pyModeS.cli import main
+
+        result: dict[str, Any] = {}
+        t = threading.Thread(
+            target=lambda: result.update(
+                code=main(["live", "--beast-stdin", "--quiet"])
+            )
+        )
+        t.start()
+        try:
+            time.sleep(0.2)
+            stop_holder["flag"].stopped = True
+            t.join(timeout=5)
+            assert not t.is_alive(), "main() blocked on a pipe with no input"
+        finally:
+            os.close(write_fd)
+            t.join(timeout=5)
+            os.close(read_fd)
+        assert result["code"] == 0
+
+    def test_unix_reads_through_unix_source(self, capsys, monkeypatch):
+        import pyModeS.cli.live as live_mod
+
+        seen: dict[str, Any] = {}
+
+        def _fake_unix_source(path, **kwargs):
+            seen["path"] = path
+            return FakeSource([("8D406B902015A678D4D220AA4BDA", 1000.0)])
+
+        monkeypatch.setattr(live_mod, "UnixSource", _fake_unix_source)
+        from pyModeS.cli import main
+
+        assert main(["live", "--unix", "/run/readsb/beast.sock"]) == 0
+        assert seen["path"] == "/run/readsb/beast.sock"
+        assert '"icao":"406B90"' in capsys.readouterr().out
+
+    def test_bad_network_among_several_exits_two(self, capsys):
+        from pyModeS.cli import main
+
+        code = main(["live", "--network", "rx1:30005", "--network", "rx2"])
+        assert code == 2
+        assert "'rx2'" in capsys.readouterr().err
+
+    def test_dump_to_with_flush_policy_writes_everything(self, capsys, tmp_path):
+        self._fake_source = FakeSource(
+            [
+                ("8D406B902015A678D4D220AA4BDA", 1000.0),
+                ("8D485020994409940838175B284F", 1001.0),
+                ("8D40058B58C901375147EFD09357", 1002.0),
+            ]
+        )
+        outfile = tmp_path / "dump.jsonl"
+        from pyModeS.cli import main
+
+        code = main(
+            [
+                "live",
+                "--network",
+                "h:1",
+                "--quiet",
+                "--dump-to",
+                str(outfile),
+                "--flush-records",
+                "2",
+                "--flush-ms",
+                "1000",
+            ]
+        )
+        assert code == 0
+        lines = outfile.read_text().splitlines()
+        assert [json.loads(line)["icao"] for line in lines] == [
+            "406B90",
+            "485020",
+            "40058B",
+        ]
+
+    def test_flush_ms_writes_out_while_feed_is_quiet(self, capsys, tmp_path):
+        outfile = tmp_path / "dump.jsonl"
+        seen_before_close: list[str] = []
+
+        class _QuietSource:
+            def iter_batches(self):
+                yield ["8D406B902015A678D4D220AA4BDA"], [1000.0]
+                deadline = time.monotonic() + 5.0
+                while time.monotonic() < deadline:
+                    time.sleep(0.01)
+                    yield [], []
+                    if text := outfile.read_text():
+                        seen_before_close.append(text)
+                        return
+
+        self._fake_source = _QuietSource()
+        from pyModeS.cli import main
+
+        argv = ["live", "--network", "h:1", "--quiet", "--dump-to", str(outfile)]
+        assert main([*argv, "--flush-records", "1000", "--flush-ms", "50"]) == 0
+        assert [json.loads(line)["icao"] for line in seen_before_close] == ["406B90"]
+
+    def test_dump_to_sqlite(self, capsys, tmp_path):
+        import sqlite3
+
+        self._fake_source = FakeSource(
+            [
+                ("8D406B902015A678D4D220AA4BDA", 1000.0),
+                ("8D485020994409940838175B284F", 1001.0),
+            ]
+        )
+        db = tmp_path / "traffic.db"
+        from pyModeS.cli import main
+
+        code = main(["live", "--network", "h:1", "--quiet", "--dump-to", str(db)])
+        assert code == 0
+        conn = sqlite3.connect(db)
+        rows = conn.execute(
+            'SELECT icao, raw_msg, "timestamp" FROM messages'
+        ).fetchall()
+        conn.close()
+        assert rows == [
+            ("406B90", "8D406B902015A678D4D220AA4BDA", 1000.0),
+            ("485020", "8D485020994409940838175B284F", 1001.0),
+        ]
+
+    def test_columnar_dump_without_pyarrow_exits_three(self, capsys, tmp_path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("pyarrow is installed")
+        self._fake_source = FakeSource([("8D406B902015A678D4D220AA4BDA", 1000.0)])
+        from pyModeS.cli import main
+
+        code = main(
+            ["live", "--network", "h:1", "--dump-to", str(tmp_path / "f.parquet")]
+        )
+        assert code == 3
+        assert 'pip install "pyModeS[arrow]"' in capsys.readouterr().err
+
     def test_quiet_suppresses_stdout(self, capsys, tmp_path):
         self._fake_source = FakeSource([("8D406B902015A678D4D220AA4BDA", 1000.0)])
         outfile = tmp_path / "dump.jsonl"
@@ -153,8 +378,8 @@ class TestLiveGracefulShutdown:
         stop_holder: dict[str, Any] = {}
 
         class SlowSource:
-            def __iter__(self):
-                yield ("8D406B902015A678D4D220AA4BDA", 1000.0)
+            def iter_batches(self):
+                yield ["8D406B902015A678D4D220AA4BDA"], [1000.0]
                 # Wait for the test to flip the stop flag
                 for _ in range(500):
                     flag = stop_holder.get("flag")
@@ -191,3 +416,84 @@ class TestLiveGracefulShutdown:
         t.join(timeout=5)
         assert not t.is_alive(), "main() did not exit after stop flag set"
         assert result["code"] == 0
+
+
+DF17_BEAST = b"\x1a\x33" + bytes(7) + bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+
+
+def _serve_once(listener: socket.socket, unlink: Path | None = None) -> None:
+    """Send one frame to the first client, then stop listening.
+
+    ``unlink`` removes a Unix socket's path as well, as a receiver
+    shutting down does.
+    """
+
+    def run() -> None:
+        with listener:
+            conn, _addr = listener.accept()
+            with conn:
+                conn.sendall(DF17_BEAST + b"\x1a")
+        if unlink is not None:
+            unlink.unlink()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def _sigterm_while_reconnecting(argv: list[str]) -> int:
+    """Run ``modes`` with ``argv`` until its feed refuses a reconnect,
+    then SIGTERM it and return the exit code."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pyModeS.cli", *argv],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert proc.stderr is not None
+        # The second backoff follows a failed reconnect.
+        for line in proc.stderr:
+            if "retrying in 1.0s" in line:
+                break
+        proc.send_signal(signal.SIGTERM)
+        return proc.wait(timeout=5)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+class TestLiveSigtermWhileReconnecting:
+    def test_network_refused_port_flushes_buffered_sink(self, tmp_path):
+        listener = socket.create_server(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        _serve_once(listener)
+        db = tmp_path / "live.db"
+        argv = ["live", "--network", f"127.0.0.1:{port}", "--dump-to", str(db)]
+        assert _sigterm_while_reconnecting([*argv, "--flush-ms", "60000"]) == 0
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("SELECT icao FROM messages").fetchall() == [("406B90",)]
+
+    def test_parquet_dump_is_readable_after_sigterm(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        listener = socket.create_server(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        _serve_once(listener)
+        out = tmp_path / "live.parquet"
+        argv = ["live", "--network", f"127.0.0.1:{port}", "--dump-to", str(out)]
+        assert _sigterm_while_reconnecting(argv) == 0
+        # Readable only if close() wrote the footer.
+        assert pq.read_table(out).column("icao").to_pylist() == ["406B90"]
+
+    def test_unix_vanished_socket_flushes_buffered_sink(self, tmp_path):
+        path = tmp_path / "beast.sock"
+        listener = socket.socket(socket.AF_UNIX)
+        listener.bind(str(path))
+        listener.listen()
+        _serve_once(listener, unlink=path)
+        out = tmp_path / "live.jsonl"
+        argv = ["live", "--unix", str(path), "--dump-to", str(out)]
+        assert _sigterm_while_reconnecting([*argv, "--flush-ms", "60000"]) == 0
+        assert not path.exists()
+        assert [json.loads(line)["icao"] for line in out.read_text().splitlines()] == [
+            "406B90"
+        ]
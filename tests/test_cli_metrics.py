@@ -0,0 +1,163 @@
+"""Tests for the `modes live --metrics` endpoint (pyModeS.cli._metrics)."""
+
+from __future__ import annotations
+
+import io
+import socket
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from pyModeS import PipeDecoder
+from pyModeS.cli._metrics import CONTENT_TYPE, LiveMetrics, MetricsServer
+from pyModeS.cli._sink import JsonLinesSink
+from pyModeS.message import Decoded
+
+DF17 = bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+DF4 = bytes.fromhex("20001838CA3804")
+
+
+def _source(*feeds: tuple[str, int, int]) -> SimpleNamespace:
+    return SimpleNamespace(
+        sources=[
+            SimpleNamespace(name=name, reconnects=reconnects, resyncs=resyncs)
+            for name, reconnects, resyncs in feeds
+        ]
+    )
+
+
+def _samples(text: str) -> dict[str, str]:
+    """``name{labels}`` -> value for every sample line."""
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.rpartition(" ")
+            out[key] = value
+    return out
+
+
+class TestLiveMetrics:
+    def test_render_counters(self):
+        pipe = PipeDecoder()
+        for msg in (DF17, DF17, DF4):
+            pipe.decode(msg, timestamp=1.0)
+        sink = JsonLinesSink(io.StringIO(), max_records=100)
+        sink.write(Decoded({"df": 17}))
+        metrics = LiveMetrics(
+            pipe, _source(("rx1:30005", 2, 5), ('odd"name', 0, 1)), sink
+        )
+        metrics.observe([DF17, DF17], 2_000)
+        metrics.observe(["20001838CA3804"], 3_000)
+
+        text = metrics.render()
+        samples = _samples(text)
+        assert samples["pymodes_pipe_messages_total"] == "3"
+        assert samples["pymodes_pipe_pending_pairs"] == "0"
+        assert samples['pymodes_live_messages_total{df="17"}'] == "2"
+        assert samples['pymodes_live_messages_total{df="4"}'] == "1"
+        assert samples["pymodes_live_bursts_total"] == "2"
+        assert samples['pymodes_live_reconnects_total{feed="rx1:30005"}'] == "2"
+        assert samples['pymodes_live_resyncs_total{feed="odd\\"name"}'] == "1"
+        assert samples["pymodes_live_sink_pending"] == "1"
+        assert samples["pymodes_live_decode_seconds_count"] == "3"
+        assert float(samples["pymodes_live_decode_seconds_sum"]) == pytest.approx(5e-6)
+        # Per-message means of the two bursts: 1 µs and 3 µs.
+        assert float(
+            samples['pymodes_live_decode_seconds{quantile="0.5"}']
+        ) == pytest.approx(1e-6)
+        assert float(
+            samples['pymodes_live_decode_seconds{quantile="0.99"}']
+        ) == pytest.approx(3e-6)
+        assert "# TYPE pymodes_pipe_pending_pairs gauge" in text
+        assert "# TYPE pymodes_live_decode_seconds summary" in text
+        assert text.endswith("\n")
+
+    def test_quantiles_before_first_burst_are_nan(self):
+        metrics = LiveMetrics(PipeDecoder(), _source(), SimpleNamespace(pending=0))
+        samples = _samples(metrics.render())
+        assert samples['pymodes_live_decode_seconds{quantile="0.9"}'] == "NaN"
+        assert samples["pymodes_live_last_burst_timestamp_seconds"] == "0.0"
+
+    def test_intake_queue_and_shed_counters(self):
+        intake = SimpleNamespace(depth=3, dropped={"commb": 7, "overflow": 2})
+        metrics = LiveMetrics(
+            PipeDecoder(), _source(), SimpleNamespace(pending=0), intake=intake
+        )
+        samples = _samples(metrics.render())
+        assert samples["pymodes_live_intake_depth"] == "3"
+        assert samples['pymodes_live_shed_total{reason="commb"}'] == "7"
+        assert samples['pymodes_live_shed_total{reason="overflow"}'] == "2"
+        plain = LiveMetrics(PipeDecoder(), _source(), SimpleNamespace(pending=0))
+        assert "live_shed_total" not in plain.render()
+
+    def test_latency_window_wraps(self, monkeypatch):
+        import pyModeS.cli._metrics as metrics_mod
+
+        monkeypatch.setattr(metrics_mod, "LATENCY_WINDOW", 4)
+        metrics = LiveMetrics(PipeDecoder(), _source(), SimpleNamespace(pending=0))
+        for us in (100, 100, 1, 2, 3, 4):
+            metrics.observe([DF17], us * 1_000)
+        samples = _samples(metrics.render())
+        assert float(
+            samples['pymodes_live_decode_seconds{quantile="0.99"}']
+        ) == pytest.approx(4e-6)
+        assert samples["pymodes_live_decode_seconds_count"] == "6"
+
+
+class TestMetricsServer:
+    def test_serves_metrics_and_404s_elsewhere(self):
+        server = MetricsServer("127.0.0.1", 0, lambda: "pymodes_up 1\n")
+        host, port = server.address
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as resp:
+                assert resp.status == 200
+                assert resp.headers["Content-Type"] == CONTENT_TYPE
+                assert resp.read() == b"pymodes_up 1\n"
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(f"http://{host}:{port}/")
+            assert excinfo.value.code == 404
+        finally:
+            server.close()
+
+
+class TestLiveMetricsCli:
+    @pytest.fixture
+    def port(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
+
+    def test_live_serves_metrics_while_decoding(self, monkeypatch, port, capsys):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        scraped: list[str] = []
+
+        class _Source:
+            def __init__(self):
+                self.sources = [SimpleNamespace(name="h:1", reconnects=0, resyncs=0)]
+
+            def iter_batches(self):
+                yield [DF17, DF4], [1000.0, 1000.5]
+                url = f"http://127.0.0.1:{port}/metrics"
+                with urllib.request.urlopen(url) as resp:
+                    scraped.append(resp.read().decode())
+                yield [DF17], [1001.0]
+
+        monkeypatch.setattr(live_mod, "NetworkSource", lambda *a, **k: _Source())
+        argv = ["live", "--network", "h:1", "--metrics", str(port)]
+        assert main(argv) == 0
+        samples = _samples(scraped[0])
+        assert samples['pymodes_live_messages_total{df="17"}'] == "1"
+        assert samples["pymodes_pipe_messages_total"] == "2"
+        err = capsys.readouterr().err
+        assert f"metrics on http://127.0.0.1:{port}/metrics" in err
+
+    def test_bad_metrics_address_exits_two(self, capsys):
+        from pyModeS.cli import main
+
+        code = main(["live", "--network", "h:1", "--metrics", "host:port"])
+        assert code == 2
+        assert "--metrics must be PORT or HOST:PORT" in capsys.readouterr().err
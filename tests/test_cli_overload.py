@@ -0,0 +1,151 @@
+"""Tests for `modes live --shed` (pyModeS.cli._overload)."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pyModeS.cli._overload import IntakeQueue, LoadShedder, shed_summary
+from pyModeS.cli._parallel import address
+
+DF17 = bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+DF17_POS = bytes.fromhex("8D406B9058B9858721735E76B697")
+DF20 = bytes.fromhex("A0001838201584F23468207CDFA5")
+DF21 = bytes.fromhex("A800178D10010080F50000D5893C")
+
+
+class _Source:
+    """Yields the given bursts, then raises ``error`` if set."""
+
+    def __init__(self, bursts, error=None):
+        self._bursts = bursts
+        self._error = error
+        self.read = threading.Event()
+        self.sources = [SimpleNamespace(name="h:1", reconnects=0, resyncs=0)]
+
+    def iter_batches(self):
+        yield from self._bursts
+        self.read.set()
+        if self._error is not None:
+            raise self._error
+
+
+class TestLoadShedder:
+    def test_nothing_dropped_below_half_full(self):
+        shedder = LoadShedder(["dup", "commb", "sample"])
+        msgs = [DF17, DF17, DF20]
+        assert shedder.shed(msgs, [0.0, 0.0, 0.0], 0.49) == (msgs, [0.0, 0.0, 0.0])
+        assert shedder.dropped == {"dup": 0, "commb": 0, "sample": 0}
+
+    def test_policies_engage_in_order(self):
+        shedder = LoadShedder(["commb", "dup"])
+        msgs = [DF17, DF17, DF20, DF21]
+        ts = [1.0, 1.1, 1.2, 1.3]
+        # Only Comm-B is shed between 50 % and 75 %.
+        assert shedder.shed(msgs, ts, 0.6) == ([DF17, DF17], [1.0, 1.1])
+        assert shedder.shed(msgs, ts, 0.8) == ([DF17], [1.0])
+        assert shedder.dropped == {"commb": 4, "dup": 1}
+
+    def test_dup_forgets_after_two_windows(self):
+        shedder = LoadShedder(["dup"])
+        assert shedder.shed([DF17], [10.0], 1.0) == ([DF17], [10.0])
+        assert shedder.shed([DF17], [10.9], 1.0) == ([], [])
+        assert shedder.shed([DF17], [11.5], 1.0) == ([], [])
+        assert shedder.shed([DF17], [13.1], 1.0) == ([DF17], [13.1])
+
+    def test_sample_per_aircraft(self):
+        shedder = LoadShedder(["sample"])
+        other = bytes.fromhex("8D4840D6202CC371C32CE0576098")
+        assert address(other) != address(DF17)
+        msgs = [DF17, DF17_POS, other, DF17_POS]
+        kept = shedder.shed(msgs, [0.0, 0.2, 0.3, 0.6], 1.0)
+        assert kept == ([DF17, other, DF17_POS], [0.0, 0.3, 0.6])
+        assert shedder.dropped == {"sample": 1}
+
+    def test_hex_input(self):
+        shedder = LoadShedder(["commb"])
+        assert shedder.shed([DF20.hex(), DF17.hex()], [0.0, 0.0], 1.0)[0] == [
+            DF17.hex()
+        ]
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="unknown shed policy"):
+            LoadShedder(["drop-all"])
+
+
+class TestIntakeQueue:
+    def test_passes_bursts_through(self):
+        bursts = [([DF17], [1.0]), ([DF20, DF21], [2.0, 3.0])]
+        intake = IntakeQueue(_Source(bursts), LoadShedder(["dup"]))
+        got = [burst for burst in intake.iter_batches() if burst[0]]
+        assert got == bursts
+        assert intake.depth == 0
+        assert intake.dropped == {"dup": 0, "overflow": 0}
+        assert intake.sources[0].name == "h:1"
+
+    def test_sheds_while_consumer_stalls(self):
+        source = _Source(
+            [
+                ([DF17, DF17_POS], [0.0, 0.1]),
+                ([DF20, DF17, DF21, DF17_POS], [0.2] * 4),
+            ]
+        )
+        intake = IntakeQueue(source, LoadShedder(["commb"]), capacity=3)
+        intake.start()
+        assert source.read.wait(5)
+        # The second burst arrived at 2/3 fill: Comm-B went first,
+        # then one frame for lack of room.
+        got = [burst for burst in intake.iter_batches() if burst[0]]
+        assert got == [([DF17, DF17_POS], [0.0, 0.1]), ([DF17], [0.2])]
+        assert intake.dropped == {"commb": 2, "overflow": 1}
+        assert shed_summary(intake.dropped) == "shed 3 (commb 2, overflow 1)"
+
+    def test_overflow_without_shedder(self):
+        source = _Source([([DF17] * 3, [0.0] * 3), ([DF20] * 3, [1.0] * 3)])
+        intake = IntakeQueue(source, capacity=4)
+        intake.start()
+        assert source.read.wait(5)
+        got = [burst for burst in intake.iter_batches() if burst[0]]
+        assert got == [([DF17] * 3, [0.0] * 3), ([DF20], [1.0])]
+        assert intake.dropped == {"overflow": 2}
+
+    def test_source_error_reaches_consumer(self):
+        intake = IntakeQueue(_Source([([DF17], [1.0])], error=OSError("boom")))
+        got = []
+        with pytest.raises(OSError, match="boom"):
+            for burst in intake.iter_batches():
+                got.append(burst)
+        assert ([DF17], [1.0]) in got
+
+
+class TestLiveShedCli:
+    def test_live_shed_reports_queue_and_drops(self, monkeypatch, capsys):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        source = _Source([([DF17, DF20], [1.0, 1.5])])
+        monkeypatch.setattr(live_mod, "NetworkSource", lambda *a, **k: source)
+        argv = ["live", "--network", "h:1", "--shed", "dup,commb"]
+        assert main([*argv, "--queue-frames", "8"]) == 0
+        captured = capsys.readouterr()
+        assert len(captured.out.splitlines()) == 2
+        assert "; queue 0/8, shed 0 (dup 0, commb 0, overflow 0)" in captured.err
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--shed", "dup,bogus"],
+            ["--shed", "dup,dup"],
+            ["--queue-frames", "10"],
+            ["--shed", "dup", "--queue-frames", "0"],
+            ["--shed", "dup", "--tui"],
+        ],
+    )
+    def test_bad_shed_args_exit_two(self, extra, capsys):
+        from pyModeS.cli import main
+
+        with pytest.raises(SystemExit) as excinfo:
+            main(["live", "--network", "h:1", *extra])
+        assert excinfo.value.code == 2
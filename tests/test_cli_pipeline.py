@@ -0,0 +1,214 @@
+"""Tests for `modes live --jobs` (pyModeS.cli._pipeline)."""
+
+from __future__ import annotations
+
+import functools
+import json
+import signal
+import time
+from pathlib import Path
+
+import pytest
+
+from pyModeS import PipeDecoder
+from pyModeS.cli._metrics import PipelineMetrics
+from pyModeS.cli._overload import LoadShedder
+from pyModeS.cli._parallel import route
+from pyModeS.cli._pipeline import FrameRing, LivePipeline
+from pyModeS.cli._sink import open_file_sink
+
+CORPUS = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+
+
+def _corpus() -> list[tuple[bytes, float]]:
+    rows = [line.split(",") for line in CORPUS.read_text().splitlines()]
+    return [(bytes.fromhex(r[1].strip('"')), float(r[0])) for r in rows]
+
+
+class _FiniteSource:
+    """Picklable stand-in for NetworkSource: a few bursts, then the end."""
+
+    def __init__(self, frames: list[tuple[bytes, float]], burst: int = 50) -> None:
+        self._frames = frames
+        self._burst = burst
+        self.reconnects = 1
+        self.resyncs = 2
+
+    @property
+    def sources(self) -> list[_FiniteSource]:
+        return [self]
+
+    def iter_batches(self):
+        for i in range(0, len(self._frames), self._burst):
+            chunk = self._frames[i : i + self._burst]
+            yield [m for m, _ in chunk], [t for _, t in chunk]
+
+
+class _EndlessSource(_FiniteSource):
+    """Like a NetworkSource: never ends by itself."""
+
+    def iter_batches(self):
+        while True:
+            yield from super().iter_batches()
+            time.sleep(0.01)
+
+
+def _serial(frames: list[tuple[bytes, float]]) -> list[dict]:
+    pipe = PipeDecoder()
+    out = []
+    for msg, ts in frames:
+        result = pipe.decode(msg, timestamp=ts)
+        result["raw_msg"] = msg.hex().upper()
+        result["timestamp"] = ts
+        out.append(json.loads(json.dumps(result, default=str)))
+    return out
+
+
+def _key(record: dict) -> tuple:
+    return (record["timestamp"], record["raw_msg"])
+
+
+class TestFrameRing:
+    def test_push_pop_wraps_and_counts_overruns(self):
+        ring = FrameRing(4)
+        frames = [bytes([i]) * 7 for i in range(6)]
+        assert ring.push(frames[:3], [0.0, 1.0, 2.0]) == 0
+        assert ring.pop(2) == (frames[:2], [0.0, 1.0])
+        # Two slots free after the pop plus one never used: 3 fit.
+        assert ring.push([*frames[3:], b"\x8d" * 14], [3.0, 4.0, 5.0, 6.0]) == 1
+        assert ring.depth == 4
+        assert ring.overruns == 1
+        assert ring.pop(10) == ([frames[2], *frames[3:]], [2.0, 3.0, 4.0, 5.0])
+        assert ring.depth == 0
+        assert not ring.closed
+        ring.close()
+        assert ring.closed
+
+    def test_reader_sheds_by_ring_fill(self):
+        from pyModeS.cli._pipeline import _push
+
+        df17 = bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+        commb_0 = bytes.fromhex("A0001838201584F23468207CDFA5")
+        commb_1 = bytes.fromhex("A000083E202CC371C31DE0AA1CCF")
+        assert [route(m, 2) for m in (df17, commb_0, commb_1)] == [0, 0, 1]
+        rings = [FrameRing(4), FrameRing(4)]
+        rings[0].push([df17, df17], [0.0, 0.0])
+        shedder = LoadShedder(["commb"])
+        # Ring 0 is half full and sheds Comm-B; ring 1 is empty.
+        _push(rings, [commb_0, df17, commb_1], [1.0] * 3, shedder)
+        assert rings[0].pop(4) == ([df17] * 3, [0.0, 0.0, 1.0])
+        assert rings[1].pop(4) == ([commb_1], [1.0])
+        assert shedder.dropped == {"commb": 1}
+
+
+class TestLivePipeline:
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_decodes_like_serial_path(self, tmp_path, jobs):
+        frames = _corpus()
+        out = tmp_path / "out.jsonl"
+        pipeline = LivePipeline(
+            functools.partial(_FiniteSource, frames),
+            functools.partial(open_file_sink, str(out), "jsonl"),
+            jobs=jobs,
+        )
+        pipeline.start()
+        while (code := pipeline.poll()) is None:
+            pass
+        assert code == 0
+        assert pipeline.stop() == 0
+
+        got = [json.loads(line) for line in out.read_text().splitlines()]
+        assert sorted(got, key=_key) == sorted(_serial(frames), key=_key)
+        if jobs == 1:
+            assert [_key(r) for r in got] == [_key(r) for r in _serial(frames)]
+
+        assert pipeline.reader_counters.as_dict() == {
+            "frames": len(frames),
+            "reconnects": 1,
+            "resyncs": 2,
+        }
+        assert pipeline.pipe_stats()["total"] == len(frames)
+        assert pipeline.writer_counters["records"] == len(frames)
+        assert pipeline.queue_depth() == 0
+        assert sum(ring.overruns for ring in pipeline.rings) == 0
+        # Each aircraft went to exactly one decoder.
+        per_decoder = [c["total"] for c in pipeline.decoder_counters]
+        expected = [0] * jobs
+        for msg, _ in frames:
+            expected[route(msg, jobs)] += 1
+        assert per_decoder == expected
+        line = pipeline.stats_line(prefix="final")
+        assert line.startswith(f"[pyModeS.live final] {len(frames)} msgs, ")
+        assert "0 overruns, writer queue 0, 0 pending in sink" in line
+
+    def test_shed_counters_reported(self, tmp_path):
+        pipeline = LivePipeline(
+            functools.partial(_FiniteSource, _corpus()),
+            functools.partial(open_file_sink, str(tmp_path / "o.jsonl"), "jsonl"),
+            jobs=2,
+            shed=["dup", "sample"],
+        )
+        pipeline.start()
+        while pipeline.poll() is None:
+            pass
+        assert pipeline.stop() == 0
+        # The rings never got near half full.
+        assert pipeline.shed_counters is not None
+        assert pipeline.shed_counters.as_dict() == {"dup": 0, "sample": 0}
+        assert pipeline.stats_line().endswith(", shed 0 (dup 0, sample 0)")
+        text = PipelineMetrics(pipeline).render()
+        assert 'pymodes_live_shed_total{reason="sample"} 0' in text
+
+    def test_writer_failure_stops_pipeline(self, tmp_path):
+        pipeline = LivePipeline(
+            functools.partial(_FiniteSource, _corpus()),
+            functools.partial(
+                open_file_sink, str(tmp_path / "no" / "x.jsonl"), "jsonl"
+            ),
+            jobs=1,
+        )
+        pipeline.start()
+        while pipeline.poll() is None:
+            pass
+        assert pipeline.stop() == 1
+
+    def test_stop_terminates_reader_despite_parent_handler(self, tmp_path):
+        # modes live installs a SIGTERM handler before forking; the
+        # reader must still die on terminate().
+        previous = signal.signal(signal.SIGTERM, lambda *_: None)
+        try:
+            pipeline = LivePipeline(
+                functools.partial(_EndlessSource, _corpus()),
+                functools.partial(open_file_sink, str(tmp_path / "o.jsonl"), "jsonl"),
+                jobs=2,
+            )
+            pipeline.start()
+            while pipeline.writer_counters["records"] == 0:
+                assert pipeline.poll() is None
+                time.sleep(0.01)
+            started = time.monotonic()
+            assert pipeline.stop(timeout=5.0) == 0
+            assert time.monotonic() - started < 5.0
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+
+class TestLiveJobsCli:
+    def test_live_jobs_dumps_every_record(self, monkeypatch, tmp_path, capfd):
+        import pyModeS.cli.live as live_mod
+        from pyModeS.cli import main
+
+        frames = _corpus()
+        monkeypatch.setattr(
+            live_mod, "NetworkSource", lambda *a, **k: _FiniteSource(frames)
+        )
+        out = tmp_path / "live.jsonl"
+        argv = ["live", "--network", "h:1", "--jobs", "2", "--dump-to", str(out)]
+        assert main([*argv, "--quiet"]) == 0
+        assert len(out.read_text().splitlines()) == len(frames)
+        assert capfd.readouterr().err == ""
+
+        assert main(argv) == 0
+        captured = capfd.readouterr()
+        assert len(captured.out.splitlines()) == len(frames)
+        assert f"[pyModeS.live final] {len(frames)} msgs" in captured.err
@@ -0,0 +1,218 @@
+"""Tests for `modes live --relay` / `--relay-file` (pyModeS.cli._relay)."""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import io
+import socket
+import time
+
+import pytest
+
+from pyModeS._bits import crc_remainder
+from pyModeS.cli._compress import open_binary_write
+from pyModeS.cli._pipeline import LivePipeline
+from pyModeS.cli._relay import BeastRelay
+from pyModeS.cli._sink import open_file_sink
+from pyModeS.cli._source import NetworkSource
+
+DF17 = "8D406B902015A678D4D220AA4BDA"
+OTHER_DF17 = "8D4840D6202CC371C32CE0576098"
+MODE_AC = b"\x1a\x31" + bytes(6) + b"\x40" + b"\x12\x34"
+
+
+def _with_address(hex_prefix: str, address: int) -> str:
+    """A frame whose parity makes the CRC remainder ``address``."""
+    data = int(hex_prefix, 16) << 24
+    length = (len(hex_prefix) // 2 + 3) * 8
+    parity = crc_remainder(data, length) ^ address
+    return f"{data | parity:0{length // 4}X}"
+
+
+DF20 = _with_address("A0001838201584F2346820", 0x406B90)
+DF11_II = _with_address("5D406B90", 0x05)
+DF11_BAD = _with_address("5D406B90", 0x1234)
+CORRUPT_DF17 = DF17[:-1] + "B"
+
+
+def _frame(hex_msg: str, mlat: int = 0, signal: int = 0x55) -> bytes:
+    payload = bytes.fromhex(hex_msg)
+    msg_type = b"\x33" if len(payload) == 14 else b"\x32"
+    body = mlat.to_bytes(6, "big") + bytes([signal]) + payload
+    return b"\x1a" + msg_type + body.replace(b"\x1a", b"\x1a\x1a")
+
+
+def _relay_through_source(data: bytes, **filters) -> tuple[bytes, BeastRelay]:
+    out = io.BytesIO()
+    relay = BeastRelay(file=out, **filters)
+    src = NetworkSource("fake", 0, raw=True, relay=relay)
+    src._buf[: len(data)] = data
+    src._consume(len(data), 1000.0)
+    return out.getvalue(), relay
+
+
+class TestBeastRelay:
+    def test_relays_frames_as_received(self):
+        # A 0x1a in the MLAT counter and the signal byte stay escaped.
+        escaped = _frame(OTHER_DF17, mlat=0x1A_0000_001A, signal=0x1A)
+        frames = [_frame(DF17, mlat=12345), MODE_AC, escaped, _frame(DF20)]
+        out, relay = _relay_through_source(b"".join(frames))
+        assert out == frames[0] + escaped + frames[3]
+        assert (relay.seen, relay.relayed) == (3, 3)
+
+    def test_filters_by_df_and_icao(self):
+        data = b"".join(_frame(m) for m in (DF17, OTHER_DF17, DF20, DF11_II))
+        out, _ = _relay_through_source(data, dfs={20, 11})
+        assert out == _frame(DF20) + _frame(DF11_II)
+        out, _ = _relay_through_source(data, icaos={0x406B90})
+        assert out == _frame(DF17) + _frame(DF20) + _frame(DF11_II)
+
+    def test_crc_filter_trusts_addresses_from_valid_squitters(self):
+        data = b"".join(
+            _frame(m)
+            for m in (DF20, CORRUPT_DF17, DF17, DF20, DF11_II, DF11_BAD, OTHER_DF17)
+        )
+        out, relay = _relay_through_source(data, crc=True, dfs={11, 20})
+        # The first DF20 precedes any valid DF17 from its aircraft.
+        assert out == _frame(DF20) + _frame(DF11_II)
+        assert relay.relayed == 2
+
+    def test_crc_upkeep_without_listeners(self):
+        sent: list[bytes] = []
+
+        class _Server:
+            clients = 0
+            send = sent.append
+
+            def close(self):
+                pass
+
+        server = _Server()
+        relay = BeastRelay(server=server, crc=True)  # type: ignore[arg-type]
+        relay(_frame(DF17), [(0, 0, bytes.fromhex(DF17))])
+        assert sent == []
+        server.clients = 1
+        relay(_frame(DF20), [(0, 0, bytes.fromhex(DF20))])
+        assert sent == [_frame(DF20)]
+
+
+class _RelayedSource:
+    """One burst of ``data`` through a real parser, then an idle feed."""
+
+    def __init__(self, data: bytes, relay=None) -> None:
+        self._data = data
+        self._relay = relay
+        self.reconnects = 0
+        self.resyncs = 0
+
+    @property
+    def sources(self):
+        return [self]
+
+    def iter_batches(self):
+        src = NetworkSource("fake", 0, raw=True, relay=self._relay)
+        src._buf[: len(self._data)] = self._data
+        yield src._consume(len(self._data), 1000.0)
+        while True:
+            time.sleep(0.01)
+            yield [], []
+
+
+def _file_relay(path: str) -> BeastRelay:
+    return BeastRelay(file=open_binary_write(path), dfs={17})
+
+
+class TestPipelineRelay:
+    def test_reader_relays_and_completes_file_on_stop(self, tmp_path):
+        data = b"".join(_frame(m) for m in (DF17, DF20, OTHER_DF17))
+        out = tmp_path / "relay.beast.gz"
+        pipeline = LivePipeline(
+            functools.partial(_RelayedSource, data),
+            functools.partial(open_file_sink, str(tmp_path / "o.jsonl"), "jsonl"),
+            jobs=2,
+            make_relay=functools.partial(_file_relay, str(out)),
+        )
+        pipeline.start()
+        while pipeline.writer_counters["records"] < 3:
+            assert pipeline.poll() is None
+            time.sleep(0.01)
+        assert pipeline.stop() == 0
+        # Readable only if the reader closed the gzip stream.
+        assert gzip.decompress(out.read_bytes()) == _frame(DF17) + _frame(OTHER_DF17)
+
+
+class TestLiveRelayCli:
+    @pytest.fixture
+    def fed_source(self, monkeypatch):
+        import pyModeS.cli.live as live_mod
+
+        bursts: list[bytes] = []
+        before_read: list = []
+
+        class _Fed(NetworkSource):
+            def iter_batches(self):
+                for hook in before_read:
+                    hook()
+                for data in bursts:
+                    self._buf[: len(data)] = data
+                    burst = self._consume(len(data), 1000.0)
+                    if burst is not None:
+                        yield burst
+
+        monkeypatch.setattr(live_mod, "NetworkSource", _Fed)
+        return bursts, before_read
+
+    def test_relay_file_and_socket(self, fed_source, tmp_path, capsys):
+        from pyModeS.cli import main
+
+        bursts, before_read = fed_source
+        data = b"".join(_frame(m) for m in (DF17, DF20, OTHER_DF17))
+        bursts.append(data)
+        path = str(tmp_path / "relay.sock")
+        client = socket.socket(socket.AF_UNIX)
+
+        def connect():
+            client.connect(path)
+            while "client unix connected" not in capsys.readouterr().err:
+                time.sleep(0.005)
+
+        before_read.append(connect)
+        out = tmp_path / "adsb.beast.gz"
+        argv = ["live", "--network", "h:1", "--relay", f"unix:{path}"]
+        argv += ["--relay-file", str(out), "--relay-df", "17"]
+        try:
+            assert main([*argv, "--relay-icao", "406b90"]) == 0
+            received = b""
+            while chunk := client.recv(65536):
+                received += chunk
+        finally:
+            client.close()
+        assert received == gzip.decompress(out.read_bytes()) == _frame(DF17)
+        captured = capsys.readouterr()
+        # Relaying leaves the decoded output alone.
+        assert len(captured.out.splitlines()) == 3
+        assert "relayed 1 of 3 frames" in captured.err
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--relay-df", "17"],
+            ["--relay-crc"],
+            ["--relay", "30105", "--relay-df", "32"],
+            ["--relay", "30105", "--relay-icao", "406B9"],
+            ["--relay", "30105", "--tui"],
+        ],
+    )
+    def test_bad_relay_args_exit_two(self, extra, capsys):
+        from pyModeS.cli import main
+
+        with pytest.raises(SystemExit) as excinfo:
+            main(["live", "--network", "h:1", *extra])
+        assert excinfo.value.code == 2
+
+    def test_bad_relay_address_exits_two(self, capsys):
+        from pyModeS.cli import main
+
+        assert main(["live", "--network", "h:1", "--relay", "unix:"]) == 2
+        assert "--relay must be PORT, HOST:PORT or unix:PATH" in capsys.readouterr().err
@@ -0,0 +1,223 @@
+"""Tests for `modes replay` (pyModeS.cli.replay)."""
+
+from __future__ import annotations
+
+import math
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pyModeS.cli._source import BeastFileSource, NetworkSource
+from pyModeS.cli.replay import (
+    MLAT_HZ,
+    ReplayServer,
+    ReplayStats,
+    beast_frame,
+    replay,
+)
+
+CORPUS = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+
+
+def _corpus(n: int | None = None) -> list[tuple[str, float]]:
+    rows = [line.split(",") for line in CORPUS.read_text().splitlines()[:n]]
+    return [(r[1].strip('"'), float(r[0])) for r in rows]
+
+
+def _serve(records, **kwargs) -> tuple[ReplayServer, threading.Thread, dict]:
+    server = ReplayServer("127.0.0.1", 0)
+    result: dict = {}
+
+    def target():
+        result["stats"] = replay(records, server, **kwargs)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return server, thread, result
+
+
+def _receive(server: ReplayServer, thread: threading.Thread) -> bytes:
+    """Connect, read until the replay ends, and close the server."""
+    chunks = []
+    with socket.create_connection(server.address, timeout=5) as conn:
+        conn.settimeout(0.2)
+        while True:
+            try:
+                chunk = conn.recv(65536)
+            except TimeoutError:
+                if not thread.is_alive():
+                    break
+                continue
+            if not chunk:
+                break
+            chunks.append(chunk)
+    thread.join(5)
+    server.close()
+    return b"".join(chunks)
+
+
+def _parse(tmp_path, data: bytes) -> list[tuple[str, float]]:
+    path = tmp_path / "received.beast"
+    path.write_bytes(data)
+    with BeastFileSource(path, mlat_hz=MLAT_HZ) as src:
+        return list(src)
+
+
+class TestBeastFrame:
+    def test_round_trip_with_escapes(self, tmp_path):
+        frames = [
+            beast_frame("8D406B902015A678D4D220AA4BDA", 12_000_000),
+            # 0x1a in both the MLAT counter and the payload
+            beast_frame("5D4CA21A6A1E3F", 0x1A1A),
+        ]
+        assert _parse(tmp_path, b"".join(frames)) == [
+            ("8D406B902015A678D4D220AA4BDA", 1.0),
+            ("5D4CA21A6A1E3F", 0x1A1A / MLAT_HZ),
+        ]
+
+    @pytest.mark.parametrize("hex_msg", ["", "8D40", "XYZ", "8D406B902015A678D4D2"])
+    def test_rejects_non_mode_s(self, hex_msg):
+        assert beast_frame(hex_msg, 0) is None
+
+    def test_counter_wraps_at_48_bits(self):
+        frame = beast_frame("5D4CA2D46A1E3F", (1 << 48) + 5)
+        assert frame is not None
+        assert frame[2:8] == (5).to_bytes(6, "big")
+
+
+class TestReplay:
+    def test_max_speed_sends_whole_capture(self, tmp_path):
+        records = _corpus()
+        server, thread, result = _serve(records, speed=math.inf)
+        received = _parse(tmp_path, _receive(server, thread))
+        assert [h for h, _ in received] == [h for h, _ in records]
+        t0 = records[0][1]
+        for (_, got), (_, ts) in zip(received, records, strict=True):
+            assert got == pytest.approx(ts - t0, abs=1e-6)
+        stats = result["stats"]
+        assert stats.frames == len(records)
+        assert stats.max_lag is None
+
+    def test_speed_scales_gaps_and_mlat(self, tmp_path):
+        records = [("8D406B902015A678D4D220AA4BDA", 100.0 + i * 0.25) for i in range(5)]
+        server, thread, result = _serve(records, speed=10.0)
+        start = time.monotonic()
+        received = _parse(tmp_path, _receive(server, thread))
+        assert time.monotonic() - start >= 0.09
+        assert [ts for _, ts in received] == pytest.approx(
+            [i * 0.025 for i in range(5)], abs=1e-6
+        )
+        assert result["stats"].max_lag is not None
+
+    def test_skips_invalid_and_keeps_counter_monotonic(self, tmp_path):
+        records = [
+            ("8D406B902015A678D4D220AA4BDA", 10.0),
+            ("not hex", 10.1),
+            ("5D4CA2D46A1E3F", 9.5),
+        ]
+        server, thread, result = _serve(records, speed=math.inf)
+        received = _parse(tmp_path, _receive(server, thread))
+        assert received == [
+            ("8D406B902015A678D4D220AA4BDA", 0.0),
+            ("5D4CA2D46A1E3F", 0.0),
+        ]
+        assert result["stats"].skipped == 1
+
+    def test_network_source_reads_replay(self):
+        records = _corpus(200)
+        server, thread, _result = _serve(records, speed=math.inf)
+        host, port = server.address
+        src = NetworkSource(host, port, silent=True)
+        got: list[str] = []
+        for msgs, _timestamps in src.iter_batches():
+            got.extend(msgs)
+            if len(got) >= len(records):
+                break
+        thread.join(5)
+        server.close()
+        assert got == [h for h, _ in records]
+
+
+class TestReplayStats:
+    def test_interval_and_final_lines(self):
+        stats = ReplayStats()
+        stats.begin()
+        stats.frames = 100
+        stats.record_lag(0.5)
+        stats.record_lag(0.1)
+        line = stats.line(1)
+        assert line.startswith("[pyModeS.replay] 100 frames, ")
+        assert "lag 0.500 s, 1 client" in line
+        stats.frames = 150
+        stats.skipped = 2
+        assert "lag" not in stats.line(2)
+        final = stats.line(0, final=True)
+        assert final.startswith("[pyModeS.replay final] 150 frames, ")
+        assert final.endswith("lag 0.500 s, 0 clients, 2 skipped")
+
+
+class TestReplayCli:
+    @pytest.fixture
+    def port(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
+
+    def test_replays_capture_file(self, tmp_path, port, capsys):
+        from pyModeS.cli import main
+
+        capture = tmp_path / "capture.csv"
+        records = _corpus(50)
+        capture.write_text("".join(f"{ts},{h}\n" for h, ts in records))
+        argv = [
+            "replay",
+            "--file",
+            str(capture),
+            "--listen",
+            f"127.0.0.1:{port}",
+            "--speed",
+            "max",
+        ]
+        result: dict = {}
+        thread = threading.Thread(
+            target=lambda: result.update(code=main(argv)), daemon=True
+        )
+        thread.start()
+        chunks = []
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                conn = socket.create_connection(("127.0.0.1", port), timeout=5)
+                break
+            except ConnectionRefusedError:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        with conn:
+            while chunk := conn.recv(65536):
+                chunks.append(chunk)
+        thread.join(5)
+        assert result["code"] == 0
+        received = _parse(tmp_path, b"".join(chunks))
+        assert [h for h, _ in received] == [h for h, _ in records]
+        err = capsys.readouterr().err
+        assert f"serving {capture} on 127.0.0.1:{port}" in err
+        assert "[pyModeS.replay final] 50 frames" in err
+
+    def test_missing_file_exits_one(self, tmp_path, capsys):
+        from pyModeS.cli import main
+
+        code = main(["replay", "--file", str(tmp_path / "nope.csv")])
+        assert code == 1
+        assert "modes replay: error:" in capsys.readouterr().err
+
+    def test_bad_listen_exits_two(self, tmp_path, capsys):
+        from pyModeS.cli import main
+
+        capture = tmp_path / "capture.csv"
+        capture.write_text("0.0,8D406B902015A678D4D220AA4BDA\n")
+        code = main(["replay", "--file", str(capture), "--listen", "host:port"])
+        assert code == 2
+        assert "--listen must be PORT or HOST:PORT" in capsys.readouterr().err
@@ -0,0 +1,294 @@
+"""Tests for the pyModeS.cli._sink output sinks."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import sqlite3
+
+import pytest
+
+from pyModeS.cli._sink import SCHEMA_COLUMNS, JsonLinesSink, NullSink, TeeSink
+from pyModeS.cli._sqlite import SqliteSink
+from pyModeS.message import Decoded
+
+
+class _CountingStream(io.StringIO):
+    """StringIO that counts write and flush calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def _record(i: int) -> Decoded:
+    return Decoded({"icao": "406B90", "seq": i})
+
+
+def _seqs(text: str) -> list[int]:
+    return [json.loads(line)["seq"] for line in text.splitlines()]
+
+
+class TestJsonLinesSink:
+    def test_unbuffered_flushes_every_line(self):
+        stream = _CountingStream()
+        sink = JsonLinesSink(stream)
+        for i in range(3):
+            sink.write(_record(i))
+        assert stream.flushes == 3
+        assert _seqs(stream.getvalue()) == [0, 1, 2]
+
+    def test_flush_after_max_records(self):
+        stream = _CountingStream()
+        sink = JsonLinesSink(stream, max_records=3)
+        sink.write(_record(0))
+        sink.write(_record(1))
+        assert stream.getvalue() == ""
+        sink.write(_record(2))
+        assert _seqs(stream.getvalue()) == [0, 1, 2]
+        assert stream.writes == 1
+        assert stream.flushes == 1
+
+    def test_flush_after_max_bytes(self):
+        line_len = len(json.dumps(_record(0), separators=(",", ":"))) + 1
+        stream = _CountingStream()
+        sink = JsonLinesSink(stream, max_bytes=2 * line_len)
+        sink.write(_record(0))
+        assert stream.getvalue() == ""
+        sink.write(_record(1))
+        assert _seqs(stream.getvalue()) == [0, 1]
+
+    def test_flush_after_max_delay(self, monkeypatch):
+        import pyModeS.cli._sink as sink_mod
+
+        now = [100.0]
+        monkeypatch.setattr(sink_mod.time, "monotonic", lambda: now[0])
+        stream = _CountingStream()
+        sink = JsonLinesSink(stream, max_records=1000, max_delay=0.5)
+        sink.write(_record(0))
+        now[0] = 100.4
+        sink.write(_record(1))
+        assert stream.getvalue() == ""
+        now[0] = 100.5
+        sink.write(_record(2))
+        assert _seqs(stream.getvalue()) == [0, 1, 2]
+
+    def test_flush_due_on_quiet_feed(self, monkeypatch):
+        import pyModeS.cli._sink as sink_mod
+
+        now = [100.0]
+        monkeypatch.setattr(sink_mod.time, "monotonic", lambda: now[0])
+        stream = _CountingStream()
+        sink = JsonLinesSink(stream, max_records=1000, max_delay=0.5)
+        sink.flush_due()
+        assert stream.flushes == 0
+        sink.write(_record(0))
+        now[0] = 100.4
+        sink.flush_due()
+        assert stream.getvalue() == ""
+        now[0] = 100.5
+        # No further record: the idle check alone writes the line.
+        sink.flush_due()
+        assert _seqs(stream.getvalue()) == [0]
+        assert sink.pending == 0
+
+    def test_close_flushes_pending(self, tmp_path):
+        path = tmp_path / "dump.jsonl"
+        sink = JsonLinesSink.to_file(str(path), max_records=100)
+        for i in range(5):
+            sink.write(_record(i))
+        assert path.read_text() == ""
+        sink.close()
+        assert _seqs(path.read_text()) == [0, 1, 2, 3, 4]
+
+    def test_to_file_unbuffered_by_default(self, tmp_path):
+        path = tmp_path / "dump.jsonl"
+        sink = JsonLinesSink.to_file(str(path))
+        sink.write(_record(0))
+        assert _seqs(path.read_text()) == [0]
+        sink.close()
+
+    def test_to_file_gzip(self, tmp_path):
+        path = tmp_path / "dump.jsonl.gz"
+        sink = JsonLinesSink.to_file(str(path))
+        for i in range(100):
+            sink.write(_record(i))
+        sink.close()
+        assert _seqs(gzip.decompress(path.read_bytes()).decode()) == list(range(100))
+
+
+class TestTeeSink:
+    def test_writes_raw_msg_if_either_side_does(self):
+        assert TeeSink(NullSink(), NullSink()).writes_raw_msg is False
+        tee = TeeSink(NullSink(), JsonLinesSink(io.StringIO()))
+        assert tee.writes_raw_msg is True
+
+    def test_nested_tees_write_and_close_every_sink(self):
+        class _Failing(NullSink):
+            closed = False
+
+            def close(self) -> None:
+                self.closed = True
+                raise OSError("disk full")
+
+        first = io.StringIO()
+        failing = _Failing()
+        last = _CountingStream()
+        tee = TeeSink(TeeSink(JsonLinesSink(first), failing), JsonLinesSink(last))
+        tee.write(_record(1))
+        assert first.getvalue() == last.getvalue() == '{"icao":"406B90","seq":1}\n'
+        with pytest.raises(OSError, match="disk full"):
+            tee.close()
+        # The failing sink doesn't keep the ones after it open.
+        assert failing.closed
+        assert last.flushes == 2
+
+    def test_flush_due_reaches_nested_sinks(self, monkeypatch):
+        import pyModeS.cli._sink as sink_mod
+
+        now = [100.0]
+        monkeypatch.setattr(sink_mod.time, "monotonic", lambda: now[0])
+        stream = io.StringIO()
+        late = JsonLinesSink(stream, max_delay=0.5)
+        tee = TeeSink(TeeSink(NullSink(), late), NullSink())
+        tee.write(_record(0))
+        assert tee.pending == 1
+        now[0] = 100.5
+        tee.flush_due()
+        assert tee.pending == 0
+        assert _seqs(stream.getvalue()) == [0]
+
+
+class TestSqliteSink:
+    @staticmethod
+    def _rows(path) -> list[dict]:
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in conn.execute("SELECT * FROM messages")]
+        finally:
+            conn.close()
+
+    def test_round_trip_typed_columns(self, tmp_path):
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path))
+        sink.write(
+            Decoded(
+                {
+                    "df": 17,
+                    "icao": "406B90",
+                    "crc_valid": True,
+                    "latitude": 52.25,
+                    "supported_bds": ["1,0", "1,7"],
+                    "timestamp": 1000.5,
+                    "not_in_schema": 1,
+                }
+            )
+        )
+        sink.close()
+        (row,) = self._rows(path)
+        assert list(row) == list(SCHEMA_COLUMNS)
+        assert row["df"] == 17
+        assert row["icao"] == "406B90"
+        assert row["crc_valid"] == 1
+        assert row["latitude"] == 52.25
+        assert json.loads(row["supported_bds"]) == ["1,0", "1,7"]
+        assert row["timestamp"] == 1000.5
+        assert row["altitude"] is None
+
+    def test_mixed_key_layouts_keep_order(self, tmp_path):
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path))
+        sink.write(Decoded({"icao": "A", "altitude": 1000}))
+        sink.write(Decoded({"icao": "B", "altitude": None, "squawk": "7000"}))
+        sink.write(Decoded({"icao": "C", "altitude": 2000}))
+        sink.write(Decoded({"seq": 1}))
+        sink.close()
+        rows = self._rows(path)
+        assert [(r["icao"], r["altitude"], r["squawk"]) for r in rows] == [
+            ("A", 1000, None),
+            ("B", None, "7000"),
+            ("C", 2000, None),
+            (None, None, None),
+        ]
+
+    def test_commits_in_batches(self, tmp_path):
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path), batch_records=3, batch_delay=60)
+        sink.write(_record(0))
+        sink.write(_record(1))
+        assert self._rows(path) == []
+        sink.write(_record(2))
+        sink.write(_record(3))
+        assert len(self._rows(path)) == 3
+        sink.close()
+        assert len(self._rows(path)) == 4
+
+    def test_commits_after_batch_delay(self, tmp_path, monkeypatch):
+        import pyModeS.cli._sqlite as sqlite_mod
+
+        now = [100.0]
+        monkeypatch.setattr(sqlite_mod.time, "monotonic", lambda: now[0])
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path), batch_delay=0.5)
+        sink.write(_record(0))
+        now[0] = 100.5
+        sink.write(_record(1))
+        assert len(self._rows(path)) == 2
+        sink.close()
+
+    def test_flush_due_commits_on_quiet_feed(self, tmp_path, monkeypatch):
+        import pyModeS.cli._sqlite as sqlite_mod
+
+        now = [100.0]
+        monkeypatch.setattr(sqlite_mod.time, "monotonic", lambda: now[0])
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path), batch_delay=0.5)
+        sink.write(_record(0))
+        sink.flush_due()
+        assert self._rows(path) == []
+        now[0] = 100.5
+        sink.flush_due()
+        assert len(self._rows(path)) == 1
+        sink.close()
+
+    def test_wal_and_index_after_close(self, tmp_path):
+        path = tmp_path / "dump.db"
+        sink = SqliteSink(str(path))
+        sink.write(_record(0))
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            sink.close()
+            indexes = [row[1] for row in conn.execute("PRAGMA index_list(messages)")]
+            assert indexes == ["messages_icao_timestamp"]
+        finally:
+            conn.close()
+
+    def test_appends_and_adds_missing_columns(self, tmp_path):
+        path = tmp_path / "dump.db"
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE messages (icao TEXT, "timestamp" REAL)')
+        conn.execute("INSERT INTO messages VALUES ('ABCDEF', 1.0)")
+        conn.commit()
+        conn.close()
+        sink = SqliteSink(str(path))
+        sink.write(_record(0))
+        sink.close()
+        rows = self._rows(path)
+        assert [row["icao"] for row in rows] == ["ABCDEF", "406B90"]
+        assert set(rows[0]) == set(SCHEMA_COLUMNS)
+
+    def test_unopenable_path_raises_oserror(self, tmp_path):
+        with pytest.raises(OSError):
+            SqliteSink(str(tmp_path / "missing" / "dump.db"))
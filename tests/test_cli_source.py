@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import socket
+import threading
+import time
+from typing import Any
+
 import pytest
 
 
@@ -147,6 +152,33 @@ class TestBeastParser:
         _mlat, hex_msg = frames[0]
         assert hex_msg.upper() == "8D406B902015A678D4D220AA4BDA"
 
+    def test_frame_split_across_calls(self):
+        """Feeding the remainder back with the next burst completes a
+        frame cut at any byte, including inside an escape pair."""
+        from pyModeS.cli._source import _parse_beast_buffer
+
+        payload = bytes.fromhex("8D406B902015A6781AD220AA4BDA")
+        frame = b"\x1a\x33" + b"\x00" * 7 + payload.replace(b"\x1a", b"\x1a\x1a")
+        stream = frame + self._make_long_frame("8D485020994409940838175B284F")
+        stream += b"\x1a"
+        for cut in range(1, len(stream)):
+            first, rest = _parse_beast_buffer(stream[:cut])
+            second, _ = _parse_beast_buffer(rest + stream[cut:])
+            got = [h.upper() for _m, h in first + second]
+            assert got == [
+                "8D406B902015A6781AD220AA4BDA",
+                "8D485020994409940838175B284F",
+            ], cut
+
+    def test_stray_marker_before_frame(self):
+        """A lone 0x1a left over from the previous burst must not
+        swallow the marker of the frame that follows it."""
+        from pyModeS.cli._source import _parse_beast_buffer
+
+        buf = b"\x1a" + self._make_long_frame("8D406B902015A678D4D220AA4BDA")
+        frames, _remainder = _parse_beast_buffer(buf + b"\x1a")
+        assert [h.upper() for _m, h in frames] == ["8D406B902015A678D4D220AA4BDA"]
+
 
 class TestMlatCalibration:
     """End-to-end tests for NetworkSource's MLAT-derived per-frame
@@ -172,7 +204,10 @@ class TestMlatCalibration:
         self,
         bursts: list[bytes],
         wall_times: list[float],
-    ) -> list[tuple[str, float]]:
+        *,
+        raw: bool = False,
+        batches: bool = False,
+    ) -> list[Any]:
         """Feed a sequence of recv() bursts through a real
         NetworkSource wired up to a fake socket. ``wall_times[i]``
         is the value ``time.time()`` returns when the i-th recv()
@@ -188,16 +223,21 @@ class TestMlatCalibration:
                     raise OSError("no more fake data")
                 return self._chunks.pop(0)
 
+            def recv_into(self, buffer: memoryview) -> int:
+                chunk = self.recv(len(buffer))
+                buffer[: len(chunk)] = chunk
+                return len(chunk)
+
             def settimeout(self, *_: object) -> None:
                 pass
 
             def close(self) -> None:
                 pass
 
-        src = NetworkSource("fake", 0)
+        src = NetworkSource("fake", 0, raw=raw)
         src._sock = _FakeSock(bursts)  # type: ignore[assignment]
 
-        captured: list[tuple[str, float]] = []
+        captured: list[Any] = []
         call_idx = [0]
         orig_time = __import__("time").time
 
@@ -214,8 +254,9 @@ class TestMlatCalibration:
         source_mod.time.time = fake_time  # type: ignore[method-assign]
         try:
             try:
-                for hex_msg, ts in src._read_loop():
-                    captured.append((hex_msg, ts))
+                reader = src._read_bursts() if batches else src._read_loop()
+                for item in reader:
+                    captured.append(item)
                     if len(captured) >= 10:
                         break
             except OSError:
@@ -268,6 +309,48 @@ class TestMlatCalibration:
         assert captured[1][1] == pytest.approx(1001.0, abs=1e-6)
         assert captured[2][1] == pytest.approx(1001.5, abs=1e-6)
 
+    def test_raw_yields_payload_bytes(self) -> None:
+        # raw=True hands out the payload bytes with the same
+        # per-frame timestamps as the hex path.
+        b1 = self._make_long_frame("8D406B902015A678D4D220AA4BDA", mlat=0) + b"\x1a"
+        f1 = self._make_long_frame("8D485020994409940838175B284F", mlat=12_000_000)
+        f2 = self._make_long_frame("8D40058B58C901375147EFD09357", mlat=18_000_000)
+        bursts = [b1, f1 + f2 + b"\x1a"]
+
+        walls = [1000.0, 1001.0]
+        as_hex = self._run_bursts(bursts, wall_times=walls)
+        as_raw = self._run_bursts(bursts, wall_times=walls, raw=True)
+        assert all(type(msg) is bytes for msg, _ts in as_raw)
+        assert [(bytes.fromhex(str(m)), ts) for m, ts in as_hex] == as_raw
+
+    def test_read_bursts_groups_frames_per_recv(self) -> None:
+        # One (msgs, timestamps) pair per recv burst, carrying the
+        # same values the frame-by-frame reader yields.
+        b1 = self._make_long_frame("8D406B902015A678D4D220AA4BDA", mlat=0) + b"\x1a"
+        f1 = self._make_long_frame("8D485020994409940838175B284F", mlat=12_000_000)
+        f2 = self._make_long_frame("8D40058B58C901375147EFD09357", mlat=18_000_000)
+        bursts = [b1, f1 + f2 + b"\x1a"]
+
+        walls = [1000.0, 1001.0]
+        frames = self._run_bursts(bursts, wall_times=walls)
+        batches = self._run_bursts(bursts, wall_times=walls, batches=True)
+        assert [len(msgs) for msgs, _ts in batches] == [1, 2]
+        flat = [pair for msgs, ts in batches for pair in zip(msgs, ts, strict=True)]
+        assert flat == frames
+
+    def test_counts_parser_resyncs(self) -> None:
+        from pyModeS.cli._source import NetworkSource
+
+        frame = self._make_long_frame("8D406B902015A678D4D220AA4BDA", mlat=0)
+        # Preamble before the first marker, then an unknown type byte.
+        data = b"junk" + frame + b"\x1a\x39" + frame + b"\x1a"
+        src = NetworkSource("fake", 0)
+        src._buf[: len(data)] = data
+        msgs, _timestamps = src._consume(len(data), 1000.0)
+        assert len(msgs) == 2
+        assert src.resyncs == 2
+        assert src.sources == [src]
+
     def test_reconnect_resets_calibration_state(self) -> None:
         from pyModeS.cli._source import NetworkSource
 
@@ -276,12 +359,357 @@ class TestMlatCalibration:
         src._prev_burst_mlat = 42
         src._rate_estimate = 12_000_000.0
 
-        # Simulate the __iter__ reconnect branch inline — same
-        # three assignments the real code does.
-        src._prev_burst_wall = None
-        src._prev_burst_mlat = None
-        src._rate_estimate = None
+        src._reset()
 
         assert src._prev_burst_wall is None
         assert src._prev_burst_mlat is None
         assert src._rate_estimate is None
+
+
+def _beast_frame(hex_msg: str, mlat: int, msg_type: int | None = None) -> bytes:
+    """Encode one beast frame, escaping 0x1a anywhere in the body."""
+    payload = bytes.fromhex(hex_msg)
+    if msg_type is None:
+        msg_type = 0x33 if len(payload) == 14 else 0x32
+    body = mlat.to_bytes(6, "big") + b"\x00" + payload
+    return b"\x1a" + bytes([msg_type]) + body.replace(b"\x1a", b"\x1a\x1a")
+
+
+def _adsb_sample() -> list[tuple[float, str]]:
+    from pathlib import Path
+
+    path = Path(__file__).parent / "data" / "sample_data_adsb.csv"
+    rows = [line.split(",") for line in path.read_text().splitlines()]
+    return [(float(r[0]), r[1].strip('"')) for r in rows]
+
+
+class TestBeastFileSource:
+    def _write(self, tmp_path, frames: list[bytes]):
+        p = tmp_path / "capture.beast"
+        p.write_bytes(b"".join(frames))
+        return p
+
+    def test_yields_frames_with_tick_timestamps(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        p = self._write(
+            tmp_path,
+            [
+                _beast_frame("8D406B902015A678D4D220AA4BDA", mlat=12_000_000),
+                _beast_frame("5D4CA2D46A1E3F", mlat=18_000_000),
+            ],
+        )
+        with BeastFileSource(p, mlat_hz=12e6, epoch=100.0) as src:
+            assert list(src) == [
+                ("8D406B902015A678D4D220AA4BDA", 101.0),
+                ("5D4CA2D46A1E3F", 101.5),
+            ]
+
+    def test_escaped_bytes_and_skipped_frame_types(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        p = self._write(
+            tmp_path,
+            [
+                _beast_frame("1234", mlat=1, msg_type=0x31),  # Mode A/C
+                _beast_frame("8D1A6B902015A678D4D220AA4B1A", mlat=0x1A1A),
+                b"\x1a\x34\x01\x02\x1a\x1a\x03",  # status frame
+                _beast_frame("8D485020994409940838175B284F", mlat=0x1A0000),
+            ],
+        )
+        with BeastFileSource(p, mlat_hz=12e6) as src:
+            frames = list(src.frames())
+        assert [(m, h) for _o, m, h in frames] == [
+            (0x1A1A, "8D1A6B902015A678D4D220AA4B1A"),
+            (0x1A0000, "8D485020994409940838175B284F"),
+        ]
+
+    def test_truncated_final_frame_is_dropped(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        whole = _beast_frame("8D406B902015A678D4D220AA4BDA", mlat=1)
+        p = self._write(tmp_path, [whole, whole[:10]])
+        with BeastFileSource(p, mlat_hz=12e6) as src:
+            assert len(list(src)) == 1
+            assert src.offset == len(whole) + 10
+
+    def test_empty_file(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        p = self._write(tmp_path, [])
+        with BeastFileSource(p) as src:
+            assert list(src) == []
+
+    def test_seek_resyncs_to_next_frame(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        # Payload with an escaped 0x1a followed by 0x33: a naive
+        # marker search from inside the frame would stop there.
+        tricky = _beast_frame("8D406B901A33A678D4D220AA4BDA", mlat=5)
+        second = _beast_frame("8D485020994409940838175B284F", mlat=6)
+        p = self._write(tmp_path, [tricky, second])
+        with BeastFileSource(p, mlat_hz=12e6) as src:
+            assert src.seek(3) == len(tricky)
+            assert [h for h, _ts in src] == ["8D485020994409940838175B284F"]
+            assert src.seek(0) == 0
+            offsets = [o for o, _m, _h in src.frames()]
+        assert offsets == [0, len(tricky)]
+
+    def test_resume_from_offset(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        frames = [
+            _beast_frame("8D406B902015A678D4D220AA4BDA", mlat=i) for i in range(5)
+        ]
+        p = self._write(tmp_path, frames)
+        with BeastFileSource(p, mlat_hz=12e6) as src:
+            it = src.frames()
+            next(it)
+            next(it)
+            resume_at = src.offset
+        with BeastFileSource(p, mlat_hz=12e6) as src:
+            src.seek(resume_at)
+            assert [m for _o, m, _h in src.frames()] == [2, 3, 4]
+
+    @pytest.mark.parametrize("hz", [12e6, 1e9])
+    def test_detects_mlat_rate(self, tmp_path, hz):
+        from pyModeS.cli._source import BeastFileSource
+
+        rows = _adsb_sample()
+        t0 = rows[0][0]
+        p = self._write(
+            tmp_path, [_beast_frame(h, mlat=round((t - t0) * hz)) for t, h in rows]
+        )
+        with BeastFileSource(p) as src:
+            assert src.mlat_hz == hz
+
+    def test_unwraps_midnight_counter_reset(self, tmp_path):
+        from pyModeS.cli._source import BeastFileSource
+
+        day_ns = 86_400 * 1_000_000_000
+        p = self._write(
+            tmp_path,
+            [
+                _beast_frame("8D406B902015A678D4D220AA4BDA", mlat=day_ns - 10**9),
+                _beast_frame("8D406B902015A678D4D220AA4BDA", mlat=5 * 10**8),
+            ],
+        )
+        with BeastFileSource(p, mlat_hz=1e9) as src:
+            (_h1, t1), (_h2, t2) = list(src)
+        assert t2 - t1 == pytest.approx(1.5)
+
+
+def _serve(bursts: list[bytes], gap: float = 0.0) -> tuple[int, threading.Event]:
+    """Serve ``bursts`` to one client on a localhost port.
+
+    Returns the port and an event that closes the connection when set.
+    """
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    done = threading.Event()
+
+    def run() -> None:
+        with listener:
+            conn, _addr = listener.accept()
+            with conn:
+                for burst in bursts:
+                    conn.sendall(burst)
+                    time.sleep(gap)
+                done.wait(10)
+
+    threading.Thread(target=run, daemon=True).start()
+    return port, done
+
+
+def _collect(src: Any, count: int, timeout: float = 5.0) -> list[Any]:
+    """Read ``count`` frames from ``src`` on a helper thread."""
+    got: list[Any] = []
+
+    def run() -> None:
+        for item in src:
+            got.append(item)
+            if len(got) >= count:
+                break
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    t.join(timeout)
+    assert not t.is_alive(), f"only {len(got)} of {count} frames arrived"
+    return got
+
+
+class TestMultiNetworkSource:
+    HEX = (
+        "8D406B902015A678D4D220AA4BDA",
+        "8D485020994409940838175B284F",
+        "8D40058B58C901375147EFD09357",
+        "8D4840D6202CC371C32CE0576098",
+    )
+
+    def test_merges_feeds_in_timestamp_order(self):
+        from pyModeS.cli._source import MultiNetworkSource
+
+        a, b, c, d = self.HEX
+        port1, done1 = _serve([_beast_frame(a, 0) + _beast_frame(b, 1) + b"\x1a"])
+        port2, done2 = _serve([_beast_frame(c, 0) + _beast_frame(d, 1) + b"\x1a"])
+        src = MultiNetworkSource(
+            [("127.0.0.1", port1), ("127.0.0.1", port2)],
+            silent=True,
+            merge_window=0.1,
+        )
+        got = _collect(src, 4)
+        done1.set()
+        done2.set()
+        assert sorted(h for h, _ts in got) == sorted(self.HEX)
+        stamps = [ts for _h, ts in got]
+        assert stamps == sorted(stamps)
+
+    def test_dead_feed_does_not_block_others(self):
+        from pyModeS.cli._source import MultiNetworkSource
+
+        with socket.create_server(("127.0.0.1", 0)) as closed:
+            dead_port = closed.getsockname()[1]
+        port, done = _serve([_beast_frame(self.HEX[0], 0) + b"\x1a"])
+        src = MultiNetworkSource(
+            [("127.0.0.1", dead_port), ("127.0.0.1", port)],
+            silent=True,
+            merge_window=0.05,
+        )
+        got = _collect(src, 1)
+        done.set()
+        assert got[0][0] == self.HEX[0]
+        dead, live = src.sources
+        assert dead.reconnects >= 1
+        assert live.reconnects == 0
+
+    def test_calibrates_each_feed_separately(self):
+        from pyModeS.cli._source import MultiNetworkSource
+
+        hex_msg = self.HEX[0]
+
+        def bursts(hz: float) -> list[bytes]:
+            # Each recv burst ends with a lone marker so its frame is
+            # complete; the anchors are 0.3 s of counter time apart.
+            return [
+                _beast_frame(hex_msg, round(i * 0.3 * hz)) + b"\x1a" for i in range(3)
+            ]
+
+        port1, done1 = _serve(bursts(12e6), gap=0.3)
+        port2, done2 = _serve(bursts(1e9), gap=0.3)
+        src = MultiNetworkSource(
+            [("127.0.0.1", port1), ("127.0.0.1", port2)],
+            silent=True,
+            merge_window=0.05,
+        )
+        _collect(src, 6)
+        done1.set()
+        done2.set()
+        rate1 = src._feeds[0].source._rate_estimate
+        rate2 = src._feeds[1].source._rate_estimate
+        assert rate1 is not None and rate2 is not None
+        assert rate1 == pytest.approx(12e6, rel=0.5)
+        assert rate2 == pytest.approx(1e9, rel=0.5)
+
+
+class TestLocalSources:
+    HEX = TestMultiNetworkSource.HEX
+
+    def test_unix_source_reads_and_reconnects(self, tmp_path):
+        from pyModeS.cli._source import UnixSource
+
+        path = str(tmp_path / "beast.sock")
+        listener = socket.socket(socket.AF_UNIX)
+        listener.bind(path)
+        listener.listen()
+
+        def run() -> None:
+            # Two connections, one frame each: the source reconnects.
+            with listener:
+                for hex_msg in self.HEX[:2]:
+                    conn, _addr = listener.accept()
+                    with conn:
+                        conn.sendall(_beast_frame(hex_msg, 0) + b"\x1a")
+
+        threading.Thread(target=run, daemon=True).start()
+        src = UnixSource(path, silent=True)
+        got = _collect(src, 2)
+        assert [h for h, _ts in got] == list(self.HEX[:2])
+        assert src.name == f"unix:{path}"
+        assert src.reconnects == 1
+
+    def test_pipe_source_calibrates_and_ends_at_eof(self):
+        import os
+
+        from pyModeS.cli._source import PipeSource
+
+        read_fd, write_fd = os.pipe()
+
+        def run() -> None:
+            # Bursts 0.3 s of a 12 MHz counter apart, like a receiver.
+            for i in range(3):
+                os.write(write_fd, _beast_frame(self.HEX[i], round(i * 0.3 * 12e6)))
+                time.sleep(0.3)
+            os.close(write_fd)
+
+        threading.Thread(target=run, daemon=True).start()
+        src = PipeSource(read_fd, raw=True)
+        try:
+            got = list(src)
+        finally:
+            os.close(read_fd)
+        assert [m.hex().upper() for m, _ts in got] == list(self.HEX[:3])
+        assert src._rate_estimate == pytest.approx(12e6, rel=0.5)
+        assert src.name == f"fd:{read_fd}"
+        assert src.reconnects == 0
+
+    def test_pipe_source_yields_empty_burst_when_idle(self, monkeypatch):
+        import os
+
+        from pyModeS.cli import _source
+        from pyModeS.cli._source import PipeSource
+
+        monkeypatch.setattr(_source, "_IDLE_POLL_S", 0.01)
+        read_fd, write_fd = os.pipe()
+        try:
+            batches = PipeSource(read_fd, raw=True).iter_batches()
+            assert next(batches) == ([], [])
+            os.write(write_fd, _beast_frame(self.HEX[0], 0))
+            msgs, _timestamps = next(batches)
+            assert [m.hex().upper() for m in msgs] == [self.HEX[0]]
+        finally:
+            os.close(write_fd)
+            os.close(read_fd)
+
+    def test_network_source_yields_empty_burst_when_idle(self, monkeypatch):
+        from pyModeS.cli import _source
+        from pyModeS.cli._source import NetworkSource
+
+        monkeypatch.setattr(_source, "_IDLE_POLL_S", 0.01)
+        port, done = _serve([_beast_frame(self.HEX[0], 0) + b"\x1a"])
+        src = NetworkSource("127.0.0.1", port, silent=True)
+        try:
+            batches = src.iter_batches()
+            msgs, _timestamps = next(batches)
+            assert msgs == [self.HEX[0]]
+            assert next(batches) == ([], [])
+            assert src.reconnects == 0
+        finally:
+            done.set()
+
+    def test_network_source_still_times_out_silent_feed(self, monkeypatch):
+        from pyModeS.cli import _source
+        from pyModeS.cli._source import NetworkSource
+
+        monkeypatch.setattr(_source, "_IDLE_POLL_S", 0.01)
+        port, done = _serve([])
+        src = NetworkSource("127.0.0.1", port, read_timeout=0.05, silent=True)
+        try:
+            src._connect()
+            bursts = src._read_bursts()
+            with pytest.raises(TimeoutError):
+                while True:
+                    assert next(bursts) == ([], [])
+        finally:
+            done.set()
+            if src._sock is not None:
+                src._sock.close()
@@ -0,0 +1,150 @@
+"""Tests for the NumPy array CPR resolvers in pyModeS.position._cpr_array.
+
+Every array variant must agree bit-for-bit with the scalar resolver
+in pyModeS.position._cpr, element by element, with NaN standing in
+for the scalar ``None``.
+"""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyModeS.position import (  # noqa: E402
+    airborne_position_pair,
+    airborne_position_pair_array,
+    airborne_position_with_ref,
+    airborne_position_with_ref_array,
+    cprNL,
+    cprNL_array,
+    surface_position_pair,
+    surface_position_pair_array,
+    surface_position_with_ref,
+    surface_position_with_ref_array,
+)
+
+N = 5000
+
+
+def _raw(rng: random.Random) -> list[int]:
+    return [rng.randrange(0, 1 << 17) for _ in range(N)]
+
+
+def _same(got_lat, got_lon, expected) -> None:
+    for i, exp in enumerate(expected):
+        if exp is None:
+            assert math.isnan(got_lat[i]) and math.isnan(got_lon[i]), i
+        else:
+            assert (got_lat[i], got_lon[i]) == exp, i
+
+
+class TestCprNLArray:
+    def test_matches_scalar_on_grid(self):
+        lats = [i * 0.01 for i in range(-9000, 9001)] + [87.0, -87.0, 0.0]
+        lats += list(np.nextafter(np.asarray(lats[-3:]), 100.0))
+        got = cprNL_array(lats)
+        assert got.tolist() == [cprNL(lat) for lat in lats]
+
+    def test_boundaries_exactly(self):
+        from pyModeS.position._cpr import _NL_BOUNDARIES
+
+        got = cprNL_array(list(_NL_BOUNDARIES))
+        assert got.tolist() == [cprNL(b) for b in _NL_BOUNDARIES]
+
+
+class TestAirbornePairArray:
+    @pytest.mark.parametrize("even_is_newer", [True, False])
+    def test_matches_scalar_random(self, even_is_newer):
+        rng = random.Random(1)
+        le, ne, lo, no = _raw(rng), _raw(rng), _raw(rng), _raw(rng)
+        lat, lon = airborne_position_pair_array(
+            le, ne, lo, no, even_is_newer=even_is_newer
+        )
+        expected = [
+            airborne_position_pair(a, b, c, d, even_is_newer=even_is_newer)
+            for a, b, c, d in zip(le, ne, lo, no, strict=True)
+        ]
+        assert any(e is None for e in expected)
+        assert any(e is not None for e in expected)
+        _same(lat, lon, expected)
+
+    def test_per_element_newer_flag(self):
+        # Worked example from "The 1090 MHz Riddle", both newer flags
+        le, ne, lo, no = 93000, 51372, 74158, 50194
+        lat, lon = airborne_position_pair_array(
+            [le, le], [ne, ne], [lo, lo], [no, no], even_is_newer=[True, False]
+        )
+        _same(
+            lat,
+            lon,
+            [
+                airborne_position_pair(le, ne, lo, no, even_is_newer=True),
+                airborne_position_pair(le, ne, lo, no, even_is_newer=False),
+            ],
+        )
+
+
+class TestSurfacePairArray:
+    @pytest.mark.parametrize("ref", [(43.6, 1.37), (-33.4, -70.8), (51.5, 179.9)])
+    @pytest.mark.parametrize("even_is_newer", [True, False])
+    def test_matches_scalar_random(self, ref, even_is_newer):
+        rng = random.Random(2)
+        le, ne, lo, no = _raw(rng), _raw(rng), _raw(rng), _raw(rng)
+        lat, lon = surface_position_pair_array(
+            le,
+            ne,
+            lo,
+            no,
+            lat_ref=ref[0],
+            lon_ref=ref[1],
+            even_is_newer=even_is_newer,
+        )
+        expected = [
+            surface_position_pair(
+                a,
+                b,
+                c,
+                d,
+                lat_ref=ref[0],
+                lon_ref=ref[1],
+                even_is_newer=even_is_newer,
+            )
+            for a, b, c, d in zip(le, ne, lo, no, strict=True)
+        ]
+        _same(lat, lon, expected)
+
+
+class TestWithRefArray:
+    @pytest.mark.parametrize(
+        ("array_fn", "scalar_fn"),
+        [
+            (airborne_position_with_ref_array, airborne_position_with_ref),
+            (surface_position_with_ref_array, surface_position_with_ref),
+        ],
+    )
+    def test_matches_scalar_random(self, array_fn, scalar_fn):
+        rng = random.Random(3)
+        fmt = [rng.randrange(2) for _ in range(N)]
+        la, lo = _raw(rng), _raw(rng)
+        lat_ref = [rng.uniform(-89.9, 89.9) for _ in range(N)]
+        lon_ref = [rng.uniform(-180.0, 180.0) for _ in range(N)]
+        lat, lon = array_fn(fmt, la, lo, lat_ref, lon_ref)
+        expected = [
+            scalar_fn(*args) for args in zip(fmt, la, lo, lat_ref, lon_ref, strict=True)
+        ]
+        _same(lat, lon, expected)
+
+    def test_scalar_reference_broadcasts(self):
+        lat, lon = airborne_position_with_ref_array(
+            [0, 1], [93000, 74158], [51372, 50194], 49.0, 6.0
+        )
+        _same(
+            lat,
+            lon,
+            [
+                airborne_position_with_ref(0, 93000, 51372, 49.0, 6.0),
+                airborne_position_with_ref(1, 74158, 50194, 49.0, 6.0),
+            ],
+        )
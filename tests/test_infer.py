@@ -131,6 +131,91 @@ class TestInferPhase3Disambiguation:
         assert result == ["5,0", "6,0"]
 
 
+class TestInferCapabilityFilter:
+    """A BDS 1,7 ``supported_bds`` list in ``known`` gates Phase 2."""
+
+    AMBIGUOUS_PAYLOAD = TestInferPhase3Disambiguation.AMBIGUOUS_PAYLOAD
+
+    def test_unadvertised_register_is_skipped(self):
+        known = {"supported_bds": ["2,0", "4,0", "6,0"]}
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20, known=known) == ["6,0"]
+
+    def test_advertised_registers_all_survive(self):
+        known = {"supported_bds": ["2,0", "5,0", "6,0"]}
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20, known=known) == ["5,0", "6,0"]
+
+    def test_filter_combines_with_phase3(self):
+        known = {"supported_bds": ["5,0", "6,0"], "heading": 359}
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20, known=known) == ["6,0", "5,0"]
+
+    def test_format_id_registers_are_never_filtered(self):
+        payload = payload_of("A000083E202CC371C31DE0AA1CCF")
+        assert infer(payload, 20, known={"supported_bds": []}) == ["2,0"]
+
+    def test_meteo_filtered_when_enabled(self):
+        payload = payload_of("A0001692185BD5CF400000DFC696")
+        assert "4,4" in infer(payload, 20, include_meteo=True)
+        known = {"supported_bds": ["2,0", "4,0", "5,0", "6,0"]}
+        assert "4,4" not in infer(payload, 20, include_meteo=True, known=known)
+
+
+class TestInferCache:
+    """Phases 1-2 are memoised per payload; Phase 3 stays per call."""
+
+    AMBIGUOUS_PAYLOAD = TestInferPhase3Disambiguation.AMBIGUOUS_PAYLOAD
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        from pyModeS.decoder.bds import _infer
+
+        _infer.cache_clear()
+        yield
+        _infer.cache_clear()
+
+    def test_repeated_payload_hits_cache_across_dfs(self):
+        from pyModeS.decoder.bds._infer import cache_info
+
+        payload = payload_of("A000083E202CC371C31DE0AA1CCF")
+        assert infer(payload, 20) == ["2,0"]
+        assert infer(payload, 21) == ["2,0"]
+        assert infer(payload, 20) == ["2,0"]
+        info = cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    def test_include_meteo_is_part_of_the_key(self):
+        from pyModeS.decoder.bds._infer import cache_info
+
+        infer(self.AMBIGUOUS_PAYLOAD, 20)
+        infer(self.AMBIGUOUS_PAYLOAD, 20, include_meteo=True)
+        assert cache_info().misses == 2
+
+    def test_caller_mutation_does_not_poison_cache(self):
+        first = infer(self.AMBIGUOUS_PAYLOAD, 20)
+        first.clear()
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20) == ["5,0", "6,0"]
+
+    def test_phase3_still_follows_known_after_cache_hit(self):
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20, known={"heading": 359})[0] == "6,0"
+        assert infer(self.AMBIGUOUS_PAYLOAD, 20, known={"groundspeed": 240})[0] == (
+            "5,0"
+        )
+
+    def test_phase3_skipped_when_known_has_no_scoring_fields(self):
+        from pyModeS.decoder.bds._infer import cache_info
+
+        infer(self.AMBIGUOUS_PAYLOAD, 20, known={"altitude": 35000, "heading": None})
+        info = cache_info()
+        assert (info.score_hits, info.score_misses) == (0, 0)
+
+    def test_phase3_scoring_values_are_cached(self):
+        from pyModeS.decoder.bds._infer import cache_info
+
+        infer(self.AMBIGUOUS_PAYLOAD, 20, known={"heading": 359})
+        infer(self.AMBIGUOUS_PAYLOAD, 20, known={"heading": 10})
+        info = cache_info()
+        assert (info.score_hits, info.score_misses) == (2, 2)
+
+
 class TestInferEs:
     def _mk_es(self, tc: int, rest: int = 0) -> int:
         """Construct a 56-bit ES ME field with given TC in bits [0:5]."""
@@ -0,0 +1,88 @@
+"""Tests for the pyModeS._json record encoder."""
+
+from __future__ import annotations
+
+import enum
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from pyModeS import PipeDecoder, _json
+from pyModeS._json import dumps
+from pyModeS.message import Decoded
+
+DATA = Path(__file__).parent / "data"
+
+
+def _corpus(full_dict: bool) -> list[Decoded]:
+    rows = []
+    for line in (DATA / "sample_data_adsb.csv").read_text().splitlines():
+        fields = line.split(",")
+        rows.append((float(fields[0]), fields[1].strip('"')))
+    df20 = (DATA / "sample_data_commb_df20.csv").read_text(encoding="utf-8-sig")
+    for line in df20.splitlines()[:500]:
+        fields = line.split(",")
+        rows.append((float(fields[0]), fields[2]))
+    rows.sort(key=lambda r: r[0])
+    pipe = PipeDecoder(full_dict=full_dict)
+    out = []
+    for ts, hex_msg in rows:
+        result = pipe.decode(hex_msg, timestamp=ts)
+        result["raw_msg"] = hex_msg
+        result["timestamp"] = ts
+        out.append(result)
+    return out
+
+
+def _stdlib(obj: dict, compact: bool) -> str:
+    separators = (",", ":") if compact else (", ", ": ")
+    return json.dumps(obj, separators=separators, default=str)
+
+
+class _Level(enum.IntEnum):
+    HIGH = 2
+
+
+_EDGE_CASES = [
+    {},
+    {"altitude": math.nan, "groundspeed": math.inf, "track": -math.inf},
+    {"latitude": 1e-05, "longitude": 1e16, "vertical_rate": -0.0, "nic": 0.0},
+    {"callsign": "ÉZY12  ", "raw_msg": "a\x7fb", "squawk": 'q"\\\n'},
+    {"icao": 2**70, "df": -(2**64), "tc": 2**63 - 1},
+    {"bds": ["4,0", "5,0"], "mixed": [1, 2.5, None, "é"]},
+    {1: "int key", "icao": "406B90"},
+    {"obj": object.__new__(type("Opaque", (), {"__str__": lambda s: "opaque"}))},
+    {"level": _Level.HIGH, "flag": True, "other": False, "none": None},
+    {"nested": {"a": [1, {"b": None}]}, "new_key_é": 1},
+    # Keys are escaped like values, on an otherwise orjson-exact record.
+    {"icao": "406B90", "vitesse_é": 1, "a\x7fb": True},
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    elif _json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestDumps:
+    @pytest.mark.parametrize("full_dict", [False, True])
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_corpus_matches_stdlib(self, backend, full_dict, compact):
+        for record in _corpus(full_dict):
+            assert dumps(record, compact=compact) == _stdlib(record, compact)
+
+    @pytest.mark.parametrize("compact", [True, False])
+    @pytest.mark.parametrize("obj", _EDGE_CASES)
+    def test_edge_values_match_stdlib(self, backend, obj, compact):
+        assert dumps(obj, compact=compact) == _stdlib(obj, compact)
+
+    def test_decoded_to_json_matches_stdlib(self):
+        d = Decoded({"icao": "406B90", "altitude": 38000, "latitude": 52.25})
+        assert d.to_json() == json.dumps(d, default=str)
+        assert d.to_json(indent=2) == json.dumps(d, indent=2, default=str)
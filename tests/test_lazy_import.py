@@ -0,0 +1,93 @@
+"""Tests for the lazy top-level ``pyModeS`` namespace.
+
+``import pyModeS`` must stay cheap: the decoder package, PipeDecoder
+and ``importlib.metadata`` are only loaded when first touched. Each
+check runs in a fresh interpreter because the test session has long
+since imported everything.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(stmt: str) -> set[str]:
+    code = f"import sys\n{stmt}\nprint('\\n'.join(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(proc.stdout.split())
+
+
+def test_bare_import_loads_no_decoder_modules() -> None:
+    loaded = _loaded_after("import pyModeS")
+    assert {m for m in loaded if m.startswith("pyModeS")} == {
+        "pyModeS",
+        "pyModeS._v2_removed",
+        "pyModeS.errors",
+    }
+    assert "importlib.metadata" not in loaded
+    assert "importlib.abc" not in loaded
+
+
+def test_decode_does_not_load_pipe_decoder() -> None:
+    loaded = _loaded_after("from pyModeS import decode")
+    assert "pyModeS.core" in loaded
+    assert "pyModeS.decoder" in loaded
+    assert "pyModeS._pipe" not in loaded
+
+
+@pytest.mark.parametrize(
+    ("name", "module"),
+    [
+        ("decode", "pyModeS.core"),
+        ("PipeDecoder", "pyModeS._pipe"),
+        ("Message", "pyModeS.message"),
+        ("Decoded", "pyModeS.message"),
+    ],
+)
+def test_lazy_public_names_resolve(name: str, module: str) -> None:
+    import importlib
+
+    import pyModeS
+
+    assert getattr(pyModeS, name) is getattr(importlib.import_module(module), name)
+
+
+def test_subpackages_reachable_as_attributes() -> None:
+    loaded = _loaded_after("import pyModeS\npyModeS.position.cprNL(52.0)")
+    assert "pyModeS.position" in loaded
+
+
+def test_version_resolves_lazily() -> None:
+    from importlib.metadata import version
+
+    import pyModeS
+
+    assert pyModeS.__version__ == version("pyModeS")
+
+
+def test_dir_lists_lazy_names() -> None:
+    import pyModeS
+
+    names = dir(pyModeS)
+    for name in ("decode", "PipeDecoder", "__version__", "decoder"):
+        assert name in names
+
+
+def test_v2_finder_runs_after_path_finder() -> None:
+    from importlib.machinery import PathFinder
+
+    import pyModeS  # noqa: F401
+    from pyModeS._v2_removed import _FINDER
+
+    assert sys.meta_path.index(_FINDER) > sys.meta_path.index(PathFinder)
+
+
+def test_position_package_does_not_import_numpy() -> None:
+    loaded = _loaded_after("import pyModeS.position")
+    assert "numpy" not in loaded
+    assert "pyModeS.position._cpr_array" not in loaded
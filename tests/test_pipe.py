@@ -20,6 +20,10 @@ class TestPipeDecoderSkeleton:
             "position_rejected": 0,
             "bootstrap_held": 0,
             "bootstrap_reset": 0,
+            "infer_cache_hits": 0,
+            "infer_cache_misses": 0,
+            "infer_score_hits": 0,
+            "infer_score_misses": 0,
         }
 
     def test_decode_single_message(self):
@@ -43,6 +47,22 @@ class TestPipeDecoderSkeleton:
         assert pipe.stats["total"] == 1
         assert pipe.stats["decoded"] == 0
 
+    def test_decode_accepts_bytes_and_int(self):
+        hex_msg = "8D406B902015A678D4D220AA4BDA"
+        expected = PipeDecoder().decode(hex_msg)
+        assert PipeDecoder().decode(bytes.fromhex(hex_msg)) == expected
+        assert PipeDecoder().decode(int(hex_msg, 16), length=112) == expected
+        short = "20000F1F684A6C"
+        assert PipeDecoder().decode(int(short, 16), length=56) == PipeDecoder().decode(
+            short
+        )
+
+    def test_decode_bad_bytes_length_reports_hex(self):
+        pipe = PipeDecoder()
+        result = pipe.decode(b"\x8d\x40\x6b")
+        assert "error" in result
+        assert result["raw_msg"] == "8D406B"
+
     def test_stats_returns_a_copy(self):
         pipe = PipeDecoder()
         stats1 = pipe.stats
@@ -66,8 +86,23 @@ class TestPipeDecoderSkeleton:
             "position_rejected": 0,
             "bootstrap_held": 0,
             "bootstrap_reset": 0,
+            "infer_cache_hits": 0,
+            "infer_cache_misses": 0,
+            "infer_score_hits": 0,
+            "infer_score_misses": 0,
         }
 
+    def test_stats_count_infer_cache_lookups(self):
+        msg = "A000083E202CC371C31DE0AA1CCF"  # DF20 BDS 2,0
+        PipeDecoder().decode(msg)  # cached before this pipe existed
+        pipe = PipeDecoder()
+        pipe.decode(msg)
+        pipe.decode(msg)
+        stats = pipe.stats
+        assert (stats["infer_cache_hits"], stats["infer_cache_misses"]) == (2, 0)
+        pipe.reset()
+        assert pipe.stats["infer_cache_hits"] == 0
+
     def test_surface_ref_propagates_to_decode(self):
         # Real DF18 BDS 0,6 surface movement from jet1090 corpus
         # (LFBO taxiway). Replaces the earlier synthetic NZCH vector.
@@ -260,6 +295,53 @@ class TestEndToEndDisambiguation:
         assert "tas" not in state
 
 
+class TestCapabilityAwareInference:
+    """A decoded BDS 1,7 capability report is remembered per ICAO and
+    forwarded as ``known["supported_bds"]`` to later Comm-B inference."""
+
+    def test_bds17_populates_supported_bds_state(self):
+        pipe = PipeDecoder()
+        # A CRC-valid DF17 from 484CB8 verifies its later DF20 replies.
+        pipe.decode("8D484CB82015A678D4D220EA923F", timestamp=999.0)
+        result = pipe.decode("A0000638FA81C10000000081A92F", timestamp=1000.0)
+        assert result["bds"] == "1,7"
+        assert result["icao_verified"] is True
+        state = pipe._state[result["icao"]]
+        assert state["supported_bds"] == result["supported_bds"]
+
+    def test_unverified_bds17_not_remembered(self):
+        pipe = PipeDecoder()
+        result = pipe.decode("A0000638FA81C10000000081A92F", timestamp=1000.0)
+        assert result["bds"] == "1,7"
+        assert result["icao_verified"] is False
+        assert "supported_bds" not in pipe._state[result["icao"]]
+
+    def test_unverified_bds17_leaves_inference_alone(self):
+        # A 1,7 reply whose address lands on 4243D0 without ever being
+        # verified must not rule out 5,0 for that aircraft.
+        pipe = PipeDecoder()
+        pipe._update_state(
+            "4243D0",
+            {"df": 20, "bds": "1,7", "supported_bds": ["2,0", "4,0", "6,0"]},
+            1000.0,
+        )
+        result = pipe.decode("a000029cffbaa11e2004727281f1", timestamp=1001.0)
+        assert result["bds"] == "5,0"
+
+    def test_unadvertised_register_not_inferred(self):
+        # Same ambiguous 5,0/6,0 vector as TestEndToEndDisambiguation:
+        # without capability info 5,0 wins; an aircraft that only
+        # advertises 6,0 gets an unambiguous 6,0.
+        pipe = PipeDecoder()
+        pipe._state["4243D0"] = {
+            "supported_bds": ["2,0", "4,0", "6,0"],
+            "_last_seen": 1000.0,
+        }
+        result = pipe.decode("a000029cffbaa11e2004727281f1", timestamp=1001.0)
+        assert result["bds"] == "6,0"
+        assert "bds_candidates" not in result
+
+
 class TestKnownKeyInvariant:
     """PipeDecoder and _infer share a contract: the scoring tables in
     _infer reference known-dict keys (e.g. "heading", "tas"), and
@@ -1192,3 +1274,31 @@ class TestPositionBootstrap:
         pipe._bootstrap_accumulate({}, self.ICAO, 52.0, 4.0, 1000.0)
         pipe.reset()
         assert pipe._bootstrap == {}
+
+
+class TestHolds:
+    EVEN = "8D40058B58C901375147EFD09357"
+    ODD = "8D40058B58C904A87F402D3B8C59"
+
+    def test_non_position_result_is_never_held(self):
+        pipe = PipeDecoder()
+        r = pipe.decode("8D406B902015A678D4D220AA4BDA", timestamp=0.0)
+        assert pipe.holds(r) is False
+
+    def test_pending_frame_held_until_pair_window_passes(self):
+        pipe = PipeDecoder(pair_window=10.0)
+        even = pipe.decode(self.EVEN, timestamp=1000.0)
+        assert pipe.holds(even) is True
+        assert pipe.holds(even, now=1005.0) is True
+        assert pipe.holds(even, now=1010.5) is False
+
+    def test_bootstrap_pair_held_until_flush(self):
+        pipe = PipeDecoder()
+        even = pipe.decode(self.EVEN, timestamp=1000.0)
+        odd = pipe.decode(self.ODD, timestamp=1001.0)
+        # Resolved pair sits in the bootstrap buffer, position unset.
+        assert pipe.holds(even) and pipe.holds(odd)
+        assert odd.get("latitude") is None
+        pipe.flush()
+        assert not pipe.holds(even) and not pipe.holds(odd)
+        assert odd["latitude"] == pytest.approx(49.81755, abs=0.001)